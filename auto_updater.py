@@ -1,77 +1,351 @@
 # auto_updater.py
+"""
+Uygulama güncelleyici.
+
+- Sürüm kontrolü arka planda (UpdateCheckThread) yapılır; sonuç version.json
+  içinde TTL süresince saklanır, açılış ağı beklemez.
+- Release'de manifest.json varsa ({"version", "files": {yol: sha256},
+  isteğe bağlı "base_url"}) sadece kurulu ağaçtakinden farklı dosyalar
+  indirilir / zip'ten çıkarılır; hepsi hazırlanıp doğrulandıktan sonra
+  os.replace ile yerlerine konur. Değiştirilen dosyalar önce yedeklenir;
+  bir dosya yerine konamazsa (kilitli dosya, dolu disk) yedekler geri
+  yüklenir, ağaç eski haliyle kalır. Manifest yoksa zip'teki .py dosyaları
+  yine hash ile karşılaştırılır, sadece değişenler yazılır.
+
+Ortam değişkenleri (yerel HTTP stub / file:// kaynağıyla denemek için):
+    KELIME_UPDATE_URL           releases/latest JSON adresi
+    KELIME_UPDATE_MANIFEST_URL  manifest adresi (release asset'i yerine)
+    KELIME_UPDATE_CHECK_TTL     kontrol önbelleği süresi, saniye
+"""
+import hashlib
+import logging
 import os
 import sys
 import json
+import time
 import requests
 import zipfile
-import shutil
-from pathlib import Path
+import tempfile
+import urllib.request
+from pathlib import Path, PurePosixPath
 from PyQt6.QtWidgets import QMessageBox, QProgressDialog
 from PyQt6.QtCore import QThread, pyqtSignal, Qt
 
+logger = logging.getLogger(__name__)
+
+# SENİN GITHUB REPON!
+DEFAULT_RELEASES_URL = "https://api.github.com/repos/Atilladmrbas/Kelime-Uygulamasi/releases/latest"
+DEFAULT_VERSION = "v1.0.0"
+DEFAULT_CHECK_TTL = 6 * 60 * 60
+MANIFEST_ASSET_NAME = "manifest.json"
+CHUNK_SIZE = 64 * 1024
+STAGED_SUFFIX = ".update-tmp"
+BACKUP_SUFFIX = ".update-bak"
+
+
+def _open_url(url, timeout=10):
+    """http(s) ve file:// adresleri için okunabilir akış"""
+    if url.startswith("file://"):
+        return urllib.request.urlopen(url, timeout=timeout)
+
+    response = requests.get(url, stream=True, timeout=timeout)
+    response.raise_for_status()
+    response.raw.decode_content = True
+    return response.raw
+
+
+def _fetch_json(url, timeout=3):
+    stream = _open_url(url, timeout)
+    try:
+        return json.loads(stream.read().decode("utf-8"))
+    finally:
+        stream.close()
+
+
+def _download(url, dst_path, timeout=30):
+    """URL'yi dosyaya akıt; yazılan içeriğin SHA-256'sını döndür"""
+    digest = hashlib.sha256()
+    stream = _open_url(url, timeout)
+    try:
+        with open(dst_path, 'wb') as f:
+            while True:
+                chunk = stream.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                digest.update(chunk)
+                f.write(chunk)
+    finally:
+        stream.close()
+    return digest.hexdigest()
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _safe_relative_path(rel_path):
+    """Manifest / zip yolunu doğrula: mutlak ya da '..' içeren yollar reddedilir"""
+    path = PurePosixPath(rel_path)
+    if path.is_absolute() or '..' in path.parts or not path.parts:
+        raise ValueError(f"Geçersiz dosya yolu: {rel_path}")
+    return Path(*path.parts)
+
+
+def _is_update_file(rel_path):
+    return rel_path.endswith(".py") and '__pycache__' not in rel_path
+
+
+def build_manifest(root, version):
+    """Release için manifest üret: kök altındaki tüm .py dosyalarının SHA-256'sı"""
+    root = Path(root)
+    files = {}
+    for path in sorted(root.rglob("*.py")):
+        rel_path = path.relative_to(root).as_posix()
+        if _is_update_file(rel_path):
+            files[rel_path] = file_sha256(path)
+    return {"version": version, "files": files}
+
+
+def changed_files(manifest, app_path):
+    """Manifest'te olup kurulu ağaçta eksik ya da hash'i farklı dosyalar"""
+    app_path = Path(app_path)
+    changed = {}
+    for rel_path, expected in manifest.get("files", {}).items():
+        target = app_path / _safe_relative_path(rel_path)
+        try:
+            if target.is_file() and file_sha256(target) == expected:
+                continue
+        except OSError:
+            pass
+        changed[rel_path] = expected
+    return changed
+
+
 class UpdateThread(QThread):
     progress = pyqtSignal(int)
     finished = pyqtSignal(bool, str)
-    
-    def __init__(self, download_url, app_path):
+
+    def __init__(self, download_url, app_path, manifest_url=None, version=None):
         super().__init__()
         self.download_url = download_url
         self.app_path = Path(app_path)
-    
+        self.manifest_url = manifest_url
+        self.version = version
+        self.bytes_downloaded = 0
+
     def run(self):
         try:
-            import tempfile
             with tempfile.TemporaryDirectory() as tmp_dir:
                 tmp_path = Path(tmp_dir)
-                
                 self.progress.emit(10)
-                response = requests.get(self.download_url, stream=True)
-                zip_path = tmp_path / "update.zip"
-                
-                with open(zip_path, 'wb') as f:
-                    for chunk in response.iter_content(8192):
-                        f.write(chunk)
-                
-                self.progress.emit(40)
-                
-                with zipfile.ZipFile(zip_path, 'r') as z:
-                    z.extractall(tmp_path / "extracted")
-                
-                self.progress.emit(60)
-                
-                extracted_dir = next((tmp_path / "extracted").iterdir())
-                py_files = list(extracted_dir.rglob("*.py"))
-                
-                for i, src_file in enumerate(py_files):
-                    if '__pycache__' not in str(src_file):
-                        rel_path = src_file.relative_to(extracted_dir)
-                        dst_file = self.app_path / rel_path
-                        dst_file.parent.mkdir(parents=True, exist_ok=True)
-                        shutil.copy2(src_file, dst_file)
-                    
-                    progress = 60 + int((i + 1) / len(py_files) * 30)
-                    self.progress.emit(progress)
-                
-                version_info = {
-                    "version": "v1.0.0",
-                    "last_update": "2024"
-                }
-                with open(self.app_path / "version.json", 'w') as f:
-                    json.dump(version_info, f)
-                
+
+                manifest = _fetch_json(self.manifest_url) if self.manifest_url else None
+                if manifest is not None:
+                    changed = changed_files(manifest, self.app_path)
+                    version = manifest.get("version") or self.version
+                    logger.info("📦 [UpdateThread] Delta güncelleme: %d / %d dosya değişmiş",
+                                len(changed), len(manifest.get("files", {})))
+
+                    if not changed:
+                        staged = []
+                    elif manifest.get("base_url"):
+                        staged = self._stage_from_base_url(manifest["base_url"], changed)
+                    else:
+                        staged = self._stage_from_zip(self._download_zip(tmp_path), changed)
+                else:
+                    version = self.version
+                    staged = self._stage_from_zip(self._download_zip(tmp_path), None)
+
+                self.progress.emit(90)
+                self._swap_in(staged)
+                self._write_version(version)
+
                 self.progress.emit(100)
-                self.finished.emit(True, "✅ Güncelleme tamamlandı!")
-                
+                self.finished.emit(True, f"✅ Güncelleme tamamlandı! ({len(staged)} dosya)")
+
         except Exception as hata:
             self.finished.emit(False, f"❌ Hata: {str(hata)}")
-    
+
+    def _download_zip(self, tmp_path):
+        zip_path = tmp_path / "update.zip"
+        _download(self.download_url, zip_path)
+        self.bytes_downloaded += zip_path.stat().st_size
+        self.progress.emit(40)
+        return zip_path
+
+    def _staged_path(self, rel_path):
+        target = self.app_path / _safe_relative_path(rel_path)
+        return target, target.with_name(target.name + STAGED_SUFFIX)
+
+    def _stage_from_base_url(self, base_url, changed):
+        """Değişen dosyaları tek tek indir, hedefin yanına hazırla"""
+        staged = []
+        try:
+            for i, (rel_path, expected) in enumerate(changed.items()):
+                target, staged_path = self._staged_path(rel_path)
+                target.parent.mkdir(parents=True, exist_ok=True)
+
+                url = base_url.rstrip('/') + '/' + rel_path
+                staged.append((staged_path, target))
+                if _download(url, staged_path) != expected:
+                    raise ValueError(f"SHA-256 uyuşmuyor: {rel_path}")
+                self.bytes_downloaded += staged_path.stat().st_size
+
+                self.progress.emit(40 + int((i + 1) / len(changed) * 50))
+        except Exception:
+            self._discard_staged(staged)
+            raise
+        return staged
+
+    def _stage_from_zip(self, zip_path, changed):
+        """
+        Zip'ten sadece gereken üyeleri akıtarak çıkar. changed None ise
+        (manifest yok) tüm .py üyeleri hash'lenir, kurulu dosyadan farklı
+        olanlar hazırlanır.
+        """
+        staged = []
+        try:
+            with zipfile.ZipFile(zip_path, 'r') as z:
+                members = [info for info in z.infolist() if not info.is_dir()]
+                for i, info in enumerate(members):
+                    # GitHub zipball'ı tek bir üst klasörle gelir
+                    parts = info.filename.split('/', 1)
+                    if len(parts) < 2:
+                        continue
+                    rel_path = parts[1]
+
+                    if changed is not None:
+                        if rel_path not in changed:
+                            continue
+                    elif not _is_update_file(rel_path):
+                        continue
+
+                    target, staged_path = self._staged_path(rel_path)
+                    target.parent.mkdir(parents=True, exist_ok=True)
+
+                    digest = hashlib.sha256()
+                    staged.append((staged_path, target))
+                    with z.open(info) as src, open(staged_path, 'wb') as dst:
+                        for chunk in iter(lambda: src.read(CHUNK_SIZE), b''):
+                            digest.update(chunk)
+                            dst.write(chunk)
+
+                    if changed is not None:
+                        if digest.hexdigest() != changed[rel_path]:
+                            raise ValueError(f"SHA-256 uyuşmuyor: {rel_path}")
+                    elif target.is_file() and file_sha256(target) == digest.hexdigest():
+                        staged.pop()
+                        os.remove(staged_path)
+
+                    self.progress.emit(40 + int((i + 1) / len(members) * 50))
+
+            if changed is not None:
+                missing = set(changed) - {target.relative_to(self.app_path).as_posix() for _, target in staged}
+                if missing:
+                    raise ValueError(f"Zip'te eksik dosyalar: {', '.join(sorted(missing))}")
+        except Exception:
+            self._discard_staged(staged)
+            raise
+        return staged
+
+    @staticmethod
+    def _discard_staged(staged):
+        for staged_path, _ in staged:
+            try:
+                os.remove(staged_path)
+            except OSError:
+                pass
+
+    def _swap_in(self, staged):
+        """
+        Tüm dosyalar hazır ve doğrulanmış. Her hedef önce yedeğe alınır; bir
+        adım başarısız olursa yapılanlar geri alınır, kalan hazırlık
+        dosyaları silinir ve hata yükseltilir - ya hepsi ya hiçbiri.
+        """
+        swapped = []  # (hedef, yedek) - yedek None ise hedef yeni dosya
+        try:
+            for staged_path, target in staged:
+                backup = None
+                if target.exists():
+                    backup = target.with_name(target.name + BACKUP_SUFFIX)
+                    os.replace(target, backup)
+                swapped.append((target, backup))
+                os.replace(staged_path, target)
+        except Exception as e:
+            logger.error("❌ [UpdateThread] Dosyalar yerine konamadı, geri alınıyor: %s", e)
+            self._restore_backups(swapped)
+            self._discard_staged(staged)
+            raise
+
+        for _, backup in swapped:
+            if backup is not None:
+                try:
+                    os.remove(backup)
+                except OSError:
+                    pass
+
+    @staticmethod
+    def _restore_backups(swapped):
+        for target, backup in reversed(swapped):
+            try:
+                if backup is not None:
+                    os.replace(backup, target)
+                elif target.exists():
+                    os.remove(target)
+            except OSError as e:
+                logger.error("❌ [UpdateThread] %s geri yüklenemedi (yedek: %s): %s", target, backup, e)
+
+    def _write_version(self, version):
+        version_file = self.app_path / "version.json"
+        version_info = _read_version_file(version_file)
+        if version:
+            version_info["version"] = version
+        version_info["last_update"] = time.strftime("%Y-%m-%d")
+        # Eski kontrol sonucu artık geçersiz
+        version_info.pop("update_check", None)
+        _write_version_file(version_file, version_info)
+
     def __del__(self):
         # Thread güvenli kapatma
         self.wait()
 
 
+class UpdateCheckThread(QThread):
+    """Sürüm kontrolünü GUI thread'i dışında yap"""
+
+    result = pyqtSignal(dict)
+
+    def __init__(self, updater, force=False):
+        super().__init__()
+        self.updater = updater
+        self.force = force
+
+    def run(self):
+        self.result.emit(self.updater.check_for_updates(force=self.force))
+
+
+def _read_version_file(version_file):
+    try:
+        with open(version_file, 'r') as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_version_file(version_file, data):
+    tmp_file = version_file.with_name(version_file.name + STAGED_SUFFIX)
+    with open(tmp_file, 'w') as f:
+        json.dump(data, f)
+    os.replace(tmp_file, version_file)
+
+
 class Updater:
-    def __init__(self, app_path=None):
+    def __init__(self, app_path=None, releases_url=None):
         if app_path is None:
             if getattr(sys, 'frozen', False):
                 self.app_path = Path(sys.executable).parent
@@ -79,55 +353,95 @@ class Updater:
                 self.app_path = Path(__file__).parent
         else:
             self.app_path = Path(app_path)
-    
-    def check_for_updates(self, parent_widget=None):
+
+        self.releases_url = releases_url or os.environ.get("KELIME_UPDATE_URL", DEFAULT_RELEASES_URL)
+        self.version_file = self.app_path / "version.json"
+        self.check_thread = None
+
+    def _check_ttl(self, version_info):
+        value = os.environ.get("KELIME_UPDATE_CHECK_TTL", version_info.get("check_ttl", DEFAULT_CHECK_TTL))
+        try:
+            return max(0, int(value))
+        except (TypeError, ValueError):
+            return DEFAULT_CHECK_TTL
+
+    def _fetch_release(self):
+        data = _fetch_json(self.releases_url, timeout=3)
+
+        manifest_url = os.environ.get("KELIME_UPDATE_MANIFEST_URL")
+        if not manifest_url:
+            for asset in data.get('assets') or []:
+                if asset.get('name') == MANIFEST_ASSET_NAME:
+                    manifest_url = asset.get('browser_download_url')
+                    break
+
+        body = data.get('body')
+        return {
+            'latest_version': data['tag_name'],
+            'download_url': data.get('zipball_url'),
+            'manifest_url': manifest_url,
+            'release_notes': body[:200] + "..." if body else ""
+        }
+
+    def check_for_updates(self, parent_widget=None, force=False):
+        """
+        Sürüm kontrolü (ağ çağrısı yapar - GUI'den check_for_updates_async
+        kullanılmalı). Son başarılı kontrol TTL dolana kadar version.json'dan gelir.
+        """
         try:
-            # SENİN GITHUB REPON!
-            url = "https://api.github.com/repos/Atilladmrbas/Kelime-Uygulamasi/releases/latest"
-            
-            response = requests.get(url, timeout=3)
-            
-            if response.status_code == 200:
-                data = response.json()
-                latest_version = data['tag_name']
-                
-                current_version = "v1.0.0"
-                version_file = self.app_path / "version.json"
-                if version_file.exists():
-                    with open(version_file, 'r') as f:
-                        veri = json.load(f)
-                        current_version = veri.get('version', 'v1.0.0')
-                
-                if latest_version != current_version:
-                    return {
-                        'update_available': True,
-                        'latest_version': latest_version,
-                        'current_version': current_version,
-                        'download_url': data['zipball_url'],
-                        'release_notes': data['body'][:200] + "..." if data['body'] else ""
-                    }
-            
+            version_info = _read_version_file(self.version_file)
+            current_version = version_info.get('version', DEFAULT_VERSION)
+
+            cached = version_info.get('update_check')
+            if not force and isinstance(cached, dict) and cached.get('release') and \
+                    time.time() - cached.get('checked_at', 0) < self._check_ttl(version_info):
+                release = cached['release']
+                logger.debug("📦 Güncelleme kontrolü önbellekten")
+            else:
+                release = self._fetch_release()
+                version_info['update_check'] = {'checked_at': time.time(), 'release': release}
+                try:
+                    _write_version_file(self.version_file, version_info)
+                except OSError as e:
+                    logger.debug("Güncelleme kontrolü kaydedilemedi: %s", e)
+
+            if release['latest_version'] != current_version:
+                return {
+                    'update_available': True,
+                    'current_version': current_version,
+                    **release
+                }
+
             return {'update_available': False}
-            
+
         except Exception as hata:
-            print(f"Güncelleme kontrolü başarısız: {hata}")
+            logger.debug("Güncelleme kontrolü başarısız: %s", hata)
             return {'update_available': False}
-    
-    def install_update(self, download_url, parent_widget=None):
+
+    def check_for_updates_async(self, callback, force=False):
+        """Kontrolü arka planda yap; callback(sonuç) GUI thread'inde çağrılır"""
+        if self.check_thread is not None and self.check_thread.isRunning():
+            return
+
+        self.check_thread = UpdateCheckThread(self, force)
+        self.check_thread.result.connect(callback)
+        self.check_thread.start()
+
+    def install_update(self, download_url, parent_widget=None, manifest_url=None, version=None):
         progress = QProgressDialog("Güncelleme hazırlanıyor...", "İptal", 0, 100, parent_widget)
         progress.setWindowTitle("Güncelleme")
         progress.setWindowModality(Qt.WindowModality.WindowModal)
         progress.setMinimumDuration(0)
         progress.setValue(5)
         progress.show()
-        
-        self.update_thread = UpdateThread(download_url, self.app_path)
+
+        self.update_thread = UpdateThread(download_url, self.app_path, manifest_url, version)
         self.update_thread.progress.connect(progress.setValue)
-        
+
         def on_finished(basarili, mesaj):
             progress.close()
             if basarili:
-                QMessageBox.information(parent_widget, "Başarılı", 
+                QMessageBox.information(parent_widget, "Başarılı",
                     "✅ Güncelleme tamamlandı!\nUygulama yeniden başlatılacak.")
                 # Thread'i temizle
                 self.update_thread.deleteLater()
@@ -136,6 +450,7 @@ class Updater:
             else:
                 QMessageBox.warning(parent_widget, "Hata", mesaj)
                 self.update_thread.deleteLater()
-        
+
         self.update_thread.finished.connect(on_finished)
-        self.update_thread.start()
\ No newline at end of file
+        self.update_thread.start()
+
@@ -0,0 +1,207 @@
+# core/__main__.py
+"""
+Arayüzsüz bakım komutları: python -m core <komut>
+
+    stats              kutu / kart / not sayıları, yetim kayıtlar, dosya boyutları
+    import DOSYA       CSV / TSV / Anki düz metin dosyasını kutuya toplu aktar
+    dedupe             aynı (ön, arka) çiftli kartlardan en eskisini tut
+    orphans            silinmiş kartlara / kutulara bağlı kalan satırları sil
+    vacuum             REINDEX + ANALYZE + arama indeksi optimize + VACUUM
+    daily              günlük desteyi hazırla ("Her gün" kutusuna kopyala)
+
+Qt import edilmez; varsayılan veritabanı core/words.db (--db ile değişir).
+Çıkış kodu: 0 başarılı, 1 işlem başarısız, 2 hatalı kullanım.
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+
+from core.card_importer import DEFAULT_CHUNK_SIZE, CardImporter
+from core.database import Database
+from core.maintenance import LibraryMaintenance
+
+logger = logging.getLogger("core.cli")
+
+
+def _resolve_box(db, value, create=False):
+    """Kutu ID'si ya da başlığı -> box_id (yoksa None)"""
+    try:
+        info = db.boxes.get(int(value))
+    except ValueError:
+        info = db.boxes.by_title(value)
+    if info:
+        return info.id
+    if create and not str(value).isdigit():
+        return db.add_box(value)
+    return None
+
+
+def _print(args, data, lines):
+    if args.json:
+        print(json.dumps(data, ensure_ascii=False, indent=2))
+    else:
+        for line in lines:
+            print(line)
+
+
+def cmd_stats(db, maintenance, args):
+    stats = maintenance.stats()
+    totals = stats['totals']
+    lines = [
+        f"Kart: {totals['cards']} (kopya {totals['copies']}, kutusuz {totals['unboxed']})",
+        f"Not: {totals['bubbles']}  Tekrar olayı: {totals['review_events']}",
+        "",
+    ]
+    for box in stats['boxes']:
+        lines.append(
+            f"  [{box['id']:>4}] {box['title']:<28} kart {box['cards']:>6}  "
+            f"öğrenilen {box['learned']:>6}  çekilmemiş kopya {box['undrawn_copies']:>6}"
+        )
+    orphans = {name: count for name, count in stats['orphans'].items() if count}
+    lines.append("")
+    lines.append("Yetim kayıt: " + (", ".join(f"{name}={count}" for name, count in orphans.items()) or "yok"))
+    for path, size in stats['files'].items():
+        lines.append(f"{path}: {size / 1024:.0f} KB")
+    _print(args, stats, lines)
+    return 0
+
+
+def cmd_import(db, maintenance, args):
+    box_id = _resolve_box(db, args.box, create=args.create)
+    if box_id is None:
+        print(f"Kutu bulunamadı: {args.box} (yeni kutu için --create)", file=sys.stderr)
+        return 2
+    if db.boxes.is_memory(box_id):
+        print("Ezber kutularına doğrudan aktarılamaz", file=sys.stderr)
+        return 2
+
+    def progress(read, imported):
+        if not args.json:
+            print(f"\r  {read} satır okundu, {imported} kart eklendi", end="", file=sys.stderr, flush=True)
+
+    importer = CardImporter(db, chunk_size=args.chunk_size,
+                            skip_duplicates=not args.keep_duplicates, same_box_only=args.same_box)
+    try:
+        result = importer.import_file(args.file, box_id, bucket=args.bucket,
+                                      delimiter=args.delimiter, progress=progress)
+    except (OSError, UnicodeDecodeError) as e:
+        print(f"\nDosya okunamadı: {e}", file=sys.stderr)
+        return 1
+    if not args.json:
+        print(file=sys.stderr)
+    result['box_id'] = box_id
+    _print(args, result, [
+        f"{result['imported']} kart kutu {box_id}'e eklendi "
+        f"({result['duplicates']} çift, {result['skipped']} boş satır atlandı)"
+    ])
+    return 0
+
+
+def cmd_dedupe(db, maintenance, args):
+    result = maintenance.dedupe(per_box=not args.across_boxes, dry_run=args.dry_run)
+    verb = "silinecek" if args.dry_run else "silindi"
+    _print(args, result, [f"{result['groups']} çift grubu, {result['deleted']} kart {verb}"])
+    return 0
+
+
+def cmd_orphans(db, maintenance, args):
+    result = maintenance.cleanup_orphans(dry_run=args.dry_run)
+    if not result:
+        return 1
+    verb = "bulundu" if args.dry_run else "silindi"
+    _print(args, result, [f"{name}: {count} {verb}" for name, count in result.items()])
+    return 0
+
+
+def cmd_vacuum(db, maintenance, args):
+    result = maintenance.optimize(vacuum=not args.no_vacuum)
+    _print(args, result, [f"{result['bytes_before'] / 1024:.0f} KB -> {result['bytes_after'] / 1024:.0f} KB"])
+    return 0
+
+
+def cmd_daily(db, maintenance, args):
+    box_ids = None
+    if args.box:
+        box_ids = []
+        for value in args.box:
+            box_id = _resolve_box(db, value)
+            if box_id is None:
+                print(f"Kutu bulunamadı: {value}", file=sys.stderr)
+                return 2
+            box_ids.append(box_id)
+
+    result = maintenance.prepare_daily_deck(box_ids)
+    if result is None:
+        return 1
+    _print(args, result, [f"Günlük kutu {result['daily_box_id']}: {result['reset']} kopya sıfırlandı, {result['created']} yeni kopya"])
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m core", description="Kelime kütüphanesi bakım komutları")
+    parser.add_argument("--db", help="words.db yolu (varsayılan core/words.db)")
+    parser.add_argument("--json", action="store_true", help="Sonucu JSON olarak yaz")
+    parser.add_argument("-v", "--verbose", action="count", default=0, help="Log seviyesi (-v INFO, -vv DEBUG)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("stats", help="Sayılar ve dosya boyutları").set_defaults(func=cmd_stats)
+
+    p = sub.add_parser("import", help="CSV / TSV / Anki düz metin dosyasını kutuya aktar")
+    p.add_argument("file")
+    p.add_argument("--box", required=True, help="Kutu ID'si ya da başlığı")
+    p.add_argument("--create", action="store_true", help="Başlıktaki kutu yoksa oluştur")
+    p.add_argument("--bucket", type=int, default=0, choices=(0, 1), help="0 bilmediklerim, 1 öğrendiklerim")
+    p.add_argument("--delimiter", help="Ayraç (varsayılan: uzantıdan / ilk satırdan)")
+    p.add_argument("--keep-duplicates", action="store_true", help="Var olan (ön, arka) çiftlerini de ekle")
+    p.add_argument("--same-box", action="store_true", help="Çift kontrolünü sadece hedef kutuda yap")
+    p.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    p.set_defaults(func=cmd_import)
+
+    p = sub.add_parser("dedupe", help="Çift kartları temizle")
+    p.add_argument("--across-boxes", action="store_true", help="Farklı kutulardaki çiftleri de birleştir")
+    p.add_argument("--dry-run", action="store_true")
+    p.set_defaults(func=cmd_dedupe)
+
+    p = sub.add_parser("orphans", help="Yetim kayıtları temizle")
+    p.add_argument("--dry-run", action="store_true")
+    p.set_defaults(func=cmd_orphans)
+
+    p = sub.add_parser("vacuum", help="Reindex / analyze / vacuum")
+    p.add_argument("--no-vacuum", action="store_true", help="Sadece reindex + analyze")
+    p.set_defaults(func=cmd_vacuum)
+
+    p = sub.add_parser("daily", help="Günlük desteyi hazırla")
+    p.add_argument("--box", action="append", help="Kaynak kutu (tekrarlanabilir; varsayılan tüm kullanıcı kutuları)")
+    p.set_defaults(func=cmd_daily)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    level = (logging.WARNING, logging.INFO, logging.DEBUG)[min(args.verbose, 2)]
+    logging.basicConfig(level=level, format="%(levelname)-7s %(name)s: %(message)s")
+
+    start = time.perf_counter()
+    db = Database(args.db)
+    # Arayüz ezber kutularını 1..5'te bekler - yeni veritabanında kullanıcı
+    # kutusu (import --create) bu ID'leri kapmasın (MainAppWindow ile aynı)
+    db.ensure_memory_boxes()
+    try:
+        code = args.func(db, LibraryMaintenance(db), args)
+    except BrokenPipeError:
+        # Çıktı okunmadan kapandı (python -m core stats | head): sessizce çık;
+        # stdout'un çıkıştaki flush'ı da tekrar hata vermesin
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        code = 0
+    finally:
+        db.conn.close()
+    logger.info("⏱️ %s: %.2f sn", args.command, time.perf_counter() - start)
+    return code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
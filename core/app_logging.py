@@ -0,0 +1,86 @@
+# core/app_logging.py
+"""
+Uygulama genelinde logging kurulumu.
+
+Modüller kendi logger'larını `logging.getLogger(__name__)` ile alır; böylece
+her alt sistem (core.bubble_db, ui.boxes_panel..., ui.words_panel...) ayrı
+seviyeyle ayarlanabilir. Mesajlar %-biçimlendirme ile lazy verilir: seviye
+kapalıyken (varsayılan WARNING) debug çağrıları string oluşturmaz.
+
+Seviye KELIME_LOG_LEVEL ortam değişkeniyle ("DEBUG", "INFO", ...) ya da
+alt sistem bazında KELIME_LOG_LEVELS="core.bubble_db=DEBUG,ui.boxes_panel=INFO"
+ile değiştirilebilir.
+"""
+import logging
+import os
+import sys
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+
+LOG_FILE_NAME = "kelime.log"
+LOG_MAX_BYTES = 1024 * 1024
+LOG_BACKUP_COUNT = 3
+DEFAULT_LEVEL = logging.WARNING
+
+_configured = False
+
+
+def _default_log_dir():
+    """Paketlenmiş exe yanında, geliştirmede proje kökünde logs/ klasörü"""
+    if getattr(sys, 'frozen', False):
+        base_dir = Path(sys.executable).parent
+    else:
+        base_dir = Path(__file__).resolve().parent.parent
+    return base_dir / "logs"
+
+
+def _parse_level(value, default=DEFAULT_LEVEL):
+    if not value:
+        return default
+    if str(value).isdigit():
+        return int(value)
+    level = logging.getLevelName(str(value).upper())
+    return level if isinstance(level, int) else default
+
+
+def setup_logging(level=None, log_dir=None):
+    """Kök logger'a döner dosya handler'ı (ve varsa konsol) ekle - tekrar çağrılabilir"""
+    global _configured
+    if _configured:
+        return logging.getLogger()
+
+    root = logging.getLogger()
+    root.setLevel(_parse_level(level or os.environ.get("KELIME_LOG_LEVEL")))
+
+    formatter = logging.Formatter(
+        "%(asctime)s %(levelname)-7s %(name)s: %(message)s"
+    )
+
+    try:
+        log_path = Path(log_dir) if log_dir else _default_log_dir()
+        log_path.mkdir(parents=True, exist_ok=True)
+        file_handler = RotatingFileHandler(
+            log_path / LOG_FILE_NAME,
+            maxBytes=LOG_MAX_BYTES,
+            backupCount=LOG_BACKUP_COUNT,
+            encoding="utf-8",
+            delay=True,
+        )
+        file_handler.setFormatter(formatter)
+        root.addHandler(file_handler)
+    except OSError:
+        pass
+
+    # console=False ile paketlenmiş sürümde stderr yoktur
+    if sys.stderr is not None:
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(formatter)
+        root.addHandler(console_handler)
+
+    for item in os.environ.get("KELIME_LOG_LEVELS", "").split(","):
+        name, _, value = item.partition("=")
+        if name.strip() and value.strip():
+            logging.getLogger(name.strip()).setLevel(_parse_level(value.strip()))
+
+    _configured = True
+    return root
@@ -0,0 +1,235 @@
+# core/box_directory.py
+"""
+Kutu dizini: box_id -> (başlık, tür, arayüz sırası) süreç içi kopyası.
+
+Kutu türü boxes.kind sütununda tutulur; ezber / otomatik kutular başlık
+eşleştirmesiyle değil tam sayı karşılaştırmasıyla ayrılır. Menüler ve
+başlık / sıra soruları veritabanına gitmeden buradan cevaplanır.
+
+Ekran sırası kimlikten ayrı, boxes.ordinal'da aralıklı tam sayılarla
+tutulur: kutu silinince kimseye dokunulmaz, taşınan kutu iki komşusunun
+arasına tek satır yazılarak yerleşir.
+
+Dizini Database'in kutu metotları (add_box, delete_box, update_box_title...)
+günceller; değişiklikte abonelere kutu ID'si (tam yenilemede None) iletilir.
+Dizin veritabanı dosyası başınadır: aynı dosyayı açan Database örnekleri
+(okuma / yazma bağlantıları dahil) aynı dizini paylaşır.
+"""
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+
+class BoxKind:
+    """boxes.kind değerleri"""
+    USER = 0    # Kullanıcının oluşturduğu kelime kutusu
+    MEMORY = 1  # Ezber (tekrar) kutusu: "Her gün", "İki günde bir"...
+    AUTO = 2    # Eski sürümlerin otomatik açtığı "Kutu N" kutuları
+
+
+# Ezber kutuları - sıra, arayüzdeki sıra ve varsayılan ID'dir (1..5)
+MEMORY_BOX_TITLES = (
+    'Her gün',
+    'İki günde bir',
+    'Dört günde bir',
+    'Dokuz günde bir',
+    'On dört günde bir',
+)
+
+AUTO_BOX_PREFIX = "Kutu "
+
+# Ardışık kutuların ordinal aralığı - araya taşımalar için boşluk bırakır
+ORDINAL_STEP = 1024
+
+
+def kind_for_title(title):
+    """Eski satırları sınıflandırmak için: başlıktan tür (sadece migration / yeni kayıtta)"""
+    if title in MEMORY_BOX_TITLES:
+        return BoxKind.MEMORY
+    if title and title.startswith(AUTO_BOX_PREFIX):
+        return BoxKind.AUTO
+    return BoxKind.USER
+
+
+def ordinal_between(before, after):
+    """İki komşu arasına yeni ordinal (boşluk kalmadıysa None)"""
+    if before is None and after is None:
+        return ORDINAL_STEP
+    if before is None:
+        return after - ORDINAL_STEP
+    if after is None:
+        return before + ORDINAL_STEP
+    if after - before > 1:
+        return (before + after) // 2
+    return None
+
+
+class BoxInfo:
+    """Tek kutunun dizindeki kaydı"""
+
+    __slots__ = ('id', 'title', 'kind', 'ordinal', 'order')
+
+    def __init__(self, id, title, kind=BoxKind.USER, ordinal=0, order=0):
+        self.id = id
+        self.title = title
+        self.kind = kind
+        self.ordinal = ordinal  # boxes.ordinal - sıralama anahtarı (aralıklı)
+        self.order = order      # Aynı türdeki kutular arasında 1'den başlayan sıra
+
+    @property
+    def is_memory(self):
+        return self.kind == BoxKind.MEMORY
+
+    def to_dict(self):
+        return {"id": self.id, "title": self.title, "kind": self.kind, "order": self.order}
+
+    def __repr__(self):
+        return f"BoxInfo(id={self.id!r}, title={self.title!r}, kind={self.kind!r}, ordinal={self.ordinal!r}, order={self.order!r})"
+
+
+class BoxDirectory:
+    """box_id -> BoxInfo; değişiklikte aboneler çağrılır"""
+
+    def __init__(self):
+        self._boxes = {}
+        self._listeners = []
+        self.loaded = False
+
+    # ---- yükleme / güncelleme (Database çağırır) ----
+
+    def load(self, db):
+        """Tüm kutuları tek sorguyla oku"""
+        cursor = db.conn.cursor()
+        cursor.execute("SELECT id, title, kind, ordinal FROM boxes ORDER BY id ASC")
+        self._boxes = {
+            row[0]: BoxInfo(row[0], row[1],
+                            row[2] if row[2] is not None else BoxKind.USER,
+                            row[3] or 0)
+            for row in cursor.fetchall()
+        }
+        self.loaded = True
+        self._renumber()
+        self._notify(None)
+
+    def put(self, box_id, title, kind, ordinal=0):
+        """Yeni kutu ya da başlığı değişen kutu"""
+        info = self._boxes.get(box_id)
+        if info is None:
+            self._boxes[box_id] = BoxInfo(box_id, title, kind, ordinal)
+        else:
+            info.title = title
+            info.kind = kind
+            info.ordinal = ordinal
+        self._renumber()
+        self._notify(box_id)
+
+    def set_ordinals(self, ordinals):
+        """{box_id: ordinal} - kutular yeniden sıralandı"""
+        for box_id, ordinal in ordinals.items():
+            info = self._boxes.get(box_id)
+            if info is not None:
+                info.ordinal = ordinal
+        self._renumber()
+        self._notify(next(iter(ordinals)) if len(ordinals) == 1 else None)
+
+    def rename(self, box_id, title):
+        info = self._boxes.get(box_id)
+        if info is None or info.title == title:
+            return
+        info.title = title
+        self._notify(box_id)
+
+    def remove(self, box_id):
+        if self._boxes.pop(box_id, None) is None:
+            return
+        self._renumber()
+        self._notify(box_id)
+
+    def _renumber(self):
+        counters = {}
+        for info in sorted(self._boxes.values(), key=lambda info: (info.ordinal, info.id)):
+            counters[info.kind] = counters.get(info.kind, 0) + 1
+            info.order = counters[info.kind]
+
+    # ---- okuma ----
+
+    def get(self, box_id):
+        try:
+            return self._boxes.get(int(box_id))
+        except (TypeError, ValueError):
+            return None
+
+    def title(self, box_id, default=None):
+        info = self.get(box_id)
+        return info.title if info else default
+
+    def kind(self, box_id):
+        info = self.get(box_id)
+        return info.kind if info else None
+
+    def is_memory(self, box_id):
+        return self.kind(box_id) == BoxKind.MEMORY
+
+    def ui_index(self, box_id, default=1):
+        info = self.get(box_id)
+        return info.order if info else default
+
+    def by_title(self, title, kind=None):
+        for info in self._boxes.values():
+            if info.title == title and (kind is None or info.kind == kind):
+                return info
+        return None
+
+    def next_ordinal(self):
+        """Sona eklenecek kutunun ordinal'ı"""
+        return max((info.ordinal for info in self._boxes.values()), default=0) + ORDINAL_STEP
+
+    def boxes_of_kind(self, kind):
+        """Türdeki kutular arayüz sırasıyla"""
+        return sorted((info for info in self._boxes.values() if info.kind == kind),
+                      key=lambda info: info.order)
+
+    def user_boxes(self):
+        return self.boxes_of_kind(BoxKind.USER)
+
+    def memory_boxes(self):
+        return self.boxes_of_kind(BoxKind.MEMORY)
+
+    # ---- bildirimler ----
+
+    def subscribe(self, callback):
+        """callback(box_id) - tam yenilemede box_id None"""
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    def unsubscribe(self, callback):
+        try:
+            self._listeners.remove(callback)
+        except ValueError:
+            pass
+
+    def _notify(self, box_id):
+        for callback in list(self._listeners):
+            try:
+                callback(box_id)
+            except Exception as e:
+                logger.debug("⚠️ [BoxDirectory] Abone hatası: %s", e)
+
+    def get_stats(self):
+        return {'boxes': len(self._boxes), 'listeners': len(self._listeners)}
+
+
+# Veritabanı dosyası -> dizin
+_directories = {}
+
+# Uygulamanın kullandığı varsayılan veritabanı (Database(db_path=None))
+DEFAULT_DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "words.db")
+
+def get_box_directory(db_path=None):
+    """Veritabanı dosyasının kutu dizinini getir (None: varsayılan words.db)"""
+    key = os.path.normcase(os.path.abspath(db_path or DEFAULT_DB_PATH))
+    directory = _directories.get(key)
+    if directory is None:
+        directory = _directories[key] = BoxDirectory()
+    return directory
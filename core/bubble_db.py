@@ -1,8 +1,28 @@
 # core/bubble_db.py
+import html
+import logging
+import re
 import sqlite3
 import os
 from datetime import datetime
 
+from .flashcard_model import normalize_search_text
+
+logger = logging.getLogger(__name__)
+
+_HIDDEN_BLOCK_RE = re.compile(r'<(head|style|script)\b[^>]*>.*?</\1\s*>', re.IGNORECASE | re.DOTALL)
+_TAG_RE = re.compile(r'<[^>]+>')
+
+
+def html_to_search_text(html_content):
+    """Bubble HTML'inden aranabilir düz metin (etiketler, stil blokları ve entity'ler çözülür)"""
+    if not html_content:
+        return ''
+    text = _HIDDEN_BLOCK_RE.sub(' ', html_content)
+    text = _TAG_RE.sub(' ', text)
+    text = html.unescape(text)
+    return normalize_search_text(' '.join(text.split()))
+
 
 class BubbleDatabase:
     """Bubble içerikleri için ayrı database - CORE klasöründe"""
@@ -41,11 +61,11 @@ class BubbleDatabase:
         
         if 'width' not in columns:
             cursor.execute("ALTER TABLE bubbles ADD COLUMN width INTEGER DEFAULT 320")
-            print("✅ [BubbleDatabase] width alanı eklendi")
+            logger.debug("✅ [BubbleDatabase] width alanı eklendi")
         
         if 'height' not in columns:
             cursor.execute("ALTER TABLE bubbles ADD COLUMN height INTEGER DEFAULT 200")
-            print("✅ [BubbleDatabase] height alanı eklendi")
+            logger.debug("✅ [BubbleDatabase] height alanı eklendi")
         
         cursor.execute("""
             CREATE INDEX IF NOT EXISTS idx_bubbles_card_id 
@@ -57,9 +77,74 @@ class BubbleDatabase:
             ON bubbles(box_id)
         """)
         
+        self._init_search(cursor, columns)
+        
         conn.commit()
         conn.close()
     
+    def _init_search(self, cursor, columns):
+        """
+        Not araması: search_text sütunu (HTML'den çıkarılmış düz metin) ve
+        onu trigger'larla izleyen harici içerikli FTS5 tablosu bubble_search
+        """
+        if 'search_text' not in columns:
+            cursor.execute("ALTER TABLE bubbles ADD COLUMN search_text TEXT")
+        
+        # Eski kayıtların düz metnini bir kez çıkar
+        cursor.execute("SELECT id, html_content FROM bubbles WHERE search_text IS NULL")
+        missing = cursor.fetchall()
+        if missing:
+            cursor.executemany(
+                "UPDATE bubbles SET search_text = ? WHERE id = ?",
+                [(html_to_search_text(html_content), bubble_id) for bubble_id, html_content in missing]
+            )
+        
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'bubble_search'")
+        needs_rebuild = cursor.fetchone() is None
+        try:
+            cursor.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS bubble_search USING fts5(
+                    search_text,
+                    content = 'bubbles',
+                    content_rowid = 'id',
+                    tokenize = 'unicode61 remove_diacritics 2',
+                    prefix = '2 3'
+                )
+            """)
+        except sqlite3.OperationalError as e:
+            logger.warning("⚠️ [BubbleDatabase] FTS5 yok, not araması kapalı: %s", e)
+            return
+        
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_bubbles_insert_search
+            AFTER INSERT ON bubbles
+            BEGIN
+                INSERT INTO bubble_search (rowid, search_text) VALUES (NEW.id, NEW.search_text);
+            END
+        """)
+        
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_bubbles_delete_search
+            AFTER DELETE ON bubbles
+            BEGIN
+                INSERT INTO bubble_search (bubble_search, rowid, search_text)
+                VALUES ('delete', OLD.id, OLD.search_text);
+            END
+        """)
+        
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_bubbles_update_search
+            AFTER UPDATE OF search_text ON bubbles
+            BEGIN
+                INSERT INTO bubble_search (bubble_search, rowid, search_text)
+                VALUES ('delete', OLD.id, OLD.search_text);
+                INSERT INTO bubble_search (rowid, search_text) VALUES (NEW.id, NEW.search_text);
+            END
+        """)
+        
+        if needs_rebuild:
+            cursor.execute("INSERT INTO bubble_search (bubble_search) VALUES ('rebuild')")
+    
     def _get_connection(self):
         """Database connection oluştur"""
         return sqlite3.connect(self.db_path)
@@ -88,23 +173,23 @@ class BubbleDatabase:
                 # GÜNCELLEME - width/height DAHİL!
                 cursor.execute("""
                     UPDATE bubbles 
-                    SET html_content = ?, box_id = ?, width = ?, height = ?, updated_at = ?
+                    SET html_content = ?, search_text = ?, box_id = ?, width = ?, height = ?, updated_at = ?
                     WHERE card_id = ?
-                """, (html_content, box_id, width, height, now, card_id))
-                print(f"✅ [BubbleDB] Bubble güncellendi: {card_id}, {width}x{height}")
+                """, (html_content, html_to_search_text(html_content), box_id, width, height, now, card_id))
+                logger.debug("✅ [BubbleDB] Bubble güncellendi: %s, %sx%s", card_id, width, height)
             else:
                 # YENİ KAYIT - width/height DAHİL!
                 cursor.execute("""
-                    INSERT INTO bubbles (card_id, html_content, box_id, width, height, updated_at)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                """, (card_id, html_content, box_id, width, height, now))
-                print(f"✅ [BubbleDB] Yeni bubble kaydedildi: {card_id}, {width}x{height}")
+                    INSERT INTO bubbles (card_id, html_content, search_text, box_id, width, height, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                """, (card_id, html_content, html_to_search_text(html_content), box_id, width, height, now))
+                logger.debug("✅ [BubbleDB] Yeni bubble kaydedildi: %s, %sx%s", card_id, width, height)
             
             conn.commit()
             return True
             
         except Exception as e:
-            print(f"❌ [BubbleDB.save_bubble] Hata: {e}")
+            logger.error("❌ [BubbleDB.save_bubble] Hata: %s", e)
             conn.rollback()
             return False
             
@@ -138,7 +223,7 @@ class BubbleDatabase:
             return None
             
         except Exception as e:
-            print(f"❌ [BubbleDatabase.get_bubble] Hata: {e}")
+            logger.error("❌ [BubbleDatabase.get_bubble] Hata: %s", e)
             return None
             
         finally:
@@ -164,7 +249,7 @@ class BubbleDatabase:
                 return False
                 
         except Exception as e:
-            print(f"❌ [BubbleDatabase.update_box_id] Hata: {e}")
+            logger.error("❌ [BubbleDatabase.update_box_id] Hata: %s", e)
             conn.rollback()
             return False
             
@@ -187,7 +272,7 @@ class BubbleDatabase:
             return cursor.rowcount > 0
             
         except Exception as e:
-            print(f"❌ [BubbleDatabase.update_bubble_size] Hata: {e}")
+            logger.error("❌ [BubbleDatabase.update_bubble_size] Hata: %s", e)
             conn.rollback()
             return False
             
@@ -209,7 +294,7 @@ class BubbleDatabase:
                 return False
                 
         except Exception as e:
-            print(f"❌ [BubbleDatabase.delete_bubble] Hata: {e}")
+            logger.error("❌ [BubbleDatabase.delete_bubble] Hata: %s", e)
             conn.rollback()
             return False
             
@@ -244,7 +329,7 @@ class BubbleDatabase:
             return result
             
         except Exception as e:
-            print(f"❌ [BubbleDatabase.get_bubbles_by_box] Hata: {e}")
+            logger.error("❌ [BubbleDatabase.get_bubbles_by_box] Hata: %s", e)
             return []
             
         finally:
@@ -264,11 +349,11 @@ class BubbleDatabase:
             """)
             
             conn.commit()
-            print(f"✅ [BubbleDatabase] {cursor.rowcount} bubble migrate edildi")
+            logger.debug("✅ [BubbleDatabase] %s bubble migrate edildi", cursor.rowcount)
             return cursor.rowcount
             
         except Exception as e:
-            print(f"❌ [BubbleDatabase.migrate_all_bubbles] Hata: {e}")
+            logger.error("❌ [BubbleDatabase.migrate_all_bubbles] Hata: %s", e)
             conn.rollback()
             return 0
             
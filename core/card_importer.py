@@ -0,0 +1,254 @@
+# core/card_importer.py
+"""
+Toplu kart içe aktarma (Qt'siz).
+
+CSV / TSV ve Anki "düz metin" dışa aktarımları satır satır okunur; satırlar
+parça parça (chunk_size) işlenir, bellekte en fazla bir parça tutulur:
+
+1. Metin temizlenir (Anki HTML'i çözülür, boşluklar sadeleşir).
+2. Çift kontrolü arayüzle aynı normalizasyonla (card_fields.norm_text)
+   yapılır: parçanın ön yüzleri tek sorguda index'ten eşlenir, dosya
+   içindeki tekrarlar parça içinde ayıklanır; önceki parçalar zaten
+   veritabanında olduğu için sonraki parçalarda yakalanır.
+3. Kalanlar executemany ile words'e, alanları card_fields'a aynı
+   transaction'da yazılır.
+
+Sütunlar: ön yüz, arka yüz; "front,back" gibi başlık satırı atlanır.
+Anki başlıkları (#separator, #html, #guid/#notetype/#deck/#tags column)
+okunur; meta sütunlar atlanır.
+Ayraç verilmezse başlıktan / uzantıdan / ilk satırdan tahmin edilir.
+
+İlerleme progress(okunan satır, eklenen kart) ile bildirilir; arayüz
+tarafı bunu CardImportThread sinyaline bağlar.
+"""
+import csv
+import html
+import json
+import logging
+import os
+import re
+
+from core.box_directory import BoxKind
+from core.flashcard_model import normalize_field_text
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 5000
+TSV_EXTENSIONS = ('.tsv', '.tab', '.txt')
+
+# Tek sorguda eşlenecek ön yüz sayısı (SQLite parametre sınırının altında)
+_LOOKUP_BATCH = 500
+
+# Anki #separator değerleri
+_ANKI_SEPARATORS = {
+    'tab': '\t', 'comma': ',', 'semicolon': ';', 'space': ' ', 'pipe': '|', 'colon': ':',
+}
+# Alan olmayan Anki sütunları
+_ANKI_META_COLUMNS = ('guid', 'notetype', 'deck', 'tags')
+
+# İlk satır bunlardan oluşuyorsa sütun başlığıdır, kart değil
+_COLUMN_TITLES = {
+    'front', 'back', 'question', 'answer', 'word', 'meaning', 'term', 'definition',
+    'english', 'turkish', 'ön', 'arka', 'ön yüz', 'arka yüz', 'kelime', 'anlam',
+}
+
+_BREAK_RE = re.compile(r'<br\s*/?>|</(div|p|li)\s*>', re.IGNORECASE)
+_TAG_RE = re.compile(r'<[a-zA-Z/!][^>]*>')
+
+
+def clean_field_text(text, strip_html=False):
+    """Dosyadaki alanı kart metnine çevir: HTML (istenirse) ve fazla boşluklar gider"""
+    if not text:
+        return ''
+    if strip_html:
+        text = _BREAK_RE.sub(' ', text)
+        text = _TAG_RE.sub('', text)
+        text = html.unescape(text)
+    return ' '.join(text.split())
+
+
+class ImportFormat:
+    """Dosyanın ayrıştırma ayarları (Anki başlıklarından / tahminden)"""
+
+    def __init__(self, delimiter=',', strip_html=None, field_columns=(0, 1), header_lines=0):
+        self.delimiter = delimiter
+        self.strip_html = strip_html    # None: alan etiket içeriyorsa çöz
+        self.field_columns = field_columns
+        self.header_lines = header_lines
+
+    @classmethod
+    def detect(cls, path, delimiter=None, encoding='utf-8-sig'):
+        """Anki başlıklarını oku; ayracı başlıktan / uzantıdan / ilk veri satırından bul"""
+        headers = {}
+        header_lines = 0
+        first_data_line = ''
+        with open(path, encoding=encoding, newline='') as f:
+            for line in f:
+                if line.startswith('#') and ':' in line:
+                    key, _, value = line[1:].partition(':')
+                    headers[key.strip().lower()] = value.strip()
+                    header_lines += 1
+                    continue
+                first_data_line = line
+                break
+
+        if delimiter is None and 'separator' in headers:
+            value = headers['separator']
+            delimiter = _ANKI_SEPARATORS.get(value.lower(), value[:1] or None)
+        if delimiter is None:
+            if os.path.splitext(path)[1].lower() in TSV_EXTENSIONS or '\t' in first_data_line:
+                delimiter = '\t'
+            else:
+                delimiter = ','
+
+        strip_html = None
+        if 'html' in headers:
+            strip_html = headers['html'].lower() == 'true'
+
+        # "#deck column:2" - 1'den başlayan sütun numarası
+        meta_columns = set()
+        for name in _ANKI_META_COLUMNS:
+            value = headers.get(f'{name} column')
+            if value and value.isdigit():
+                meta_columns.add(int(value) - 1)
+        field_columns = tuple(index for index in range(len(meta_columns) + 2) if index not in meta_columns)[:2]
+
+        return cls(delimiter, strip_html, field_columns, header_lines)
+
+
+def iter_file_rows(path, delimiter=None, encoding='utf-8-sig'):
+    """Dosyadan temizlenmiş (ön, arka) çiftleri - akış halinde"""
+    fmt = ImportFormat.detect(path, delimiter, encoding)
+    front_column, back_column = fmt.field_columns
+    with open(path, encoding=encoding, newline='') as f:
+        for _ in range(fmt.header_lines):
+            f.readline()
+        first_row = True
+        for row in csv.reader(f, delimiter=fmt.delimiter):
+            if not row:
+                continue
+            if first_row:
+                first_row = False
+                if all(normalize_field_text(cell) in _COLUMN_TITLES for cell in row[:2]):
+                    continue
+            front = row[front_column] if len(row) > front_column else ''
+            back = row[back_column] if len(row) > back_column else ''
+            strip_html = fmt.strip_html
+            if strip_html is None:
+                strip_html = bool(_TAG_RE.search(front) or _TAG_RE.search(back))
+            yield clean_field_text(front, strip_html), clean_field_text(back, strip_html)
+
+
+class CardImporter:
+    """(ön, arka) akışını tek kutuya toplu ekler"""
+
+    def __init__(self, db, chunk_size=DEFAULT_CHUNK_SIZE, skip_duplicates=True, same_box_only=False):
+        self.db = db
+        self.chunk_size = max(1, chunk_size)
+        self.skip_duplicates = skip_duplicates
+        self.same_box_only = same_box_only  # False: arayüz gibi tüm kutularda (ezber hariç)
+        self.cancelled = False
+
+    def cancel(self):
+        """Sıradaki parçadan önce dur (yazılmış parçalar kalır)"""
+        self.cancelled = True
+
+    def import_file(self, path, box_id, bucket=0, delimiter=None, progress=None):
+        """Dosyayı kutuya aktar; sonuç {'read', 'imported', 'duplicates', 'skipped'}"""
+        return self.import_rows(iter_file_rows(path, delimiter), box_id, bucket, progress)
+
+    def import_rows(self, rows, box_id, bucket=0, progress=None):
+        """
+        rows: (ön, arka) iterable'ı. progress(read, imported) her parçadan
+        sonra çağrılır.
+        """
+        result = {'read': 0, 'imported': 0, 'duplicates': 0, 'skipped': 0}
+        chunk = []
+        for front, back in rows:
+            if self.cancelled:
+                break
+            result['read'] += 1
+            if not front and not back:
+                result['skipped'] += 1
+                continue
+            chunk.append((front, back))
+            if len(chunk) >= self.chunk_size:
+                self._flush(chunk, box_id, bucket, result)
+                chunk = []
+                if progress:
+                    progress(result['read'], result['imported'])
+
+        if chunk and not self.cancelled:
+            self._flush(chunk, box_id, bucket, result)
+        if progress:
+            progress(result['read'], result['imported'])
+        return result
+
+    def _flush(self, chunk, box_id, bucket, result):
+        if self.skip_duplicates:
+            unique = self._drop_duplicates(chunk, box_id)
+            result['duplicates'] += len(chunk) - len(unique)
+            chunk = unique
+        if chunk:
+            result['imported'] += self._insert_chunk(chunk, box_id, bucket)
+
+    def _drop_duplicates(self, chunk, box_id):
+        """Parçadan hem dosya içi hem veritabanındaki (ön, arka) tekrarlarını at"""
+        keyed = [((normalize_field_text(front), normalize_field_text(back)), front, back)
+                 for front, back in chunk]
+        existing = self._existing_pairs({key[0] for key, _, _ in keyed}, box_id)
+
+        unique = []
+        for key, front, back in keyed:
+            if key in existing:
+                continue
+            existing.add(key)
+            unique.append((front, back))
+        return unique
+
+    def _existing_pairs(self, fronts, box_id):
+        """Verilen ön yüzlere sahip orijinal kartların (ön, arka) norm çiftleri"""
+        fronts = [front for front in fronts if front]
+        pairs = set()
+        cursor = self.db.conn.cursor()
+        for start in range(0, len(fronts), _LOOKUP_BATCH):
+            batch = fronts[start:start + _LOOKUP_BATCH]
+            query = f"""
+                SELECT f.norm_text, b.norm_text
+                FROM card_fields f
+                JOIN card_fields b ON b.card_id = f.card_id AND b.side = 'back'
+                JOIN words w ON w.id = f.card_id
+                WHERE f.side = 'front' AND f.norm_text IN ({",".join("?" * len(batch))})
+                AND w.is_copy = 0
+                AND w.box NOT IN (SELECT id FROM boxes WHERE kind = ?)
+            """
+            params = batch + [BoxKind.MEMORY]
+            if self.same_box_only:
+                query += " AND w.box = ?"
+                params.append(box_id)
+            cursor.execute(query, params)
+            pairs.update((row[0], row[1]) for row in cursor.fetchall())
+        return pairs
+
+    def _insert_chunk(self, chunk, box_id, bucket):
+        """Parçayı ve alanlarını tek transaction'da yaz"""
+        cursor = self.db.conn.cursor()
+        try:
+            cursor.execute("SELECT COALESCE(MAX(id), 0) FROM words")
+            last_id = cursor.fetchone()[0]
+            cursor.executemany(
+                "INSERT INTO words (english, turkish, detail, box, bucket) VALUES (?, ?, ?, ?, ?)",
+                [
+                    (front, back,
+                     json.dumps({"front_fields": [front], "back_fields": [back]}, ensure_ascii=False),
+                     box_id, bucket)
+                    for front, back in chunk
+                ],
+            )
+            self.db._write_card_fields_since(last_id)
+            self.db.conn.commit()
+            return len(chunk)
+        except Exception as e:
+            self.db.conn.rollback()
+            logger.error("❌ [CardImporter] Parça yazılamadı (%s satır): %s", len(chunk), e)
+            return 0
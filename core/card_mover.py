@@ -1,30 +1,30 @@
 # core/card_mover.py
 from .database import Database
-from .bubble_db import BubbleDatabase
 
 
 class CardMover:
-    """Kartları kutular arası taşıma sistemi"""
+    """
+    Kartları kutular arası taşıma sistemi.
+
+    Kartın kutusu ve notunun (bubble) kutusu Database.move_card ile tek
+    transaction'da yazılır; state dosyaları commit'ten sonra güncellenir.
+    """
     
-    def __init__(self):
-        self.main_db = Database()
-        self.bubble_db = BubbleDatabase()
+    def __init__(self, db=None):
+        self.main_db = db or Database()
     
     def move_card(self, card_id, from_box_id, to_box_id, bucket=0):
         """
         Kartı bir kutudan diğerine taşı
         """
         try:
-            # 1. Ana DB'de kartın box'ını güncelle
-            success = self.main_db.update_word_box(card_id, to_box_id, bucket)
+            # 1. Kart + notu tek transaction'da
+            success = self.main_db.move_card(card_id, to_box_id, bucket)
             
             if not success:
                 return False
             
-            # 2. Bubble DB'de box_id güncelle
-            self._update_bubble_db(card_id, to_box_id)
-            
-            # 3. State dosyalarını güncelle
+            # 2. State dosyalarını güncelle
             self._update_state_files(card_id, from_box_id, to_box_id, bucket)
             
             return True
@@ -37,16 +37,13 @@ class CardMover:
         Kartı panele geri taşı (box = NULL)
         """
         try:
-            # 1. Ana DB'de kartın box'ını NULL yap
-            success = self.main_db.unassign_card_from_box(card_id)
+            # 1. Kart + notu tek transaction'da panele (box = NULL)
+            success = self.main_db.move_card(card_id, None)
             
             if not success:
                 return False
             
-            # 2. Bubble DB'de box_id NULL yap
-            self._update_bubble_db(card_id, None)
-            
-            # 3. State dosyasından sil
+            # 2. State dosyasından sil
             self._remove_from_state(card_id, from_box_id)
             
             return True
@@ -78,16 +75,13 @@ class CardMover:
         Kartı container'dan container'a taşı
         """
         try:
-            # 1. Ana DB'de kartın box'ını güncelle
-            success = self.main_db.move_card_between_boxes(card_id, from_box_id, to_box_id, to_bucket)
+            # 1. Kart + notu tek transaction'da
+            success = self.main_db.move_card(card_id, to_box_id, to_bucket)
             
             if not success:
                 return False
             
-            # 2. Bubble DB'de box_id güncelle
-            self._update_bubble_db(card_id, to_box_id)
-            
-            # 3. State dosyalarını güncelle
+            # 2. State dosyalarını güncelle
             self._update_state_files(card_id, from_box_id, to_box_id, to_bucket)
             
             return True
@@ -95,12 +89,20 @@ class CardMover:
         except Exception:
             return False
     
-    def _update_bubble_db(self, card_id, to_box_id):
-        """Bubble DB'de box_id güncelle"""
+    def delete_card(self, card_id, box_id=None):
+        """
+        Kartı ve notunu tek transaction'da sil
+        """
         try:
-            self.bubble_db.update_box_id(card_id, to_box_id)
+            success = self.main_db.delete_cards([card_id])
+            
+            if success and box_id is not None:
+                self._remove_from_state(card_id, box_id)
+            
+            return success
+            
         except Exception:
-            pass
+            return False
     
     def _update_state_files(self, card_id, from_box_id, to_box_id, bucket=0):
         """
@@ -116,21 +118,7 @@ class CardMover:
             # TO state'i yükle ve kartı ekle
             to_state = self._load_box_state(to_box_id)
             if to_state:
-                existing_card = None
-                for card in to_state.cards:
-                    if card.get("id") == card_id:
-                        existing_card = card
-                        break
-                
-                if existing_card:
-                    existing_card["bucket"] = bucket
-                else:
-                    to_state.cards.append({
-                        "id": int(card_id),
-                        "bucket": bucket,
-                        "rect": None
-                    })
-                
+                to_state.add_card(int(card_id), bucket)
                 to_state.save()
             
             return True
@@ -171,24 +159,13 @@ class CardMover:
         BoxDetailState objesini yükle
         """
         try:
-            from ui.words_panel.detail_window.states.box_detail_state import BoxDetailState
-            
-            boxes = self.main_db.get_boxes()
-            box_title = None
-            for bid, title in boxes:
-                if bid == box_id:
-                    box_title = title
-                    break
+            from ui.words_panel.detail_window.states.state_loader import BoxDetailStateLoader
             
+            box_title = self.main_db.boxes.title(box_id)
             if not box_title:
                 return None
             
-            state = BoxDetailState(box_id, box_title)
-            if state.load():
-                return state
-            else:
-                state.mark_dirty()
-                return state
+            return BoxDetailStateLoader(self.main_db).load_or_create(box_id, box_title)
                 
         except Exception:
             return None
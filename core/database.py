@@ -1,19 +1,136 @@
 # database.py
+import logging
 import os
+import re
 import sqlite3
+from datetime import datetime
+
+from core.box_directory import (
+    DEFAULT_DB_PATH, MEMORY_BOX_TITLES, ORDINAL_STEP, BoxKind, get_box_directory, kind_for_title, ordinal_between,
+)
+from core.flashcard_model import card_row_factory, iter_card_fields, normalize_field_text, normalize_search_text
+
+logger = logging.getLogger(__name__)
+
+# card_search'e bir kartın (ya da hepsinin) anlamlarını card_fields'tan yaz;
+# noktalı/noktasız i burada katlanır, kalan harf/aksan katlamasını unicode61 yapar
+_CARD_SEARCH_FILL = """
+    INSERT INTO card_search (rowid, front, back)
+    SELECT card_id,
+           group_concat(CASE WHEN side = 'front' THEN replace(replace(text, 'İ', 'i'), 'ı', 'i') END, ' '),
+           group_concat(CASE WHEN side = 'back' THEN replace(replace(text, 'İ', 'i'), 'ı', 'i') END, ' ')
+    FROM card_fields
+    {where}
+    GROUP BY card_id
+"""
+
+# card_fields'a yazılan / silinen her satırda kartın arama satırını yeniden kur
+_CARD_SEARCH_TRIGGER = """
+    CREATE TRIGGER IF NOT EXISTS trg_card_fields_{event}_search
+    AFTER {EVENT} ON card_fields
+    BEGIN
+        DELETE FROM card_search WHERE rowid = {ref}.card_id;
+        {fill};
+    END
+"""
+
+# En küçük boş kutu ID'si (1'den): ardılı olmayan en küçük ID + 1, tek sorguda
+# PRIMARY KEY index'iyle. add_box bunu INSERT ... SELECT içinde çalıştırır;
+# tek ifade yazma kilidi altında yürüdüğü için aynı veritabanını paylaşan
+# iki bağlantı aynı ID'yi alamaz.
+_NEXT_BOX_ID = """
+    SELECT CASE
+        WHEN NOT EXISTS (SELECT 1 FROM boxes WHERE id = 1) THEN 1
+        ELSE (SELECT MIN(b.id) + 1 FROM boxes b
+              WHERE NOT EXISTS (SELECT 1 FROM boxes n WHERE n.id = b.id + 1))
+    END
+"""
+
+# Not eşleşmesi, kartın kendi metnindeki eşleşmeden daha zayıf sayılır
+NOTE_MATCH_WEIGHT = 0.5
+
+
+def _fts_match_query(text):
+    """Kullanıcı metnini FTS5 sorgusuna çevir: her kelime önek olarak, hepsi birlikte"""
+    tokens = re.findall(r'\w+', normalize_search_text(text))
+    return ' '.join(f'"{token}"*' for token in tokens)
 
 
 class Database:
-    def __init__(self):
-        base_dir = os.path.dirname(os.path.abspath(__file__))
-        self.db_path = os.path.join(base_dir, "words.db")
+    def __init__(self, db_path=None):
+        if db_path:
+            self.db_path = os.path.abspath(db_path)
+        else:
+            self.db_path = DEFAULT_DB_PATH
 
         self.conn = sqlite3.connect(self.db_path)
         self.conn.row_factory = sqlite3.Row
 
         self.create_tables()
         self._migrate_words_table()
+        self._migrate_boxes_table()
         self._add_copy_fields()
+        self._migrate_card_fields()
+        self.fts_available = self._init_card_search()
+
+        self.boxes = get_box_directory(self.db_path)
+        if not self.boxes.loaded:
+            self.boxes.load(self)
+
+        # Kart taşıma / silme, notunu (bubble) aynı transaction'da günceller
+        self.bubbles_attached = self._attach_bubbles(create=True)
+
+    def open_reader(self):
+        """
+        Aynı veritabanına ayrı bağlantılı, salt okunur bir Database döndür.
+        sqlite bağlantısı thread'e bağlıdır; arka plan thread'inde çağrılıp
+        orada kapatılmalıdır. Tablo oluşturma / migration tekrar yapılmaz.
+        """
+        reader = Database.__new__(Database)
+        reader.db_path = self.db_path
+        reader.conn = sqlite3.connect(self.db_path)
+        reader.conn.row_factory = sqlite3.Row
+        reader.conn.execute("PRAGMA query_only = ON")
+        reader.boxes = get_box_directory(self.db_path)
+        return reader
+
+    def open_writer(self):
+        """
+        Arka plan thread'inde toplu yazma (içe aktarma) için ayrı bağlantılı
+        Database. Ana bağlantı yazarken kilidi bekler; thread'de kapatılmalıdır.
+        """
+        writer = Database.__new__(Database)
+        writer.db_path = self.db_path
+        writer.conn = sqlite3.connect(self.db_path, timeout=30)
+        writer.conn.row_factory = sqlite3.Row
+        writer.boxes = get_box_directory(self.db_path)
+        writer.fts_available = self.fts_available
+        return writer
+
+    def _fetch_cards(self, query, params=()):
+        """words satırlarını doğrudan CardRow olarak getir (ara dict yok)"""
+        cursor = self.conn.cursor()
+        cursor.row_factory = card_row_factory
+        cursor.execute(query, params)
+        return cursor.fetchall()
+
+    def iter_cards(self, box_id=None, batch_size=500):
+        """
+        Kartları parça parça CardRow olarak dolaş - istatistik / dışa aktarım
+        gibi tüm tabloyu okuyan işler listeyi bellekte tutmak zorunda kalmaz.
+        """
+        cursor = self.conn.cursor()
+        cursor.row_factory = card_row_factory
+        if box_id is None:
+            cursor.execute("SELECT * FROM words ORDER BY id ASC")
+        else:
+            cursor.execute("SELECT * FROM words WHERE box=? ORDER BY id ASC", (box_id,))
+
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            yield from rows
 
     def create_tables(self):
         cursor = self.conn.cursor()
@@ -21,7 +138,9 @@ class Database:
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS boxes (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
-                title TEXT NOT NULL
+                title TEXT NOT NULL,
+                kind INTEGER NOT NULL DEFAULT 0,
+                ordinal INTEGER NOT NULL DEFAULT 0
             )
         """)
 
@@ -53,9 +172,357 @@ class Database:
                 FOREIGN KEY (box_id) REFERENCES boxes(id)
             )
         """)
+
+        # Tekrar geçmişi: her kart çekme / öğrenme / geri dönüş olayı
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS review_log (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                card_id INTEGER NOT NULL,
+                original_card_id INTEGER,
+                box_id INTEGER,
+                event TEXT NOT NULL,
+                created_at TIMESTAMP DEFAULT (datetime('now', 'localtime'))
+            )
+        """)
+
+        # Günlük özet: review_log'a her ekleme trigger ile artımlı işlenir,
+        # takvim ham olayları taramadan buradan okur
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS review_daily (
+                day TEXT NOT NULL,
+                box_id INTEGER NOT NULL DEFAULT 0,
+                event TEXT NOT NULL,
+                count INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (day, box_id, event)
+            )
+        """)
+
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_review_log_created_at
+            ON review_log(created_at)
+        """)
+
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_review_daily_event_box
+            ON review_daily(event, box_id, day)
+        """)
+
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_review_log_rollup
+            AFTER INSERT ON review_log
+            BEGIN
+                INSERT INTO review_daily (day, box_id, event, count)
+                VALUES (date(NEW.created_at), COALESCE(NEW.box_id, 0), NEW.event, 1)
+                ON CONFLICT(day, box_id, event) DO UPDATE SET count = count + 1;
+            END
+        """)
+
+        # Kutu başına değişiklik sayacı - açık/havuzdaki detay pencereleri
+        # bununla güncel olup olmadıklarını anlar
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS box_changes (
+                box_id INTEGER PRIMARY KEY,
+                counter INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_words_insert_box_change
+            AFTER INSERT ON words
+            BEGIN
+                INSERT INTO box_changes (box_id, counter) VALUES (NEW.box, 1)
+                ON CONFLICT(box_id) DO UPDATE SET counter = counter + 1;
+            END
+        """)
+
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_words_delete_box_change
+            AFTER DELETE ON words
+            BEGIN
+                INSERT INTO box_changes (box_id, counter) VALUES (OLD.box, 1)
+                ON CONFLICT(box_id) DO UPDATE SET counter = counter + 1;
+            END
+        """)
+
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_words_update_box_change
+            AFTER UPDATE ON words
+            BEGIN
+                INSERT INTO box_changes (box_id, counter) VALUES (OLD.box, 1)
+                ON CONFLICT(box_id) DO UPDATE SET counter = counter + 1;
+                INSERT INTO box_changes (box_id, counter)
+                SELECT NEW.box, 1 WHERE NEW.box IS NOT OLD.box
+                ON CONFLICT(box_id) DO UPDATE SET counter = counter + 1;
+            END
+        """)
+        
+        # Kartın tüm anlamları (detail'deki ek alanlar dahil) satır satır;
+        # arama / filtre / çift kontrolü JSON çözmeden norm_text index'iyle eşleşir
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name='card_fields'")
+        self._card_fields_needs_backfill = cursor.fetchone() is None
+
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS card_fields (
+                card_id INTEGER NOT NULL,
+                side TEXT NOT NULL,
+                ordinal INTEGER NOT NULL,
+                text TEXT NOT NULL,
+                norm_text TEXT NOT NULL,
+                PRIMARY KEY (card_id, side, ordinal)
+            )
+        """)
+
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_card_fields_norm_text
+            ON card_fields(norm_text, side)
+        """)
+
+        # Ham SQL ile silinen kartların alanları da gitsin
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_words_delete_card_fields
+            AFTER DELETE ON words
+            BEGIN
+                DELETE FROM card_fields WHERE card_id = OLD.id;
+            END
+        """)
         
         self.conn.commit()
 
+    def _init_card_search(self):
+        """
+        Global arama için FTS5 tablosu: kart başına bir satır (rowid = kart ID),
+        ön ve arka yüzün tüm anlamları. card_fields'a yazılan / silinen her
+        satır trigger ile kartın arama satırını yeniden kurar. card_fields
+        migration'ından sonra çağrılır; yeni oluşturulduysa tek sorguda dolar.
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'card_search'")
+        needs_backfill = cursor.fetchone() is None
+        try:
+            cursor.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS card_search USING fts5(
+                    front,
+                    back,
+                    tokenize = 'unicode61 remove_diacritics 2',
+                    prefix = '2 3'
+                )
+            """)
+        except sqlite3.OperationalError as e:
+            logger.warning("⚠️ FTS5 yok, global arama card_fields önek aramasına düşecek: %s", e)
+            return False
+
+        for event in ("insert", "delete"):
+            self._create_card_search_trigger(cursor, event)
+
+        if needs_backfill:
+            cursor.execute(_CARD_SEARCH_FILL.format(where=""))
+        self.conn.commit()
+        return True
+
+    @staticmethod
+    def _create_card_search_trigger(cursor, event):
+        ref = "NEW" if event == "insert" else "OLD"
+        cursor.execute(_CARD_SEARCH_TRIGGER.format(
+            event=event, EVENT=event.upper(), ref=ref,
+            fill=_CARD_SEARCH_FILL.format(where=f"WHERE card_id = {ref}.card_id"),
+        ))
+
+    def _write_card_fields(self, cursor, card_id, english, turkish, detail):
+        """Kartın card_fields satırlarını words'teki son haline göre yeniden yaz"""
+        cursor.execute("DELETE FROM card_fields WHERE card_id = ?", (card_id,))
+        cursor.executemany(
+            "INSERT INTO card_fields (card_id, side, ordinal, text, norm_text) VALUES (?, ?, ?, ?, ?)",
+            [
+                (card_id, side, ordinal, text, normalize_field_text(text))
+                for side, ordinal, text in iter_card_fields(english, turkish, detail)
+            ],
+        )
+
+    def _write_card_fields_since(self, last_id, batch_size=1000):
+        """
+        id > last_id olan (toplu eklenmiş) kartların card_fields satırlarını
+        parça parça yaz. Commit etmez - ekleme ile aynı transaction'da kalır.
+
+        Satır başına arama trigger'ı yerine arama satırları sonda tek
+        sorguyla kurulur: trigger transaction içinde düşürülüp yeniden
+        oluşturulur, diğer bağlantılar trigger'sız anı hiç görmez.
+        """
+        bulk_search = getattr(self, 'fts_available', False) and self.conn.in_transaction
+        if bulk_search:
+            self.conn.execute("DROP TRIGGER IF EXISTS trg_card_fields_insert_search")
+
+        read_cursor = self.conn.cursor()
+        read_cursor.execute(
+            "SELECT id, english, turkish, detail FROM words WHERE id > ? ORDER BY id ASC",
+            (last_id,),
+        )
+        write_cursor = self.conn.cursor()
+        written = 0
+        while True:
+            rows = read_cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            write_cursor.executemany(
+                "INSERT OR REPLACE INTO card_fields (card_id, side, ordinal, text, norm_text) VALUES (?, ?, ?, ?, ?)",
+                [
+                    (row[0], side, ordinal, text, normalize_field_text(text))
+                    for row in rows
+                    for side, ordinal, text in iter_card_fields(row[1], row[2], row[3])
+                ],
+            )
+            written += len(rows)
+
+        if bulk_search:
+            write_cursor.execute("DELETE FROM card_search WHERE rowid > ?", (last_id,))
+            write_cursor.execute(_CARD_SEARCH_FILL.format(where="WHERE card_id > ?"), (last_id,))
+            self._create_card_search_trigger(write_cursor, "insert")
+        return written
+
+    def _migrate_card_fields(self, batch_size=1000):
+        """card_fields tablosu yeni oluşturulduysa mevcut detail JSON'larından doldur"""
+        if not getattr(self, '_card_fields_needs_backfill', False):
+            return
+
+        read_cursor = self.conn.cursor()
+        read_cursor.execute("SELECT id, english, turkish, detail FROM words")
+        write_cursor = self.conn.cursor()
+        migrated = 0
+        try:
+            while True:
+                rows = read_cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                write_cursor.executemany(
+                    "INSERT OR REPLACE INTO card_fields (card_id, side, ordinal, text, norm_text) VALUES (?, ?, ?, ?, ?)",
+                    [
+                        (row[0], side, ordinal, text, normalize_field_text(text))
+                        for row in rows
+                        for side, ordinal, text in iter_card_fields(row[1], row[2], row[3])
+                    ],
+                )
+                migrated += len(rows)
+            self.conn.commit()
+            self._card_fields_needs_backfill = False
+            logger.info("card_fields migration: %s kart işlendi", migrated)
+        except Exception as e:
+            self.conn.rollback()
+            logger.error("❌ card_fields migration hatası: %s", e)
+
+    def _attach_bubbles(self, create=False):
+        """
+        bubbles.db'yi 'bubbles_db' adıyla bu bağlantıya bağla (bir kez); yoksa False.
+        create=True: dosya hiç yoksa şemasıyla birlikte oluşturulur.
+        ATTACH açık transaction içinde yapılamaz; o durumda da False.
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("PRAGMA database_list")
+        if any(row[1] == 'bubbles_db' for row in cursor.fetchall()):
+            return True
+
+        bubbles_path = os.path.join(os.path.dirname(self.db_path), "bubbles.db")
+        if not os.path.exists(bubbles_path):
+            if not create:
+                return False
+            from core.bubble_db import BubbleDatabase
+            BubbleDatabase(bubbles_path)
+        if self.conn.in_transaction:
+            return False
+        try:
+            cursor.execute("ATTACH DATABASE ? AS bubbles_db", (bubbles_path,))
+            return True
+        except sqlite3.Error as e:
+            logger.warning("⚠️ bubbles.db bağlanamadı: %s", e)
+            return False
+
+    def search_cards(self, text, limit=50, box_id=None, include_notes=True):
+        """
+        Tüm kütüphanede ara: kart metni, ek anlamlar ve (istenirse) bubble
+        notları. Dönüş: en iyi eşleşme önce [(card_id, box_id), ...]
+        """
+        match = _fts_match_query(text)
+        if not match:
+            return []
+
+        if not getattr(self, 'fts_available', False):
+            card_ids = self.find_card_ids_by_field_prefix(text, box_id)
+            cursor = self.conn.cursor()
+            cursor.execute(
+                f"SELECT id, box FROM words WHERE id IN ({','.join('?' * len(card_ids))}) ORDER BY id LIMIT ?",
+                [*card_ids, limit],
+            )
+            return [(row[0], row[1]) for row in cursor.fetchall()]
+
+        sources = ["SELECT rowid AS card_id, bm25(card_search) AS score FROM card_search WHERE card_search MATCH ?"]
+        params = [match]
+
+        if include_notes and self._attach_bubbles():
+            cursor = self.conn.cursor()
+            cursor.execute("SELECT 1 FROM bubbles_db.sqlite_master WHERE name = 'bubble_search'")
+            if cursor.fetchone():
+                sources.append(f"""
+                    SELECT b.card_id, bm25(bubble_search) * {NOTE_MATCH_WEIGHT} AS score
+                    FROM bubbles_db.bubble_search
+                    JOIN bubbles_db.bubbles b ON b.id = bubble_search.rowid
+                    WHERE bubble_search MATCH ?
+                """)
+                params.append(match)
+
+        # İç LIMIT, tek kaynaklı alt sorgunun join'e düzleştirilmesini (bm25 hatası) engeller
+        query = f"""
+            SELECT m.card_id, w.box, MIN(m.score) AS best
+            FROM ({" UNION ALL ".join(sources)} LIMIT -1) m
+            JOIN words w ON w.id = m.card_id
+        """
+        if box_id is not None:
+            query += " WHERE w.box = ?"
+            params.append(box_id)
+        query += " GROUP BY m.card_id ORDER BY best ASC LIMIT ?"
+        params.append(limit)
+
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute(query, params)
+        except sqlite3.OperationalError as e:
+            logger.error("❌ Arama hatası: %s", e)
+            return []
+        return [(row[0], row[1]) for row in cursor.fetchall()]
+
+    def find_cards_by_field(self, text, side=None, box_id=None):
+        """Herhangi bir anlamı (ek alanlar dahil) text olan kartlar"""
+        query = """
+            SELECT * FROM words WHERE id IN (
+                SELECT card_id FROM card_fields WHERE norm_text = ?
+        """
+        params = [normalize_field_text(text)]
+        if side:
+            query += " AND side = ?"
+            params.append(side)
+        query += ")"
+        if box_id is not None:
+            query += " AND box = ?"
+            params.append(box_id)
+        return self._fetch_cards(query + " ORDER BY id ASC", params)
+
+    def find_card_ids_by_field_prefix(self, prefix, box_id=None):
+        """Bir anlamı prefix ile başlayan kart ID'leri (index aralık taraması)"""
+        prefix = normalize_field_text(prefix)
+        if not prefix:
+            return set()
+
+        query = """
+            SELECT DISTINCT f.card_id FROM card_fields f
+            JOIN words w ON w.id = f.card_id
+            WHERE f.norm_text >= ? AND f.norm_text < ?
+        """
+        params = [prefix, prefix + "\U0010ffff"]
+        if box_id is not None:
+            query += " AND w.box = ?"
+            params.append(box_id)
+
+        cursor = self.conn.cursor()
+        cursor.execute(query, params)
+        return {row[0] for row in cursor.fetchall()}
+
     def _migrate_words_table(self):
         cursor = self.conn.cursor()
         cursor.execute("PRAGMA table_info(words)")
@@ -76,6 +543,31 @@ class Database:
         if "is_drawn" not in columns:
             cursor.execute("ALTER TABLE words ADD COLUMN is_drawn BOOLEAN DEFAULT 0")
         
+        # Kutu içeriği ve kopya -> orijinal aramaları tabloyu taramasın
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_words_box_bucket ON words(box, bucket)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_words_original ON words(original_card_id)")
+        self.conn.commit()
+
+    def _migrate_boxes_table(self):
+        """
+        boxes.kind: ezber / otomatik kutular başlıkla değil türle ayrılır.
+        boxes.ordinal: ekran sırası kimlikten ayrı (eski satırlar ID sırasıyla).
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("PRAGMA table_info(boxes)")
+        columns = [row[1] for row in cursor.fetchall()]
+        if "ordinal" not in columns:
+            cursor.execute("ALTER TABLE boxes ADD COLUMN ordinal INTEGER NOT NULL DEFAULT 0")
+            cursor.execute("UPDATE boxes SET ordinal = id * ?", (ORDINAL_STEP,))
+        if "kind" not in columns:
+            cursor.execute(f"ALTER TABLE boxes ADD COLUMN kind INTEGER NOT NULL DEFAULT {BoxKind.USER}")
+            cursor.execute("SELECT id, title FROM boxes")
+            cursor.executemany(
+                "UPDATE boxes SET kind=? WHERE id=?",
+                [(kind_for_title(row["title"]), row["id"]) for row in cursor.fetchall()],
+            )
+
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_boxes_kind ON boxes(kind)")
         self.conn.commit()
 
     def _add_copy_fields(self):
@@ -152,9 +644,10 @@ class Database:
             0,
             original_card_id,
         ))
+        new_id = cursor.lastrowid
+        self._write_card_fields(cursor, new_id, english, turkish, original.get('detail', '{}'))
         
         self.conn.commit()
-        new_id = cursor.lastrowid
         return new_id
 
     def get_drawn_copy_for_original(self, original_card_id):
@@ -229,9 +722,7 @@ class Database:
 
     def get_undrawn_copy_cards_in_box(self, box_id):
         try:
-            cursor = self.conn.cursor()
-            
-            cursor.execute("""
+            return self._fetch_cards("""
                 SELECT * FROM words 
                 WHERE box = ? 
                 AND is_copy = 1 
@@ -240,81 +731,34 @@ class Database:
                 LIMIT 50
             """, (box_id,))
             
-            rows = cursor.fetchall()
-            result = []
-            
-            for row in rows:
-                result.append(dict(row))
-            
-            return result
-            
         except Exception:
             return []
 
     def get_boxes(self):
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT id, title FROM boxes ORDER BY id ASC")
-        
-        user_boxes = []
-        system_box_titles = [
-            'Her gün',
-            'İki günde bir',
-            'Dört günde bir',
-            'Dokuz günde bir',
-            'On dört günde bir'
-        ]
-        
-        for row in cursor.fetchall():
-            box_id = row["id"]
-            title = row["title"]
-            
-            if title not in system_box_titles and not title.startswith("Kutu "):
-                user_boxes.append((box_id, title))
-        
-        return user_boxes
+        """Kullanıcı kutuları (id, başlık) arayüz sırasıyla - kutu dizininden, sorgusuz"""
+        return [(info.id, info.title) for info in self.boxes.user_boxes()]
 
     def get_next_available_box_id(self):
+        """Sıradaki boş kutu ID'si (sadece bakmak için - add_box ayırmayı kendisi yapar)"""
         cursor = self.conn.cursor()
-        
-        try:
-            cursor.execute("SELECT id FROM boxes ORDER BY id")
-            existing_ids = [row[0] for row in cursor.fetchall()]
-            
-            if not existing_ids:
-                return 1
-            
-            for i in range(1, max(existing_ids) + 2):
-                if i not in existing_ids:
-                    return i
-                    
-            return max(existing_ids) + 1
-            
-        except Exception:
-            cursor.execute("SELECT MAX(id) FROM boxes")
-            max_id = cursor.fetchone()[0]
-            return (max_id or 0) + 1
+        cursor.execute(_NEXT_BOX_ID)
+        return cursor.fetchone()[0]
 
     def add_box(self, title):
         cursor = self.conn.cursor()
         
         try:
-            system_titles = [
-                'Her gün',
-                'İki günde bir',
-                'Dört günde bir',
-                'Dokuz günde bir',
-                'On dört günde bir'
-            ]
-            if title in system_titles:
+            if title in MEMORY_BOX_TITLES:
                 return None
             
-            next_id = self.get_next_available_box_id()
-            
+            ordinal = self.boxes.next_ordinal()
             cursor.execute(
-                "INSERT INTO boxes (id, title) VALUES (?, ?)",
-                (next_id, title)
+                f"INSERT INTO boxes (id, title, kind, ordinal) SELECT ({_NEXT_BOX_ID}), ?, ?, ?",
+                (title, BoxKind.USER, ordinal)
             )
+            next_id = cursor.lastrowid
             self.conn.commit()
+            self.boxes.put(next_id, title, BoxKind.USER, ordinal)
             return next_id
             
         except Exception:
@@ -324,26 +768,17 @@ class Database:
     def delete_box(self, box_id):
         cursor = self.conn.cursor()
         
-        cursor.execute("SELECT title FROM boxes WHERE id=?", (box_id,))
+        cursor.execute("SELECT kind FROM boxes WHERE id=?", (box_id,))
         box_info = cursor.fetchone()
         
         if box_info:
-            title = box_info["title"]
-            
-            system_titles = [
-                'Her gün',
-                'İki günde bir',
-                'Dört günde bir',
-                'Dokuz günde bir',
-                'On dört günde bir'
-            ]
-            
-            if title in system_titles:
+            if box_info["kind"] == BoxKind.MEMORY:
                 return False
             
             cursor.execute("DELETE FROM words WHERE box=?", (box_id,))
             cursor.execute("DELETE FROM boxes WHERE id=?", (box_id,))
             self.conn.commit()
+            self.boxes.remove(box_id)
             return True
         else:
             return False
@@ -355,27 +790,71 @@ class Database:
             (new_title, box_id),
         )
         self.conn.commit()
+        self.boxes.rename(box_id, new_title)
+
+    def move_box(self, box_id, position):
+        """
+        Kutuyu kendi türündeki kutular arasında position'a (1'den) taşı.
+        Komşuların ordinal'ları arasına tek satır yazılır; aralık tükenmişse
+        türün sırası bir kez yeniden aralıklandırılır.
+        """
+        info = self.boxes.get(box_id)
+        if info is None:
+            return False
+
+        siblings = [other for other in self.boxes.boxes_of_kind(info.kind) if other.id != info.id]
+        position = max(1, min(int(position), len(siblings) + 1))
+        before = siblings[position - 2].ordinal if position > 1 else None
+        after = siblings[position - 1].ordinal if position <= len(siblings) else None
+
+        ordinal = ordinal_between(before, after)
+        if ordinal is None:
+            ordered = siblings[:position - 1] + [info] + siblings[position - 1:]
+            ordinals = {box.id: index * ORDINAL_STEP for index, box in enumerate(ordered, 1)}
+        else:
+            ordinals = {info.id: ordinal}
 
-    def get_box_info(self, box_id: int):
         cursor = self.conn.cursor()
-        cursor.execute("SELECT id, title FROM boxes WHERE id = ?", (box_id,))
-        row = cursor.fetchone()
-        if row:
-            return {"id": row["id"], "title": row["title"]}
-        return None
+        cursor.executemany(
+            "UPDATE boxes SET ordinal=? WHERE id=?",
+            [(value, moved_id) for moved_id, value in ordinals.items()]
+        )
+        self.conn.commit()
+        self.boxes.set_ordinals(ordinals)
+        return True
+
+    def get_box_info(self, box_id: int):
+        info = self.boxes.get(box_id)
+        return info.to_dict() if info else None
 
     def get_box_by_title(self, title: str):
+        info = self.boxes.by_title(title)
+        return info.to_dict() if info else None
+
+    def ensure_memory_boxes(self):
+        """Eksik ezber kutularını varsayılan ID'leriyle (1..5) oluştur"""
         cursor = self.conn.cursor()
-        cursor.execute("SELECT id, title FROM boxes WHERE title = ?", (title,))
-        row = cursor.fetchone()
-        if row:
-            return {"id": row["id"], "title": row["title"]}
-        return None
+        created = False
+        for default_id, title in enumerate(MEMORY_BOX_TITLES, 1):
+            if self.boxes.by_title(title, BoxKind.MEMORY):
+                continue
+            box_id = None if self.boxes.get(default_id) else default_id
+            ordinal = default_id * ORDINAL_STEP
+            cursor.execute(
+                "INSERT INTO boxes (id, title, kind, ordinal) VALUES (?, ?, ?, ?)",
+                (box_id, title, BoxKind.MEMORY, ordinal)
+            )
+            self.boxes.put(cursor.lastrowid, title, BoxKind.MEMORY, ordinal)
+            created = True
+
+        if created:
+            self.conn.commit()
+        return created
 
     def cleanup_auto_boxes(self):
         cursor = self.conn.cursor()
         
-        cursor.execute("SELECT id, title FROM boxes WHERE title LIKE 'Kutu %'")
+        cursor.execute("SELECT id FROM boxes WHERE kind = ?", (BoxKind.AUTO,))
         auto_boxes = cursor.fetchall()
         
         deleted_count = 0
@@ -384,6 +863,7 @@ class Database:
             
             cursor.execute("DELETE FROM words WHERE box=?", (box_id,))
             cursor.execute("DELETE FROM boxes WHERE id=?", (box_id,))
+            self.boxes.remove(box_id)
             deleted_count += 1
         
         if deleted_count > 0:
@@ -400,8 +880,10 @@ class Database:
             """,
             (english, turkish, detail, box_id, bucket, original_card_id, is_copy),
         )
+        card_id = cursor.lastrowid
+        self._write_card_fields(cursor, card_id, english, turkish, detail)
         self.conn.commit()
-        return cursor.lastrowid
+        return card_id
 
     def update_word(self, word_id, english, turkish, detail, box_id, bucket):
         cursor = self.conn.cursor()
@@ -413,6 +895,7 @@ class Database:
             """,
             (english, turkish, detail, box_id, bucket, word_id),
         )
+        self._write_card_fields(cursor, word_id, english, turkish, detail)
         self.conn.commit()
 
     def update_word_bucket(self, word_id: int, bucket: int) -> bool:
@@ -426,7 +909,51 @@ class Database:
             self.conn.commit()
             return cursor.rowcount > 0
         except Exception as e:
-            print(f"❌ update_word_bucket hatası: {e}")
+            logger.error("❌ update_word_bucket hatası: %s", e)
+            self.conn.rollback()
+            return False
+
+    def move_card(self, card_id, box_id, bucket=0):
+        """
+        Kartı kutuya (box_id=None: panele) taşı; notunun box_id'si aynı
+        transaction'da değişir - tek commit, yarım kalmış taşıma olmaz.
+        """
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute(
+                "UPDATE words SET box=?, bucket=? WHERE id=?",
+                (box_id, bucket, card_id),
+            )
+            moved = cursor.rowcount > 0
+            if moved and self._attach_bubbles():
+                cursor.execute(
+                    "UPDATE bubbles_db.bubbles SET box_id=?, updated_at=? WHERE card_id=?",
+                    (box_id, datetime.now(), card_id),
+                )
+            self.conn.commit()
+            return moved
+        except sqlite3.Error as e:
+            logger.error("❌ move_card hatası: %s", e)
+            self.conn.rollback()
+            return False
+
+    def delete_cards(self, card_ids):
+        """Kartları ve notlarını tek transaction'da sil (card_fields / arama trigger'la gider)"""
+        card_ids = [int(card_id) for card_id in card_ids if card_id]
+        if not card_ids:
+            return False
+
+        placeholders = ",".join("?" * len(card_ids))
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute(f"DELETE FROM words WHERE id IN ({placeholders})", card_ids)
+            deleted = cursor.rowcount > 0
+            if self._attach_bubbles():
+                cursor.execute(f"DELETE FROM bubbles_db.bubbles WHERE card_id IN ({placeholders})", card_ids)
+            self.conn.commit()
+            return deleted
+        except sqlite3.Error as e:
+            logger.error("❌ delete_cards hatası: %s", e)
             self.conn.rollback()
             return False
 
@@ -440,13 +967,10 @@ class Database:
         return True
 
     def delete_word(self, word_id):
-        cursor = self.conn.cursor()
-        cursor.execute("DELETE FROM words WHERE id=?", (word_id,))
-        self.conn.commit()
+        return self.delete_cards([word_id])
 
     def get_cards_by_box_and_bucket(self, box_id, bucket):
-        cursor = self.conn.cursor()
-        cursor.execute(
+        return self._fetch_cards(
             """
             SELECT * FROM words
             WHERE box=? AND bucket=?
@@ -454,20 +978,12 @@ class Database:
             """,
             (box_id, bucket),
         )
-        return [dict(row) for row in cursor.fetchall()]
 
     def get_all_words(self):
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM words ORDER BY id ASC")
-        return [dict(row) for row in cursor.fetchall()]
+        return self._fetch_cards("SELECT * FROM words ORDER BY id ASC")
 
     def get_card_info(self, card_id):
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM words WHERE id = ?", (card_id,))
-        row = cursor.fetchone()
-        if row:
-            return dict(row)
-        return None
+        return self.get_word_by_id(card_id)
 
     def get_card_box(self, card_id):
         cursor = self.conn.cursor()
@@ -477,6 +993,7 @@ class Database:
 
     def get_cards_by_box(self, box_id, only_copies=False, only_originals=False):
         cursor = self.conn.cursor()
+        cursor.row_factory = card_row_factory
         
         if only_copies:
             cursor.execute(
@@ -505,18 +1022,14 @@ class Database:
                 """,
                 (box_id,),
             )
-        return [dict(row) for row in cursor.fetchall()]
+        return cursor.fetchall()
 
     def get_words_by_box(self, box_id):
         return self.get_cards_by_box(box_id)
 
     def get_word_by_id(self, word_id: int):
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM words WHERE id = ?", (word_id,))
-        row = cursor.fetchone()
-        if row:
-            return dict(row)
-        return None
+        rows = self._fetch_cards("SELECT * FROM words WHERE id = ?", (word_id,))
+        return rows[0] if rows else None
     
     def get_cards_count_by_box(self, box_id: int):
         cursor = self.conn.cursor()
@@ -534,32 +1047,26 @@ class Database:
         return row["count"] if row else 0
 
     def get_daily_box_id(self):
-        box_info = self.get_box_by_title("Her gün")
-        if box_info:
-            return box_info["id"]
-        return None
+        info = self.boxes.by_title(MEMORY_BOX_TITLES[0], BoxKind.MEMORY)
+        return info.id if info else None
     
     def create_system_box_on_demand(self, title):
-        system_titles = [
-            'Her gün',
-            'İki günde bir',
-            'Dört günde bir',
-            'Dokuz günde bir',
-            'On dört günde bir'
-        ]
-        
-        if title not in system_titles:
+        if title not in MEMORY_BOX_TITLES:
             return None
         
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT id FROM boxes WHERE title = ?", (title,))
-        if cursor.fetchone():
-            cursor.execute("SELECT id FROM boxes WHERE title = ?", (title,))
-            return cursor.fetchone()["id"]
+        info = self.boxes.by_title(title, BoxKind.MEMORY)
+        if info:
+            return info.id
         
-        cursor.execute("INSERT INTO boxes (title) VALUES (?)", (title,))
+        ordinal = (MEMORY_BOX_TITLES.index(title) + 1) * ORDINAL_STEP
+        cursor = self.conn.cursor()
+        cursor.execute(
+            "INSERT INTO boxes (title, kind, ordinal) VALUES (?, ?, ?)",
+            (title, BoxKind.MEMORY, ordinal)
+        )
         self.conn.commit()
         box_id = cursor.lastrowid
+        self.boxes.put(box_id, title, BoxKind.MEMORY, ordinal)
         return box_id
 
     def unassign_card_from_box(self, card_id):
@@ -613,12 +1120,13 @@ class Database:
 
     def get_copy_cards_by_original(self, original_card_id):
         cursor = self.conn.cursor()
+        cursor.row_factory = card_row_factory
         cursor.execute("""
             SELECT * FROM words 
             WHERE original_card_id=? AND is_copy=1
             ORDER BY box ASC
         """, (original_card_id,))
-        return [dict(row) for row in cursor.fetchall()]
+        return cursor.fetchall()
 
     def get_original_card_id(self, copy_card_id):
         cursor = self.conn.cursor()
@@ -704,6 +1212,77 @@ class Database:
     def get_original_cards_in_box(self, box_id):
         return self.get_cards_by_box(box_id, only_originals=True)
 
+    def log_review_event(self, card_id, event, box_id=None, original_card_id=None):
+        """Tekrar geçmişine olay ekle (günlük özet trigger ile güncellenir)"""
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute(
+                """
+                INSERT INTO review_log (card_id, original_card_id, box_id, event)
+                VALUES (?, ?, ?, ?)
+                """,
+                (card_id, original_card_id, box_id, event),
+            )
+            self.conn.commit()
+            return cursor.lastrowid
+        except Exception:
+            self.conn.rollback()
+            return None
+
+    def get_last_review_event_id(self):
+        """review_log'daki son olayın ID'si - hangi bağlantı yazarsa yazsın artar"""
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT MAX(id) FROM review_log")
+        return cursor.fetchone()[0] or 0
+
+    def get_daily_review_counts(self, start_day, end_day):
+        """[start_day, end_day] aralığındaki günlük olay sayıları: {gün: {olay: sayı}}"""
+        cursor = self.conn.cursor()
+        cursor.execute(
+            """
+            SELECT day, event, SUM(count) AS total FROM review_daily
+            WHERE day BETWEEN ? AND ?
+            GROUP BY day, event
+            """,
+            (start_day, end_day),
+        )
+        result = {}
+        for row in cursor.fetchall():
+            result.setdefault(row["day"], {})[row["event"]] = row["total"]
+        return result
+
+    def get_last_review_days(self, event):
+        """Her kutu için olayın son görüldüğü gün: {box_id: 'yyyy-MM-dd'}"""
+        cursor = self.conn.cursor()
+        cursor.execute(
+            """
+            SELECT box_id, MAX(day) AS last_day FROM review_daily
+            WHERE event = ?
+            GROUP BY box_id
+            """,
+            (event,),
+        )
+        return {row["box_id"]: row["last_day"] for row in cursor.fetchall()}
+
+    def get_undrawn_copy_counts(self):
+        """Kutu bazında çekilmemiş kopya kart sayıları: {box_id: sayı}"""
+        cursor = self.conn.cursor()
+        cursor.execute(
+            """
+            SELECT box, COUNT(*) AS count FROM words
+            WHERE is_copy = 1 AND is_drawn = 0 AND box IS NOT NULL
+            GROUP BY box
+            """
+        )
+        return {row["box"]: row["count"] for row in cursor.fetchall()}
+
+    def get_box_change_counter(self, box_id):
+        """Kutudaki kartlar her değiştiğinde artan sayaç (trigger'larla tutulur)"""
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT counter FROM box_changes WHERE box_id = ?", (box_id,))
+        row = cursor.fetchone()
+        return row["counter"] if row else 0
+
     def __del__(self):
         try:
             if self.conn:
@@ -1,6 +1,59 @@
+import json
 import uuid
 
+_UNPARSED = object()
+
+
+def _parse_detail(detail):
+    """detail JSON'unu sözlüğe çevir (bozuk / boş ise {})"""
+    if not detail:
+        return {}
+    try:
+        parsed = json.loads(detail)
+    except (TypeError, ValueError):
+        return {}
+    return parsed if isinstance(parsed, dict) else {}
+
+
+def normalize_field_text(text):
+    """card_fields.norm_text: baş/son boşlukları atılmış küçük harf metin"""
+    return (text or '').strip().lower()
+
+
+def normalize_search_text(text):
+    """
+    FTS5 için Türkçe uyarlaması: unicode61 (remove_diacritics 2) büyük/küçük
+    harfi ve ç ş ğ ö ü aksanlarını zaten katlar; noktalı / noktasız i'yi
+    katlamadığı için İ ve ı burada 'i' yapılır.
+    """
+    return (text or '').replace('İ', 'i').replace('ı', 'i')
+
+
+def iter_card_fields(english, turkish, detail):
+    """
+    Kartın tüm anlamlarını (side, ordinal, text) olarak ver.
+    detail'deki front_fields / back_fields esas alınır; bir taraf için
+    alan yoksa english / turkish o tarafın tek anlamıdır.
+    """
+    parsed = _parse_detail(detail)
+    for side, key, fallback in (('front', 'front_fields', english), ('back', 'back_fields', turkish)):
+        texts = parsed.get(key)
+        if not isinstance(texts, list):
+            texts = []
+
+        found = False
+        for ordinal, text in enumerate(texts):
+            if isinstance(text, str) and text.strip():
+                found = True
+                yield side, ordinal, text
+
+        if not found and fallback and str(fallback).strip():
+            yield side, 0, str(fallback)
+
+
 class FlashCardData:
+    __slots__ = ('id', 'english', 'turkish', '_detail', '_detail_data', 'box', 'box_id', 'bucket')
+
     def __init__(self, english, turkish, detail="", box=None, bucket=0, id=None, box_id=None):
         self.id = id or str(uuid.uuid4())
         self.english = english
@@ -10,6 +63,22 @@ class FlashCardData:
         self.box_id = box_id  # Integer box ID from database
         self.bucket = bucket
 
+    @property
+    def detail(self):
+        return self._detail
+
+    @detail.setter
+    def detail(self, value):
+        self._detail = value
+        self._detail_data = _UNPARSED
+
+    @property
+    def detail_data(self):
+        """detail JSON'u ilk erişimde çözülür"""
+        if self._detail_data is _UNPARSED:
+            self._detail_data = _parse_detail(self._detail)
+        return self._detail_data
+
     def to_dict(self):
         return {
             "id": self.id,
@@ -20,12 +89,11 @@ class FlashCardData:
             "box_id": self.box_id,
             "bucket": self.bucket
         }
-    
+
     def to_json(self):
         """JSON formatında döndür (drag-drop için)"""
-        import json
         return json.dumps(self.to_dict())
-    
+
     @classmethod
     def from_dict(cls, data):
         """Dict'ten FlashCardData oluştur"""
@@ -38,10 +106,10 @@ class FlashCardData:
             bucket=data.get("bucket", 0),
             id=data.get("id")
         )
-    
+
     @classmethod
     def from_db_row(cls, row):
-        """Database row'dan FlashCardData oluştur"""
+        """Database row'dan (CardRow ya da dict) FlashCardData oluştur"""
         return cls(
             id=row.get("id"),
             english=row.get("english", ""),
@@ -49,4 +117,121 @@ class FlashCardData:
             detail=row.get("detail", ""),
             box_id=row.get("box"),
             bucket=row.get("bucket", 0)
-        )
\ No newline at end of file
+        )
+
+
+class CardRow:
+    """
+    words tablosundan okunan tek satır.
+    sqlite3.Row + dict(row) yerine card_row_factory ile doğrudan bu nesneye
+    çözülür; __slots__ sayesinde satır başına sözlük tutulmaz. Eski kodla
+    uyum için dict gibi de okunur (get, [], in, keys, dict(row)).
+    'box_id' anahtarı 'box' sütununun takma adıdır.
+    """
+
+    COLUMNS = ('id', 'english', 'turkish', 'detail', 'box', 'bucket', 'original_card_id', 'is_copy', 'is_drawn')
+    __slots__ = ('id', 'english', 'turkish', '_detail', '_detail_data', 'box', 'bucket',
+                 'original_card_id', 'is_copy', 'is_drawn')
+
+    def __init__(self, id=None, english='', turkish='', detail=None, box=None, bucket=0,
+                 original_card_id=None, is_copy=0, is_drawn=0):
+        self.id = id
+        self.english = english
+        self.turkish = turkish
+        self._detail = detail
+        self._detail_data = _UNPARSED
+        self.box = box
+        self.bucket = bucket
+        self.original_card_id = original_card_id
+        self.is_copy = is_copy
+        self.is_drawn = is_drawn
+
+    @property
+    def detail(self):
+        return self._detail
+
+    @detail.setter
+    def detail(self, value):
+        self._detail = value
+        self._detail_data = _UNPARSED
+
+    @property
+    def detail_data(self):
+        """detail JSON'u ilk erişimde çözülür - sadece okuyan satırlar bedel öder"""
+        if self._detail_data is _UNPARSED:
+            self._detail_data = _parse_detail(self._detail)
+        return self._detail_data
+
+    @property
+    def box_id(self):
+        return self.box
+
+    # ---- dict uyumluluğu ----
+
+    def keys(self):
+        return self.COLUMNS
+
+    def values(self):
+        return [getattr(self, column) for column in self.COLUMNS]
+
+    def items(self):
+        return [(column, getattr(self, column)) for column in self.COLUMNS]
+
+    def __iter__(self):
+        return iter(self.COLUMNS)
+
+    def __len__(self):
+        return len(self.COLUMNS)
+
+    def __contains__(self, key):
+        return key in self.COLUMNS
+
+    def __getitem__(self, key):
+        if key in self.COLUMNS or key == 'box_id':
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key not in self.COLUMNS:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def get(self, key, default=None):
+        if key == 'box_id':
+            return default if self.box is None else self.box
+        if key in self.COLUMNS:
+            return getattr(self, key)
+        return default
+
+    def to_dict(self):
+        return {column: getattr(self, column) for column in self.COLUMNS}
+
+    def copy(self):
+        return self.to_dict()
+
+    def __repr__(self):
+        return f"CardRow(id={self.id!r}, english={self.english!r}, box={self.box!r}, bucket={self.bucket!r})"
+
+
+# (cursor.description, satır kurucu) - aynı sorgunun satırları için sütun eşlemesi bir kez yapılır
+_row_builder = (None, None)
+
+
+def _make_row_builder(description):
+    names = tuple(column[0] for column in description)
+    if names == CardRow.COLUMNS:
+        return lambda row: CardRow(*row)
+
+    indexes = [(index, name) for index, name in enumerate(names) if name in CardRow.COLUMNS]
+    return lambda row: CardRow(**{name: row[index] for index, name in indexes})
+
+
+def card_row_factory(cursor, row):
+    """sqlite3 row_factory: words satırını doğrudan CardRow'a çöz"""
+    global _row_builder
+    description = cursor.description
+    cached_description, build = _row_builder
+    if cached_description is not description:
+        build = _make_row_builder(description)
+        _row_builder = (description, build)
+    return build(row)
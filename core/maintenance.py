@@ -0,0 +1,277 @@
+# core/maintenance.py
+"""
+Kütüphane bakımı (Qt'siz): istatistik, çift kart temizliği, yetim kayıt
+temizliği, vacuum / reindex ve günlük deste hazırlığı.
+
+Arayüzü açmadan `python -m core` ile çalıştırılır. Büyük tablolar
+cursor üzerinden parça parça okunur; bellekte tek parça tutulur. Silme /
+ekleme işleri Database'in toplu metotlarıyla transaction içinde yapılır
+(kartın notu kartla birlikte gider).
+"""
+import logging
+import os
+
+from core.box_directory import BoxKind
+from core.flashcard_model import normalize_field_text
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+class LibraryMaintenance:
+    """Database üstünde toplu bakım işleri"""
+
+    def __init__(self, db, batch_size=DEFAULT_BATCH_SIZE):
+        self.db = db
+        self.batch_size = max(1, batch_size)
+        # Çift kontrolünde arayüzle aynı normalizasyon (card_fields.norm_text)
+        self.db.conn.create_function("kelime_norm", 1, normalize_field_text, deterministic=True)
+
+    # ---- istatistik ----
+
+    def stats(self):
+        """Kutu / kart / not sayıları ve dosya boyutları"""
+        cursor = self.db.conn.cursor()
+
+        boxes = []
+        cursor.execute("""
+            SELECT box, COUNT(*) AS cards,
+                   SUM(is_copy = 0) AS originals,
+                   SUM(is_copy = 0 AND bucket = 1) AS learned,
+                   SUM(is_copy = 1 AND is_drawn = 0) AS undrawn
+            FROM words WHERE box IS NOT NULL
+            GROUP BY box
+        """)
+        counts = {row["box"]: row for row in cursor.fetchall()}
+        for kind in (BoxKind.MEMORY, BoxKind.USER, BoxKind.AUTO):
+            for info in self.db.boxes.boxes_of_kind(kind):
+                row = counts.get(info.id)
+                boxes.append({
+                    'id': info.id,
+                    'title': info.title,
+                    'kind': info.kind,
+                    'cards': row["cards"] if row else 0,
+                    'originals': row["originals"] if row else 0,
+                    'learned': row["learned"] if row else 0,
+                    'undrawn_copies': row["undrawn"] if row else 0,
+                })
+
+        cursor.execute("""
+            SELECT COUNT(*) AS cards,
+                   COALESCE(SUM(is_copy = 1), 0) AS copies,
+                   COALESCE(SUM(box IS NULL), 0) AS unboxed
+            FROM words
+        """)
+        totals = dict(cursor.fetchone())
+
+        cursor.execute("SELECT COUNT(*) FROM review_log")
+        totals['review_events'] = cursor.fetchone()[0]
+
+        if self.db._attach_bubbles():
+            cursor.execute("SELECT COUNT(*) FROM bubbles_db.bubbles")
+            totals['bubbles'] = cursor.fetchone()[0]
+        else:
+            totals['bubbles'] = 0
+
+        return {
+            'totals': totals,
+            'boxes': boxes,
+            'orphans': self.cleanup_orphans(dry_run=True),
+            'files': {path: os.path.getsize(path) for path in self._db_files() if os.path.exists(path)},
+        }
+
+    # ---- çift kartlar ----
+
+    def iter_duplicate_groups(self, per_box=True):
+        """
+        Aynı (ön, arka) çiftini taşıyan orijinal kartlar: [id, ...] grupları,
+        en eski kart başta. Ezber kutuları (kopyalar) hariç; per_box=False
+        ise kutular arası çiftler de gruplanır.
+        """
+        group_key = "box, " if per_box else ""
+        cursor = self.db.conn.cursor()
+        cursor.execute(f"""
+            SELECT id, box, kelime_norm(english) AS front, kelime_norm(turkish) AS back
+            FROM words
+            WHERE is_copy = 0 AND box IS NOT NULL
+            AND box NOT IN (SELECT id FROM boxes WHERE kind = ?)
+            AND kelime_norm(english) != '' AND kelime_norm(turkish) != ''
+            ORDER BY {group_key}front, back, id
+        """, (BoxKind.MEMORY,))
+
+        current_key = None
+        group = []
+        while True:
+            rows = cursor.fetchmany(self.batch_size)
+            if not rows:
+                break
+            for row in rows:
+                key = (row["box"] if per_box else None, row["front"], row["back"])
+                if key != current_key:
+                    if len(group) > 1:
+                        yield group
+                    current_key = key
+                    group = []
+                group.append(row["id"])
+        if len(group) > 1:
+            yield group
+
+    def dedupe(self, per_box=True, dry_run=False):
+        """Çiftlerden en eskisini tut, diğerlerini (kopyaları ve notlarıyla) sil"""
+        result = {'groups': 0, 'deleted': 0}
+        pending = []
+        for group in self.iter_duplicate_groups(per_box):
+            result['groups'] += 1
+            pending.extend(group[1:])
+            if len(pending) >= self.batch_size:
+                result['deleted'] += self._delete_with_copies(pending, dry_run)
+                pending = []
+        if pending:
+            result['deleted'] += self._delete_with_copies(pending, dry_run)
+        return result
+
+    def _delete_with_copies(self, card_ids, dry_run):
+        if dry_run:
+            return len(card_ids)
+        cursor = self.db.conn.cursor()
+        placeholders = ",".join("?" * len(card_ids))
+        cursor.execute(
+            f"SELECT id FROM words WHERE is_copy = 1 AND original_card_id IN ({placeholders})",
+            card_ids,
+        )
+        copy_ids = [row[0] for row in cursor.fetchall()]
+        if not self.db.delete_cards(list(card_ids) + copy_ids):
+            return 0
+        return len(card_ids)
+
+    # ---- yetim kayıtlar ----
+
+    # ad -> (sayma sorgusu, silme sorgusu); bubbles_db sorguları bağlıysa çalışır
+    _ORPHAN_QUERIES = {
+        'copies': """
+            FROM words WHERE is_copy = 1 AND (original_card_id IS NULL
+            OR original_card_id NOT IN (SELECT id FROM words))
+        """,
+        'card_fields': "FROM card_fields WHERE card_id NOT IN (SELECT id FROM words)",
+        'drawn_cards': """
+            FROM drawn_cards WHERE copy_card_id NOT IN (SELECT id FROM words)
+            OR original_card_id NOT IN (SELECT id FROM words)
+        """,
+        'box_changes': "FROM box_changes WHERE box_id NOT IN (SELECT id FROM boxes)",
+        'bubbles': "FROM bubbles_db.bubbles WHERE card_id NOT IN (SELECT id FROM main.words)",
+    }
+
+    def cleanup_orphans(self, dry_run=False):
+        """
+        Silinmiş kartlara / kutulara bağlı kalan satırlar: {tür: sayı}.
+        Hepsi tek transaction'da silinir. Kopyalar önce gider; onlara bağlı
+        alan / not satırları aynı turda yakalanır.
+        """
+        bubbles_attached = self.db._attach_bubbles()
+        cursor = self.db.conn.cursor()
+        result = {}
+        try:
+            for name, query in self._ORPHAN_QUERIES.items():
+                if name == 'bubbles' and not bubbles_attached:
+                    continue
+                if dry_run:
+                    cursor.execute(f"SELECT COUNT(*) {query}")
+                    result[name] = cursor.fetchone()[0]
+                else:
+                    cursor.execute(f"DELETE {query}")
+                    result[name] = cursor.rowcount
+            if not dry_run:
+                self.db.conn.commit()
+        except Exception as e:
+            self.db.conn.rollback()
+            logger.error("❌ [Maintenance] Yetim temizliği başarısız: %s", e)
+            return {}
+        return result
+
+    # ---- vacuum / reindex ----
+
+    def _db_files(self):
+        paths = [self.db.db_path]
+        bubbles_path = os.path.join(os.path.dirname(self.db.db_path), "bubbles.db")
+        if os.path.exists(bubbles_path):
+            paths.append(bubbles_path)
+        return paths
+
+    def optimize(self, vacuum=True):
+        """REINDEX + ANALYZE, arama indekslerini sıkıştır, istenirse VACUUM"""
+        if self.db.conn.in_transaction:
+            self.db.conn.commit()
+
+        schemas = ["main"]
+        if self.db._attach_bubbles():
+            schemas.append("bubbles_db")
+
+        before = sum(os.path.getsize(path) for path in self._db_files())
+        cursor = self.db.conn.cursor()
+        cursor.execute("REINDEX")
+        if getattr(self.db, 'fts_available', False):
+            cursor.execute("INSERT INTO card_search (card_search) VALUES ('optimize')")
+        if "bubbles_db" in schemas:
+            cursor.execute("SELECT 1 FROM bubbles_db.sqlite_master WHERE name = 'bubble_search'")
+            if cursor.fetchone():
+                cursor.execute("INSERT INTO bubbles_db.bubble_search (bubble_search) VALUES ('optimize')")
+        for schema in schemas:
+            cursor.execute(f"ANALYZE {schema}")
+        self.db.conn.commit()
+
+        if vacuum:
+            for schema in schemas:
+                cursor.execute(f"VACUUM {schema}")
+
+        after = sum(os.path.getsize(path) for path in self._db_files())
+        return {'bytes_before': before, 'bytes_after': after}
+
+    # ---- günlük deste ----
+
+    def prepare_daily_deck(self, box_ids=None):
+        """
+        Arayüzdeki "Her gün'e kopyala" ile aynı iş, tek transaction'da:
+        günlük kutudaki kopyalar çekilmemiş yapılır; seçili kutuların
+        (verilmezse tüm kullanıcı kutularının) bilmediklerim kartlarından
+        kopyası olmayanlara günlük kutuda kopya açılır.
+        """
+        daily_box_id = self.db.get_daily_box_id()
+        if daily_box_id is None:
+            self.db.ensure_memory_boxes()
+            daily_box_id = self.db.get_daily_box_id()
+        if box_ids is None:
+            box_ids = [info.id for info in self.db.boxes.user_boxes()]
+        box_ids = [box_id for box_id in box_ids if not self.db.boxes.is_memory(box_id)]
+
+        result = {'daily_box_id': daily_box_id, 'reset': 0, 'created': 0}
+        cursor = self.db.conn.cursor()
+        try:
+            cursor.execute("UPDATE words SET is_drawn = 0 WHERE box = ? AND is_copy = 1", (daily_box_id,))
+            result['reset'] = cursor.rowcount
+            cursor.execute("UPDATE drawn_cards SET is_active = 0 WHERE box_id = ? AND is_active = 1", (daily_box_id,))
+
+            if box_ids:
+                cursor.execute("SELECT COALESCE(MAX(id), 0) FROM words")
+                last_id = cursor.fetchone()[0]
+                placeholders = ",".join("?" * len(box_ids))
+                cursor.execute(f"""
+                    INSERT INTO words (english, turkish, detail, box, bucket, original_card_id, is_copy, is_drawn)
+                    SELECT TRIM(o.english), TRIM(o.turkish), COALESCE(o.detail, '{{}}'), ?, 0, o.id, 1, 0
+                    FROM words o
+                    WHERE o.box IN ({placeholders}) AND o.is_copy = 0 AND o.bucket = 0
+                    AND (TRIM(o.english) != '' OR TRIM(o.turkish) != '')
+                    AND NOT EXISTS (
+                        SELECT 1 FROM words c WHERE c.original_card_id = o.id AND c.is_copy = 1
+                    )
+                    ORDER BY o.id
+                """, [daily_box_id] + list(box_ids))
+                result['created'] = cursor.rowcount
+                self.db._write_card_fields_since(last_id, self.batch_size)
+
+            self.db.conn.commit()
+        except Exception as e:
+            self.db.conn.rollback()
+            logger.error("❌ [Maintenance] Günlük deste hazırlanamadı: %s", e)
+            return None
+        return result
@@ -0,0 +1,130 @@
+# core/review_stats.py
+from datetime import date, timedelta
+
+
+class ReviewEvent:
+    """review_log tablosundaki olay türleri"""
+    DRAWN = "drawn"        # Kart ezber kutusundan çekildi
+    LEARNED = "learned"    # Orijinal kart öğrendiklerim'e taşındı
+    RETURNED = "returned"  # Çekilen kart bir ezber kutusuna geri bırakıldı
+
+
+# Sistem kutusu başlığı -> tekrar aralığı (gün)
+SYSTEM_BOX_INTERVALS = {
+    "Her gün": 1,
+    "İki günde bir": 2,
+    "Dört günde bir": 4,
+    "Dokuz günde bir": 9,
+    "On dört günde bir": 14,
+}
+
+
+class ReviewStatsEngine:
+    """
+    Takvim için tekrar istatistikleri.
+    Günlük sayılar review_daily özet tablosundan okunur (ham log taranmaz),
+    ay bazında önbelleğe alınır. Önbellek review_log'un son olay ID'sine
+    bağlıdır: CLI ya da başka bir bağlantı olay ekleyince de geçersiz olur.
+    """
+
+    def __init__(self, db):
+        self.db = db
+        self._month_cache = {}  # (year, month) -> (son olay ID'si, {gün: {olay: sayı}})
+
+    def _generation(self):
+        try:
+            return self.db.get_last_review_event_id()
+        except Exception:
+            return None
+
+    @staticmethod
+    def _month_range(year, month):
+        first = date(year, month, 1)
+        if month == 12:
+            last = date(year + 1, 1, 1) - timedelta(days=1)
+        else:
+            last = date(year, month + 1, 1) - timedelta(days=1)
+        return first, last
+
+    def get_month_review_counts(self, year, month):
+        """Ayın günlerine göre olay sayıları: {'yyyy-MM-dd': {olay: sayı}}"""
+        if not self.db:
+            return {}
+
+        key = (year, month)
+        generation = self._generation()
+        cached = self._month_cache.get(key)
+        if cached and generation is not None and cached[0] == generation:
+            return cached[1]
+
+        first, last = self._month_range(year, month)
+        try:
+            counts = self.db.get_daily_review_counts(first.isoformat(), last.isoformat())
+        except Exception:
+            counts = {}
+
+        self._month_cache[key] = (generation, counts)
+        return counts
+
+    def get_month_due_load(self, year, month, today=None):
+        """
+        Bugün ve sonrası için günlük bekleyen kart yükü: {'yyyy-MM-dd': sayı}
+        Her sistem kutusu son çekildiği günden itibaren kendi aralığında vadesi
+        gelir; gecikmiş kutular bugüne sayılır.
+        """
+        if not self.db:
+            return {}
+
+        today = today or date.today()
+        first, last = self._month_range(year, month)
+        if last < today:
+            return {}
+
+        try:
+            last_drawn = self.db.get_last_review_days(ReviewEvent.DRAWN)
+            pending = self.db.get_undrawn_copy_counts()
+            boxes = self._get_system_boxes()
+        except Exception:
+            return {}
+
+        start = max(first, today)
+        due_load = {}
+
+        for box_id, interval in boxes:
+            count = pending.get(box_id, 0)
+            if not count:
+                continue
+
+            last_day = last_drawn.get(box_id)
+            if last_day:
+                next_due = date.fromisoformat(last_day) + timedelta(days=interval)
+                if next_due < today:
+                    next_due = today
+            else:
+                next_due = today
+
+            # Ay başına kadar aralıkla ilerle
+            if next_due < start:
+                steps = (start - next_due).days // interval
+                next_due += timedelta(days=steps * interval)
+                if next_due < start:
+                    next_due += timedelta(days=interval)
+
+            while next_due <= last:
+                key = next_due.isoformat()
+                due_load[key] = due_load.get(key, 0) + count
+                next_due += timedelta(days=interval)
+
+        return due_load
+
+    def _get_system_boxes(self):
+        """(box_id, aralık) listesi"""
+        from core.box_directory import get_box_directory
+        return [
+            (info.id, SYSTEM_BOX_INTERVALS[info.title])
+            for info in (getattr(self.db, 'boxes', None) or get_box_directory()).memory_boxes()
+            if info.title in SYSTEM_BOX_INTERVALS
+        ]
+
+    def clear_cache(self):
+        self._month_cache.clear()
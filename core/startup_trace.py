@@ -0,0 +1,110 @@
+# core/startup_trace.py
+"""
+Açılış süresi izi.
+
+Açılışın aşamaları (importlar, veritabanı, sekmeler, ilk çizim) süreç
+başlangıcına göre milisaniye olarak kaydedilir. Sonuç INFO seviyesinde
+loglanır; KELIME_STARTUP_TRACE=<dosya> verilirse JSON olarak da yazılır.
+
+Gerileme kontrolü: `python opening_window.py --startup-check` ana pencereyi
+doğrudan açar, ilk çizimden sonra çıkar; ilk çizim bütçeyi
+(KELIME_STARTUP_BUDGET_MS, varsayılan DEFAULT_BUDGET_MS) aşarsa çıkış kodu 1.
+"""
+import json
+import logging
+import os
+import time
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+# Bu modül açılışta ilk import edilenlerden olmalı - süreler buradan ölçülür
+_PROCESS_START = time.perf_counter()
+
+DEFAULT_BUDGET_MS = 2500
+FIRST_PAINT = "first_paint"
+
+
+class StartupTrace:
+    """Aşama adı -> (başlangıç, süre) ms; işaretler süreç başından itibaren"""
+
+    def __init__(self, origin=None):
+        self.origin = _PROCESS_START if origin is None else origin
+        self.phases = {}  # ad -> (başlangıç ms, süre ms)
+        self.marks = {}   # ad -> ms
+        self.reported = False
+
+    def _now_ms(self):
+        return (time.perf_counter() - self.origin) * 1000.0
+
+    def mark(self, name):
+        """Anlık işaret (ilk kayıt geçerli)"""
+        if name not in self.marks:
+            self.marks[name] = self._now_ms()
+        return self.marks[name]
+
+    @contextmanager
+    def phase(self, name):
+        """with get_startup_trace().phase("db_open"): ..."""
+        start = self._now_ms()
+        try:
+            yield
+        finally:
+            if name not in self.phases:
+                self.phases[name] = (start, self._now_ms() - start)
+
+    def to_dict(self):
+        return {
+            'phases': {name: {'start_ms': round(start, 1), 'duration_ms': round(duration, 1)}
+                       for name, (start, duration) in self.phases.items()},
+            'marks': {name: round(value, 1) for name, value in self.marks.items()},
+        }
+
+    def report(self):
+        """Bir kez logla ve (istenirse) JSON dosyasına yaz"""
+        if self.reported:
+            return
+        self.reported = True
+
+        summary = ", ".join(
+            [f"{name}={duration:.0f}ms" for name, (_, duration) in self.phases.items()] +
+            [f"{name}@{value:.0f}ms" for name, value in self.marks.items()]
+        )
+        logger.info("⏱️ Açılış: %s", summary)
+
+        trace_path = os.environ.get("KELIME_STARTUP_TRACE")
+        if trace_path:
+            try:
+                with open(trace_path, 'w', encoding='utf-8') as f:
+                    json.dump(self.to_dict(), f, indent=2)
+            except OSError as e:
+                logger.warning("⚠️ Açılış izi yazılamadı: %s", e)
+
+    def check_budget(self, budget_ms=None):
+        """İlk çizim bütçe içinde mi? (ilk çizim yoksa False)"""
+        if budget_ms is None:
+            try:
+                budget_ms = float(os.environ.get("KELIME_STARTUP_BUDGET_MS", DEFAULT_BUDGET_MS))
+            except (TypeError, ValueError):
+                budget_ms = DEFAULT_BUDGET_MS
+
+        first_paint = self.marks.get(FIRST_PAINT)
+        if first_paint is None:
+            logger.error("❌ Açılış kontrolü: ilk çizim kaydedilmedi")
+            return False
+        if first_paint > budget_ms:
+            logger.error("❌ Açılış yavaşladı: ilk çizim %.0f ms > bütçe %.0f ms", first_paint, budget_ms)
+            return False
+        logger.info("✅ Açılış bütçe içinde: %.0f ms <= %.0f ms", first_paint, budget_ms)
+        return True
+
+
+# Global trace instance
+_global_trace = None
+
+def get_startup_trace():
+    """Global açılış izini getir"""
+    global _global_trace
+    if _global_trace is None:
+        _global_trace = StartupTrace()
+    return _global_trace
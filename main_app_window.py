@@ -1,40 +1,53 @@
 # main_app_window.py - DÜZELTİLMİŞ VERSİYON (flash_sync_manager TAMAMEN KALDIRILDI)
+import logging
+import time
 from PyQt6.QtWidgets import QTabWidget, QApplication, QWidget, QVBoxLayout, QMessageBox
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
 from ui.boxes_panel.boxes_window import BoxesWindow
-from ui.words_panel.words_window import WordsWindow
-from ui.calendar_panel.calendar_window import CalendarWindow
 from core.database import Database
+from core.startup_trace import get_startup_trace, FIRST_PAINT
 from ui.words_panel.detail_window.box_detail_controller import get_controller
 from three_buttons import ThreeButtons
-from auto_updater import Updater  # 📌 Bunu en üste ekle!
+from ui.refresh_scheduler import get_refresh_scheduler, RefreshKind
+
+# WordsWindow, CalendarWindow ve Updater (requests) sekme / kontrol ilk
+# gerektiğinde import edilir - açılışta sadece Kutular sekmesi kurulur
+
+logger = logging.getLogger(__name__)
 
 class MainAppWindow(QTabWidget):
+    first_painted = pyqtSignal()
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Kelime Uygulaması")
         self.setMinimumSize(1400, 800)
         
-        self.db = Database()
-        self._initialize_boxes()
+        trace = get_startup_trace()
+        with trace.phase("db_open"):
+            self.db = Database()
+            self._initialize_boxes()
 
         # ❌ FlashCardsSyncManager TAMAMEN KALDIRILDI - senkronizasyon zaten CopySyncManager üzerinden çalışıyor
 
         # Önce tab'leri oluştur, SONRA overlay observer
-        self.boxes_tab_widget = self._create_boxes_tab()
+        with trace.phase("boxes_tab"):
+            self.boxes_tab_widget = self._create_boxes_tab()
 
         # Controller'ı başlat
         self.controller = get_controller(self.db)
         
-        self.words_window = WordsWindow()
-        self.calendar_window = CalendarWindow()
-
-        self.words_window.db = self.db
+        # Kelimeler ve Takvim sekmeleri ilk seçildiklerinde kurulur
+        self.words_window = None
+        self.calendar_window = None
+        self._lazy_tabs = {}  # sekme index'i -> (yer tutucu, kurucu)
+        self._first_paint_done = False
+        self._overlay_scheduled = False
         
         # Tab'leri ekle
         self.addTab(self.boxes_tab_widget, "Kutular")
-        self.addTab(self.words_window, "Kelimeler")
-        self.addTab(self.calendar_window, "Takvim")
+        self._add_lazy_tab("Kelimeler", self._build_words_window)
+        self._add_lazy_tab("Takvim", self._build_calendar_window)
         
         self.setStyleSheet("""
             QTabWidget::pane {
@@ -83,8 +96,52 @@ class MainAppWindow(QTabWidget):
         # Tab değişimi için gecikmeli bağlantı
         QTimer.singleShot(100, lambda: self._reset_tab_colors(0))
         
-        # Overlay sistemini geciktirilmiş başlat
-        QTimer.singleShot(500, self._initialize_overlay_system)
+        # Overlay sistemi ilk çizimden sonra bir kez başlatılır (_on_first_paint)
+
+    def _add_lazy_tab(self, title, builder):
+        """Boş yer tutucuyla sekme ekle; içerik ilk seçildiğinde kurulur"""
+        placeholder = QWidget()
+        layout = QVBoxLayout(placeholder)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+        
+        index = self.addTab(placeholder, title)
+        self._lazy_tabs[index] = (placeholder, builder)
+
+    def _ensure_tab(self, index):
+        """Sekme henüz kurulmadıysa şimdi kur"""
+        entry = self._lazy_tabs.pop(index, None)
+        if entry is None:
+            return
+        
+        placeholder, builder = entry
+        started = time.perf_counter()
+        placeholder.layout().addWidget(builder())
+        logger.info("⏱️ %s sekmesi %.0f ms'de kuruldu", self.tabText(index),
+                    (time.perf_counter() - started) * 1000)
+
+    def _build_words_window(self):
+        from ui.words_panel.words_window import WordsWindow
+        
+        self.words_window = WordsWindow()
+        self.words_window.db = self.db
+        
+        if hasattr(self.words_window, 'buttons') and hasattr(self.words_window.buttons, 'switch_to_boxes_tab'):
+            self.words_window.buttons.switch_to_boxes_tab.connect(self.switch_to_boxes_tab)
+        
+        if hasattr(self.words_window, 'slide_to_boxes_requested'):
+            self.words_window.slide_to_boxes_requested.connect(self.switch_to_boxes_tab)
+        
+        if hasattr(self.words_window, 'transfer_requested'):
+            self.words_window.transfer_requested.connect(self._on_transfer_completed)
+        
+        return self.words_window
+
+    def _build_calendar_window(self):
+        from ui.calendar_panel.calendar_window import CalendarWindow
+        
+        self.calendar_window = CalendarWindow(db=self.db)
+        return self.calendar_window
 
     def _create_boxes_tab(self):
         """Kutular sekmesini oluştur"""
@@ -115,36 +172,18 @@ class MainAppWindow(QTabWidget):
         return tab_widget
 
     def _initialize_boxes(self):
-        """Varsayılan kutuları oluştur"""
-        cursor = self.db.conn.cursor()
-        default_boxes = [
-            ("Her gün", 1),
-            ("İki günde bir", 2),
-            ("Dört günde bir", 3),
-            ("Dokuz günde bir", 4),
-            ("On dört günde bir", 5)
-        ]
-        
-        for box_title, order in default_boxes:
-            cursor.execute("SELECT id FROM boxes WHERE title = ?", (box_title,))
-            if not cursor.fetchone():
-                self.db.add_box(box_title)
+        """Varsayılan (ezber) kutuları oluştur - kutu dizininden bakılır, sorgu yok"""
+        self.db.ensure_memory_boxes()
 
     def _connect_signals(self):
         """Sinyal bağlantılarını kur"""
         self.currentChanged.connect(self._on_tab_changed)
-        
-        if hasattr(self.words_window, 'buttons') and hasattr(self.words_window.buttons, 'switch_to_boxes_tab'):
-            self.words_window.buttons.switch_to_boxes_tab.connect(self.switch_to_boxes_tab)
-        
-        if hasattr(self.words_window, 'slide_to_boxes_requested'):
-            self.words_window.slide_to_boxes_requested.connect(self.switch_to_boxes_tab)
-        
-        if hasattr(self.words_window, 'transfer_requested'):
-            self.words_window.transfer_requested.connect(self._on_transfer_completed)
+        # Kelimeler sekmesinin sinyalleri sekme kurulurken bağlanır (_build_words_window)
 
     def _on_tab_changed(self, index):
         """Sekme değiştiğinde detail window'ları yönet"""
+        self._ensure_tab(index)
+        
         try:
             from ui.words_panel.detail_window.box_detail_window import BoxDetailWindow
             
@@ -161,13 +200,22 @@ class MainAppWindow(QTabWidget):
         except Exception:
             pass
         
-        QTimer.singleShot(200, self._refresh_overlays_for_tab)
+        get_refresh_scheduler().mark_dirty(RefreshKind.OVERLAYS, None, self._refresh_all_overlays)
 
     def check_updates(self):
-        """Uygulama açılırken güncelleme kontrolü yap"""
+        """Uygulama açılırken güncelleme kontrolü yap - arka planda, açılış ağı beklemez"""
         try:
-            updater = Updater()
-            sonuc = updater.check_for_updates(self)
+            from auto_updater import Updater
+            
+            self._updater = Updater()
+            self._updater.check_for_updates_async(self._on_update_check_result)
+        except Exception as hata:
+            logger.debug("Güncelleme hatası: %s", hata)
+
+    def _on_update_check_result(self, sonuc):
+        """Arka plandaki kontrol bitti (GUI thread'i)"""
+        try:
+            updater = self._updater
             
             if sonuc.get('update_available'):
                 msg = QMessageBox()
@@ -210,29 +258,28 @@ class MainAppWindow(QTabWidget):
                 msg.button(QMessageBox.StandardButton.No).setText("❌ Hayır")
                 
                 if msg.exec() == QMessageBox.StandardButton.Yes:
-                    updater.install_update(sonuc['download_url'], self)
+                    updater.install_update(
+                        sonuc['download_url'], self,
+                        manifest_url=sonuc.get('manifest_url'),
+                        version=sonuc.get('latest_version')
+                    )
                     
         except Exception as hata:
-            print(f"Güncelleme hatası: {hata}")
-
-    def _refresh_overlays_for_tab(self):
-        """Sekme değiştiğinde overlay'ları güncelle"""
-        if hasattr(self, 'overlay_observer') and self.overlay_observer:
-            self.overlay_observer._batch_update_overlays()
+            logger.debug("Güncelleme hatası: %s", hata)
 
     def _on_transfer_completed(self, boxes):
         """Transfer tamamlandığında kutuları güncelle"""
         if hasattr(self.boxes_window, 'update_all_counts'):
             self.boxes_window.update_all_counts()
         
-        QTimer.singleShot(300, self._refresh_all_overlays)
+        get_refresh_scheduler().mark_dirty(RefreshKind.OVERLAYS, None, self._refresh_all_overlays)
 
     def switch_to_boxes_tab(self):
         """Kutular sekmesine geç"""
         self.setCurrentIndex(0)
         self._update_boxes()
         
-        QTimer.singleShot(100, self._refresh_all_overlays)
+        get_refresh_scheduler().mark_dirty(RefreshKind.OVERLAYS, None, self._refresh_all_overlays)
 
     def _update_boxes(self):
         """Kutuları güncelle"""
@@ -253,8 +300,25 @@ class MainAppWindow(QTabWidget):
         super().showEvent(event)
         if hasattr(self.boxes_window, 'update_all_counts'):
             self.boxes_window.update_all_counts()
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self._first_paint_done:
+            self._first_paint_done = True
+            # Bu çizim turu bitince
+            QTimer.singleShot(0, self._on_first_paint)
+
+    def _on_first_paint(self):
+        """İlk kare ekranda: açılış izini kapat, ertelenen işleri başlat"""
+        trace = get_startup_trace()
+        trace.mark(FIRST_PAINT)
+        trace.report()
+        
+        if not self._overlay_scheduled:
+            self._overlay_scheduled = True
+            QTimer.singleShot(500, self._initialize_overlay_system)
         
-        QTimer.singleShot(800, self._initialize_overlay_system)
+        self.first_painted.emit()
 
     def _initialize_overlay_system(self):
         """Overlay sistemini başlat"""
@@ -1,8 +1,12 @@
 # opening_window.py - GÜNCELLENMİŞ
 import sys
 import os
+
+# Açılış izi ilk iş - süreler bu import'tan itibaren ölçülür
+from core.startup_trace import get_startup_trace
+
 from PyQt6.QtWidgets import QApplication, QWidget, QVBoxLayout, QLabel, QPushButton
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QFont
 
 # Root path
@@ -11,8 +15,12 @@ sys.path.insert(0, ROOT)
 sys.path.insert(0, os.path.join(ROOT, "core"))
 sys.path.insert(0, os.path.join(ROOT, "ui"))
 
-# Import main modules
-from main_app_window import create_main_app_window
+
+def _import_main_app():
+    """Ana pencere modülleri (ağır) - açılış penceresi göründükten sonra yüklenir"""
+    with get_startup_trace().phase("imports"):
+        from main_app_window import create_main_app_window
+    return create_main_app_window
 
 
 # ====================================================
@@ -36,6 +44,9 @@ class OpeningWindow(QWidget):
         
         self.setup_ui()
         self.btn_english.clicked.connect(self.open_main_app)
+        
+        # Kullanıcı dil seçerken ana pencere modüllerini önceden yükle
+        QTimer.singleShot(0, _import_main_app)
 
     def setup_ui(self):
         layout = QVBoxLayout(self)
@@ -95,7 +106,11 @@ class OpeningWindow(QWidget):
         self.btn_english.setText("Açılıyor...")
         
         # Ana pencereyi oluştur ve göster
-        self.main_window = create_main_app_window()
+        trace = get_startup_trace()
+        trace.mark("open_clicked")
+        create_main_app_window = _import_main_app()
+        with trace.phase("main_window"):
+            self.main_window = create_main_app_window()
         
         # Ana pencereyi ekranın ortasına yerleştir
         screen = QApplication.primaryScreen().geometry()
@@ -113,6 +128,10 @@ class OpeningWindow(QWidget):
 # ANA UYGULAMA BAŞLATICI
 # ====================================================
 def main():
+    # Log ayarı ilk iş - modüllerin logger'ları kök handler'ları kullanır
+    from core.app_logging import setup_logging
+    setup_logging()
+
     app = QApplication(sys.argv)
     
     # Uygulama stilini ayarla
@@ -155,6 +174,9 @@ def main():
         }
     """)
     
+    if "--startup-check" in sys.argv:
+        sys.exit(run_startup_check(app))
+    
     # Açılış penceresini göster
     win = OpeningWindow()
     win.show()
@@ -162,5 +184,22 @@ def main():
     sys.exit(app.exec())
 
 
+def run_startup_check(app):
+    """
+    Açılış gerileme kontrolü: ana pencereyi doğrudan aç, ilk çizimde çık.
+    İlk çizim bütçeyi aşarsa 1 döner (bkz. core/startup_trace.py).
+    """
+    trace = get_startup_trace()
+    create_main_app_window = _import_main_app()
+    with trace.phase("main_window"):
+        window = create_main_app_window()
+    
+    window.first_painted.connect(lambda: app.exit(0 if trace.check_budget() else 1))
+    # İlk çizim hiç gelmezse takılıp kalma
+    QTimer.singleShot(60000, lambda: app.exit(1))
+    window.show()
+    return app.exec()
+
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,70 @@
+# file: ui/animation_clock.py
+import logging
+import weakref
+from PyQt6.QtCore import QObject, QTimer
+
+logger = logging.getLogger(__name__)
+
+
+class AnimationClock(QObject):
+    """
+    Tüm hover/fade animasyonları için tek ortak saat.
+    Widget'lar geçiş başladığında kendi adım fonksiyonlarını kaydeder; adım
+    fonksiyonu False döndürünce (hedefe ulaşıldı) kayıt silinir. Kayıt
+    kalmayınca timer durur - boşta bekleyen pencere hiç uyanmaz.
+    """
+
+    FRAME_INTERVAL = 16  # ~60 FPS
+
+    def __init__(self):
+        super().__init__()
+        self._steps = {}  # (id(obj), fonksiyon adı) -> WeakMethod
+        self.timer = QTimer(self)
+        self.timer.setInterval(self.FRAME_INTERVAL)
+        self.timer.timeout.connect(self._tick)
+
+    def request(self, step):
+        """Bağlı metodu (örn. self.animate_step) animasyon bitene kadar çalıştır"""
+        key = (id(step.__self__), step.__func__.__name__)
+        if key not in self._steps:
+            self._steps[key] = weakref.WeakMethod(step)
+        if not self.timer.isActive():
+            self.timer.start()
+
+    def cancel(self, step):
+        self._steps.pop((id(step.__self__), step.__func__.__name__), None)
+        if not self._steps:
+            self.timer.stop()
+
+    def is_running(self):
+        return self.timer.isActive()
+
+    def _tick(self):
+        for key, ref in list(self._steps.items()):
+            step = ref()
+            keep = False
+            if step is not None:
+                try:
+                    keep = bool(step())
+                except RuntimeError:
+                    # Widget C++ tarafında silinmiş
+                    keep = False
+                except Exception as e:
+                    logger.error("❌ [AnimationClock] Adım hatası: %s", e)
+                    keep = False
+            if not keep:
+                self._steps.pop(key, None)
+
+        if not self._steps:
+            self.timer.stop()
+
+
+# Global clock instance
+_global_clock = None
+
+def get_animation_clock():
+    """Global animasyon saatini getir"""
+    global _global_clock
+    if _global_clock is None:
+        _global_clock = AnimationClock()
+    return _global_clock
@@ -1,7 +1,8 @@
 # boxes_window.py - DÜZELTİLMİŞ VERSİYON
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QSizePolicy)
-from PyQt6.QtCore import Qt, QTimer, QPoint
+from PyQt6.QtCore import Qt, QTimer, QPoint, QEvent
 from .scrollable_boxes_area import ScrollableBoxesArea
+from ui.refresh_scheduler import get_refresh_scheduler, RefreshKind
 
 
 class BoxesWindow(QWidget):
@@ -14,6 +15,12 @@ class BoxesWindow(QWidget):
         self.card_original_boxes = {}
         self.drawn_cards = {}
         
+        # Kutu başına kart konumu önbelleği: box_id -> QPoint (card_layer koordinatı)
+        # Sadece kutunun geometrisi değişince geçersiz olur, scroll'da hesaplanmaz
+        self._card_anchor_cache = {}
+        # Geometri değişimi izlenen widget -> etkilediği kutu ID'leri
+        self._geometry_watch = {}
+        
         # Otomatik scroll için değişkenler
         self.auto_scroll_timer = QTimer()
         self.auto_scroll_timer.timeout.connect(self._handle_auto_scroll)
@@ -24,17 +31,12 @@ class BoxesWindow(QWidget):
         self.bottom_scroll_zone = 100
         self.scroll_speed = 25
         
-        # Drag kontrolü için
-        self.drag_check_timer = QTimer()
-        self.drag_check_timer.timeout.connect(self._check_drag_status)
-        self.drag_check_timer.setInterval(100)
-        
         # Drag durumu
         self.is_drag_active = False
         # Sekme değişimi durumu
         self.is_tab_changed = False
-        # Timer'ların durumunu takip et
-        self.timers_active = False
+        # Drag sinyallerine bağlı mı
+        self.drag_signals_connected = False
 
         if self.db:
             self._ensure_waiting_area_table()
@@ -59,53 +61,66 @@ class BoxesWindow(QWidget):
         
         self._connect_waiting_area_signals()
         
-        self.scrollable_area.verticalScrollBar().valueChanged.connect(self._on_scroll_changed)
-        self.scroll_timer = QTimer()
-        self.scroll_timer.timeout.connect(self._update_all_card_positions)
-        self.scroll_timer.start(50)
+        # Çekilen kartlar kutularla birlikte scroll olan içerik widget'ında durur;
+        # scroll sırasında konum hesaplanmaz ve repaint zorlanmaz
+        self.card_layer = self.scrollable_area.content_widget
+        self.card_layer.installEventFilter(self)
         
-        # Timer'ları başlat
-        self._start_timers()
-    
-    def _start_timers(self):
-        """Timer'ları başlat"""
-        if not self.timers_active:
-            self.drag_check_timer.start()
-            self.timers_active = True
+        # Drag sinyallerine bağlan
+        self._connect_drag_signals()
     
-    def _stop_timers(self):
-        """Timer'ları durdur (sadece gerçek kapanma durumunda)"""
-        if self.timers_active:
-            if self.auto_scroll_timer.isActive():
-                self.auto_scroll_timer.stop()
-            if self.drag_check_timer.isActive():
-                self.drag_check_timer.stop()
-            self.timers_active = False
-    
-    def _check_drag_status(self):
-        """Drag durumunu periyodik olarak kontrol et"""
+    def _connect_drag_signals(self):
+        """DragDropManager sinyallerine bağlan (polling timer yok)"""
+        if self.drag_signals_connected:
+            return
+        
         try:
             from ui.boxes_panel.drag_drop_manager.base_manager import get_drag_drop_manager
             drag_manager = get_drag_drop_manager()
             
-            if drag_manager and hasattr(drag_manager, 'current_operation'):
-                if drag_manager.current_operation and drag_manager.current_operation.card_widget:
-                    if not self.is_drag_active:
-                        self.is_drag_active = True
-                        
-                        if not self.auto_scroll_timer.isActive():
-                            self.auto_scroll_timer.start()
-                    return
+            drag_manager.drag_started.connect(self._on_drag_started)
+            drag_manager.drag_finished.connect(self._on_drag_finished)
+            self.drag_signals_connected = True
             
-            if self.is_drag_active:
-                self.is_drag_active = False
-                
-                if self.auto_scroll_timer.isActive():
-                    self.auto_scroll_timer.stop()
-                    
+            # Bağlanmadan önce başlamış bir drag varsa yakala
+            if drag_manager.is_drag_active():
+                self._on_drag_started()
         except Exception:
             pass
     
+    def _disconnect_drag_signals(self):
+        """Sinyal bağlantılarını kes ve auto-scroll'u durdur (sadece gerçek kapanma durumunda)"""
+        if self.auto_scroll_timer.isActive():
+            self.auto_scroll_timer.stop()
+        
+        if not self.drag_signals_connected:
+            return
+        
+        try:
+            from ui.boxes_panel.drag_drop_manager.base_manager import get_drag_drop_manager
+            drag_manager = get_drag_drop_manager()
+            
+            drag_manager.drag_started.disconnect(self._on_drag_started)
+            drag_manager.drag_finished.disconnect(self._on_drag_finished)
+        except Exception:
+            pass
+        
+        self.drag_signals_connected = False
+    
+    def _on_drag_started(self):
+        """Drag başladı - auto-scroll sadece drag süresince çalışır"""
+        self.is_drag_active = True
+        
+        if not self.auto_scroll_timer.isActive():
+            self.auto_scroll_timer.start()
+    
+    def _on_drag_finished(self, success=False):
+        """Drag bitti - auto-scroll'u durdur"""
+        self.is_drag_active = False
+        
+        if self.auto_scroll_timer.isActive():
+            self.auto_scroll_timer.stop()
+    
     def _handle_auto_scroll(self):
         """Drag sırasında fare pozisyonuna göre otomatik scroll"""
         try:
@@ -134,14 +149,12 @@ class BoxesWindow(QWidget):
                 new_value = max(scroll_bar.minimum(), current_value - self.scroll_speed)
                 if new_value != current_value:
                     scroll_bar.setValue(new_value)
-                    self._update_all_card_positions()
             
             elif widget_pos.y() > self.height() - self.bottom_scroll_zone:
                 current_value = scroll_bar.value()
                 new_value = min(scroll_bar.maximum(), current_value + self.scroll_speed)
                 if new_value != current_value:
                     scroll_bar.setValue(new_value)
-                    self._update_all_card_positions()
                     
         except Exception:
             pass
@@ -179,17 +192,13 @@ class BoxesWindow(QWidget):
             if waiting_areas:
                 pass
 
-    def _on_scroll_changed(self, value):
-        """Scroll değiştiğinde kart pozisyonlarını güncelle"""
-        self._update_all_card_positions()
-        
     def showEvent(self, event):
         """Widget gösterildiğinde"""
         super().showEvent(event)
         self._restore_drawn_cards_from_db()
         self._update_all_card_positions()
-        # Sekme tekrar aktif olduğunda timer'ları başlat
-        self._start_timers()
+        # Sekme tekrar aktif olduğunda drag sinyallerine bağlı olduğundan emin ol
+        self._connect_drag_signals()
         self.is_tab_changed = False
     
     def hideEvent(self, event):
@@ -201,16 +210,69 @@ class BoxesWindow(QWidget):
         if self.isVisible():
             self._cleanup_only_invalid_widgets()
         
-        # Timer'ları durdurma - sadece gizleniyoruz, kapanmıyoruz
-        # Eğer drag işlemi devam ediyorsa timer'lar çalışmaya devam etmeli
+        # Sinyal bağlantılarını kesme - sadece gizleniyoruz, kapanmıyoruz
+        # Eğer drag işlemi devam ediyorsa auto-scroll çalışmaya devam etmeli
         self.is_tab_changed = True
         
         super().hideEvent(event)
     
-    def resizeEvent(self, event):
-        """Widget yeniden boyutlandırıldığında"""
-        super().resizeEvent(event)
-        QTimer.singleShot(100, self._update_all_card_positions)
+    def eventFilter(self, obj, event):
+        """Kutu veya içerik geometrisi değişince kart konum önbelleğini geçersiz kıl"""
+        event_type = event.type()
+        if event_type in (QEvent.Type.Move, QEvent.Type.Resize):
+            if obj is self.card_layer:
+                if event_type == QEvent.Type.Resize:
+                    self._invalidate_card_anchors()
+            else:
+                box_ids = self._geometry_watch.get(obj)
+                if box_ids:
+                    self._invalidate_card_anchors(box_ids)
+        
+        return super().eventFilter(obj, event)
+    
+    def _watch_box_geometry(self, memory_box):
+        """Kutunun ve card_layer'a kadar olan ebeveynlerinin geometrisini izle"""
+        widget = memory_box
+        while widget is not None and widget is not self.card_layer:
+            box_ids = self._geometry_watch.get(widget)
+            if box_ids is None:
+                box_ids = set()
+                self._geometry_watch[widget] = box_ids
+                widget.installEventFilter(self)
+                # Kutu yeniden kurulunca silinen widget'lar haritada kalmasın
+                widget.destroyed.connect(lambda _=None, w=widget: self._geometry_watch.pop(w, None))
+            box_ids.add(memory_box.box_id)
+            widget = widget.parentWidget()
+    
+    def _invalidate_card_anchors(self, box_ids=None):
+        """Önbelleği temizle ve etkilenen kartları yeniden konumlandır"""
+        if box_ids is None:
+            self._card_anchor_cache.clear()
+        else:
+            for box_id in box_ids:
+                self._card_anchor_cache.pop(box_id, None)
+        
+        for card_id, card_info in list(self.drawn_cards.items()):
+            memory_box = card_info['box']
+            if box_ids is None or getattr(memory_box, 'box_id', None) in box_ids:
+                self._update_card_position(card_id)
+    
+    def _get_card_anchor(self, memory_box):
+        """Kutunun altındaki kart konumunu önbellekten getir (gerekirse hesapla)"""
+        box_id = memory_box.box_id
+        anchor = self._card_anchor_cache.get(box_id)
+        if anchor is None:
+            box_pos = memory_box.mapTo(self.card_layer, QPoint(0, 0))
+            box_width = 300
+            box_height = 260
+            card_width = 260
+            
+            anchor = QPoint(
+                box_pos.x() + (box_width - card_width) // 2,
+                box_pos.y() + box_height + 30
+            )
+            self._card_anchor_cache[box_id] = anchor
+        return anchor
 
     def _ensure_waiting_area_table(self):
         """waiting_area_cards tablosunun var olduğundan emin ol"""
@@ -268,17 +330,17 @@ class BoxesWindow(QWidget):
             except Exception:
                 pass
         
-        if card_widget.parent() != self:
-            card_widget.setParent(self)
-        
-        card_widget.show()
+        if card_widget.parent() is not self.card_layer:
+            card_widget.setParent(self.card_layer)
         
         self.drawn_cards[card_id] = {
             'widget': card_widget,
             'box': memory_box
         }
         
+        self._watch_box_geometry(memory_box)
         self._update_card_position(card_id)
+        card_widget.show()
         card_widget.raise_()
         
         for child in card_widget.findChildren(QWidget):
@@ -387,7 +449,7 @@ class BoxesWindow(QWidget):
                 except Exception:
                     continue
             
-            QTimer.singleShot(100, self.update_all_counts)
+            get_refresh_scheduler().mark_dirty(RefreshKind.ALL_BOX_COUNTS, self, self.update_all_counts)
             
         except Exception:
             pass
@@ -418,84 +480,31 @@ class BoxesWindow(QWidget):
                 box_row.memory_box.update_card_count()
     
     def _update_all_card_positions(self):
-        """Tüm kartların pozisyonlarını güncelle - GÜVENLİ VERSİYON"""
-        invalid_cards = []
-        for card_id in list(self.drawn_cards.keys()):
-            card_info = self.drawn_cards[card_id]
-            card_widget = card_info['widget']
-            
-            try:
-                if not card_widget or not hasattr(card_widget, 'isVisible'):
-                    invalid_cards.append(card_id)
-            except RuntimeError:
-                invalid_cards.append(card_id)
-        
-        for card_id in invalid_cards:
-            if card_id in self.drawn_cards:
-                del self.drawn_cards[card_id]
-        
+        """Tüm kartların pozisyonlarını güncelle - önbellekteki konumlarla"""
         for card_id in list(self.drawn_cards.keys()):
             self._update_card_position(card_id)
     
     def _update_card_position(self, card_id):
-        """Tek bir kartın pozisyonunu güncelle"""
-        if card_id not in self.drawn_cards:
+        """Tek bir kartı kutusunun önbellekteki konumuna yerleştir"""
+        card_info = self.drawn_cards.get(card_id)
+        if not card_info:
             return
         
-        card_info = self.drawn_cards[card_id]
         card_widget = card_info['widget']
         
         try:
             if not card_widget or not hasattr(card_widget, 'isVisible'):
                 del self.drawn_cards[card_id]
                 return
-        except RuntimeError:
-            if card_id in self.drawn_cards:
-                del self.drawn_cards[card_id]
-            return
-        
-        try:
-            memory_box = card_info['box']
-            box_pos = memory_box.mapTo(self, QPoint(0, 0))
-            box_width = 300
-            box_height = 260
-            card_width = 260
-            card_height = 120
-            
-            card_x = box_pos.x() + (box_width - card_width) // 2
-            card_y = box_pos.y() + box_height + 30
-            
-            card_widget.move(card_x, card_y)
-            card_widget.raise_()
             
-            card_widget.update()
-            card_widget.repaint()
+            anchor = self._get_card_anchor(card_info['box'])
+            if card_widget.pos() != anchor:
+                card_widget.move(anchor)
             
         except RuntimeError:
-            if card_id in self.drawn_cards:
-                del self.drawn_cards[card_id]
+            self.drawn_cards.pop(card_id, None)
         except Exception:
-            try:
-                memory_box = card_info['box']
-                box_global_pos = memory_box.mapToGlobal(QPoint(0, 0))
-                self_global_pos = self.mapToGlobal(QPoint(0, 0))
-                
-                box_in_self_x = box_global_pos.x() - self_global_pos.x()
-                box_in_self_y = box_global_pos.y() - self_global_pos.y()
-                
-                card_width = 260
-                box_width = 300
-                box_height = 260
-                
-                card_x = box_in_self_x + (box_width - card_width) // 2
-                card_y = box_in_self_y + box_height + 30
-                
-                card_widget.move(card_x, card_y)
-                card_widget.raise_()
-                
-            except Exception:
-                if card_id in self.drawn_cards:
-                    del self.drawn_cards[card_id]
+            pass
     
     def remove_drawn_card(self, card_id):
         """Çekilmiş kartı sistemden HEMEN kaldır"""
@@ -521,7 +530,17 @@ class BoxesWindow(QWidget):
     
     def _on_card_dropped_to_waiting(self, word_id, target_box_id):
         """Kart bekleme alanına bırakıldığında - DÜZGÜN TEMİZLİK YAP"""
-        if self.db:
+        operation = None
+        try:
+            from ui.boxes_panel.drag_drop_manager.base_manager import get_drag_drop_manager
+            operation = get_drag_drop_manager().find_operation(word_id)
+        except Exception:
+            operation = None
+        
+        if operation is not None and operation.card_record is not None:
+            # Kartın sürükleme başındaki kutusu payload'da
+            self.card_original_boxes[word_id] = operation.box_id
+        elif self.db:
             try:
                 cursor = self.db.conn.cursor()
                 cursor.execute("SELECT box FROM words WHERE id = ?", (word_id,))
@@ -695,11 +714,8 @@ class BoxesWindow(QWidget):
         """Pencere kapanırken - Gerçek temizlik"""
         self._save_drawn_cards_to_db()
         
-        # Bu sefer gerçekten kapanıyoruz, timer'ları durdur
-        self._stop_timers()
-        
-        if hasattr(self, 'scroll_timer'):
-            self.scroll_timer.stop()
+        # Bu sefer gerçekten kapanıyoruz, drag sinyallerinden ayrıl
+        self._disconnect_drag_signals()
         
         super().closeEvent(event)
 
@@ -14,6 +14,7 @@ from PyQt6.QtCore import QRect, QEasingCurve, QPropertyAnimation, QParallelAnima
 from PyQt6.QtWidgets import QGraphicsOpacityEffect, QApplication
 
 from ui.words_panel.button_and_cards.bubble.bubble_text import BubbleText
+from ui.words_panel.button_and_cards.bubble.bubble_text_metrics import BubbleTextMetrics
 from ui.words_panel.button_and_cards.bubble.bubble_opening import (
     BubbleStateManager, place_bubble_next_to_card_fast
 )
@@ -32,6 +33,7 @@ class CopyNoteBubble(QWidget):
     SCREEN_PAD = 24
     CONTENT_PAD_W = 48
     CONTENT_PAD_H = 48
+    RESIZE_FRAME_MS = 16
     
     _global_bubble_instances = {}
     
@@ -87,7 +89,13 @@ class CopyNoteBubble(QWidget):
         
         layout.addWidget(self.text)
         
-        self.text.document().contentsChanged.connect(self._auto_resize_to_text)
+        self._text_metrics = BubbleTextMetrics(self.text)
+        self._restore_focus_after_resize = False
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(self.RESIZE_FRAME_MS)
+        self._resize_timer.timeout.connect(self._auto_resize_to_text)
+        self.text.document().contentsChanged.connect(self._schedule_auto_resize)
         
         if self.card_id and not self._is_clone:
             self.__class__._global_bubble_instances[self.card_id] = self
@@ -151,23 +159,26 @@ class CopyNoteBubble(QWidget):
         except Exception:
             self.text.setHtml("<p></p>")
     
+    def _schedule_auto_resize(self):
+        if not self._resize_timer.isActive():
+            self._resize_timer.start()
+    
     def _auto_resize_to_text(self):
         try:
             if not hasattr(self, 'text'):
                 return
+
+            self._resize_timer.stop()
                 
             text_widget = self.text
             had_focus = text_widget.hasFocus()
 
-            fm = text_widget.fontMetrics()
-            plain = text_widget.document().toPlainText()
-            lines = plain.splitlines() or [""]
-
-            max_line_width = max(fm.horizontalAdvance(line) for line in lines)
+            # Sadece son ölçümden beri değişen bloklar yeniden ölçülür
+            max_line_width, line_count = self._text_metrics.content_size()
             content_w = max_line_width + self.CONTENT_PAD_W
 
-            line_height = fm.lineSpacing()
-            content_h = (len(lines) * line_height) + self.CONTENT_PAD_H
+            line_height = text_widget.fontMetrics().lineSpacing()
+            content_h = (line_count * line_height) + self.CONTENT_PAD_H
 
             target_w = max(self.MIN_W, content_w)
             target_h = max(self.MIN_H, content_h)
@@ -219,14 +230,18 @@ class CopyNoteBubble(QWidget):
 
             if target_w != cur_w or target_h != cur_h or x != geo.x() or y != geo.y():
                 self.setGeometry(x, y, target_w, target_h)
-                if had_focus:
-                    QTimer.singleShot(0, text_widget.setFocus)
-
-                QTimer.singleShot(0, self._snap_back_next_to_card)
+                self._restore_focus_after_resize = had_focus
+                QTimer.singleShot(0, self._after_auto_resize)
                 
         except Exception:
             pass
     
+    def _after_auto_resize(self):
+        if self._restore_focus_after_resize:
+            self._restore_focus_after_resize = False
+            self.text.setFocus()
+        self._snap_back_next_to_card()
+    
     def _snap_back_next_to_card(self):
         try:
             if self._animating:
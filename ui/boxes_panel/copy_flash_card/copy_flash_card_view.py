@@ -1,12 +1,14 @@
 from __future__ import annotations
+import logging
 import time
 import json
 from PyQt6.QtWidgets import QFrame, QPushButton, QWidget, QGraphicsOpacityEffect, QApplication
 from PyQt6.QtGui import QFont, QPainter, QColor, QLinearGradient, QDrag, QPixmap, QPainter
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QMimeData, QByteArray, QPoint
+from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot, QTimer, QMimeData, QByteArray, QPoint
 from .copy_drag_handle import CopyDragHandleIcon
 from .copy_dynamic_field import CopyDynamicField
 from .copy_dialogs import show_copy_delete_dialog
+from ui.card_store import get_card_store
 
 try:
     from ..drag_drop_manager.decorators import draggable_card
@@ -43,6 +45,8 @@ except ImportError:
             return cls
         return decorator
 
+logger = logging.getLogger(__name__)
+
 # Overlay observer import
 try:
     from ui.boxes_panel.overlay_observer import get_overlay_observer
@@ -116,6 +120,9 @@ class CopyFlashCardView(QFrame):
         
         self.sync_manager = None
         
+        # Aynı kopya kaydı başka bir tutucuda değişince (CardStore.update) alanları tazele
+        get_card_store().card_changed.connect(self._on_record_changed)
+        
         if data is None:
             self._create_field(True, "")
             self._create_field(False, "")
@@ -157,7 +164,10 @@ class CopyFlashCardView(QFrame):
             is_copy = getattr(model, "is_copy", True)
             self.original_card_id = getattr(model, "original_card_id", None)
         
-        self.data = model
+        # Kopya kartın kendi ID'si var; aynı kopyayı gösteren görünümler tek kaydı paylaşır
+        self.data = get_card_store().intern(
+            model, is_copy=is_copy, box_id=self.box_id, original_card_id=self.original_card_id
+        )
         self.card_id = card_id
         self.is_copy_card = is_copy
         
@@ -538,8 +548,9 @@ class CopyFlashCardView(QFrame):
             self.__class__._global_dragging_cards.add(self.card_id)
             self._drag_in_progress = True
             
-            pixmap = self.grab()
-            if pixmap.isNull():
+            from ..drag_drop_manager.drag_pixmap_cache import get_drag_pixmap_cache
+            pixmap = get_drag_pixmap_cache().pixmap_for(self, lambda widget: widget.grab())
+            if pixmap is None or pixmap.isNull():
                 self._cleanup_drag()
                 return
             
@@ -556,12 +567,14 @@ class CopyFlashCardView(QFrame):
             }
             
             # DEBUG: original_card_id kontrolü
-            print(f"🐉 DRAG BAŞLATILDI - Kart ID: {self.card_id}, Orijinal ID: {self.original_card_id}")
+            logger.debug("🐉 DRAG BAŞLATILDI - Kart ID: %s, Orijinal ID: %s", self.card_id, self.original_card_id)
             
             mime_data.setData(
                 "application/x-flashcard-operation",
                 QByteArray(json.dumps(drag_data).encode())
             )
+            # Bırakma hedefleri kartı bu metinden çözer (bkz. main_coordinator._parse_mime_data)
+            mime_data.setText(f"card:{self.card_id}")
             
             drag = QDrag(self)
             drag.setMimeData(mime_data)
@@ -585,7 +598,7 @@ class CopyFlashCardView(QFrame):
                 self.reset_drag_effect()
                     
         except Exception as e:
-            print(f"❌ Drag hatası: {e}")
+            logger.error("❌ Drag hatası: %s", e)
             self._cleanup_drag()
     
     def _cleanup_drag(self):
@@ -912,19 +925,46 @@ class CopyFlashCardView(QFrame):
             
             if hasattr(self, 'data') and self.data:
                 try:
-                    if isinstance(self.data, dict):
-                        if 'english' in updates:
-                            self.data['english'] = updates['english']
-                        if 'turkish' in updates:
-                            self.data['turkish'] = updates['turkish']
-                        if 'detail' in updates:
-                            self.data['detail'] = updates['detail']
+                    get_card_store().update(self.data, **{
+                        key: updates[key] for key in ('english', 'turkish', 'detail') if key in updates
+                    })
                 except Exception:
                     pass
             
         except Exception:
             pass
     
+    @pyqtSlot(object)
+    def _on_record_changed(self, record):
+        """Paylaşılan kayıt değişti - kimlik, kutu ve alan metinlerini kayıttan al"""
+        if record is not self.data:
+            return
+        
+        self.card_id = record.id
+        self.box_id = record.box_id
+        self.bucket_id = record.bucket or 0
+        if record.original_card_id is not None:
+            self.original_card_id = record.original_card_id
+        
+        front_texts, back_texts = record.field_texts()
+        changed = False
+        for fields, is_front, texts in ((self.front_fields, True, front_texts), (self.back_fields, False, back_texts)):
+            texts = [text.strip() for text in texts]
+            if [field.text() for field in fields] == texts:
+                continue
+            changed = True
+            for field in fields[len(texts):]:
+                field.hide()
+                field.deleteLater()
+            del fields[len(texts):]
+            for field, text in zip(fields, texts):
+                field.setText(text)
+            for text in texts[len(fields):]:
+                self._create_field(is_front, text)
+        
+        if changed:
+            self._relayout()
+    
     def _on_bubble_content_updated(self, original_id, html_content):
         """Orijinal kart bubble'ı güncellendiğinde çağrılır"""
         try:
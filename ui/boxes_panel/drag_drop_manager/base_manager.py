@@ -30,10 +30,20 @@ class DragSource(Enum):
     BOX_DETAIL = "box_detail"
 
 
+# Sürüklemenin MIME formatı - içinde sadece operation_id taşınır
+DRAG_MIME_FORMAT = "application/x-flashcard-operation"
+
+
 class DragOperation:
-    """Tek bir drag-drop operasyonunu temsil eden sınıf"""
+    """
+    Tek bir drag-drop operasyonunu temsil eden sınıf.
+    Süreç içi payload'dır: MIME verisi sadece operation_id taşır, drop
+    hedefleri kartın kaydını ve kaynak bilgisini buradan okur (JSON çözme
+    ya da veritabanı sorgusu olmadan).
+    """
     
     def __init__(self):
+        self.operation_id: Optional[int] = None
         self.card_id: Optional[int] = None
         self.card_type: CardType = CardType.UNKNOWN
         self.source_type: Optional[DragSource] = None
@@ -46,10 +56,16 @@ class DragOperation:
         self.start_time: int = 0
         self.end_time: int = 0
         self.original_box_id: Optional[int] = None
+        # Sürükleme başladığı andaki kart bağlamı
+        self.card_record = None  # ui.card_store.CardRecord
+        self.box_id: Optional[int] = None
+        self.is_copy: bool = False
+        self.original_card_id: Optional[int] = None
         
     def to_dict(self) -> Dict:
         """Dictionary'e çevir"""
         return {
+            'operation_id': self.operation_id,
             'card_id': self.card_id,
             'card_type': self.card_type.value,
             'source_type': self.source_type.value if self.source_type else None,
@@ -71,9 +87,17 @@ def get_drag_drop_manager():
 
 
 def create_drag_pixmap(card_widget) -> QPixmap:
-    """Drag için görsel oluştur"""
+    """Drag için görsel (kart başına önbellekli, bkz. drag_pixmap_cache)"""
+    from .drag_pixmap_cache import get_drag_pixmap_cache
+    return get_drag_pixmap_cache().pixmap_for(card_widget, render_drag_pixmap)
+
+
+def render_drag_pixmap(card_widget) -> QPixmap:
+    """Kart widget ağacını ekranın device pixel ratio'sunda pixmap'e çiz"""
     size = card_widget.size()
-    pixmap = QPixmap(size)
+    dpr = card_widget.devicePixelRatioF()
+    pixmap = QPixmap(size * dpr)
+    pixmap.setDevicePixelRatio(dpr)
     pixmap.fill(Qt.GlobalColor.transparent)
     
     painter = QPainter(pixmap)
@@ -104,6 +128,8 @@ def apply_drag_effect(card_widget):
         
         if hasattr(card_widget, 'setStyleSheet'):
             original_style = card_widget.styleSheet() or ""
+            # Kaldırırken aynen geri konur; stil birikirse görsel önbelleği hep ıskalar
+            card_widget._pre_drag_style = original_style
             card_widget.setStyleSheet(f"""
                 {original_style}
                 QFrame {{
@@ -124,14 +150,10 @@ def remove_drag_effect(card_widget):
         card_widget.setGraphicsEffect(None)
         
         if hasattr(card_widget, 'setStyleSheet'):
-            current_style = card_widget.styleSheet() or ""
-            lines = current_style.split('\n')
-            cleaned_lines = []
-            for line in lines:
-                if 'opacity:' not in line and 'background-color:' not in line:
-                    cleaned_lines.append(line)
-            cleaned_style = '\n'.join(cleaned_lines)
-            card_widget.setStyleSheet(cleaned_style)
+            original_style = getattr(card_widget, '_pre_drag_style', None)
+            if original_style is not None:
+                card_widget._pre_drag_style = None
+                card_widget.setStyleSheet(original_style)
             
             card_widget.setWindowOpacity(1.0)
     except Exception:
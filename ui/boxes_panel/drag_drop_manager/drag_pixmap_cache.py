@@ -0,0 +1,157 @@
+"""
+SÜRÜKLEME GÖRSELİ ÖNBELLEĞİ
+
+Her sürüklemenin başında kartın tüm widget ağacını yeni bir pixmap'e
+çizmek yerine, kart başına son görsel QPixmapCache'te tutulur.
+
+Anahtar: kart ID + içerik revizyonu + device pixel ratio + görünüm imzası
+(görünen yüz, alan metinleri, boyut, stil). İçerik revizyonu kart
+deposundaki değişiklik / silme sinyalleriyle artar; eski görsel hemen atılır.
+
+Önbelleğin kendine ait boyut bütçesi vardır (KB), en eski kullanılan kart
+önce çıkar:
+    KELIME_DRAG_PIXMAP_CACHE_KB  (varsayılan 8192)
+"""
+import logging
+import os
+from collections import OrderedDict
+
+from PyQt6.QtGui import QPixmapCache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUDGET_KB = 8192
+KEY_PREFIX = "kelime-drag"
+
+
+def _view_signature(card_widget):
+    """Kartın görünüşünü belirleyen, ucuz okunan durum"""
+    texts = []
+    for field_list in ('front_fields', 'back_fields'):
+        for field in getattr(card_widget, field_list, None) or []:
+            try:
+                texts.append(field.text())
+            except Exception:
+                pass
+
+    size = card_widget.size()
+    return hash((
+        getattr(card_widget, 'front', True),
+        tuple(texts),
+        size.width(), size.height(),
+        card_widget.styleSheet(),
+    ))
+
+
+def _pixmap_kb(pixmap):
+    return max(1, pixmap.width() * pixmap.height() * pixmap.depth() // 8 // 1024)
+
+
+class DragPixmapCache:
+    """card_id -> QPixmapCache anahtarı; bütçe aşılınca LRU ile atılır"""
+
+    def __init__(self, budget_kb=None):
+        if budget_kb is None:
+            try:
+                budget_kb = max(0, int(os.environ.get("KELIME_DRAG_PIXMAP_CACHE_KB", DEFAULT_BUDGET_KB)))
+            except (TypeError, ValueError):
+                budget_kb = DEFAULT_BUDGET_KB
+        self.budget_kb = budget_kb
+
+        self._entries = OrderedDict()  # card_id -> (anahtar, KB)
+        self._revisions = {}           # card_id -> içerik revizyonu
+        self._store_connected = False
+        self.hits = 0
+        self.misses = 0
+
+    def _connect_store(self):
+        if self._store_connected:
+            return
+        self._store_connected = True
+        try:
+            from ui.card_store import get_card_store
+            store = get_card_store()
+            store.card_changed.connect(self._on_card_changed)
+            store.card_removed.connect(self.invalidate)
+        except Exception as e:
+            logger.debug("⚠️ [DragPixmapCache] Kart deposuna bağlanılamadı: %s", e)
+
+    def _on_card_changed(self, record):
+        self.invalidate(getattr(record, 'id', None))
+
+    def invalidate(self, card_id):
+        """Kartın metni / stili değişti - önbellekteki görseli at"""
+        if card_id is None:
+            return
+        self._revisions[card_id] = self._revisions.get(card_id, 0) + 1
+        entry = self._entries.pop(card_id, None)
+        if entry is not None:
+            QPixmapCache.remove(entry[0])
+
+    def pixmap_for(self, card_widget, render):
+        """Kartın sürükleme görseli: önbellekte varsa o, yoksa render(card_widget)"""
+        card_id = getattr(card_widget, 'card_id', None)
+        if card_id is None or self.budget_kb <= 0:
+            return render(card_widget)
+
+        self._connect_store()
+
+        key = "%s:%s:%d:%g:%x" % (
+            KEY_PREFIX, card_id, self._revisions.get(card_id, 0),
+            card_widget.devicePixelRatioF(), _view_signature(card_widget) & 0xffffffffffffffff,
+        )
+
+        entry = self._entries.get(card_id)
+        if entry is not None and entry[0] == key:
+            pixmap = QPixmapCache.find(key)
+            if pixmap is not None and not pixmap.isNull():
+                self._entries.move_to_end(card_id)
+                self.hits += 1
+                return pixmap
+
+        self.misses += 1
+        pixmap = render(card_widget)
+        if pixmap is None or pixmap.isNull():
+            return pixmap
+
+        # Aynı kartın eski görünümü artık geçersiz
+        if entry is not None:
+            QPixmapCache.remove(entry[0])
+            self._entries.pop(card_id, None)
+
+        size_kb = _pixmap_kb(pixmap)
+        if size_kb <= self.budget_kb:
+            # Genel QPixmapCache sınırı bütçemizden küçükse büyüt
+            if QPixmapCache.cacheLimit() < self.budget_kb * 2:
+                QPixmapCache.setCacheLimit(self.budget_kb * 2)
+            if QPixmapCache.insert(key, pixmap):
+                self._entries[card_id] = (key, size_kb)
+                self._evict()
+
+        return pixmap
+
+    def _evict(self):
+        total = sum(size_kb for _, size_kb in self._entries.values())
+        while self._entries and total > self.budget_kb:
+            _, (key, size_kb) = self._entries.popitem(last=False)
+            QPixmapCache.remove(key)
+            total -= size_kb
+
+    def get_stats(self):
+        return {
+            'entries': len(self._entries),
+            'kb': sum(size_kb for _, size_kb in self._entries.values()),
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+
+
+# Global cache instance
+_global_pixmap_cache = None
+
+def get_drag_pixmap_cache():
+    """Global sürükleme görseli önbelleğini getir"""
+    global _global_pixmap_cache
+    if _global_pixmap_cache is None:
+        _global_pixmap_cache = DragPixmapCache()
+    return _global_pixmap_cache
@@ -1,22 +1,31 @@
 """ANA DRAG-DROP KOORDİNATÖRÜ"""
-from PyQt6.QtCore import Qt, QMimeData, QByteArray, QTimer, QPoint
-import json
+from PyQt6.QtCore import Qt, QObject, QMimeData, QByteArray, QTimer, QPoint, pyqtSignal
+import itertools
+from collections import OrderedDict
 from typing import Optional, Dict, Any, Callable
 from PyQt6.QtGui import QDrag
 
 from .base_manager import (
-    CardType, DropTarget, DragSource, DragOperation,
+    CardType, DropTarget, DragSource, DragOperation, DRAG_MIME_FORMAT,
     create_drag_pixmap, apply_drag_effect, remove_drag_effect
 )
 from .waiting_area_manager import WaitingAreaManager
 from .memory_box_manager import MemoryBoxManager
 
 
-class DragDropManager:
+class DragDropManager(QObject):
     """ANA KOORDİNATÖR - Eski DragDropManager ile aynı interface"""
     
+    # Drag durumu sinyalleri - dinleyiciler polling yerine bunlara bağlanır
+    drag_started = pyqtSignal()
+    drag_finished = pyqtSignal(bool)  # success
+    
     _instance = None
     
+    # Biten operasyonlar da bir süre çözülebilir kalır: drop hedefleri
+    # process_drop'tan sonra da payload'a bakıyor
+    RECENT_OPERATIONS = 8
+    
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
@@ -26,14 +35,22 @@ class DragDropManager:
     def __init__(self):
         if self._initialized:
             return
-            
+        
+        super().__init__()
         self._initialized = True
+        self._drag_active = False
         
         self.waiting_area_manager = WaitingAreaManager(self)
         self.memory_box_manager = MemoryBoxManager(self)
         
         self.current_operation: Optional[DragOperation] = None
         self.operation_history = []
+        
+        # operation_id -> DragOperation (süreç içi payload kaydı)
+        self._operations = OrderedDict()
+        self._operation_ids = itertools.count(1)
+        self._last_mime = None
+        self._last_mime_operation = None
         self.drop_targets: Dict[Any, DropTarget] = {}
         
         self.on_drag_start_callbacks = []
@@ -41,6 +58,21 @@ class DragDropManager:
         self.on_drop_success_callbacks = []
         self.on_drop_fail_callbacks = []
     
+    def is_drag_active(self) -> bool:
+        """Şu an bir drag işlemi sürüyor mu?"""
+        return self._drag_active
+    
+    def _set_drag_active(self, active: bool, success: bool = False):
+        """Drag durumunu değiştir ve sadece geçişlerde sinyal gönder"""
+        if self._drag_active == active:
+            return
+        
+        self._drag_active = active
+        if active:
+            self.drag_started.emit()
+        else:
+            self.drag_finished.emit(success)
+    
     def start_drag(self, card_widget, event) -> bool:
         """DRAG İŞLEMİNİ BAŞLAT"""
         source_type = self._get_source_type(card_widget)
@@ -54,7 +86,8 @@ class DragDropManager:
     
     def process_drop(self, widget, event, db=None) -> bool:
         """DROP İŞLEMİNİ İŞLE"""
-        card_id = self._parse_mime_data(event.mimeData())
+        operation = self.resolve_operation(event.mimeData())
+        card_id = operation.card_id if operation else self._parse_mime_data(event.mimeData())
         if not card_id:
             return False
         
@@ -72,11 +105,82 @@ class DragDropManager:
         return success
     
     def _create_operation(self):
-        """Yeni drag operation oluştur"""
+        """Yeni drag operation oluştur ve payload kaydına ekle"""
         operation = DragOperation()
         operation.start_time = QTimer().remainingTime()
+        operation.operation_id = next(self._operation_ids)
+        
+        self._operations[operation.operation_id] = operation
+        while len(self._operations) > self.RECENT_OPERATIONS:
+            self._operations.popitem(last=False)
+        
+        return operation
+    
+    def capture_card_context(self, card_widget) -> bool:
+        """
+        Sürüklenen kartın kimliğini ve bağlamını operasyona yaz.
+        Kart deposundaki kayıt (varsa) esas alınır; drop hedefleri bu
+        bilgiyi veritabanına sormadan kullanır.
+        """
+        operation = self.current_operation
+        if operation is None or not hasattr(card_widget, 'card_id'):
+            return False
+        
+        operation.card_id = card_widget.card_id
+        operation.card_type = CardType.COPY
+        
+        record = None
+        try:
+            from ui.card_store import get_card_store, CardRecord
+            record = get_card_store().get(operation.card_id)
+            if record is None and isinstance(getattr(card_widget, 'data', None), CardRecord):
+                record = card_widget.data
+        except Exception:
+            record = None
+        
+        operation.card_record = record
+        if record is not None:
+            operation.box_id = record.box_id
+            operation.is_copy = bool(record.is_copy)
+            operation.original_card_id = record.original_card_id
+        else:
+            operation.box_id = getattr(card_widget, 'box_id', None)
+            operation.is_copy = bool(getattr(card_widget, 'is_copy_card', True))
+            operation.original_card_id = getattr(card_widget, 'original_card_id', None)
+        
+        if not operation.original_card_id:
+            operation.original_card_id = getattr(card_widget, 'original_card_id', None)
+        
+        return True
+    
+    def resolve_operation(self, mime_data) -> Optional[DragOperation]:
+        """MIME verisindeki operation_id'yi operasyona çöz (JSON yok, sorgu yok)"""
+        if mime_data is None:
+            return None
+        
+        # Aynı sürüklemenin dragMove'ları aynı QMimeData ile gelir
+        if mime_data is self._last_mime:
+            return self._last_mime_operation
+        
+        operation = None
+        try:
+            if mime_data.hasFormat(DRAG_MIME_FORMAT):
+                operation_id = int(bytes(mime_data.data(DRAG_MIME_FORMAT)))
+                operation = self._operations.get(operation_id)
+        except (TypeError, ValueError):
+            operation = None
+        
+        self._last_mime = mime_data
+        self._last_mime_operation = operation
         return operation
     
+    def find_operation(self, card_id) -> Optional[DragOperation]:
+        """Bu kartın en son sürükleme operasyonu (kayıtta duruyorsa)"""
+        for operation in reversed(self._operations.values()):
+            if operation.card_id == card_id:
+                return operation
+        return None
+    
     def _get_source_type(self, card_widget) -> DragSource:
         """Kaynak türünü belirle"""
         parent = card_widget.parent()
@@ -108,15 +212,8 @@ class DragDropManager:
         if not self.memory_box_manager.start_drag_from_memory_box(card_widget, event):
             return False
         
-        if self.current_operation.card_id and self.current_operation.db:
-            try:
-                cursor = self.current_operation.db.conn.cursor()
-                cursor.execute("SELECT box FROM words WHERE id = ?", (self.current_operation.card_id,))
-                result = cursor.fetchone()
-                if result:
-                    self.current_operation.original_box_id = result[0]
-            except Exception:
-                pass
+        # Kartın kutusu sürükleme bağlamında zaten var
+        self.current_operation.original_box_id = self.current_operation.box_id
         
         mime_data = self._create_mime_data()
         if not mime_data:
@@ -135,50 +232,45 @@ class DragDropManager:
         pixmap = create_drag_pixmap(card_widget)
         if pixmap and not pixmap.isNull():
             drag.setPixmap(pixmap)
-            drag.setHotSpot(QPoint(pixmap.width() // 2, pixmap.height() // 2))
+            size = pixmap.deviceIndependentSize()
+            drag.setHotSpot(QPoint(int(size.width()) // 2, int(size.height()) // 2))
         
         apply_drag_effect(card_widget)
         self._call_drag_start_callbacks()
+        self._set_drag_active(True)
         
         try:
             result = drag.exec(Qt.DropAction.MoveAction)
+            success = result == Qt.DropAction.MoveAction
             
             if self.current_operation and self.current_operation.card_widget:
                 remove_drag_effect(self.current_operation.card_widget)
             
-            self._finish_drag_operation(result == Qt.DropAction.MoveAction)
-            self.cleanup_all_memory_box_borders()
+            self._finish_drag_operation(success)
+            # Drop hedefi operasyonu önceden kapatmış olabilir; sinyal yine de bir kez gitsin
+            self._set_drag_active(False, success)
             
-            return result == Qt.DropAction.MoveAction
+            return success
             
         except Exception:
             if self.current_operation and self.current_operation.card_widget:
                 remove_drag_effect(self.current_operation.card_widget)
             
-            self.cleanup_all_memory_box_borders()
             self.current_operation = None
+            self._set_drag_active(False)
             
             return False
     
     def _create_mime_data(self) -> Optional[QMimeData]:
-        """MIME data oluştur"""
+        """MIME data oluştur - sadece operation_id; payload süreç içi kayıtta"""
         if not self.current_operation:
             return None
         
         mime_data = QMimeData()
         
-        drag_data = {
-            'operation_id': id(self.current_operation),
-            'card_id': self.current_operation.card_id,
-            'card_type': self.current_operation.card_type.value,
-            'source_type': self.current_operation.source_type.value if self.current_operation.source_type else None,
-            'original_box_id': self.current_operation.original_box_id,
-            'requires_cleanup': True
-        }
-        
         mime_data.setData(
-            "application/x-flashcard-operation",
-            QByteArray(json.dumps(drag_data).encode())
+            DRAG_MIME_FORMAT,
+            QByteArray(str(self.current_operation.operation_id).encode())
         )
         
         mime_data.setText(f"card:{self.current_operation.card_id}")
@@ -186,13 +278,8 @@ class DragDropManager:
         return mime_data
     
     def _parse_mime_data(self, mime_data) -> Optional[int]:
-        """MIME data'dan kart ID'sini parse et"""
+        """Kayıtta olmayan sürükleme için metinden kart ID'si"""
         try:
-            if mime_data.hasFormat("application/x-flashcard-operation"):
-                data = mime_data.data("application/x-flashcard-operation")
-                operation_data = json.loads(data.data().decode())
-                return operation_data.get('card_id')
-            
             text = mime_data.text()
             if text.startswith("card:"):
                 return int(text.split(":")[1])
@@ -247,6 +334,7 @@ class DragDropManager:
             self.operation_history.pop(0)
         
         self.current_operation = None
+        self._set_drag_active(False, success)
     
     def cleanup_all_memory_box_borders(self):
         """Tüm MemoryBox border'larını temizle"""
@@ -1,6 +1,7 @@
 """SADECE MEMORY BOX DRAG-DROP İŞLEMLERİ"""
 from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtWidgets import QApplication
+from core.review_stats import ReviewEvent
 from .base_manager import (
     DropTarget, DragSource, CardType,
     remove_drag_effect
@@ -34,17 +35,28 @@ class MemoryBoxManager:
         if db:
             try:
                 cursor = db.conn.cursor()
-                cursor.execute("SELECT box, is_copy, original_card_id FROM words WHERE id = ?", (card_id,))
-                result = cursor.fetchone()
                 
-                if not result:
-                    return False
-                
-                current_box, is_copy, original_card_id = result
+                operation = self.main_manager.current_operation
+                if operation is not None and operation.card_id == card_id:
+                    # Sürükleme bağlamı kaynakta toplandı - tekrar sorgulamaya gerek yok
+                    current_box = operation.box_id
+                    is_copy = 1 if operation.is_copy else 0
+                    original_card_id = operation.original_card_id
+                else:
+                    cursor.execute("SELECT box, is_copy, original_card_id FROM words WHERE id = ?", (card_id,))
+                    result = cursor.fetchone()
+                    
+                    if not result:
+                        return False
+                    
+                    current_box, is_copy, original_card_id = result
                 
                 try:
-                    cursor.execute("UPDATE words SET box = ? WHERE id = ?", (memory_box.box_id, card_id))
-                    cursor.execute("UPDATE words SET is_drawn = 0 WHERE id = ?", (card_id,))
+                    cursor.execute("UPDATE words SET box = ?, is_drawn = 0 WHERE id = ?", (memory_box.box_id, card_id))
+                    if cursor.rowcount == 0:
+                        # Kart bu arada silinmiş
+                        db.conn.rollback()
+                        return False
                     
                     if is_copy == 1 and original_card_id:
                         cursor.execute("""
@@ -64,6 +76,11 @@ class MemoryBoxManager:
                     db.conn.rollback()
                     return False
                 
+                self._update_card_record(card_id, memory_box.box_id)
+                
+                if hasattr(db, 'log_review_event'):
+                    db.log_review_event(card_id, ReviewEvent.RETURNED, memory_box.box_id, original_card_id)
+                
                 if self.main_manager.current_operation and self.main_manager.current_operation.card_widget:
                     card_widget = self.main_manager.current_operation.card_widget
                     self._immediately_remove_card_widget(card_widget)
@@ -96,13 +113,16 @@ class MemoryBoxManager:
     
     def _extract_card_info(self, card_widget) -> bool:
         """Kart bilgilerini çıkar"""
-        if not hasattr(card_widget, 'card_id'):
-            return False
-        
-        self.main_manager.current_operation.card_id = card_widget.card_id
-        self.main_manager.current_operation.card_type = CardType.COPY
-        
-        return True
+        return self.main_manager.capture_card_context(card_widget)
+    
+    @staticmethod
+    def _update_card_record(card_id, box_id):
+        """Paylaşılan kart kaydının kutusunu veritabanıyla eşitle"""
+        try:
+            from ui.card_store import get_card_store
+            get_card_store().update(card_id, box_id=box_id)
+        except Exception:
+            pass
     
     def _find_memory_box(self, widget):
         """Widget'tan memory box bul"""
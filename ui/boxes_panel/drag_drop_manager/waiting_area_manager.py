@@ -1,9 +1,12 @@
 """SADECE WAITING AREA İÇİ DRAG-DROP İŞLEMLERİ"""
+import logging
 from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtWidgets import QApplication
 from .base_manager import DropTarget, DragSource, CardType
 import traceback
 
+logger = logging.getLogger(__name__)
+
 
 class WaitingAreaManager:
     """Waiting area özel drag-drop yöneticisi"""
@@ -33,7 +36,7 @@ class WaitingAreaManager:
         
         # ✅ YENİ KONTROL: Eğer kart zaten bu waiting area'daysa drop'u engelle
         if hasattr(waiting_area, 'cards') and card_id in waiting_area.cards:
-            print(f"⚠️ Kart {card_id} zaten bu waiting area'da")
+            logger.warning("⚠️ Kart %s zaten bu waiting area'da", card_id)
             self._cancel_drag_operation()
             return False
         
@@ -48,7 +51,7 @@ class WaitingAreaManager:
             
         # Eğer source ve target aynı waiting area ise (kart kendi içinde taşınıyorsa)
         if source_widget and source_widget == waiting_area:
-            print(f"⚠️ Kart {card_id} aynı waiting area içinde taşınıyor - engelle")
+            logger.warning("⚠️ Kart %s aynı waiting area içinde taşınıyor - engelle", card_id)
             self._cancel_drag_operation()
             return False
         
@@ -77,6 +80,9 @@ class WaitingAreaManager:
                             cursor = db.conn.cursor()
                             cursor.execute("UPDATE words SET box = NULL WHERE id = ?", (card_id,))
                             db.conn.commit()
+                            
+                            from ui.card_store import get_card_store
+                            get_card_store().update(card_id, box_id=None)
                         except Exception:
                             pass
                     
@@ -216,13 +222,7 @@ class WaitingAreaManager:
     
     def _extract_card_info(self, card_widget) -> bool:
         """Kart bilgilerini çıkar"""
-        if not hasattr(card_widget, 'card_id'):
-            return False
-        
-        self.main_manager.current_operation.card_id = card_widget.card_id
-        self.main_manager.current_operation.card_type = CardType.COPY
-        
-        return True
+        return self.main_manager.capture_card_context(card_widget)
     
     def _extract_source_waiting_area(self, card_widget):
         """Kartın kaynak waiting area'sını bul"""
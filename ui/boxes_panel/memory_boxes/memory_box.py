@@ -1,9 +1,13 @@
 # ui/boxes_panel/memory_boxes/memory_box.py - İşlevsel Kodlar
+import logging
 from PyQt6.QtWidgets import QMessageBox
 from PyQt6.QtCore import Qt, QTimer
 import traceback
 import random
 
+from core.review_stats import ReviewEvent
+from ui.widget_registry import get_widget_registry, ViewKind
+
 # ✅ Tasarım sınıfını import et
 from .memory_boxes_design_and_message_boxes import MemoryBoxDesign, BOX_BORDER_COLORS, BOX_TITLES
 
@@ -30,6 +34,8 @@ except ImportError:
     def get_drag_drop_manager():
         return None
 
+logger = logging.getLogger(__name__)
+
 @drop_target(DropTarget.MEMORY_BOX)
 class MemoryBox(MemoryBoxDesign):
     """Tek bir ezber kutu widget'ı - İşlevsel kodlar"""
@@ -39,6 +45,9 @@ class MemoryBox(MemoryBoxDesign):
         
         self.db = db
         
+        # Kutu ID'siyle bulunabilmek için kayıt defterine katıl
+        get_widget_registry().register(ViewKind.MEMORY_BOX, self.box_id, self)
+        
         # ✅ DRAG STATE TRACKING - GÜNCELLENDİ
         self._is_drag_over = False
         self._last_drag_enter_time = 0
@@ -75,10 +84,10 @@ class MemoryBox(MemoryBoxDesign):
         # ✅ ANİMASYON MANAGER
         self.animation_manager = None
         
-        # ✅ AUTOMATIC DRAG CLEANUP TIMER
-        self.drag_cleanup_timer = QTimer()
-        self.drag_cleanup_timer.timeout.connect(self._auto_cleanup_drag_style)
-        self.drag_cleanup_timer.start(500)
+        # ✅ DRAG BİTİNCE BORDER TEMİZLİĞİ (timer yerine sinyal)
+        manager = get_drag_drop_manager()
+        if manager and hasattr(manager, 'drag_finished'):
+            manager.drag_finished.connect(self._auto_cleanup_drag_style)
         
         self.update_card_count()
         
@@ -93,9 +102,9 @@ class MemoryBox(MemoryBoxDesign):
             event.acceptProposedAction()
             self._is_drag_over = True
             self._last_drag_enter_time = QTimer().remainingTime()
-            # ✅ SADECE BORDER STİLİNİ DEĞİŞTİR
+            # ✅ SADECE BORDER STİLİNİ DEĞİŞTİR - boyama bir sonraki karede
             self.setStyleSheet(self._drag_over_style)
-            self.repaint()
+            self.update()
             event.accept()
         else:
             event.ignore()
@@ -108,7 +117,7 @@ class MemoryBox(MemoryBoxDesign):
                 self._is_drag_over = True
                 # ✅ SADECE BORDER STİLİNİ DEĞİŞTİR
                 self.setStyleSheet(self._drag_over_style)
-                self.repaint()
+                self.update()
             event.accept()
         else:
             event.ignore()
@@ -130,24 +139,21 @@ class MemoryBox(MemoryBoxDesign):
             event.ignore()
             return
         
+        # Payload process_drop'tan önce çözülür; biten operasyon da kayıtta kalır
+        operation = manager.resolve_operation(event.mimeData()) if hasattr(manager, 'resolve_operation') else None
+        
         success = manager.process_drop(self, event, self.db)
         
         if success:
             # ============= OVERLAY BİLDİRİMİ - DÜZELTİLDİ =============
             try:
-                import json
-                from PyQt6.QtWidgets import QApplication
-                
-                mime_data = event.mimeData()
-                if mime_data.hasFormat("application/x-flashcard-operation"):
-                    data = json.loads(mime_data.data("application/x-flashcard-operation").data().decode())
-                    
-                    # 1. MIME data'dan original_card_id al
-                    original_id = data.get('original_card_id')
+                if operation is not None:
+                    # 1. Sürükleme bağlamından original_card_id al
+                    original_id = operation.original_card_id
                     
-                    # 2. Eğer yoksa, kart ID'sinden bul
-                    if not original_id:
-                        card_id = data.get('card_id')
+                    # 2. Bağlamda kart kaydı yoksa, kart ID'sinden bul
+                    if not original_id and operation.card_record is None:
+                        card_id = operation.card_id
                         if card_id and self.db:
                             try:
                                 cursor = self.db.conn.cursor()
@@ -155,23 +161,23 @@ class MemoryBox(MemoryBoxDesign):
                                 row = cursor.fetchone()
                                 if row and row[0]:
                                     original_id = row[0]
-                                    print(f"🔍 DB'den original_card_id bulundu: {original_id}")
+                                    logger.debug("🔍 DB'den original_card_id bulundu: %s", original_id)
                             except Exception as e:
-                                print(f"❌ DB sorgusu hatası: {e}")
+                                logger.error("❌ DB sorgusu hatası: %s", e)
                     
                     # BİLDİRİM GÖNDER
                     if original_id:
-                        print(f"🚀 Overlay bildirimi: Orijinal={original_id}, Kutu={self.box_id}")
+                        logger.debug("🚀 Overlay bildirimi: Orijinal=%s, Kutu=%s", original_id, self.box_id)
                         
                         from ui.boxes_panel.overlay_observer import get_overlay_observer
                         observer = get_overlay_observer()
                         observer.notify_copy_moved(original_id, self.box_id)
                         
             except Exception as e:
-                print(f"❌ Overlay bildirimi hatası: {e}")
+                logger.error("❌ Overlay bildirimi hatası: %s", e)
             # ============================================================
             
-            QTimer.singleShot(50, self.update_card_count)
+            self._immediate_count_update()
         
         event.acceptProposedAction()
         QTimer.singleShot(10, self._apply_normal_style)
@@ -192,15 +198,10 @@ class MemoryBox(MemoryBoxDesign):
         """Normal stili kesinlikle uygula (eski metod)"""
         self._apply_normal_style()
 
-    def _auto_cleanup_drag_style(self):
-        """Otomatik drag style temizleme"""
+    def _auto_cleanup_drag_style(self, success=False):
+        """Drag bittiğinde kalan drag-over stilini temizle"""
         if self._is_drag_over:
-            current_time = QTimer().remainingTime()
-            time_since_drag = abs(current_time - self._last_drag_enter_time)
-            
-            if time_since_drag > 2000:
-                self._is_drag_over = False
-                self._apply_normal_style()
+            self._apply_normal_style()
 
     # ==================== KART ÇEKME İŞLEMLERİ ====================
 
@@ -271,6 +272,8 @@ class MemoryBox(MemoryBoxDesign):
                 self.is_drawing_card = False
                 return
             
+            self.db.log_review_event(card_id, ReviewEvent.DRAWN, self.box_id, original_card_id)
+            
             self.update_card_count()
             
             QTimer.singleShot(50, lambda: self._create_and_show_card(selected_card))
@@ -306,7 +309,7 @@ class MemoryBox(MemoryBoxDesign):
                 self.btn.setEnabled(True)
                 return
             
-            print(f"🔵 [_create_and_show_card] Kart oluşturma başlıyor: {card_id}")
+            logger.debug("🔵 [_create_and_show_card] Kart oluşturma başlıyor: %s", card_id)
             
             # ✅ AKTİF WIDGET'LARI KONTROL ET - DAHA AZ AGGRESİF
             app = QApplication.instance()
@@ -320,7 +323,7 @@ class MemoryBox(MemoryBoxDesign):
                             widget.isVisible() and
                             widget.parent()):
                             
-                            print(f"⚠️ [_create_and_show_card] Bu kart zaten görünür: {card_id}")
+                            logger.warning("⚠️ [_create_and_show_card] Bu kart zaten görünür: %s", card_id)
                             visible_duplicates.append(widget)
                             
                     except Exception:
@@ -356,32 +359,32 @@ class MemoryBox(MemoryBoxDesign):
                 if path not in sys.path:
                     sys.path.insert(0, path)
             
-            print(f"🔵 [_create_and_show_card] Import yolları eklendi")
+            logger.debug("🔵 [_create_and_show_card] Import yolları eklendi")
             
             # ✅ RELATIVE IMPORT DENE, BAŞARISIZ OLURSA ABSOLUTE IMPORT
             try:
                 from ..copy_flash_card import CopyFlashCardView
-                print(f"✅ [_create_and_show_card] Relative import başarılı")
+                logger.debug("✅ [_create_and_show_card] Relative import başarılı")
             except ImportError as e:
-                print(f"⚠️ [_create_and_show_card] Relative import hatası: {e}")
+                logger.warning("⚠️ [_create_and_show_card] Relative import hatası: %s", e)
                 # Absolute import deneyelim
                 try:
                     from ui.boxes_panel.copy_flash_card import CopyFlashCardView
-                    print(f"✅ [_create_and_show_card] Absolute import başarılı")
+                    logger.debug("✅ [_create_and_show_card] Absolute import başarılı")
                 except ImportError as e2:
-                    print(f"❌ [_create_and_show_card] Absolute import da başarısız: {e2}")
+                    logger.error("❌ [_create_and_show_card] Absolute import da başarısız: %s", e2)
                     self.btn.setEnabled(True)
                     self.is_drawing_card = False
                     return
             
             boxes_design = self._find_boxes_design()
             if not boxes_design:
-                print(f"❌ [_create_and_show_card] BoxesDesign bulunamadı")
+                logger.error("❌ [_create_and_show_card] BoxesDesign bulunamadı")
                 self.is_drawing_card = False
                 self.btn.setEnabled(True)
                 return
 
-            print(f"✅ [_create_and_show_card] CopyFlashCardView oluşturuluyor...")
+            logger.debug("✅ [_create_and_show_card] CopyFlashCardView oluşturuluyor...")
             
             # ✅ KART WIDGET'INI OLUŞTUR
             card_widget = CopyFlashCardView(
@@ -402,14 +405,14 @@ class MemoryBox(MemoryBoxDesign):
                             existing_card.card_id == card_id and
                             existing_card.isVisible() and
                             existing_card.parent() == boxes_design):
-                            print(f"⚠️ [_create_and_show_card] Aynı parent'ta zaten kart var")
+                            logger.warning("⚠️ [_create_and_show_card] Aynı parent'ta zaten kart var")
                             is_duplicate = True
                             break
                     except Exception:
                         continue
             
             if is_duplicate:
-                print(f"❌ [_create_and_show_card] Kart zaten gösteriliyor - iptal edildi")
+                logger.debug("❌ [_create_and_show_card] Kart zaten gösteriliyor - iptal edildi")
                 card_widget.deleteLater()
                 self.btn.setEnabled(True)
                 self.is_drawing_card = False
@@ -417,19 +420,19 @@ class MemoryBox(MemoryBoxDesign):
             
             # ✅ KART ID'SİNİ DOĞRULA
             if not hasattr(card_widget, 'card_id') or not card_widget.card_id:
-                print(f"⚠️ [_create_and_show_card] Kart ID'si atanmamış, bind_model çağrılıyor")
+                logger.warning("⚠️ [_create_and_show_card] Kart ID'si atanmamış, bind_model çağrılıyor")
                 card_widget.bind_model(card_data)
             
-            print(f"✅ [_create_and_show_card] Kart oluşturuldu: {card_widget.card_id}")
+            logger.debug("✅ [_create_and_show_card] Kart oluşturuldu: %s", card_widget.card_id)
             
             # ✅ DÜZELTİLDİ: on_card_removed_or_moved fonksiyonunu tanımla
             def on_card_removed_or_moved():
                 """Kart kaldırıldığında/silindiğinde çağrılır"""
-                print(f"🔵 [on_card_removed_or_moved] Kart temizleniyor")
+                logger.debug("🔵 [on_card_removed_or_moved] Kart temizleniyor")
                 self.current_card_widget = None
                 self.is_drawing_card = False
-                QTimer.singleShot(100, self.update_card_count)
-                QTimer.singleShot(100, lambda: self.btn.setEnabled(True))
+                self.btn.setEnabled(True)
+                self._immediate_count_update()
             
             # Sinyalleri bağla
             card_widget.card_clicked.connect(on_card_removed_or_moved)
@@ -441,23 +444,22 @@ class MemoryBox(MemoryBoxDesign):
             
             # ✅ ANİMASYON MANAGER KONTROLÜ
             if CardAnimationManager:
-                print(f"✅ [_create_and_show_card] Animasyon manager kullanılıyor")
+                logger.debug("✅ [_create_and_show_card] Animasyon manager kullanılıyor")
                 self.animation_manager = CardAnimationManager(self, boxes_design)
                 self.animation_manager.show_copy_card_with_slide_animation(card_widget, card_data)
             else:
-                print(f"⚠️ [_create_and_show_card] Animasyon manager yok, direkt ekleniyor")
+                logger.warning("⚠️ [_create_and_show_card] Animasyon manager yok, direkt ekleniyor")
                 if hasattr(boxes_design, 'add_drawn_card'):
                     boxes_design.add_drawn_card(self, card_widget)
             
             self.btn.setEnabled(True)
             self.is_drawing_card = False
             
-            print(f"✅ [_create_and_show_card] Kart başarıyla gösterildi")
+            logger.debug("✅ [_create_and_show_card] Kart başarıyla gösterildi")
             
         except Exception as e:
-            print(f"❌ [_create_and_show_card] KRİTİK HATA: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.error("❌ [_create_and_show_card] KRİTİK HATA: %s", e)
+            logger.debug("Ayrıntı", exc_info=True)
             self.btn.setEnabled(True)
             self.is_drawing_card = False
     
@@ -497,12 +499,12 @@ class MemoryBox(MemoryBoxDesign):
         """Kart silindiğinde veya bekleme alanına taşındığında çağrılır"""
         self.current_card_widget = None
         self.is_drawing_card = False
-        QTimer.singleShot(100, self.update_card_count)
-        QTimer.singleShot(100, lambda: self.btn.setEnabled(True))
+        self.btn.setEnabled(True)
+        self._immediate_count_update()
 
     def clear_current_card(self):
         """Mevcut kartı UI'dan TAMAMEN temizle"""
-        print(f"🔵 [clear_current_card] Başlıyor - current_card_widget: {self.current_card_widget}")
+        logger.debug("🔵 [clear_current_card] Başlıyor - current_card_widget: %s", self.current_card_widget)
         
         if self.current_card_widget:
             try:
@@ -511,37 +513,36 @@ class MemoryBox(MemoryBoxDesign):
                 if boxes_design and hasattr(boxes_design, 'remove_drawn_card'):
                     card_id = getattr(self.current_card_widget, 'card_id', None)
                     if card_id:
-                        print(f"🔵 [clear_current_card] boxes_design'den kaldırılıyor: {card_id}")
+                        logger.debug("🔵 [clear_current_card] boxes_design'den kaldırılıyor: %s", card_id)
                         boxes_design.remove_drawn_card(card_id)
                 
                 # 2. Parent'tan kaldır
                 if self.current_card_widget.parent():
-                    print(f"🔵 [clear_current_card] Parent'tan kaldırılıyor")
+                    logger.debug("🔵 [clear_current_card] Parent'tan kaldırılıyor")
                     parent = self.current_card_widget.parent()
                     if parent.layout():
                         parent.layout().removeWidget(self.current_card_widget)
                 
                 # 3. Widget'ı gizle ve temizle
-                print(f"🔵 [clear_current_card] Widget gizleniyor ve temizleniyor")
+                logger.debug("🔵 [clear_current_card] Widget gizleniyor ve temizleniyor")
                 self.current_card_widget.hide()
                 self.current_card_widget.setParent(None)
                 
                 # 4. Delete later ile tamamen sil
                 self.current_card_widget.deleteLater()
                 
-                print(f"✅ [clear_current_card] Kart UI'dan tamamen kaldırıldı")
+                logger.debug("✅ [clear_current_card] Kart UI'dan tamamen kaldırıldı")
                 
             except Exception as e:
-                print(f"❌ [clear_current_card] Hata: {e}")
-                import traceback
-                traceback.print_exc()
+                logger.error("❌ [clear_current_card] Hata: %s", e)
+                logger.debug("Ayrıntı", exc_info=True)
             finally:
                 self.current_card_widget = None
                 self.is_drawing_card = False
         
         # Butonu etkinleştir ve sayacı güncelle
-        QTimer.singleShot(100, self.update_card_count)
-        QTimer.singleShot(100, lambda: self.btn.setEnabled(True))
+        self.btn.setEnabled(True)
+        self._immediate_count_update()
 
     # ==================== DİĞER METODLAR ====================
 
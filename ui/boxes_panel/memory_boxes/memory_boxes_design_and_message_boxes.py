@@ -1,9 +1,11 @@
 # ui/boxes_panel/memory_boxes/memory_boxes_design_and_message_boxes.py - Tasarım ve Mesaj Kutuları
 from PyQt6.QtWidgets import QFrame, QLabel, QVBoxLayout, QPushButton, QGraphicsDropShadowEffect, QMessageBox
 from PyQt6.QtGui import QColor, QPainterPath, QRegion
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt
 import random
 
+from ui.refresh_scheduler import get_refresh_scheduler, RefreshKind
+
 # ✅ RENK PALETİ
 BOX_BORDER_COLORS = [
     "#DADDE3",  # Box 1: Açık gri
@@ -154,7 +156,7 @@ class MemoryBoxDesign(QFrame):
         self.is_drawing_card = False
         
         # SAYACI HEMEN GÜNCELLE
-        QTimer.singleShot(50, self._immediate_count_update)
+        self._immediate_count_update()
         
     def paintEvent(self, event):
         """Widget'ı yuvarlak köşeli yapmak için"""
@@ -177,8 +179,10 @@ class MemoryBoxDesign(QFrame):
             self.setGraphicsEffect(shadow)
 
     def _immediate_count_update(self):
-        """SAYAÇ GÜNCELLEMESİNİ HEMEN YAP"""
-        QTimer.singleShot(0, self.update_card_count)
+        """Sayaç yenilemesini bir sonraki frame'e işaretle (tekrarlar birleşir)"""
+        get_refresh_scheduler().mark_dirty(
+            RefreshKind.MEMORY_BOX_COUNT, self.box_id, self.update_card_count
+        )
         
     def update_card_count(self):
         """Kutudaki ÇEKİLMEMİŞ kopya kart sayısını göster"""
@@ -1,7 +1,12 @@
 # file: ui/boxes_panel/overlay_observer.py
+import logging
 from PyQt6.QtCore import QObject, pyqtSignal, QTimer
 from PyQt6.QtWidgets import QApplication
 
+from ui.refresh_scheduler import get_refresh_scheduler, RefreshKind
+
+logger = logging.getLogger(__name__)
+
 
 class OverlayObserver(QObject):
     """Kopya kart hareketlerini gözlemleyerek orijinal kart overlay'larını günceller"""
@@ -27,7 +32,7 @@ class OverlayObserver(QObject):
         
         if card_widget not in self.original_cards[card_id]:
             self.original_cards[card_id].append(card_widget)
-            print(f"✅ [OverlayObserver] Kart kaydedildi: {card_id}")  # GEÇİCİ
+            logger.debug("✅ [OverlayObserver] Kart kaydedildi: %s", card_id)  # GEÇİCİ
     
     def unregister_original_card(self, card_widget):
         """Orijinal kart widget'ını kayıttan çıkar"""
@@ -38,14 +43,14 @@ class OverlayObserver(QObject):
         if card_id in self.original_cards:
             if card_widget in self.original_cards[card_id]:
                 self.original_cards[card_id].remove(card_widget)
-                print(f"✅ [OverlayObserver] Kart kaydı silindi: {card_id}")  # GEÇİCİ
+                logger.debug("✅ [OverlayObserver] Kart kaydı silindi: %s", card_id)  # GEÇİCİ
             
             if not self.original_cards[card_id]:
                 del self.original_cards[card_id]
     
     def notify_copy_moved(self, original_card_id, target_box_id):
         """Kopya kart hareket ettiğinde bildir - GÜÇLENDİRİLMİŞ"""
-        print(f"🔵 [OverlayObserver] Kopya hareket etti - Orijinal: {original_card_id}, Kutu: {target_box_id}")
+        logger.debug("🔵 [OverlayObserver] Kopya hareket etti - Orijinal: %s, Kutu: %s", original_card_id, target_box_id)
         
         # Önce kayıtlı kartları kontrol et
         updated = False
@@ -56,22 +61,27 @@ class OverlayObserver(QObject):
                         card_widget.color_overlay.update_for_card_move(target_box_id)
                         card_widget.color_overlay.show()
                         card_widget.color_overlay.raise_()
-                        print(f"✅ [OverlayObserver] Kayıtlı kart güncellendi: {original_card_id}")
+                        logger.debug("✅ [OverlayObserver] Kayıtlı kart güncellendi: %s", original_card_id)
                         updated = True
                     except Exception as e:
-                        print(f"❌ [OverlayObserver] Güncelleme hatası: {e}")
+                        logger.error("❌ [OverlayObserver] Güncelleme hatası: %s", e)
         
         # Kayıtlı değilse veya güncellenemediyse tüm widget'ları tara
         if not updated:
-            print(f"🔍 [OverlayObserver] Widget taraması başlıyor: {original_card_id}")
+            logger.debug("🔍 [OverlayObserver] Widget taraması başlıyor: %s", original_card_id)
             self._find_and_update_card(original_card_id, target_box_id)
         
-        # 2 saniye sonra tekrar dene (geç yüklenen kartlar için)
-        QTimer.singleShot(2000, lambda: self._delayed_update(original_card_id, target_box_id))
+        # 2 saniye sonra tekrar dene (geç yüklenen kartlar için) - aynı kart
+        # için art arda gelen bildirimler tek denemede birleşir
+        get_refresh_scheduler().mark_dirty(
+            RefreshKind.OVERLAYS, original_card_id,
+            lambda: self._delayed_update(original_card_id, target_box_id),
+            delay=2000,
+        )
 
     def _delayed_update(self, original_card_id, target_box_id):
         """Gecikmeli güncelleme - geç yüklenen kartlar için"""
-        print(f"⏰ [OverlayObserver] Gecikmeli güncelleme: {original_card_id}")
+        logger.debug("⏰ [OverlayObserver] Gecikmeli güncelleme: %s", original_card_id)
         self._find_and_update_card(original_card_id, target_box_id)
     
     def _find_and_update_card(self, original_card_id, target_box_id):
@@ -88,7 +98,7 @@ class OverlayObserver(QObject):
                     if hasattr(widget, 'card_id') and widget.card_id == original_card_id:
                         if hasattr(widget, 'color_overlay') and widget.color_overlay:
                             widget.color_overlay.update_for_card_move(target_box_id)
-                            print(f"✅ [OverlayObserver] Widget taraması ile güncellendi: {original_card_id}")  # GEÇİCİ
+                            logger.debug("✅ [OverlayObserver] Widget taraması ile güncellendi: %s", original_card_id)  # GEÇİCİ
                             
                             # Otomatik kaydet
                             self.register_original_card(widget)
@@ -96,7 +106,7 @@ class OverlayObserver(QObject):
         except ImportError:
             pass
         except Exception as e:
-            print(f"❌ [OverlayObserver] Hata: {e}")  # GEÇİCİ
+            logger.error("❌ [OverlayObserver] Hata: %s", e)  # GEÇİCİ
     
     def _batch_update_overlays(self):
         """Toplu overlay güncellemesi"""
@@ -126,5 +136,5 @@ def get_overlay_observer():
     global _global_observer
     if _global_observer is None:
         _global_observer = OverlayObserver()
-        print("✅ [OverlayObserver] Global observer oluşturuldu")  # GEÇİCİ
+        logger.debug("✅ [OverlayObserver] Global observer oluşturuldu")  # GEÇİCİ
     return _global_observer
\ No newline at end of file
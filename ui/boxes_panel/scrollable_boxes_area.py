@@ -96,11 +96,9 @@ class ScrollableBoxesArea(QScrollArea):
                     new_value = max_value
                 
                 if new_value != current_value:
+                    # Çekilen kartlar içerik widget'ında olduğu için kendiliğinden kayar
                     vscroll.setValue(new_value)
                     event.accept()
-                    
-                    if self.parent_window and hasattr(self.parent_window, '_update_all_card_positions'):
-                        self.parent_window._update_all_card_positions()
                 else:
                     event.ignore()
             else:
@@ -17,6 +17,7 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt, QDate
 
+from core.review_stats import ReviewEvent, ReviewStatsEngine
 from ui.calendar_panel.day_multi_select_cell import DayMultiSelectContent
 
 
@@ -110,10 +111,52 @@ class CalendarDataStore:
 class DayCell(QWidget):
     CELL_HEIGHT = 210
 
+    # Gün kutusu stil durumları (aynı stil tekrar uygulanmasın)
+    _STYLE_DAY = "day"
+    _STYLE_TODAY = "today"
+    _STYLE_PLACEHOLDER = "placeholder"
+
+    _CONTAINER_STYLE = """
+        QWidget {
+            background: #ffffff;
+            border: 1px solid #e5e7eb;
+        }
+    """
+
+    _LABEL_STYLES = {
+        _STYLE_TODAY: """
+            QLabel {
+                background: #ef4444;
+                color: white;
+                font-size: 14px;
+                font-weight: 700;
+                padding: 2px 8px;
+                border-radius: 4px;
+            }
+        """,
+        _STYLE_DAY: """
+            QLabel {
+                background: transparent;
+                color: #111827;
+                font-size: 14px;
+                font-weight: 600;
+                padding: 2px 6px;
+            }
+        """,
+        _STYLE_PLACEHOLDER: """
+            QLabel {
+                background: transparent;
+                color: transparent;
+                padding: 0px;
+            }
+        """,
+    }
+
     def __init__(self, store: CalendarDataStore):
         super().__init__()
         self.store = store
         self.date_key = None
+        self._label_style = None
 
         self.setFixedHeight(self.CELL_HEIGHT)
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
@@ -123,19 +166,35 @@ class DayCell(QWidget):
         root.setSpacing(0)
 
         self.container = QWidget()
-        self.container.setStyleSheet("""
-            QWidget {
-                background: #ffffff;
-                border: 2px solid #e5e7eb;
-            }
-        """)
+        # Border kalsın ki çizgiler devam etsin (placeholder dahil)
+        self.container.setStyleSheet(self._CONTAINER_STYLE)
 
         layout = QVBoxLayout(self.container)
         layout.setContentsMargins(6, 6, 6, 6)
         layout.setSpacing(4)
 
+        header = QHBoxLayout()
+        header.setContentsMargins(0, 0, 0, 0)
+        header.setSpacing(4)
+
         self.day_label = QLabel("")
-        layout.addWidget(self.day_label, alignment=Qt.AlignmentFlag.AlignLeft)
+        header.addWidget(self.day_label, alignment=Qt.AlignmentFlag.AlignLeft)
+        header.addStretch()
+
+        # Gerçek çalışma verisi: çekilen kart sayısı ve bekleyen yük
+        self.stats_label = QLabel("")
+        self.stats_label.setStyleSheet("""
+            QLabel {
+                background: transparent;
+                border: none;
+                color: #6b7280;
+                font-size: 11px;
+            }
+        """)
+        self.stats_label.setVisible(False)
+        header.addWidget(self.stats_label, alignment=Qt.AlignmentFlag.AlignRight)
+
+        layout.addLayout(header)
 
         self.content = DayMultiSelectContent()
         self.content.values_changed.connect(self.on_values_changed)
@@ -148,40 +207,18 @@ class DayCell(QWidget):
         """Slot değerleri değiştiğinde çağrılır"""
         pass
 
+    def _apply_label_style(self, style_key: str):
+        """Etiket stilini sadece değiştiyse uygula (setStyleSheet pahalı)"""
+        if self._label_style == style_key:
+            return
+        self._label_style = style_key
+        self.day_label.setStyleSheet(self._LABEL_STYLES[style_key])
+
     def bind_date(self, qdate: QDate, is_today: bool):
         self.date_key = qdate.toString("yyyy-MM-dd")
 
-        self.container.setStyleSheet("""
-            QWidget {
-                background: #ffffff;
-                border: 1px solid #e5e7eb;
-            }
-        """)
-
         self.day_label.setText(str(qdate.day()))
-        self.content.setVisible(True)
-
-        if is_today:
-            self.day_label.setStyleSheet("""
-                QLabel {
-                    background: #ef4444;
-                    color: white;
-                    font-size: 14px;
-                    font-weight: 700;
-                    padding: 2px 8px;
-                    border-radius: 4px;
-                }
-            """)
-        else:
-            self.day_label.setStyleSheet("""
-                QLabel {
-                    background: transparent;
-                    color: #111827;
-                    font-size: 14px;
-                    font-weight: 600;
-                    padding: 2px 6px;
-                }
-            """)
+        self._apply_label_style(self._STYLE_TODAY if is_today else self._STYLE_DAY)
 
         self.content.bind_store(
             self.date_key,
@@ -189,6 +226,29 @@ class DayCell(QWidget):
             self.store.set_values
         )
 
+        if not self.content.isVisible():
+            self.content.setVisible(True)
+
+    def set_review_stats(self, reviews: int, due: int):
+        """Günlük tekrar sayısı ve bekleyen kart yükünü göster"""
+        parts = []
+        if reviews:
+            parts.append(f"✓ {reviews}")
+        if due:
+            parts.append(f"⏳ {due}")
+
+        text = "  ".join(parts)
+        if text != self.stats_label.text():
+            self.stats_label.setText(text)
+            tooltip = []
+            if reviews:
+                tooltip.append(f"{reviews} kart tekrar edildi")
+            if due:
+                tooltip.append(f"{due} kartın tekrarı bekleniyor")
+            self.stats_label.setToolTip("\n".join(tooltip))
+
+        self.stats_label.setVisible(bool(text))
+
     def make_placeholder(self):
         """
         Grid bozulmasın diye VAR.
@@ -200,32 +260,26 @@ class DayCell(QWidget):
         self.date_key = None
 
         self.day_label.setText("")
-        self.day_label.setStyleSheet("""
-            QLabel {
-                background: transparent;
-                color: transparent;
-                padding: 0px;
-            }
-        """)
+        self._apply_label_style(self._STYLE_PLACEHOLDER)
+        self.stats_label.setVisible(False)
 
         self.content.setVisible(False)
 
-        # Border kalsın ki çizgiler devam etsin
-        self.container.setStyleSheet("""
-            QWidget {
-                background: #ffffff;
-                border: 1px solid #e5e7eb;
-            }
-        """)
-
 
 # --------------------------------------------------
 # CALENDAR GRID (PERFECT SYMMETRY)
 # --------------------------------------------------
 class CalendarGrid(QWidget):
-    def __init__(self, store: CalendarDataStore):
+    # En uzun ay 31 gün -> 5 satır x 7 sütun
+    MAX_ROWS = 5
+    COLUMNS = 7
+
+    def __init__(self, store: CalendarDataStore, stats: Optional[ReviewStatsEngine] = None):
         super().__init__()
         self.store = store
+        self.stats = stats
+        self._year = None
+        self._month = None
         self.today = QDate.currentDate()
         
         # ARKA PLAN BEYAZ YAPILDI
@@ -235,40 +289,85 @@ class CalendarGrid(QWidget):
         self.grid.setSpacing(0)
         self.grid.setContentsMargins(0, 0, 0, 0)
 
-        for c in range(7):
+        for c in range(self.COLUMNS):
             self.grid.setColumnStretch(c, 1)
 
+        # Sabit hücre havuzu: ay değişiminde hücreler yeniden oluşturulmaz,
+        # sadece bind_date / make_placeholder ile yeniden bağlanır
+        self.cells: List[DayCell] = []
+        for i in range(self.MAX_ROWS * self.COLUMNS):
+            cell = DayCell(self.store)
+            cell.make_placeholder()
+            self.grid.addWidget(cell, i // self.COLUMNS, i % self.COLUMNS)
+            self.cells.append(cell)
+
+        # İlk render_month satır yüksekliklerini ayarlasın
+        self._visible_rows = -1
+
     def clear(self):
-        while self.grid.count():
-            item = self.grid.takeAt(0)
-            w = item.widget()
-            if w:
-                w.deleteLater()
+        """Tüm hücreleri boş placeholder haline getir (widget silinmez)"""
+        for cell in self.cells:
+            cell.make_placeholder()
+
+    def _set_visible_rows(self, rows: int):
+        if rows == self._visible_rows:
+            return
+
+        for r in range(self.MAX_ROWS):
+            visible = r < rows
+            self.grid.setRowMinimumHeight(r, DayCell.CELL_HEIGHT if visible else 0)
+            self.grid.setRowStretch(r, 0)
+            for c in range(self.COLUMNS):
+                self.cells[r * self.COLUMNS + c].setVisible(visible)
+
+        self._visible_rows = rows
 
     def render_month(self, year: int, month: int):
-        self.clear()
+        self._year = year
+        self._month = month
 
         days = QDate(year, month, 1).daysInMonth()
         rows = (days + 6) // 7  # kaç satır lazım
         total_cells = rows * 7  # son satır dahil 7'ye tamamla
 
-        for r in range(rows):
-            self.grid.setRowMinimumHeight(r, DayCell.CELL_HEIGHT)
-            self.grid.setRowStretch(r, 0)
+        self.setUpdatesEnabled(False)
+        try:
+            self._set_visible_rows(rows)
 
-        for i in range(total_cells):
-            r = i // 7
-            c = i % 7
+            for i in range(total_cells):
+                cell = self.cells[i]
 
-            cell = DayCell(self.store)
+                if i < days:
+                    qdate = QDate(year, month, i + 1)
+                    cell.bind_date(qdate, qdate == self.today)
+                else:
+                    cell.make_placeholder()
 
-            if i < days:
-                qdate = QDate(year, month, i + 1)
-                cell.bind_date(qdate, qdate == self.today)
-            else:
-                cell.make_placeholder()
+            self._bind_review_stats(days)
+        finally:
+            self.setUpdatesEnabled(True)
 
-            self.grid.addWidget(cell, r, c)
+    def _bind_review_stats(self, days: int):
+        """Ayın istatistiklerini tek seferde al ve hücrelere dağıt"""
+        if not self.stats:
+            return
+
+        reviews = self.stats.get_month_review_counts(self._year, self._month)
+        due_load = self.stats.get_month_due_load(self._year, self._month)
+
+        for i in range(days):
+            cell = self.cells[i]
+            day_counts = reviews.get(cell.date_key, {})
+            cell.set_review_stats(
+                day_counts.get(ReviewEvent.DRAWN, 0),
+                due_load.get(cell.date_key, 0)
+            )
+
+    def refresh_review_stats(self):
+        """Sadece istatistikleri yenile (hücreler yeniden bağlanmaz)"""
+        if self._year is None:
+            return
+        self._bind_review_stats(QDate(self._year, self._month, 1).daysInMonth())
 
 
 # --------------------------------------------------
@@ -334,6 +433,12 @@ class CalendarToolbar(QWidget):
         prev_btn.clicked.connect(prev_cb)
         next_btn.clicked.connect(next_cb)
 
+        # Basılı tutunca aylar hızlıca kaysın (render_month artık sadece veri bağlıyor)
+        for btn in (prev_btn, next_btn):
+            btn.setAutoRepeat(True)
+            btn.setAutoRepeatDelay(300)
+            btn.setAutoRepeatInterval(60)
+
         # Buton stilleri
         prev_btn.setStyleSheet("""
             QPushButton {
@@ -379,8 +484,9 @@ class CalendarToolbar(QWidget):
 # MAIN WINDOW WITH FILE STATUS
 # --------------------------------------------------
 class CalendarWindow(QWidget):
-    def __init__(self):
+    def __init__(self, db=None):
         super().__init__()
+        self.db = db
         
         # ARKA PLAN BEYAZ YAPILDI
         self.setStyleSheet("""
@@ -401,7 +507,8 @@ class CalendarWindow(QWidget):
             self.clear_month,
             self.clear_all
         )
-        self.grid = CalendarGrid(self.store)
+        self.review_stats = ReviewStatsEngine(db) if db else None
+        self.grid = CalendarGrid(self.store, self.review_stats)
 
         root.addWidget(self.toolbar)
         root.addWidget(self.grid, 1)
@@ -412,6 +519,11 @@ class CalendarWindow(QWidget):
         self.toolbar.title.setText(self.current.toString("MMMM yyyy"))
         self.grid.render_month(self.current.year(), self.current.month())
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        # Sekmeye dönünce yeni tekrar verilerini yansıt
+        self.grid.refresh_review_stats()
+
     def prev_month(self):
         self.current = self.current.addMonths(-1)
         self.update_calendar()
@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 
+import logging
 from typing import Callable, List, Optional, Tuple, Dict
 from enum import Enum
 
@@ -19,6 +20,8 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtGui import QPainter, QColor, QBrush, QFont, QAction, QPen
 
+logger = logging.getLogger(__name__)
+
 
 # --------------------------------------------------
 # REPEAT TYPES ENUM
@@ -169,6 +172,9 @@ class _Slot(QFrame):
         painter.end()
 
     def set_repeat_type(self, repeat_type: Optional[RepeatType]):
+        # Ay değişiminde aynı değer tekrar bağlanabilir; stil yeniden hesaplanmasın
+        if repeat_type is self.repeat_type and self.is_empty == (repeat_type is None):
+            return
         self.is_empty = (repeat_type is None)
         self.repeat_type = repeat_type
         self.display_text = repeat_type.display_text if repeat_type else ""
@@ -350,7 +356,7 @@ class DayMultiSelectContent(QWidget):
                     for i, value in enumerate(values):
                         self.set_slot_value(i, value)
             except Exception as e:
-                print(f"Error loading from store: {e}")
+                logger.error("Error loading from store: %s", e)
                 self.current_values = [None] * self.SLOT_COUNT
 
     def set_values(self, values):
@@ -371,7 +377,7 @@ class DayMultiSelectContent(QWidget):
             try:
                 self._set_values_cb(self._date_key, values)
             except Exception as e:
-                print(f"Error saving to store: {e}")
+                logger.error("Error saving to store: %s", e)
         
         # Değişiklik sinyali gönder
         self.values_changed.emit(self._date_key, values)
@@ -0,0 +1,211 @@
+# file: ui/card_store.py
+import json
+import logging
+import weakref
+from PyQt6.QtCore import QObject, pyqtSignal
+
+logger = logging.getLogger(__name__)
+
+
+class CardRecord:
+    """
+    Bir kartın süreç içindeki tek kopyası.
+    Görünümler (FlashCardView, CopyFlashCardView), BoxDetailContent.cards_data
+    ve duplicate checker aynı nesneyi paylaşır. Eski dict tabanlı kodla uyum
+    için get / [] / in ile de okunabilir.
+    """
+
+    FIELDS = ('id', 'english', 'turkish', 'detail', 'box_id', 'bucket', 'is_copy', 'original_card_id')
+    __slots__ = FIELDS + ('__weakref__',)
+
+    def __init__(self, id=None, english='', turkish='', detail='{}', box_id=None,
+                 bucket=0, is_copy=False, original_card_id=None):
+        self.id = id
+        self.english = english
+        self.turkish = turkish
+        self.detail = detail
+        self.box_id = box_id
+        self.bucket = bucket
+        self.is_copy = is_copy
+        self.original_card_id = original_card_id
+
+    def get(self, key, default=None):
+        if key in self.FIELDS:
+            value = getattr(self, key)
+            return default if value is None else value
+        return default
+
+    def __getitem__(self, key):
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key, value):
+        # Doğrudan yazım sinyal üretmez - paylaşılan alanlar için CardStore.update kullanılmalı
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key):
+        return key in self.FIELDS and getattr(self, key) is not None
+
+    def to_dict(self):
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+    def field_texts(self):
+        """(ön yüz alanları, arka yüz alanları) - detail'de yoksa english / turkish"""
+        try:
+            detail = json.loads(self.detail) if self.detail else {}
+        except (TypeError, ValueError):
+            detail = {}
+        if not isinstance(detail, dict):
+            detail = {}
+        front = [str(text) for text in detail.get('front_fields') or []] or [self.english or '']
+        back = [str(text) for text in detail.get('back_fields') or []] or [self.turkish or '']
+        return front, back
+
+    def copy(self):
+        return self.to_dict()
+
+    def __repr__(self):
+        return f"CardRecord(id={self.id!r}, english={self.english!r}, box_id={self.box_id!r}, bucket={self.bucket!r})"
+
+
+def _normalize_id(card_id):
+    if card_id is None or card_id == '':
+        return None
+    try:
+        return int(card_id)
+    except (TypeError, ValueError):
+        return card_id
+
+
+class CardStore(QObject):
+    """
+    card_id -> CardRecord kimlik haritası (identity map).
+    Aynı ID için her zaman aynı kayıt döner; bir alan değiştiğinde
+    card_changed yayılır ve kaydı gösteren görünümler (FlashCardView,
+    CopyFlashCardView) alanlarını ondan tazeler. Kayıtlar zayıf tutulur: kartı gösteren hiçbir
+    görünüm kalmayınca kayıt da bellekten düşer.
+    Sadece GUI thread'inden kullanılmalı.
+    """
+
+    card_changed = pyqtSignal(object)  # CardRecord
+    card_removed = pyqtSignal(object)  # card_id
+
+    def __init__(self):
+        super().__init__()
+        self._records = weakref.WeakValueDictionary()
+
+    def get(self, card_id):
+        return self._records.get(_normalize_id(card_id))
+
+    def intern(self, data, **overrides):
+        """
+        dict / FlashCardData / CardRecord'u paylaşılan kayda çevir.
+        ID'si bilinen kart zaten varsa aynı kayıt güncellenip döner.
+        """
+        if isinstance(data, CardRecord):
+            mapped = self._records.get(data.id) if data.id is not None else None
+            if mapped is not None and mapped is not data:
+                # Aynı ID'ye ikinci kayıt açılmaz - alanlar haritadakine aktarılır
+                fields = data.to_dict()
+                fields.pop('id')
+                fields.update(overrides)
+                self.update(mapped, **fields)
+                return mapped
+            if data.id is not None and mapped is None:
+                self._records[data.id] = data
+            if overrides:
+                self.update(data, **overrides)
+            return data
+
+        fields = self._fields_from(data)
+        fields.update(overrides)
+        fields['id'] = _normalize_id(fields.get('id'))
+
+        record = self._records.get(fields['id']) if fields['id'] is not None else None
+        if record is None:
+            record = CardRecord(**fields)
+            if record.id is not None:
+                self._records[record.id] = record
+            return record
+
+        self.update(record, **{key: value for key, value in fields.items() if key != 'id'})
+        return record
+
+    @staticmethod
+    def _fields_from(data):
+        if data is None:
+            return {}
+
+        if isinstance(data, dict):
+            getter = data.get
+        else:
+            getter = lambda key, default=None: getattr(data, key, default)
+
+        fields = {}
+        for field in CardRecord.FIELDS:
+            value = getter(field, None)
+            if field == 'box_id' and value is None:
+                value = getter('box', None)
+            if value is not None:
+                fields[field] = value
+        return fields
+
+    def update(self, card, **fields):
+        """Kaydın alanlarını değiştir; gerçekten değişen varsa card_changed yay"""
+        record = card if isinstance(card, CardRecord) else self.get(card)
+        if record is None:
+            return None
+
+        new_id = fields.pop('id', None)
+        changed = False
+        if new_id is not None:
+            changed = self.assign_id(record, new_id)
+
+        for field, value in fields.items():
+            if field in CardRecord.FIELDS and getattr(record, field) != value:
+                setattr(record, field, value)
+                changed = True
+
+        if changed:
+            self.card_changed.emit(record)
+        return record
+
+    def assign_id(self, record, card_id):
+        """Yeni kaydedilen kartın veritabanı ID'sini kayda ve haritaya işle"""
+        card_id = _normalize_id(card_id)
+        if card_id is None or record.id == card_id:
+            return False
+
+        if record.id is not None and self._records.get(record.id) is record:
+            del self._records[record.id]
+        record.id = card_id
+        self._records[card_id] = record
+        return True
+
+    def remove(self, card_id):
+        """Kart veritabanından silindi"""
+        card_id = _normalize_id(card_id)
+        if card_id is None:
+            return
+        self._records.pop(card_id, None)
+        self.card_removed.emit(card_id)
+
+    def records_in_box(self, box_id):
+        return [record for record in list(self._records.values()) if record.box_id == box_id]
+
+    def get_stats(self):
+        return {'records': len(self._records)}
+
+
+# Global store instance
+_global_store = None
+
+def get_card_store():
+    """Global kart deposunu getir"""
+    global _global_store
+    if _global_store is None:
+        _global_store = CardStore()
+    return _global_store
@@ -0,0 +1,131 @@
+# file: ui/refresh_scheduler.py
+import logging
+import time
+from PyQt6.QtCore import QObject, QTimer
+
+logger = logging.getLogger(__name__)
+
+
+class RefreshKind:
+    """Kirli işaretlenebilen yenileme türleri - (tür, anahtar) çifti tekildir"""
+    MEMORY_BOX_COUNT = "memory_box_count"   # anahtar: box_id
+    BOX_VIEW_COUNT = "box_view_count"       # anahtar: box_id (kelimeler sekmesi)
+    ALL_BOX_COUNTS = "all_box_counts"       # anahtar: sayaçları yenileyen nesne
+    OVERLAYS = "overlays"                   # anahtar: None (hepsi) ya da original_card_id
+    WAITING_AREA = "waiting_area"           # anahtar: None ya da box_id
+
+
+class RefreshScheduler(QObject):
+    """
+    Sayaç / overlay / bekleme alanı yenilemelerini tek noktadan toplar.
+    Çağıranlar kendi QTimer.singleShot'larını kurmak yerine bir anahtarı kirli
+    işaretler; aynı anahtar frame içinde kaç kez işaretlenirse işaretlensin
+    geri çağırım bir kez, tek parti halinde çalışır.
+    """
+
+    FRAME_INTERVAL = 16  # ms
+
+    def __init__(self):
+        super().__init__()
+        self._dirty = {}  # (tür, anahtar) -> (callback, çalışma zamanı ms)
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self._flush)
+        self.stats = {
+            'requested': 0,   # toplam işaretleme
+            'coalesced': 0,   # zaten kirli olduğu için birleştirilen
+            'flushed': 0,     # gerçekten çalışan yenileme
+            'batches': 0,     # parti sayısı
+        }
+
+    @staticmethod
+    def _now():
+        return time.monotonic() * 1000.0
+
+    def mark_dirty(self, kind, key=None, callback=None, delay=0):
+        """
+        (kind, key) yenilemesini iste. delay=0 ise bir sonraki frame'de,
+        aksi halde en erken delay ms sonra çalışır. Bekleyen aynı anahtar
+        varsa zamanı korunur, geri çağırım en günceliyle değiştirilir.
+        """
+        if callback is None:
+            return
+
+        self.stats['requested'] += 1
+        dirty_key = (kind, key)
+
+        if dirty_key in self._dirty:
+            self.stats['coalesced'] += 1
+            self._dirty[dirty_key] = (callback, self._dirty[dirty_key][1])
+            return
+
+        due = self._now() + max(delay, self.FRAME_INTERVAL)
+        self._dirty[dirty_key] = (callback, due)
+        self._schedule()
+
+    def is_dirty(self, kind, key=None):
+        return (kind, key) in self._dirty
+
+    def flush_now(self):
+        """Bekleyen tüm yenilemeleri hemen çalıştır"""
+        self._flush(force=True)
+
+    def _schedule(self):
+        if not self._dirty:
+            self.timer.stop()
+            return
+
+        next_due = min(due for _, due in self._dirty.values())
+        remaining = max(0, int(next_due - self._now()))
+
+        if self.timer.isActive() and self.timer.remainingTime() <= remaining:
+            return
+        self.timer.start(remaining)
+
+    def _flush(self, force=False):
+        now = self._now()
+        batch = [
+            (dirty_key, callback)
+            for dirty_key, (callback, due) in self._dirty.items()
+            if force or due <= now + 1
+        ]
+        for dirty_key, _ in batch:
+            del self._dirty[dirty_key]
+
+        if batch:
+            self.stats['batches'] += 1
+            for dirty_key, callback in batch:
+                try:
+                    callback()
+                    self.stats['flushed'] += 1
+                except RuntimeError:
+                    # Widget bu arada silinmiş
+                    pass
+                except Exception as e:
+                    logger.error("❌ [RefreshScheduler] %s yenilemesi hatası: %s", dirty_key, e)
+
+            logger.debug("🔄 [RefreshScheduler] %s yenileme çalıştı (toplam birleştirilen: %s)",
+                         len(batch), self.stats['coalesced'])
+
+        self._schedule()
+
+    def get_stats(self):
+        """Sayaçların kopyası + bekleyen yenileme sayısı"""
+        stats = dict(self.stats)
+        stats['pending'] = len(self._dirty)
+        return stats
+
+    def reset_stats(self):
+        for name in self.stats:
+            self.stats[name] = 0
+
+
+# Global scheduler instance
+_global_scheduler = None
+
+def get_refresh_scheduler():
+    """Global yenileme zamanlayıcısını getir"""
+    global _global_scheduler
+    if _global_scheduler is None:
+        _global_scheduler = RefreshScheduler()
+    return _global_scheduler
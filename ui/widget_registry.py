@@ -0,0 +1,106 @@
+# file: ui/widget_registry.py
+import logging
+import weakref
+from functools import partial
+
+from PyQt6 import sip
+
+logger = logging.getLogger(__name__)
+
+
+class ViewKind:
+    """Kayıt türleri - anahtar her zaman kutu ID'sidir"""
+    BOX_VIEW = "box_view"              # Kelimeler sekmesindeki BoxView (db_id)
+    MEMORY_BOX = "memory_box"          # Kutular sekmesindeki MemoryBox (box_id 1-5)
+    DETAIL_CONTENT = "detail_content"  # Açık BoxDetailContent (box_id)
+
+
+class WidgetRegistry:
+    """
+    (tür, box_id) -> canlı widget'lar.
+    Widget'lar oluşturulurken katılır, destroyed sinyaliyle kendiliğinden
+    ayrılır; referanslar zayıf tutulur. Böylece kutuya göre görünüm bulmak
+    için app.allWidgets() / children() taraması yerine sözlük erişimi yeterli.
+    """
+
+    def __init__(self):
+        self._views = {}  # (tür, box_id) -> {id(widget): weakref}
+
+    def register(self, kind, box_id, widget):
+        if widget is None or box_id is None:
+            return
+
+        bucket = self._views.setdefault((kind, box_id), {})
+        widget_key = id(widget)
+        if widget_key in bucket:
+            return
+
+        bucket[widget_key] = weakref.ref(widget)
+        try:
+            widget.destroyed.connect(partial(self._forget, kind, box_id, widget_key))
+        except (AttributeError, RuntimeError):
+            pass
+
+    def unregister(self, kind, box_id, widget):
+        if widget is None:
+            return
+        self._forget(kind, box_id, id(widget))
+
+    def rekey(self, kind, old_box_id, new_box_id, widget):
+        """Widget'ın kutu ID'si değiştiğinde kaydını taşı (yoksa ekle)"""
+        if old_box_id != new_box_id:
+            self.unregister(kind, old_box_id, widget)
+        self.register(kind, new_box_id, widget)
+
+    def _forget(self, kind, box_id, widget_key, *args):
+        bucket = self._views.get((kind, box_id))
+        if not bucket:
+            return
+        bucket.pop(widget_key, None)
+        if not bucket:
+            del self._views[(kind, box_id)]
+
+    @staticmethod
+    def _alive(ref):
+        widget = ref()
+        if widget is None:
+            return None
+        try:
+            if sip.isdeleted(widget) or getattr(widget, '_deleted', False):
+                return None
+        except TypeError:
+            pass
+        return widget
+
+    def get_all(self, kind, box_id):
+        """Bu kutuya ait canlı widget listesi"""
+        bucket = self._views.get((kind, box_id))
+        if not bucket:
+            return []
+        return [w for w in (self._alive(ref) for ref in list(bucket.values())) if w is not None]
+
+    def get(self, kind, box_id):
+        """Bu kutuya ait ilk canlı widget ya da None"""
+        views = self.get_all(kind, box_id)
+        return views[0] if views else None
+
+    def iter_kind(self, kind):
+        """Bir türdeki tüm canlı widget'lar"""
+        for (view_kind, _), bucket in list(self._views.items()):
+            if view_kind != kind:
+                continue
+            for ref in list(bucket.values()):
+                widget = self._alive(ref)
+                if widget is not None:
+                    yield widget
+
+
+# Global registry instance
+_global_registry = None
+
+def get_widget_registry():
+    """Global widget kayıt defterini getir"""
+    global _global_registry
+    if _global_registry is None:
+        _global_registry = WidgetRegistry()
+    return _global_registry
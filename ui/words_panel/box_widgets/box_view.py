@@ -1,3 +1,4 @@
+import logging
 from PyQt6.QtWidgets import QFrame, QMessageBox
 from PyQt6.QtCore import Qt, pyqtSignal, QTimer
 from PyQt6.QtGui import QColor
@@ -8,6 +9,9 @@ from .state.state_manager import BoxStateManager
 from .managers.animation_manager import AnimationManager
 from .managers.event_handler import EventHandler
 from .managers.title_manager import TitleManager
+from ui.widget_registry import get_widget_registry, ViewKind
+
+logger = logging.getLogger(__name__)
 
 
 class BoxView(QFrame):
@@ -29,6 +33,9 @@ class BoxView(QFrame):
         self.ui_index = ui_index if ui_index is not None else 1
         self._deleted = False
         
+        # Kutu ID'siyle bulunabilmek için kayıt defterine katıl
+        get_widget_registry().register(ViewKind.BOX_VIEW, self.db_id, self)
+        
         # UI referansları
         self.label = None
         self.editor = None
@@ -184,6 +191,7 @@ class BoxView(QFrame):
     
     def deleteLater(self):
         self._deleted = True
+        get_widget_registry().unregister(ViewKind.BOX_VIEW, self.db_id, self)
         
         if self.state_manager:
             self.state_manager.cleanup()
@@ -279,7 +287,7 @@ class BoxView(QFrame):
                     
             except Exception as e:
                 # Hata durumunda direk sil (eski davranış)
-                print(f"Dialog hatası: {e}")
+                logger.debug("Dialog hatası: %s", e)
                 if self.state_manager:
                     self.state_manager.request_delete()
                 self.delete_requested.emit(self)
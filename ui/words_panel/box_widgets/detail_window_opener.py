@@ -39,8 +39,8 @@ def open_detail_window_for_box(box_view):
             existing_window.close_window()
             return True
         
-        # 5. Yeni pencere oluştur
-        detail_window = BoxDetailWindow(
+        # 5. Pencereyi al (havuzda varsa dolu haliyle geri gelir) ya da oluştur
+        detail_window = BoxDetailWindow.get_or_create_window(
             parent=words_window,
             db=None,
             box_id=box_view.db_id,
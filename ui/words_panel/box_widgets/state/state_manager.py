@@ -244,29 +244,18 @@ class BoxStateManager:
                     
                 except ImportError:
                     # Basit yöntem
-                    old_state_file = self._find_state_file(self.db_id, self.ui_index, old_title or self.title)
-                    if old_state_file and old_state_file.exists():
+                    state_file = self._find_state_file(self.db_id, self.ui_index, old_title or self.title)
+                    if state_file and state_file.exists():
                         try:
-                            with open(old_state_file, 'r', encoding='utf-8') as f:
+                            with open(state_file, 'r', encoding='utf-8') as f:
                                 data = json.load(f)
                             
                             data["box_title"] = new_title
                             data["updated_at"] = datetime.now().isoformat()
                             
-                            # Yeni dosya adı ile kaydet
-                            safe_title = self._make_safe_filename(new_title)
-                            if not safe_title:
-                                safe_title = f"box_{self.db_id}"
-                            
-                            new_filename = f"{self.ui_index}_{safe_title}.state.json"
-                            new_path = old_state_file.parent / new_filename
-                            
-                            with open(new_path, 'w', encoding='utf-8') as f:
+                            # Dosya adı kutu ID'sine bağlı - yerinde güncellenir
+                            with open(state_file, 'w', encoding='utf-8') as f:
                                 json.dump(data, f, ensure_ascii=False, indent=2)
-                            
-                            # Eski dosyayı sil
-                            if old_state_file != new_path:
-                                old_state_file.unlink()
                                 
                         except Exception:
                             pass
@@ -275,115 +264,27 @@ class BoxStateManager:
             pass
 
     def _find_state_file(self, box_id: int, ui_index: int, title: str) -> Path:
-        """State dosyasını bul"""
+        """State dosyasını bul - box_<id>.state.json"""
         try:
-            states_dir = self._get_states_dir()
-            
-            # Önce tam uyumlu dosyayı ara
-            safe_title = self._make_safe_filename(title)
-            if safe_title:
-                filename = f"{ui_index}_{safe_title}.state.json"
-                filepath = states_dir / filename
-                if filepath.exists():
-                    return filepath
-            
-            # Box ID ile ara
-            for filepath in states_dir.glob("*.state.json"):
-                try:
-                    with open(filepath, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    
-                    if data.get("box_id") == box_id:
-                        return filepath
-                except Exception:
-                    continue
-                    
+            from ui.words_panel.detail_window.states.state_file_manager import StateFileManager
+            filepath = Path(StateFileManager().path_for_box(box_id))
+            if filepath.exists():
+                return filepath
         except Exception:
             pass
         return None
 
-    def _make_safe_filename(self, text: str) -> str:
-        """Metni dosya adı için güvenli hale getir"""
-        if not text:
-            return ""
-        
-        turkish_chars = {'ç': 'c', 'ğ': 'g', 'ı': 'i', 'ö': 'o', 
-                         'ş': 's', 'ü': 'u', 'Ç': 'C', 'Ğ': 'G', 
-                         'İ': 'I', 'Ö': 'O', 'Ş': 'S', 'Ü': 'U'}
-        
-        for old, new in turkish_chars.items():
-            text = text.replace(old, new)
-        
-        safe = "".join(c for c in text if c.isalnum() or c in (' ', '-', '_')).strip()
-        safe = safe.replace(' ', '_').replace('-', '_')
-        
-        while '__' in safe:
-            safe = safe.replace('__', '_')
-        
-        safe = safe.lower()[:30]
-        
-        if not safe or all(c == '_' for c in safe):
-            return ""
-        
-        return safe
-
     def request_delete(self):
-        """State dosyalarını sil"""
+        """State dosyasını sil"""
         self._state_check_timer.stop()
         
         if self.db_id is not None and self.db_connection:
-            try:
-                states_dir = self._get_states_dir()
-                
-                if states_dir.exists():
-                    # Tüm state dosyalarını ara
-                    for filepath in states_dir.glob("*.state.json"):
-                        try:
-                            with open(filepath, 'r', encoding='utf-8') as f:
-                                data = json.load(f)
-                            
-                            if data.get("box_id") == self.db_id:
-                                os.remove(filepath)
-                        except Exception:
-                            # JSON okunamazsa bile sil
-                            try:
-                                os.remove(filepath)
-                            except Exception:
-                                pass
-            except Exception:
-                pass
-
-    def _get_states_dir(self) -> Path:
-        """State dosyalarının bulunduğu dizini al"""
-        try:
-            # Ana uygulama dizinini bul
-            current_file = Path(__file__).resolve()
-            
-            # detail_window/states/state_json yolunu oluştur
-            states_dir = current_file.parent.parent.parent / "detail_window" / "states" / "state_json"
-            
-            # Eğer bu dizin yoksa, oluştur
-            if not states_dir.exists():
-                # Alternatif yolları dene
-                cwd = Path.cwd()
-                possible_paths = [
-                    cwd / "ui" / "words_panel" / "detail_window" / "states" / "state_json",
-                    cwd / "detail_window" / "states" / "state_json",
-                ]
-                
-                for path in possible_paths:
-                    if path.exists():
-                        states_dir = path
-                        break
-                else:
-                    # Hiçbiri yoksa, oluştur
-                    states_dir.mkdir(parents=True, exist_ok=True)
-            
-            return states_dir
-            
-        except Exception:
-            # Fallback: geçerli dizinde oluştur
-            return Path.cwd() / "state_json"
+            state_file = self._find_state_file(self.db_id, self.ui_index, self.title)
+            if state_file:
+                try:
+                    os.remove(state_file)
+                except Exception:
+                    pass
 
     def cleanup(self):
         """Temizlik işlemleri"""
@@ -39,7 +39,7 @@ class StateSyncManager:
     
     def _load_or_create_state(self, box_id: int, title: str, ui_index: int) -> Dict:
         """State dosyasını yükle veya yeni oluştur"""
-        state_file = self._get_state_file_path(ui_index, title)
+        state_file = self._get_state_file_path(box_id)
         
         if state_file.exists():
             try:
@@ -62,7 +62,6 @@ class StateSyncManager:
             "created_at": datetime.now().isoformat(),
             "updated_at": datetime.now().isoformat(),
             "version": 5,
-            "ui_index": ui_index,
             "cards": [],
             "scroll_y": 0,
             "panel_width": None
@@ -138,8 +137,8 @@ class StateSyncManager:
         return old_cards != new_cards
     
     def _save_state_file(self, state_data: Dict, ui_index: int, title: str):
-        """State dosyasını kaydet - {ui_index}_{title}.state.json formatında"""
-        state_file = self._get_state_file_path(ui_index, title)
+        """State dosyasını kaydet - box_<id>.state.json"""
+        state_file = self._get_state_file_path(state_data.get("box_id"))
         
         try:
             state_file.parent.mkdir(parents=True, exist_ok=True)
@@ -150,71 +149,10 @@ class StateSyncManager:
         except Exception:
             pass
     
-    def _get_state_file_path(self, ui_index: int, title: str) -> Path:
-        """State dosya yolunu oluştur - {ui_index}_{title}.state.json formatında"""
-        try:
-            # Ana uygulama dizinini bul
-            current_file = Path(__file__).resolve()
-            
-            # detail_window/states/state_json yolunu oluştur
-            states_dir = current_file.parent.parent.parent / "detail_window" / "states" / "state_json"
-            
-            # Eğer bu dizin yoksa, oluştur
-            if not states_dir.exists():
-                # Alternatif: projenin kök dizininde ara
-                cwd = Path.cwd()
-                possible_paths = [
-                    cwd / "ui" / "words_panel" / "detail_window" / "states" / "state_json",
-                    cwd / "detail_window" / "states" / "state_json",
-                ]
-                
-                for path in possible_paths:
-                    if path.exists():
-                        states_dir = path
-                        break
-                else:
-                    # Hiçbiri yoksa, mevcut dosyanın göreli konumunda oluştur
-                    states_dir.mkdir(parents=True, exist_ok=True)
-            
-            # Dosya adını oluştur
-            safe_title = self._make_safe_filename(title)
-            if not safe_title:
-                safe_title = f"box_{ui_index}"
-            
-            filename = f"{ui_index}_{safe_title}.state.json"
-            return states_dir / filename
-            
-        except Exception:
-            # Fallback: geçerli dizinde oluştur
-            safe_title = self._make_safe_filename(title)
-            if not safe_title:
-                safe_title = f"box_{ui_index}"
-            return Path.cwd() / f"{ui_index}_{safe_title}.state.json"
-    
-    def _make_safe_filename(self, text: str) -> str:
-        """Metni dosya adı için güvenli hale getir"""
-        if not text:
-            return ""
-        
-        turkish_chars = {'ç': 'c', 'ğ': 'g', 'ı': 'i', 'ö': 'o', 
-                         'ş': 's', 'ü': 'u', 'Ç': 'C', 'Ğ': 'G', 
-                         'İ': 'I', 'Ö': 'O', 'Ş': 'S', 'Ü': 'U'}
-        
-        for old, new in turkish_chars.items():
-            text = text.replace(old, new)
-        
-        safe = "".join(c for c in text if c.isalnum() or c in (' ', '-', '_')).strip()
-        safe = safe.replace(' ', '_').replace('-', '_')
-        
-        while '__' in safe:
-            safe = safe.replace('__', '_')
-        
-        safe = safe.lower()[:30]
-        
-        if not safe or all(c == '_' for c in safe):
-            return ""
-        
-        return safe
+    def _get_state_file_path(self, box_id: int) -> Path:
+        """State dosya yolu - başlık / sıra değil kutu ID'si (bkz. StateFileManager)"""
+        from ui.words_panel.detail_window.states.state_file_manager import StateFileManager
+        return Path(StateFileManager().path_for_box(box_id))
     
     def _validate_state_file(self, state_data: Dict, box_id: int) -> bool:
         """State dosyasının geçerli olup olmadığını kontrol et"""
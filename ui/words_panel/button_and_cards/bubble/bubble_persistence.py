@@ -1,10 +1,13 @@
 # bubble_persistence.py - TAM KAYIT SİSTEMİ (GÜNCELLENMİŞ)
 from __future__ import annotations
+import logging
 from typing import TYPE_CHECKING
 from PyQt6.QtCore import QTimer
 import json
 import re
 
+logger = logging.getLogger(__name__)
+
 if TYPE_CHECKING:
     from PyQt6.QtWidgets import QWidget
 
@@ -57,7 +60,7 @@ def save_bubble(bubble: QWidget) -> bool:
         )
         
         if result:
-            print(f"✅ [save_bubble] Bubble kaydedildi - ID: {card_id}, Boyut: {width}x{height}, HTML: {len(html_content)}")
+            logger.debug("✅ [save_bubble] Bubble kaydedildi - ID: %s, Boyut: %sx%s, HTML: %s", card_id, width, height, len(html_content))
             
             # 7. ORİJİNAL KART İSE SENKRONİZASYON
             if _is_original_card(bubble):
@@ -66,7 +69,7 @@ def save_bubble(bubble: QWidget) -> bool:
         return result
 
     except Exception as e:
-        print(f"❌ [save_bubble] Hata: {e}")
+        logger.error("❌ [save_bubble] Hata: %s", e)
         return False
     finally:
         _SAVING_IN_PROGRESS = False
@@ -102,13 +105,13 @@ def _notify_copy_bubbles_updated(original_id, html_content, bubble_widget):
                 width=width,
                 height=height
             )
-            print(f"✅ [_notify_copy_bubbles_updated] Kopya bubble'lara bildirildi: {original_id}")
+            logger.debug("✅ [_notify_copy_bubbles_updated] Kopya bubble'lara bildirildi: %s", original_id)
             
         except ImportError as e:
-            print(f"⚠️ [_notify_copy_bubbles_updated] CopyBubbleSyncManager bulunamadı: {e}")
+            logger.warning("⚠️ [_notify_copy_bubbles_updated] CopyBubbleSyncManager bulunamadı: %s", e)
             
     except Exception as e:
-        print(f"❌ [_notify_copy_bubbles_updated] Hata: {e}")
+        logger.error("❌ [_notify_copy_bubbles_updated] Hata: %s", e)
 
 def _save_to_copy_bubbles_old(bubble, original_id, html_content):
     """Eski sistem - Geriye dönük uyumluluk"""
@@ -0,0 +1,110 @@
+# bubble_text_metrics.py
+"""
+Bubble auto-resize için artımlı metin ölçümü.
+
+Her değişiklikte tüm metni toPlainText() ile kurup her satırı yeniden
+ölçmek yerine blok (paragraf) başına genişlik ve satır sayısı saklanır;
+QTextDocument.contentsChange ile sadece değişen bloklar yeniden ölçülür.
+Böylece uzun notlarda yazma gecikmesi not boyuyla büyümez.
+"""
+import logging
+
+from PyQt6.QtCore import QObject
+
+logger = logging.getLogger(__name__)
+
+# QTextBlock.text() içinde Shift+Enter ile girilen satır ayırıcı
+LINE_SEPARATOR = '\u2028'
+
+
+class BubbleTextMetrics(QObject):
+    """Bir QTextEdit'in blok genişliklerini önbellekte tutar"""
+
+    def __init__(self, text_edit):
+        super().__init__(text_edit)
+        self._text_edit = text_edit
+        self._widths = []  # blok numarası -> en geniş satırın genişliği
+        self._lines = []   # blok numarası -> satır sayısı
+        self._font_key = None
+        self._valid = False
+        self.measured_blocks = 0  # toplam ölçülen blok (tanılama için)
+
+        text_edit.document().contentsChange.connect(self._on_contents_change)
+
+    def _measure(self, block, fm):
+        self.measured_blocks += 1
+        lines = block.text().split(LINE_SEPARATOR)
+        return max(fm.horizontalAdvance(line) for line in lines), len(lines)
+
+    def _rebuild(self, fm):
+        widths = []
+        line_counts = []
+        block = self._text_edit.document().firstBlock()
+        while block.isValid():
+            width, lines = self._measure(block, fm)
+            widths.append(width)
+            line_counts.append(lines)
+            block = block.next()
+
+        self._widths = widths
+        self._lines = line_counts
+        self._valid = True
+
+    def _on_contents_change(self, position, chars_removed, chars_added):
+        if not self._valid:
+            return
+
+        try:
+            document = self._text_edit.document()
+            first_block = document.findBlock(position)
+            last_block = document.findBlock(position + chars_added)
+            if not first_block.isValid():
+                self._valid = False
+                return
+            if not last_block.isValid():
+                last_block = document.lastBlock()
+
+            first = first_block.blockNumber()
+            last = last_block.blockNumber()
+
+            # Değişiklikten önce first..old_last olan bloklar şimdi first..last
+            old_last = last - (document.blockCount() - len(self._widths))
+            if first > len(self._widths) or old_last < first - 1 or old_last >= len(self._widths):
+                self._valid = False
+                return
+
+            fm = self._text_edit.fontMetrics()
+            widths = []
+            line_counts = []
+            block = first_block
+            while block.isValid() and block.blockNumber() <= last:
+                width, lines = self._measure(block, fm)
+                widths.append(width)
+                line_counts.append(lines)
+                block = block.next()
+
+            self._widths[first:old_last + 1] = widths
+            self._lines[first:old_last + 1] = line_counts
+
+            if len(self._widths) != document.blockCount():
+                self._valid = False
+
+        except Exception as e:
+            logger.debug("⚠️ [BubbleTextMetrics] Artımlı ölçüm atlandı: %s", e)
+            self._valid = False
+
+    def invalidate(self):
+        """Bir sonraki content_size çağrısında tümünü yeniden ölç"""
+        self._valid = False
+
+    def content_size(self):
+        """(en geniş satır genişliği, toplam satır sayısı)"""
+        fm = self._text_edit.fontMetrics()
+        font_key = self._text_edit.font().key()
+        if not self._valid or font_key != self._font_key:
+            self._font_key = font_key
+            self._rebuild(fm)
+
+        if not self._widths:
+            return 0, 1
+        return max(self._widths), sum(self._lines)
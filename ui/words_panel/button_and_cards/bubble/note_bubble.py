@@ -1,10 +1,14 @@
+import logging
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QSizePolicy
 from PyQt6.QtCore import Qt, QPoint, pyqtSignal, QTimer, QEvent
 from PyQt6.QtGui import QPainter, QColor, QPen
 
 from .bubble_text import BubbleText
+from .bubble_text_metrics import BubbleTextMetrics
 from .bubble_persistence import save_bubble, load_bubble
 
+logger = logging.getLogger(__name__)
+
 
 class NoteBubble(QWidget):
     """KARTLAR İÇİN BUBBLE - SENKRONİZASYON YOK, BASİT VERSİYON"""
@@ -18,6 +22,7 @@ class NoteBubble(QWidget):
     SCREEN_PAD = 24
     CONTENT_PAD_W = 48
     CONTENT_PAD_H = 48
+    RESIZE_FRAME_MS = 16  # auto-resize en fazla kare başına bir kez
 
     def __init__(self, parent=None, card_view=None, state=None, db=None, is_copy=False):
         super().__init__(parent)
@@ -71,8 +76,14 @@ class NoteBubble(QWidget):
         
         layout.addWidget(self.text)
 
-        # AUTO RESIZE
-        self.text.document().contentsChanged.connect(self._auto_resize_to_text)
+        # AUTO RESIZE - her tuşta değil, kare başına bir kez
+        self._text_metrics = BubbleTextMetrics(self.text)
+        self._restore_focus_after_resize = False
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(self.RESIZE_FRAME_MS)
+        self._resize_timer.timeout.connect(self._auto_resize_to_text)
+        self.text.document().contentsChanged.connect(self._schedule_auto_resize)
 
         # AUTO SAVE SYSTEM - ✅ SADECE ORİJİNAL KARTLAR İÇİN
         if not self.is_copy:
@@ -87,7 +98,7 @@ class NoteBubble(QWidget):
             self._auto_save_timer = None
 
         # ✅ SENKRONİZASYON YOK - BASİT
-        print(f"✅ [NoteBubble] Oluşturuldu - card_id: {self.card_id}, is_copy: {is_copy}")
+        logger.debug("✅ [NoteBubble] Oluşturuldu - card_id: %s, is_copy: %s", self.card_id, is_copy)
 
         # LOAD SAVED CONTENT
         if self.card_id:
@@ -126,24 +137,28 @@ class NoteBubble(QWidget):
         self.bubble_closed.emit()
         super().closeEvent(event)
 
+    def _schedule_auto_resize(self):
+        """Aynı karedeki değişiklikleri tek bir auto-resize'da birleştir"""
+        if not self._resize_timer.isActive():
+            self._resize_timer.start()
+
     def _auto_resize_to_text(self):
         """Auto-resize fonksiyonu"""
         try:
             if not hasattr(self, 'text'):
                 return
+
+            self._resize_timer.stop()
                 
             text_widget = self.text
             had_focus = text_widget.hasFocus()
 
-            fm = text_widget.fontMetrics()
-            plain = text_widget.document().toPlainText()
-            lines = plain.splitlines() or [""]
-
-            max_line_width = max(fm.horizontalAdvance(line) for line in lines)
+            # Sadece son ölçümden beri değişen bloklar yeniden ölçülür
+            max_line_width, line_count = self._text_metrics.content_size()
             content_w = max_line_width + self.CONTENT_PAD_W
 
-            line_height = fm.lineSpacing()
-            content_h = (len(lines) * line_height) + self.CONTENT_PAD_H
+            line_height = text_widget.fontMetrics().lineSpacing()
+            content_h = (line_count * line_height) + self.CONTENT_PAD_H
 
             target_w = max(self.MIN_W, content_w)
             target_h = max(self.MIN_H, content_h)
@@ -195,13 +210,18 @@ class NoteBubble(QWidget):
 
             if target_w != cur_w or target_h != cur_h or x != geo.x() or y != geo.y():
                 self.setGeometry(x, y, target_w, target_h)
-                if had_focus:
-                    QTimer.singleShot(0, text_widget.setFocus)
-
-                QTimer.singleShot(0, self._snap_back_next_to_card)
+                self._restore_focus_after_resize = had_focus
+                QTimer.singleShot(0, self._after_auto_resize)
                 
         except Exception as e:
-            print(f"❌ [NoteBubble._auto_resize_to_text] Hata: {e}")
+            logger.error("❌ [NoteBubble._auto_resize_to_text] Hata: %s", e)
+
+    def _after_auto_resize(self):
+        """Resize sonrası tek geri çağrı: odağı geri ver, kartın yanına hizala"""
+        if getattr(self, '_restore_focus_after_resize', False):
+            self._restore_focus_after_resize = False
+            self.text.setFocus()
+        self._snap_back_next_to_card()
 
     def _snap_back_next_to_card(self):
         """Bubble açıkken, resize sonrası tekrar kartın yanına hizalar."""
@@ -263,7 +283,7 @@ class NoteBubble(QWidget):
                 self._last_saved_size = (self.width(), self.height())
                 
         except Exception as e:
-            print(f"❌ [NoteBubble._perform_auto_save] Hata: {e}")
+            logger.error("❌ [NoteBubble._perform_auto_save] Hata: %s", e)
 
     def _force_save_immediately(self):
         """Hemen kaydet - ✅ SADECE ORİJİNAL"""
@@ -277,7 +297,7 @@ class NoteBubble(QWidget):
             if self.card_id:
                 save_bubble(self)
         except Exception as e:
-            print(f"❌ [NoteBubble._force_save_immediately] Hata: {e}")
+            logger.error("❌ [NoteBubble._force_save_immediately] Hata: %s", e)
 
     def _load_saved_content_delayed(self):
         """Kaydedilmiş içeriği yükle"""
@@ -305,9 +325,9 @@ class NoteBubble(QWidget):
                             original_data = load_bubble(original_id)
                             if original_data and original_data.get("html"):
                                 html_content = original_data.get("html", "")
-                                print(f"✅ [NoteBubble] Kopya kart için orijinal bubble yüklendi: {original_id}")
+                                logger.debug("✅ [NoteBubble] Kopya kart için orijinal bubble yüklendi: %s", original_id)
                     except Exception as e:
-                        print(f"⚠️ [NoteBubble] Orijinal bubble yükleme hatası: {e}")
+                        logger.warning("⚠️ [NoteBubble] Orijinal bubble yükleme hatası: %s", e)
                 
                 if html_content:
                     self.text.setHtml(html_content)
@@ -318,7 +338,7 @@ class NoteBubble(QWidget):
                 h = max(self.MIN_H, int(data.get("height", self.MIN_H) or self.MIN_H)) if data else self.MIN_H
                 self.resize(w, h)
                 
-                print(f"✅ [NoteBubble] Kopya kart bubble içeriği yüklendi")
+                logger.debug("✅ [NoteBubble] Kopya kart bubble içeriği yüklendi")
                 
             else:
                 # ORİJİNAL KARTLAR İÇİN NORMAL YÜKLEME
@@ -333,7 +353,7 @@ class NoteBubble(QWidget):
                     self._last_saved_html = data.get("html", "")
                     self._last_saved_size = (w, h)
                     
-                    print(f"✅ [NoteBubble] Orijinal kart bubble içeriği yüklendi")
+                    logger.debug("✅ [NoteBubble] Orijinal kart bubble içeriği yüklendi")
                     
                 elif isinstance(data, str):
                     self.text.setHtml(data)
@@ -342,7 +362,7 @@ class NoteBubble(QWidget):
                     self.text.setHtml("<p></p>")
 
         except Exception as e:
-            print(f"❌ [NoteBubble._load_saved_content_delayed] Hata: {e}")
+            logger.error("❌ [NoteBubble._load_saved_content_delayed] Hata: %s", e)
             self.text.setHtml("<p></p>")
 
     def paintEvent(self, event):
@@ -393,10 +413,10 @@ class NoteBubble(QWidget):
             if not self.is_copy:
                 self.text.setFocus()
                 
-            print(f"✅ [NoteBubble.open_near] Bubble açıldı - is_copy: {self.is_copy}")
+            logger.debug("✅ [NoteBubble.open_near] Bubble açıldı - is_copy: %s", self.is_copy)
                 
         except Exception as e:
-            print(f"❌ [NoteBubble.open_near] Hata: {e}")
+            logger.error("❌ [NoteBubble.open_near] Hata: %s", e)
 
     def adjust_to_content(self):
         """Uyumluluk için"""
@@ -405,7 +425,7 @@ class NoteBubble(QWidget):
     def cleanup(self):
         """Temizlik"""
         try:
-            print(f"🔵 [NoteBubble.cleanup] Temizleniyor - card_id: {self.card_id}, is_copy: {self.is_copy}")
+            logger.debug("🔵 [NoteBubble.cleanup] Temizleniyor - card_id: %s, is_copy: %s", self.card_id, self.is_copy)
             
             # Toolbar temizliği
             if hasattr(self, 'text') and self.text:
@@ -421,7 +441,7 @@ class NoteBubble(QWidget):
             self.setParent(None)
             self.deleteLater()
             
-            print(f"✅ [NoteBubble.cleanup] Temizlendi")
+            logger.debug("✅ [NoteBubble.cleanup] Temizlendi")
             
         except Exception as e:
-            print(f"❌ [NoteBubble.cleanup] Hata: {e}")
\ No newline at end of file
+            logger.error("❌ [NoteBubble.cleanup] Hata: %s", e)
\ No newline at end of file
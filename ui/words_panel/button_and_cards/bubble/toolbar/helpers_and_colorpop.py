@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import logging
 from typing import TYPE_CHECKING
 
 from PyQt6.QtWidgets import (
@@ -9,6 +10,8 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, QObject, QEvent, QPoint, QRect
 from PyQt6.QtGui import QTextCharFormat, QTextCursor, QColor
 
+logger = logging.getLogger(__name__)
+
 if TYPE_CHECKING:
     from .floating_toolbar import FloatingToolbar
 
@@ -291,7 +294,7 @@ class ColorPopup(QFrame):
     def cleanup(self):
         """Popup'ı temizle"""
         try:
-            print("🧹 Cleaning up color popup...")
+            logger.debug("🧹 Cleaning up color popup...")
             
             # 1. Event filter'ı kaldır
             self._remove_event_filter()
@@ -306,10 +309,10 @@ class ColorPopup(QFrame):
             # 4. Parent'ı temizle
             self.setParent(None)
             
-            print("✅ Color popup cleaned up")
+            logger.debug("✅ Color popup cleaned up")
             
         except Exception as e:
-            print(f"❌ Color popup cleanup error: {e}")
+            logger.error("❌ Color popup cleanup error: %s", e)
 
 # ======================================================
 # COLOR POPUP CLOSE FILTER
@@ -2,12 +2,17 @@
 Kart ışınlama (teleportation) işlemleri - SEÇİM SENKRONİZASYONU
 """
 
+import logging
 import json
 from typing import Optional, Dict, Any, List
 from PyQt6.QtWidgets import QWidget, QMenu, QApplication
 from PyQt6.QtGui import QAction
 from PyQt6.QtCore import QTimer, Qt, pyqtSignal, QObject
 from core.database import Database
+from ui.refresh_scheduler import get_refresh_scheduler, RefreshKind
+from ui.widget_registry import get_widget_registry, ViewKind
+
+logger = logging.getLogger(__name__)
 
 
 class CardTeleporter(QObject):
@@ -227,20 +232,13 @@ class CardTeleporter(QObject):
     # ==================== KUTU LİSTESİ ====================
     
     def _get_boxes_with_names(self):
+        """Menü için kullanıcı kutuları - kutu dizininden, menü açılışında sorgu yok"""
         try:
-            boxes_result = self.db.get_boxes()
             boxes_with_details = []
             
-            for item in boxes_result:
+            for info in self.db.boxes.user_boxes():
                 try:
-                    if isinstance(item, tuple) and len(item) >= 2:
-                        box_id, title = item[0], item[1]
-                    elif isinstance(item, dict):
-                        box_id, title = item.get('id'), item.get('title', f'Kutu {item.get("id")}')
-                    else:
-                        box_id, title = item, f'Kutu {item}'
-                    
-                    box_id = int(box_id)
+                    box_id, title = info.id, str(info.title or '')
                     if '📦' in title:
                         title = title.replace('📦', '').strip()
                     if not title or title == 'None':
@@ -342,23 +340,16 @@ class CardTeleporter(QObject):
     def _notify_all_containers_before_removal(self, card_ids: List[int]):
         """Tüm açık BoxDetailContent pencerelerini kartların kaldırılacağı konusunda bilgilendir"""
         try:
-            from PyQt6.QtWidgets import QApplication
-            
-            app = QApplication.instance()
-            if not app:
-                return
-            
-            # Tüm BoxDetailContent widget'larını bul
-            for widget in app.allWidgets():
+            # Açık BoxDetailContent'ler kayıt defterinden gelir
+            for widget in get_widget_registry().iter_kind(ViewKind.DETAIL_CONTENT):
                 try:
-                    if hasattr(widget, '__class__') and widget.__class__.__name__ == 'BoxDetailContent':
-                        # Her kart için container'ı güncelle
-                        for card_id in card_ids:
-                            QTimer.singleShot(10, lambda w=widget, cid=card_id: w._remove_card_immediately(cid))
+                    # Her kart için container'ı güncelle
+                    for card_id in card_ids:
+                        QTimer.singleShot(10, lambda w=widget, cid=card_id: w._remove_card_immediately(cid))
                 except RuntimeError:
                     continue  # Widget silinmiş olabilir
         except Exception as e:
-            print(f"❌ Container bildirimi hatası: {e}")
+            logger.error("❌ Container bildirimi hatası: %s", e)
     
     def _teleport_cards_to_box(self, card_widgets: List, target_box_id: int, box_title: str) -> bool:
         # Önce geçerli widget'ları filtrele
@@ -469,8 +460,9 @@ class CardTeleporter(QObject):
     def _force_refresh_box_counters(self, old_box_ids: List[int], new_box_id: int):
         """DB sorgusu ile zorla sayaçları güncelle"""
         try:
-            # Tüm kutuların sayaçlarını güncelle
+            # Tüm kutuların sayaçlarını güncelle - aynı kutu tek seferde yenilenir
             all_box_ids = set(old_box_ids + [new_box_id])
+            scheduler = get_refresh_scheduler()
             
             for box_id in all_box_ids:
                 if not box_id:
@@ -479,9 +471,10 @@ class CardTeleporter(QObject):
                 # BoxView'ı bul
                 box_view = self._find_box_view_by_id(box_id)
                 if box_view:
-                    QTimer.singleShot(100, box_view.refresh_card_counts)
+                    scheduler.mark_dirty(RefreshKind.BOX_VIEW_COUNT, box_id, box_view.refresh_card_counts)
                 else:
-                    QTimer.singleShot(200, lambda b_id=box_id: self._refresh_box_from_db(b_id))
+                    scheduler.mark_dirty(RefreshKind.BOX_VIEW_COUNT, box_id,
+                                         lambda b_id=box_id: self._refresh_box_from_db(b_id))
             
         except Exception:
             pass
@@ -489,11 +482,7 @@ class CardTeleporter(QObject):
     def _find_box_view_by_id(self, box_id: int):
         """Box ID'ye göre BoxView'ı bul"""
         try:
-            words_window = self._find_words_window()
-            if words_window and hasattr(words_window, 'container'):
-                for box in words_window.container.boxes:
-                    if hasattr(box, 'db_id') and box.db_id == box_id:
-                        return box
+            return get_widget_registry().get(ViewKind.BOX_VIEW, box_id)
         except Exception:
             pass
         return None
@@ -600,19 +589,8 @@ class CardTeleporter(QObject):
             
             # Yeni kutu state'ine kartları ekle
             try:
-                box_title = f"Kutu {new_box_id}"
-                boxes = self._get_boxes_with_names()
-                for bid, title in boxes:
-                    if bid == new_box_id:
-                        box_title = title
-                        break
-                
-                ui_index = 1
-                boxes_list = self.db.get_boxes()
-                for idx, (bid, _) in enumerate(boxes_list, 1):
-                    if bid == new_box_id:
-                        ui_index = idx
-                        break
+                box_title = self.db.boxes.title(new_box_id) or f"Kutu {new_box_id}"
+                ui_index = self.db.boxes.ui_index(new_box_id)
                 
                 new_state = state_loader.load_or_create(new_box_id, box_title, ui_index)
                 if not new_state:
@@ -641,19 +619,8 @@ class CardTeleporter(QObject):
             for old_box_id in old_box_ids:
                 if old_box_id:
                     try:
-                        old_box_title = f"Kutu {old_box_id}"
-                        boxes = self._get_boxes_with_names()
-                        for bid, title in boxes:
-                            if bid == old_box_id:
-                                old_box_title = title
-                                break
-                        
-                        old_ui_index = 1
-                        boxes_list = self.db.get_boxes()
-                        for idx, (bid, _) in enumerate(boxes_list, 1):
-                            if bid == old_box_id:
-                                old_ui_index = idx
-                                break
+                        old_box_title = self.db.boxes.title(old_box_id) or f"Kutu {old_box_id}"
+                        old_ui_index = self.db.boxes.ui_index(old_box_id)
                         
                         old_state = state_loader.load_or_create(old_box_id, old_box_title, old_ui_index)
                         if old_state:
@@ -747,7 +714,7 @@ class CardTeleporter(QObject):
                 pass
                 
         except Exception as e:
-            print(f"❌ Kart temizleme hatası: {e}")
+            logger.error("❌ Kart temizleme hatası: %s", e)
     
     def _delete_from_detail_window(self, card_view):
         try:
@@ -1,9 +1,12 @@
 # file: ui/words_panel/button_and_cards/flash_card_detail/real_card_color_overlay.py
 
+import logging
 from PyQt6.QtWidgets import QWidget
 from PyQt6.QtCore import Qt, pyqtSignal, QTimer
 from PyQt6.QtGui import QPainter, QColor, QBrush, QPainterPath
 
+logger = logging.getLogger(__name__)
+
 
 class ColorOverlayWidget(QWidget):
     """
@@ -48,7 +51,7 @@ class ColorOverlayWidget(QWidget):
         # Başlangıçta gizle
         self.hide()
         
-        print(f"🆕 ColorOverlayWidget oluşturuldu (YUVARLAK KÖŞELİ) - {self}")
+        logger.debug("🆕 ColorOverlayWidget oluşturuldu (YUVARLAK KÖŞELİ) - %s", self)
     
     def set_database(self, db):
         self.db = db
@@ -83,14 +86,14 @@ class ColorOverlayWidget(QWidget):
                 box_id = row[0] if row[0] is not None else 0
                 count = row[1]
                 self.target_boxes = {box_id: count}
-                print(f"📊 Overlay: Kutu {box_id} - {count} kopya")
+                logger.debug("📊 Overlay: Kutu %s - %s kopya", box_id, count)
             
             self.is_loaded = True
             self._update_overlay_visibility()
             self.overlay_updated.emit()
             
         except Exception as e:
-            print(f"❌ Overlay yükleme hatası: {e}")
+            logger.error("❌ Overlay yükleme hatası: %s", e)
             self.target_boxes = {}
             self.hide()
     
@@ -111,7 +114,7 @@ class ColorOverlayWidget(QWidget):
             self.update()
             
             box_id = list(self.target_boxes.keys())[0]
-            print(f"✅ Overlay GÖSTERİLDİ! Kutu {box_id}")
+            logger.debug("✅ Overlay GÖSTERİLDİ! Kutu %s", box_id)
         else:
             self.is_visible = False
             self.hide()
@@ -146,12 +149,12 @@ class ColorOverlayWidget(QWidget):
                 box_id = row[0] if row[0] is not None else 0
                 count = row[1]
                 self.target_boxes = {box_id: count}
-                print(f"🔄 Overlay güncellendi: Kutu {box_id} - {count} kopya")
+                logger.debug("🔄 Overlay güncellendi: Kutu %s - %s kopya", box_id, count)
             
             self._update_overlay_visibility()
             
         except Exception as e:
-            print(f"❌ update_for_card_move hatası: {e}")
+            logger.error("❌ update_for_card_move hatası: %s", e)
             self.schedule_lazy_update()
     
     def parent_resized(self):
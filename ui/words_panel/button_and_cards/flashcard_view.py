@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import logging
 import json
 import uuid
 
@@ -15,19 +16,22 @@ from PyQt6.QtGui import (
     QPen, QAction, QCursor
 )
 from PyQt6.QtCore import (
-    Qt, pyqtSignal, QTimer, QSize,
+    Qt, pyqtSignal, pyqtSlot, QTimer, QSize,
     QMimeData, QByteArray, QPoint, QRect
 )
 
 from ui.words_panel.button_and_cards.bubble.note_bubble import NoteBubble
 from ui.words_panel.button_and_cards.bubble.bubble_opening import open_bubble, close_bubble
-from ui.words_panel.button_and_cards.bubble.bubble_persistence import load_bubble, delete_bubble, save_bubble
+from ui.words_panel.button_and_cards.bubble.bubble_persistence import load_bubble, save_bubble
 
 from ui.words_panel.button_and_cards.flash_card_detail.original_card_dialogs import (
     show_original_card_delete_dialog
 )
 
 from ui.words_panel.button_and_cards.flash_card_detail.real_card_color_overlay import ColorOverlayWidget
+from ui.card_store import get_card_store
+
+logger = logging.getLogger(__name__)
 
 
 class DynamicField(QLineEdit):
@@ -179,6 +183,7 @@ class FlashCardView(QFrame):
         self.is_newly_created = False
         self.temp_id = None
         self.is_copy_card = False
+        self._writing_model = False
         
         self.is_selected_for_teleport = False
         self.selection_manager = None
@@ -232,6 +237,9 @@ class FlashCardView(QFrame):
         
         self.color_overlay = None
         
+        # Aynı kaydı başka bir tutucu değiştirince (CardStore.update) alanları tazele
+        get_card_store().card_changed.connect(self._on_record_changed)
+        
         if data is not None:
             self.bind_model(data)
         else:
@@ -249,7 +257,7 @@ class FlashCardView(QFrame):
         if hasattr(self, 'is_copy_card') and self.is_copy_card:
             return
         
-        print(f"🎨 [_init_color_overlay] Overlay oluşturuluyor - Kart: {self.card_id}")
+        logger.debug("🎨 [_init_color_overlay] Overlay oluşturuluyor - Kart: %s", self.card_id)
         
         # Mevcut overlay varsa temizle
         if self.color_overlay:
@@ -276,7 +284,7 @@ class FlashCardView(QFrame):
         if self.card_id and self.db:
             self.color_overlay.schedule_lazy_update(force=True)
         
-        print(f"✅ [_init_color_overlay] Overlay oluşturuldu ve gösterildi")
+        logger.debug("✅ [_init_color_overlay] Overlay oluşturuldu ve gösterildi")
     
     def _lazy_init_overlay(self):
         """Overlay'ı geciktirilmiş başlat"""
@@ -332,7 +340,7 @@ class FlashCardView(QFrame):
                         count = cursor.fetchone()[0]
                         
                         if count > 0:
-                            print(f"🚨 ZORLA overlay gösteriliyor! Kopya sayısı: {count}")
+                            logger.debug("🚨 ZORLA overlay gösteriliyor! Kopya sayısı: %s", count)
                             
                             # EN ÇOK KOPYA OLAN MEMORY BOX'U BUL (1-5 ARASI)
                             cursor.execute("""
@@ -362,12 +370,12 @@ class FlashCardView(QFrame):
                                 self.color_overlay.raise_()
                                 self.color_overlay.update()
                                 
-                                print(f"✅ Overlay ZORLA gösterildi! Kutu {box_id} - {count} kopya")
+                                logger.debug("✅ Overlay ZORLA gösterildi! Kutu %s - %s kopya", box_id, count)
                             
                     except Exception as e:
-                        print(f"❌ _force_show_overlay hatası: {e}")
+                        logger.error("❌ _force_show_overlay hatası: %s", e)
         except Exception as e:
-            print(f"❌ _force_show_overlay genel hata: {e}")
+            logger.error("❌ _force_show_overlay genel hata: %s", e)
 
     def _show_context_menu(self, position):
         if not self.teleporter:
@@ -521,7 +529,8 @@ class FlashCardView(QFrame):
             if model_back:
                 current_back_text = model_back
         
-        self.data = model
+        # Aynı kart için tüm görünümler tek kaydı paylaşır
+        self.data = get_card_store().intern(model)
         self.is_newly_created = False
         
         if isinstance(model, dict):
@@ -619,13 +628,13 @@ class FlashCardView(QFrame):
                         count = cursor.fetchone()[0]
                         
                         if count > 0:
-                            print(f"🚨 ZORLA overlay gösteriliyor! Kopya sayısı: {count}")
+                            logger.debug("🚨 ZORLA overlay gösteriliyor! Kopya sayısı: %s", count)
                             self.color_overlay.schedule_lazy_update(force=True)
                             self.color_overlay.show()
                             self.color_overlay.raise_()
                             self.color_overlay.update()
                     except Exception as e:
-                        print(f"❌ _force_show_overlay hatası: {e}")
+                        logger.error("❌ _force_show_overlay hatası: %s", e)
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
@@ -728,13 +737,7 @@ class FlashCardView(QFrame):
                 success = self._save_new_card()
                 if success:
                     if self.data:
-                        if isinstance(self.data, dict):
-                            self.data["id"] = self.card_id
-                        else:
-                            try:
-                                self.data.id = self.card_id
-                            except:
-                                pass
+                        self._write_model(id=self.card_id)
                     self._notify_parent_card_saved()
                 return
             
@@ -790,25 +793,16 @@ class FlashCardView(QFrame):
                     success = False
             
             if success:
-                if isinstance(self.data, dict):
-                    self.data["english"] = english
-                    self.data["turkish"] = turkish
-                    self.data["detail"] = detail_json
-                    self.data["box_id"] = self.box_id
-                    self.data["bucket"] = self.bucket_id
-                    self.data["is_copy"] = False
-                elif self.data:
-                    try:
-                        self.data.english = english
-                        self.data.turkish = turkish
-                        self.data.detail = detail_json
-                        self.data.box_id = self.box_id
-                        self.data.bucket = self.bucket_id
-                        self.data.is_copy = False
-                    except:
-                        pass
+                self._write_model(
+                    id=self.card_id,
+                    english=english,
+                    turkish=turkish,
+                    detail=detail_json,
+                    box_id=self.box_id,
+                    bucket=self.bucket_id,
+                    is_copy=False
+                )
                 
-                self._update_parent_data()
                 self._update_state_file()
                 self.updated.emit(self)
                 
@@ -834,22 +828,61 @@ class FlashCardView(QFrame):
         except Exception:
             pass
 
-    def _update_parent_data(self):
+    def _write_model(self, **fields):
+        """Kart verisini paylaşılan kayda yaz - aynı kaydı tutan herkes güncel kalır"""
+        store = get_card_store()
+        self._writing_model = True
         try:
-            parent = self.parent()
-            if not parent or not hasattr(parent, '_data'):
-                return
-            
-            for i, item in enumerate(parent._data):
-                if isinstance(item, dict) and item.get('id') == self.card_id:
-                    parent._data[i] = self.data.copy() if isinstance(self.data, dict) else self.data
-                    break
-                elif hasattr(item, 'id') and item.id == self.card_id:
-                    parent._data[i] = self.data
-                    break
-            
-        except Exception:
-            pass
+            if self.data is None:
+                self.data = store.intern(fields)
+            else:
+                self.data = store.intern(self.data)
+                store.update(self.data, **fields)
+        finally:
+            self._writing_model = False
+    
+    @pyqtSlot(object)
+    def _on_record_changed(self, record):
+        """Paylaşılan kayıt başka bir tutucuda değişti - alanları kayıttan tazele"""
+        if record is not self.data or self._writing_model:
+            return
+        
+        self.card_id = record.id
+        self.box_id = record.box_id
+        self.bucket_id = record.bucket or 0
+        
+        # Düzenlenmekte olan metin ezilmez; kaydedilince kayıt bu görünümden eşitlenir
+        if any(field.get_is_modified() for field in self.front_fields + self.back_fields):
+            return
+        
+        front_texts, back_texts = record.field_texts()
+        changed = self._replace_field_texts(True, front_texts)
+        changed = self._replace_field_texts(False, back_texts) or changed
+        if changed:
+            self._relayout()
+            self.update_fields()
+    
+    def _replace_field_texts(self, is_front, texts):
+        """Bir yüzün alanlarını verilen metinlerle değiştir (otomatik kayıt tetiklenmez)"""
+        fields = self.front_fields if is_front else self.back_fields
+        texts = [text.strip() for text in texts[:self.MAX_FIELDS]]
+        if [field.text() for field in fields] == texts:
+            return False
+        
+        for field in fields[len(texts):]:
+            field.hide()
+            field.deleteLater()
+        del fields[len(texts):]
+        
+        for field, text in zip(fields, texts):
+            field.blockSignals(True)
+            field.setText(text)
+            field.blockSignals(False)
+        
+        for text in texts[len(fields):]:
+            field = self._create_field(is_front, text)
+            field.text_changed_signal.connect(self._schedule_save)
+        return True
 
     def _update_state_file(self):
         try:
@@ -1033,31 +1066,17 @@ class FlashCardView(QFrame):
             if copy_cards:
                 self._cleanup_specific_card_copies(self.card_id, copy_cards)
             
-            if copy_cards:
-                try:
-                    cursor = self.db.conn.cursor()
-                    placeholders = ','.join(['?' for _ in copy_cards])
-                    cursor.execute(f"DELETE FROM words WHERE id IN ({placeholders})", copy_cards)
-                    self.db.conn.commit()
-                except Exception:
-                    self.db.conn.rollback()
-            
+            # Kart, kopyaları ve notları tek transaction'da
             try:
-                success = self.db.delete_word(int(self.card_id))
-                if not success:
-                    cursor = self.db.conn.cursor()
-                    cursor.execute("DELETE FROM words WHERE id = ?", (self.card_id,))
-                    self.db.conn.commit()
+                if not self.db.delete_cards([int(self.card_id)] + copy_cards):
+                    return
             except Exception:
                 return
             
-            try:
-                from ui.words_panel.button_and_cards.bubble.bubble_persistence import delete_bubble
-                delete_bubble(self.card_id)
-                for copy_id in copy_cards:
-                    delete_bubble(copy_id)
-            except:
-                pass
+            store = get_card_store()
+            store.remove(self.card_id)
+            for copy_id in copy_cards:
+                store.remove(copy_id)
             
             self._remove_from_state()
             
@@ -1087,16 +1106,12 @@ class FlashCardView(QFrame):
                 return
             
             try:
+                # Kart ve notu tek transaction'da
                 self.db.delete_word(int(self.card_id))
+                get_card_store().remove(self.card_id)
             except Exception:
                 pass
             
-            try:
-                from ui.words_panel.button_and_cards.bubble.bubble_persistence import delete_bubble
-                delete_bubble(self.card_id)
-            except:
-                pass
-            
             self._remove_from_state()
             
             try:
@@ -1160,34 +1175,26 @@ class FlashCardView(QFrame):
     def _immediate_memory_box_update(self, box_id):
         try:
             from PyQt6.QtWidgets import QApplication
-            from PyQt6.QtCore import QTimer
+            from ui.refresh_scheduler import get_refresh_scheduler, RefreshKind
             
             app = QApplication.instance()
             if not app:
                 return
             
-            def update_now():
-                try:
-                    for widget in app.allWidgets():
-                        if hasattr(widget, '__class__') and 'MemoryBox' in widget.__class__.__name__:
-                            if hasattr(widget, 'box_id') and widget.box_id == box_id:
-                                if hasattr(widget, 'update_card_count'):
-                                    widget.update_card_count()
-                                    widget.count_lbl.update()
-                                    widget.btn.update()
-                                    widget.update()
-                                    break
-                    
-                    for widget in app.topLevelWidgets():
-                        if hasattr(widget, 'design'):
-                            if hasattr(widget.design, '_force_immediate_count_update'):
-                                widget.design._force_immediate_count_update()
-                                break
-                            
-                except Exception:
-                    pass
+            from ui.widget_registry import get_widget_registry, ViewKind
+            
+            scheduler = get_refresh_scheduler()
+            
+            memory_box = get_widget_registry().get(ViewKind.MEMORY_BOX, box_id)
+            if memory_box and hasattr(memory_box, 'update_card_count'):
+                scheduler.mark_dirty(RefreshKind.MEMORY_BOX_COUNT, box_id, memory_box.update_card_count)
             
-            QTimer.singleShot(0, update_now)
+            for widget in app.topLevelWidgets():
+                if hasattr(widget, 'design'):
+                    if hasattr(widget.design, '_force_immediate_count_update'):
+                        scheduler.mark_dirty(RefreshKind.WAITING_AREA, None,
+                                             widget.design._force_immediate_count_update)
+                        break
             
         except Exception:
             pass
@@ -1207,12 +1214,11 @@ class FlashCardView(QFrame):
                         widget.update_all_counts()
                         return
             
-            for widget in app.allWidgets():
-                if hasattr(widget, '__class__') and 'MemoryBox' in widget.__class__.__name__:
-                    if hasattr(widget, 'box_id') and widget.box_id == box_id:
-                        if hasattr(widget, 'update_card_count'):
-                            widget.update_card_count()
-                            break
+            from ui.widget_registry import get_widget_registry, ViewKind
+            
+            memory_box = get_widget_registry().get(ViewKind.MEMORY_BOX, box_id)
+            if memory_box and hasattr(memory_box, 'update_card_count'):
+                memory_box.update_card_count()
             
         except Exception:
             pass
@@ -1223,11 +1229,11 @@ class FlashCardView(QFrame):
             if not app:
                 return
             
-            from PyQt6.QtCore import QTimer
+            from ui.refresh_scheduler import get_refresh_scheduler, RefreshKind
             
-            QTimer.singleShot(100, self._refresh_memory_box_counts_once)
-            QTimer.singleShot(300, self._refresh_memory_box_counts_once)
-            QTimer.singleShot(500, self._refresh_memory_box_counts_once)
+            get_refresh_scheduler().mark_dirty(
+                RefreshKind.ALL_BOX_COUNTS, None, self._refresh_memory_box_counts_once
+            )
             
         except Exception:
             pass
@@ -1262,18 +1268,11 @@ class FlashCardView(QFrame):
 
     def _update_box_views_in_container(self, container):
         try:
-            from PyQt6.QtCore import QTimer
-            from ui.words_panel.box_widgets.box_view import BoxView
-            
-            def find_and_update(widget):
-                if isinstance(widget, BoxView) and hasattr(widget, 'refresh_card_counts'):
-                    widget.refresh_card_counts()
-                
-                for child in widget.children():
-                    if isinstance(child, QWidget):
-                        find_and_update(child)
+            from ui.widget_registry import get_widget_registry, ViewKind
             
-            find_and_update(container)
+            for box_view in get_widget_registry().iter_kind(ViewKind.BOX_VIEW):
+                if container.isAncestorOf(box_view) and hasattr(box_view, 'refresh_card_counts'):
+                    box_view.refresh_card_counts()
             
         except Exception:
             pass
@@ -1336,25 +1335,15 @@ class FlashCardView(QFrame):
                 self.is_newly_created = False
                 self.temp_id = None
                 
-                if isinstance(self.data, dict):
-                    self.data["id"] = card_id
-                    self.data["english"] = english
-                    self.data["turkish"] = turkish
-                    self.data["detail"] = detail_json
-                    self.data["box_id"] = self.box_id
-                    self.data["bucket"] = 0
-                    self.data["is_copy"] = False
-                elif self.data:
-                    try:
-                        self.data.id = card_id
-                        self.data.english = english
-                        self.data.turkish = turkish
-                        self.data.detail = detail_json
-                        self.data.box_id = self.box_id
-                        self.data.bucket = 0
-                        self.data.is_copy = False
-                    except:
-                        pass
+                self._write_model(
+                    id=card_id,
+                    english=english,
+                    turkish=turkish,
+                    detail=detail_json,
+                    box_id=self.box_id,
+                    bucket=0,
+                    is_copy=False
+                )
                 
                 if not self.is_copy_card:
                     self._init_color_overlay()
@@ -1466,11 +1455,11 @@ class FlashCardView(QFrame):
     
     def on_card_learned(self):
         """Kart öğrenildi container'ına taşındığında çağrılır"""
-        print(f"🎓 [FlashCardView] on_card_learned çağrıldı - Kart ID: {self.card_id}")
+        logger.debug("🎓 [FlashCardView] on_card_learned çağrıldı - Kart ID: %s", self.card_id)
         
         # ÖNCE: Overlay'i hemen kaldır
         if hasattr(self, 'color_overlay') and self.color_overlay is not None:
-            print(f"   - Overlay bulundu, kaldırılıyor...")
+            logger.debug("   - Overlay bulundu, kaldırılıyor...")
             if hasattr(self.color_overlay, '_hide_overlay'):
                 self.color_overlay._hide_overlay()
             elif hasattr(self.color_overlay, 'hide'):
@@ -1479,9 +1468,9 @@ class FlashCardView(QFrame):
             # Overlay'i temizle
             self.color_overlay.cleanup()
             self.color_overlay = None
-            print(f"   ✅ Overlay tamamen kaldırıldı")
+            logger.debug("   ✅ Overlay tamamen kaldırıldı")
         else:
-            print(f"   - Overlay zaten yok")
+            logger.debug("   - Overlay zaten yok")
         
         # Bucket'ı güncelle
         self.bucket_id = 1
@@ -1490,16 +1479,16 @@ class FlashCardView(QFrame):
         if self.db and self.card_id:
             try:
                 self.db.update_word_bucket(self.card_id, 1)
-                print(f"   ✅ Veritabanı bucket=1 olarak güncellendi")
+                logger.debug("   ✅ Veritabanı bucket=1 olarak güncellendi")
             except Exception as e:
-                print(f"   ❌ Veritabanı güncelleme hatası: {e}")
+                logger.error("   ❌ Veritabanı güncelleme hatası: %s", e)
         
         # UI'ı güncelle
         self.update()
         
         # Notify parent
         self._notify_bucket_changed()
-        print(f"✅ [FlashCardView] on_card_learned tamamlandı")
+        logger.debug("✅ [FlashCardView] on_card_learned tamamlandı")
     
     def _notify_bucket_changed(self):
         try:
@@ -10,6 +10,8 @@ from PyQt6.QtGui import QColor, QPainter, QBrush, QFont, QPolygonF
 from PyQt6.QtCore import Qt, QPointF, QTimer, QEvent
 from PyQt6.QtCore import pyqtSignal
 
+from ui.animation_clock import get_animation_clock
+
 
 class ModernButton(QPushButton):
     def __init__(self, text, parent=None):
@@ -25,9 +27,8 @@ class ModernButton(QPushButton):
         self.intensity = 0.3
         self.target_intensity = 0.3
         
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.animate_step)
-        self.timer.start(16)
+        # Ortak animasyon saati - sadece geçiş sürerken çalışır
+        self.animation_clock = get_animation_clock()
         
         self.shadow = QGraphicsDropShadowEffect()
         self.shadow.setBlurRadius(12)
@@ -54,13 +55,20 @@ class ModernButton(QPushButton):
         self.update()
 
     def animate_step(self):
+        """Intensity'i hedefe yaklaştır - animasyon sürüyorsa True döner"""
         if abs(self.intensity - self.target_intensity) > 0.01:
             self.intensity += (self.target_intensity - self.intensity) * 0.25
-            self.update_style()
-            
-            alpha = min(255, max(0, int(100 * self.intensity)))
-            self.shadow.setColor(QColor(0, 0, 0, alpha))
-            self.update()
+            running = True
+        else:
+            self.intensity = self.target_intensity
+            running = False
+
+        self.update_style()
+        
+        alpha = min(255, max(0, int(100 * self.intensity)))
+        self.shadow.setColor(QColor(0, 0, 0, alpha))
+        self.update()
+        return running
 
     def update_style(self):
         alpha = min(255, max(0, int(255 * self.intensity)))
@@ -150,6 +158,9 @@ class ModernButton(QPushButton):
         self.target_intensity = min(1.0, max(0.0, target_intensity))
         self.setEnabled(enable_button)
         
+        if self.intensity != self.target_intensity:
+            self.animation_clock.request(self.animate_step)
+        
         if enable_button:
             self.setCursor(Qt.CursorShape.PointingHandCursor)
         else:
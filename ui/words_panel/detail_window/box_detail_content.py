@@ -1,6 +1,10 @@
 # ui/words_panel/detail_window/box_detail_content.py
+import logging
 import os
 import sys
+import time
+
+logger = logging.getLogger(__name__)
 
 # ÖNCE import path'ini düzelt
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -12,6 +16,11 @@ from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QPoint
 from PyQt6.QtGui import QPainter, QColor
 from PyQt6.QtWidgets import QApplication
 
+from ui.widget_registry import get_widget_registry, ViewKind
+from ui.card_store import get_card_store
+from .card_loader import BoxCardsLoader, collect_box_cards, order_visible_first
+from .states.state_loader import BoxDetailStateLoader
+
 try:
     from .box_detail_controller import get_controller
     CONTROLLER_AVAILABLE = True
@@ -27,9 +36,9 @@ except ImportError:
 
 try:
     from .card_scroll_layout import CardScrollLayout
-    print("✅ CardScrollLayout import başarılı")
+    logger.debug("✅ CardScrollLayout import başarılı")
 except ImportError as e:
-    print(f"❌ CardScrollLayout import hatası: {e}")
+    logger.error("❌ CardScrollLayout import hatası: %s", e)
     CardScrollLayout = None
 
 # Filtre widget'larını import et
@@ -123,6 +132,18 @@ class DirectionalArrowButton(QPushButton):
 class BoxDetailContent(QWidget):
     card_deleted = pyqtSignal(object)
     card_teleported = pyqtSignal(int)
+    load_progress = pyqtSignal(int, int)  # oluşturulan, toplam
+    first_cards_ready = pyqtSignal()      # görünen ilk kartlar hazır
+    cards_loaded = pyqtSignal()
+    
+    # Her event-loop turunda widget oluşturmaya ayrılan süre (saniye)
+    MATERIALIZE_SLICE = 0.008
+    
+    # Havuzdan dönüşte bundan fazla kart eklenecek/değişecekse tam yükleme yapılır
+    DIFF_RELOAD_LIMIT = 40
+    
+    # Çalışan yükleyici thread'ler (bitene kadar referans tutulur)
+    _active_loaders = set()
     
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -158,6 +179,19 @@ class BoxDetailContent(QWidget):
         self.unknown_scroll_layout = None
         self.learned_scroll_layout = None
         
+        # İki aşamalı yükleme durumu
+        self._load_generation = 0
+        self._collecting = False
+        self._loaded_change_counter = None
+        self._pending_entries = []
+        self._load_total = 0
+        self._first_chunk_done = False
+        self._bulk_loading = False
+        self._materialize_timer = QTimer(self)
+        self._materialize_timer.setSingleShot(True)
+        self._materialize_timer.setInterval(0)
+        self._materialize_timer.timeout.connect(self._materialize_next_chunk)
+        
         # CardTeleporter
         self.card_teleporter = None
         self._create_card_teleporter()
@@ -196,7 +230,7 @@ class BoxDetailContent(QWidget):
 
     def _on_card_learned(self, card):
         """Kart öğrenildi container'ına taşındığında"""
-        print(f"🎓 Kart öğrenildi container'ına taşındı: {card.card_id}")
+        logger.debug("🎓 Kart öğrenildi container'ına taşındı: %s", card.card_id)
         
         # Kartın overlay'ini hemen kaldır
         if hasattr(card, 'on_card_learned'):
@@ -343,10 +377,10 @@ class BoxDetailContent(QWidget):
                 return dialog.exec() == QDialog.DialogCode.Accepted
             else:
                 # Fallback: Basit bir mesaj göster
-                print(f"⚠️ DUPLICATE BULUNDU: {duplicate_info}")
+                logger.warning("⚠️ DUPLICATE BULUNDU: %s", duplicate_info)
                 return True
         except Exception as e:
-            print(f"❌ Global duplicate uyarısı gösterilirken hata: {e}")
+            logger.error("❌ Global duplicate uyarısı gösterilirken hata: %s", e)
         return True  # Hata durumunda devam et
     
     def _show_copy_card_warning(self, copy_cards_in_boxes):
@@ -355,7 +389,7 @@ class BoxDetailContent(QWidget):
                 dialog = CopyCardWarningDialog(copy_cards_in_boxes, self)
                 return dialog.exec() == QDialog.DialogCode.Accepted
         except Exception as e:
-            print(f"❌ Kopya kart uyarısı gösterilirken hata: {e}")
+            logger.error("❌ Kopya kart uyarısı gösterilirken hata: %s", e)
             return True
         return True
     
@@ -375,6 +409,14 @@ class BoxDetailContent(QWidget):
             scroll_layout.filter_cards(lambda card: True)
             return
         
+        # Ek anlamlarla eşleşen kartlar - filtre başına tek index sorgusu
+        field_match_ids = set()
+        if search_text and self.db and hasattr(self.db, 'find_card_ids_by_field_prefix'):
+            try:
+                field_match_ids = self.db.find_card_ids_by_field_prefix(search_text, self.box_id)
+            except Exception as e:
+                logger.debug("card_fields araması yapılamadı: %s", e)
+        
         # Filtre fonksiyonu - BAŞ HARFE GÖRE!
         def filter_func(card_widget):
             card_data = self._get_card_data_for_widget(card_widget, container_type)
@@ -388,12 +430,13 @@ class BoxDetailContent(QWidget):
                 card_data=card_data,
                 search_text=search_text,
                 color_id=color_id if container_type == "unknown" else 0,
-                db=self.db
+                db=self.db,
+                field_match_ids=field_match_ids
             )
         
         # Filtreyi uygula
         scroll_layout.filter_cards(filter_func)
-        print(f"🔍 [BoxDetailContent] {container_type} filtresi uygulandı: '{search_text}'")
+        logger.debug("🔍 [BoxDetailContent] %s filtresi uygulandı: '%s'", container_type, search_text)
     
     def _get_card_data_for_widget(self, card_widget, container_type):
         """Kart widget'ı için veri bul"""
@@ -408,51 +451,36 @@ class BoxDetailContent(QWidget):
         return None
         
     def add_card_to_container(self, container_type, card_data=None, show_duplicate_warning=False):
-        print("=" * 80)
-        print(f"🎴 add_card_to_container ÇAĞRILDI:")
-        print(f"   - Container: {container_type}")
-        print(f"   - show_duplicate_warning: {show_duplicate_warning}")
-        print(f"   - card_data: {card_data}")
+        logger.debug("🎴 add_card_to_container ÇAĞRILDI:")
+        logger.debug("   - Container: %s", container_type)
+        logger.debug("   - show_duplicate_warning: %s", show_duplicate_warning)
+        logger.debug("   - card_data: %s", card_data)
         
         scroll_layout = self.unknown_scroll_layout if container_type == "unknown" else self.learned_scroll_layout
         
         if not scroll_layout:
-            print("❌ Scroll layout yok!")
+            logger.error("❌ Scroll layout yok!")
             return None
         
         try:
             from ui.words_panel.button_and_cards.flashcard_view import FlashCardView
-            print("✅ FlashCardView import edildi")
+            logger.debug("✅ FlashCardView import edildi")
             
-            simple_data = {}
-            if card_data:
-                if isinstance(card_data, dict):
-                    simple_data = card_data.copy()
-                    print(f"   - card_data DICT: {simple_data}")
-                else:
-                    simple_data = {
-                        'id': getattr(card_data, 'id', None),
-                        'english': getattr(card_data, 'english', ''),
-                        'turkish': getattr(card_data, 'turkish', ''),
-                        'detail': getattr(card_data, 'detail', '{}'),
-                        'box_id': getattr(card_data, 'box_id', self.box_id),
-                        'bucket': getattr(card_data, 'bucket', 0)
-                    }
-                    print(f"   - card_data OBJE: {simple_data}")
-            
-            simple_data.setdefault('english', '')
-            simple_data.setdefault('turkish', '')
-            simple_data.setdefault('detail', '{}')
-            
-            print(f"📊 Simple data: {simple_data}")
+            # Kopya yerine paylaşılan kayıt: kart widget'ı, cards_data ve
+            # duplicate checker aynı nesneyi okur
+            simple_data = get_card_store().intern(card_data or {})
+            if simple_data.box_id is None:
+                simple_data.box_id = self.box_id
+            
+            logger.debug("📊 Kart kaydı: %s", simple_data)
             
             # Kart ID kontrolü
             card_id = simple_data.get('id')
-            if card_id:
-                print(f"🔍 Mevcut kart kontrolü: ID={card_id}")
+            if card_id and not self._bulk_loading:
+                logger.debug("🔍 Mevcut kart kontrolü: ID=%s", card_id)
                 for i, existing_card in enumerate(self.card_widgets[container_type]):
                     if hasattr(existing_card, 'card_id') and existing_card.card_id == card_id:
-                        print(f"✅ Kart zaten mevcut: index={i}")
+                        logger.debug("✅ Kart zaten mevcut: index=%s", i)
                         return existing_card
             
             # ✅ YENİ: GLOBAL ÇİFT DUPLICATE KONTROLÜ - TÜM SİSTEMDE!
@@ -460,14 +488,14 @@ class BoxDetailContent(QWidget):
                 front_text = simple_data.get('english', '').strip()
                 back_text = simple_data.get('turkish', '').strip()
                 
-                print(f"🔍 DUPLICATE KONTROLÜ BAŞLIYOR:")
-                print(f"   - front_text: '{front_text}'")
-                print(f"   - back_text: '{back_text}'")
-                print(f"   - duplicate_checker mevcut: {self.duplicate_checker is not None}")
-                print(f"   - 🔥 TÜM SİSTEMDE aranacak (check_only_same_box=False)")
+                logger.debug("🔍 DUPLICATE KONTROLÜ BAŞLIYOR:")
+                logger.debug("   - front_text: '%s'", front_text)
+                logger.debug("   - back_text: '%s'", back_text)
+                logger.debug("   - duplicate_checker mevcut: %s", self.duplicate_checker is not None)
+                logger.debug("   - 🔥 TÜM SİSTEMDE aranacak (check_only_same_box=False)")
                 
                 if front_text and back_text:
-                    print(f"🔍 YENİ KART DUPLICATE KONTROLÜ: '{front_text}' → '{back_text}'")
+                    logger.debug("🔍 YENİ KART DUPLICATE KONTROLÜ: '%s' → '%s'", front_text, back_text)
                     
                     # Global duplicate kontrolü yap - TÜM SİSTEMDE!
                     duplicate_info = self.duplicate_checker.check_global_pair_duplicate(
@@ -478,115 +506,115 @@ class BoxDetailContent(QWidget):
                         check_only_same_box=False  # ✅ BÜTÜN SİSTEMDE ARA!
                     )
                     
-                    print(f"🔍 Duplicate kontrol SONUCU:")
-                    print(f"   - has_duplicate: {duplicate_info.get('has_duplicate', False)}")
-                    print(f"   - total_count: {duplicate_info.get('total_count', 0)}")
-                    print(f"   - locations: {len(duplicate_info.get('found_locations', []))} adet")
-                    print(f"   - check_only_same_box: {duplicate_info.get('check_only_same_box', False)}")
+                    logger.debug("🔍 Duplicate kontrol SONUCU:")
+                    logger.debug("   - has_duplicate: %s", duplicate_info.get('has_duplicate', False))
+                    logger.debug("   - total_count: %s", duplicate_info.get('total_count', 0))
+                    logger.debug("   - locations: %s adet", len(duplicate_info.get('found_locations', [])))
+                    logger.debug("   - check_only_same_box: %s", duplicate_info.get('check_only_same_box', False))
                     
                     # DEBUG: Bulunan duplicate'ları göster
                     if duplicate_info.get('found_locations'):
-                        print(f"📋 BULUNAN DUPLICATE'LAR:")
+                        logger.debug("📋 BULUNAN DUPLICATE'LAR:")
                         for i, loc in enumerate(duplicate_info['found_locations'], 1):
                             same_box_mark = "✅ AYNI BOX" if loc.get('same_box') else "🌍 FARKLI BOX"
-                            print(f"   {i}. {same_box_mark} - Box {loc['box_id']} - {loc['container']} - ID: {loc['card_id']}")
+                            logger.debug("   %s. %s - Box %s - %s - ID: %s", i, same_box_mark, loc['box_id'], loc['container'], loc['card_id'])
                     
                     if duplicate_info.get('has_duplicate', False):
-                        print("⚠️ DUPLICATE BULUNDU! Dialog gösteriliyor...")
+                        logger.warning("⚠️ DUPLICATE BULUNDU! Dialog gösteriliyor...")
                         # Kullanıcıya uyarı göster
                         should_continue = self._show_global_duplicate_warning(duplicate_info)
-                        print(f"   - Kullanıcı seçimi: {'DEVAM' if should_continue else 'İPTAL'}")
+                        logger.debug("   - Kullanıcı seçimi: %s", 'DEVAM' if should_continue else 'İPTAL')
                         if not should_continue:
-                            print("❌ Kullanıcı iptal etti, kart eklenmiyor")
+                            logger.debug("❌ Kullanıcı iptal etti, kart eklenmiyor")
                             return None
                         else:
-                            print("✅ Kullanıcı devam etmeyi seçti, kart ekleniyor")
+                            logger.debug("✅ Kullanıcı devam etmeyi seçti, kart ekleniyor")
                     else:
-                        print("✅ Duplicate BULUNAMADI, kart ekleniyor")
+                        logger.debug("✅ Duplicate BULUNAMADI, kart ekleniyor")
             else:
-                print(f"⚠️ Duplicate kontrol YAPILMIYOR:")
-                print(f"   - show_duplicate_warning: {show_duplicate_warning}")
-                print(f"   - duplicate_checker mevcut: {self.duplicate_checker is not None}")
+                logger.debug("⚠️ Duplicate kontrol YAPILMIYOR:")
+                logger.debug("   - show_duplicate_warning: %s", show_duplicate_warning)
+                logger.debug("   - duplicate_checker mevcut: %s", self.duplicate_checker is not None)
                 if not show_duplicate_warning:
-                    print(f"   - ❌ show_duplicate_warning=False olduğu için kontrol yapılmıyor!")
+                    logger.debug("   - ❌ show_duplicate_warning=False olduğu için kontrol yapılmıyor!")
             
             # Kart widget'ını oluştur
-            print(f"🛠️ FlashCardView oluşturuluyor...")
+            logger.debug("🛠️ FlashCardView oluşturuluyor...")
             card = FlashCardView(data=simple_data)
-            print(f"✅ FlashCardView oluşturuldu: {card}")
+            logger.debug("✅ FlashCardView oluşturuldu: %s", card)
             
             if simple_data and 'id' in simple_data:
                 card.card_id = simple_data['id']
                 card.box_id = simple_data.get('box_id', self.box_id)
                 card.bucket_id = simple_data.get('bucket', 0)
-                print(f"📝 Kart özellikleri ayarlandı: ID={card.card_id}, Box={card.box_id}, Bucket={card.bucket_id}")
+                logger.debug("📝 Kart özellikleri ayarlandı: ID=%s, Box=%s, Bucket=%s", card.card_id, card.box_id, card.bucket_id)
             
             card.db = self.db
-            print(f"✅ Database atandı")
+            logger.debug("✅ Database atandı")
             
             # ✅ DEBUG: Sinyal bağlantısını DETAYLI kontrol et
-            print(f"🔗 SİNYAL BAĞLANTILARI KONTROLÜ:")
-            print(f"   - card objesi: {card}")
-            print(f"   - card.updated var mı?: {hasattr(card, 'updated')}")
-            print(f"   - card.card_clicked var mı?: {hasattr(card, 'card_clicked')}")
-            print(f"   - card.delete_requested var mı?: {hasattr(card, 'delete_requested')}")
+            logger.debug("🔗 SİNYAL BAĞLANTILARI KONTROLÜ:")
+            logger.debug("   - card objesi: %s", card)
+            logger.debug("   - card.updated var mı?: %s", hasattr(card, 'updated'))
+            logger.debug("   - card.card_clicked var mı?: %s", hasattr(card, 'card_clicked'))
+            logger.debug("   - card.delete_requested var mı?: %s", hasattr(card, 'delete_requested'))
             
             # updated sinyali var mı kontrol et
             if hasattr(card, 'updated'):
-                print(f"   - ✅ card.updated SINYALI MEVCUT")
+                logger.debug("   - ✅ card.updated SINYALI MEVCUT")
                 
                 # 1. ÖNCE tüm eski bağlantıları temizle
                 try:
                     card.updated.disconnect()
-                    print(f"   - Eski bağlantılar temizlendi")
+                    logger.debug("   - Eski bağlantılar temizlendi")
                 except Exception as e:
-                    print(f"   - Eski bağlantı yok veya temizlenemedi: {e}")
+                    logger.debug("   - Eski bağlantı yok veya temizlenemedi: %s", e)
                 
                 # 2. DEBUG sinyali ekle
                 def debug_signal():
-                    print(f"🚨🚨🚨 SİNYAL GELDİ! Kart {getattr(card, 'card_id', 'N/A')} güncellendi")
-                    print(f"   - Kart objesi: {card}")
-                    print(f"   - İngilizce: {getattr(card, 'english_edit', getattr(card, 'english_label', 'N/A'))}")
-                    print(f"   - Türkçe: {getattr(card, 'turkish_edit', getattr(card, 'turkish_label', 'N/A'))}")
+                    logger.debug("🚨🚨🚨 SİNYAL GELDİ! Kart %s güncellendi", getattr(card, 'card_id', 'N/A'))
+                    logger.debug("   - Kart objesi: %s", card)
+                    logger.debug("   - İngilizce: %s", getattr(card, 'english_edit', getattr(card, 'english_label', 'N/A')))
+                    logger.debug("   - Türkçe: %s", getattr(card, 'turkish_edit', getattr(card, 'turkish_label', 'N/A')))
                 
                 card.updated.connect(debug_signal)
-                print(f"   - Debug sinyali bağlandı")
+                logger.debug("   - Debug sinyali bağlandı")
                 
                 # 3. ASIL handler'ı bağla
                 card.updated.connect(
                     lambda: self._on_card_updated(card)
                 )
-                print(f"   - Ana handler bağlandı: self._on_card_updated")
+                logger.debug("   - Ana handler bağlandı: self._on_card_updated")
             else:
-                print(f"❌❌❌ CRITICAL: card.updated SINYALI YOK!")
-                print(f"   - FlashCardView sınıfında updated sinyali tanımlı değil")
-                print(f"   - Sınıf özellikleri: {dir(card)}")
+                logger.error("❌❌❌ CRITICAL: card.updated SINYALI YOK!")
+                logger.debug("   - FlashCardView sınıfında updated sinyali tanımlı değil")
+                logger.debug("   - Sınıf özellikleri: %s", dir(card))
             
             # Diğer sinyalleri bağla
             if hasattr(card, 'card_clicked'):
-                print(f"   - card_clicked bağlanıyor...")
+                logger.debug("   - card_clicked bağlanıyor...")
                 card.card_clicked.connect(
                     lambda c=card, ct=container_type: self._on_card_clicked(c, ct)
                 )
             
             if hasattr(card, 'delete_requested'):
-                print(f"   - delete_requested bağlanıyor...")
+                logger.debug("   - delete_requested bağlanıyor...")
                 card.delete_requested.connect(
                     lambda c=card, ct=container_type: self._on_card_deleted(c, ct)
                 )
             
             # Kartı ekle
-            print(f"📥 Kart listelere ekleniyor...")
+            logger.debug("📥 Kart listelere ekleniyor...")
             self.cards_data[container_type].append(simple_data)
             self.card_widgets[container_type].append(card)
-            print(f"✅ Listelere eklendi:")
-            print(f"   - cards_data[{container_type}]: {len(self.cards_data[container_type])} kart")
-            print(f"   - card_widgets[{container_type}]: {len(self.card_widgets[container_type])} widget")
+            logger.debug("✅ Listelere eklendi:")
+            logger.debug("   - cards_data[%s]: %s kart", container_type, len(self.cards_data[container_type]))
+            logger.debug("   - card_widgets[%s]: %s widget", container_type, len(self.card_widgets[container_type]))
             
             # CardScrollLayout'a ekle
-            print(f"📜 CardScrollLayout'a ekleniyor...")
+            logger.debug("📜 CardScrollLayout'a ekleniyor...")
             success = scroll_layout.add_card(card)
-            print(f"✅ CardScrollLayout sonucu: {'Başarılı' if success else 'Başarısız'}")
+            logger.debug("✅ CardScrollLayout sonucu: %s", 'Başarılı' if success else 'Başarısız')
             
             if not success:
                 return None
@@ -619,21 +647,18 @@ class BoxDetailContent(QWidget):
                         True
                     )
             
-            # ✅ YENİ: Duplicate checker cache'ini güncelle
-            if self.duplicate_checker:
+            # ✅ YENİ: Duplicate checker cache'ini güncelle (toplu yüklemede sonda bir kez)
+            if self.duplicate_checker and not self._bulk_loading:
                 QTimer.singleShot(100, lambda: self.duplicate_checker._update_cache_for_content(self))
-                print(f"✅ Duplicate checker cache güncellenecek")
+                logger.debug("✅ Duplicate checker cache güncellenecek")
             
-            print(f"✅✅✅ Kart başarıyla eklendi: ID={getattr(card, 'card_id', 'N/A')}")
-            print("=" * 80)
+            logger.debug("✅✅✅ Kart başarıyla eklendi: ID=%s", getattr(card, 'card_id', 'N/A'))
             
             return card
                     
         except Exception as e:
-            print(f"❌❌❌ Kart eklenirken CRITICAL HATA: {e}")
-            import traceback
-            traceback.print_exc()
-            print("=" * 80)
+            logger.error("❌❌❌ Kart eklenirken CRITICAL HATA: %s", e)
+            logger.debug("Ayrıntı", exc_info=True)
             return None
     
     def _initialize_card_overlay(self, card_widget):
@@ -824,7 +849,7 @@ class BoxDetailContent(QWidget):
                 # Kartın overlay'ini hemen kaldır
                 if hasattr(widget, 'on_card_learned'):
                     widget.on_card_learned()
-                    print(f"🎓 [TRANSFER] Kart öğrenildi, overlay kaldırıldı: {card_id}")
+                    logger.debug("🎓 [TRANSFER] Kart öğrenildi, overlay kaldırıldı: %s", card_id)
             # ======================================================================
             
             # Veriyi bul
@@ -833,7 +858,7 @@ class BoxDetailContent(QWidget):
             
             for i, data in enumerate(self.cards_data[from_type]):
                 if data.get('id') == card_id:
-                    card_data = data.copy()
+                    card_data = data
                     data_index = i
                     break
             
@@ -867,7 +892,7 @@ class BoxDetailContent(QWidget):
             if self.box_state:
                 self._update_state_for_card(card_id, new_bucket)
             
-            card_data['bucket'] = new_bucket
+            get_card_store().update(card_data, bucket=new_bucket)
             
             # Listelerden çıkar
             if widget_index >= 0:
@@ -907,7 +932,7 @@ class BoxDetailContent(QWidget):
             return True
             
         except Exception as e:
-            print(f"❌ Kart transfer edilirken hata: {e}")
+            logger.error("❌ Kart transfer edilirken hata: %s", e)
             return False
 
     def _delete_copy_cards_from_memory_boxes(self, copy_cards_in_boxes):
@@ -931,7 +956,7 @@ class BoxDetailContent(QWidget):
                 self._update_memory_box_counter(box_id)
             
         except Exception as e:
-            print(f"❌ Kopya kartları silerken hata: {e}")
+            logger.error("❌ Kopya kartları silerken hata: %s", e)
 
     def _remove_copy_card_from_ui(self, card_id):
         try:
@@ -963,26 +988,20 @@ class BoxDetailContent(QWidget):
                                     break
             
         except Exception as e:
-            print(f"❌ UI'dan kopya kart kaldırılırken hata: {e}")
+            logger.error("❌ UI'dan kopya kart kaldırılırken hata: %s", e)
 
     def _update_memory_box_counter(self, box_id):
         try:
-            from PyQt6.QtWidgets import QApplication
-            from PyQt6.QtCore import QTimer
-            
-            app = QApplication.instance()
-            if not app:
-                return
+            from ui.refresh_scheduler import get_refresh_scheduler, RefreshKind
             
-            for widget in app.allWidgets():
-                if hasattr(widget, '__class__') and 'MemoryBox' in widget.__class__.__name__:
-                    if hasattr(widget, 'box_id') and widget.box_id == box_id:
-                        if hasattr(widget, 'update_card_count'):
-                            QTimer.singleShot(100, widget.update_card_count)
-                        break
+            memory_box = get_widget_registry().get(ViewKind.MEMORY_BOX, box_id)
+            if memory_box and hasattr(memory_box, 'update_card_count'):
+                get_refresh_scheduler().mark_dirty(
+                    RefreshKind.MEMORY_BOX_COUNT, box_id, memory_box.update_card_count
+                )
             
         except Exception as e:
-            print(f"❌ Memory box sayacı güncellenirken hata: {e}")
+            logger.error("❌ Memory box sayacı güncellenirken hata: %s", e)
     
     def _is_card_in_container(self, card_id: int, container_type: str) -> bool:
         for card_data in self.cards_data[container_type]:
@@ -1057,25 +1076,22 @@ class BoxDetailContent(QWidget):
     
     def _on_card_updated(self, card_widget):
         """Kart güncellendiğinde çağrılır - GÜNCELLENMİŞ VERSİYON"""
-        print("=" * 80)
-        print("🔄🔄🔄 _on_card_updated ÇAĞRILDI! 🔄🔄🔄")
-        print(f"   - Gelen widget: {card_widget}")
-        print(f"   - Widget type: {type(card_widget)}")
-        print(f"   - Widget ID: {getattr(card_widget, 'card_id', 'N/A')}")
+        logger.debug("🔄🔄🔄 _on_card_updated ÇAĞRILDI! 🔄🔄🔄")
+        logger.debug("   - Gelen widget: %s", card_widget)
+        logger.debug("   - Widget type: %s", type(card_widget))
+        logger.debug("   - Widget ID: %s", getattr(card_widget, 'card_id', 'N/A'))
         
         if not self.db:
-            print("❌ Database yok, işlem iptal")
-            print("=" * 80)
+            logger.error("❌ Database yok, işlem iptal")
             return
         
         # Kart ID'sini al
         card_id = getattr(card_widget, 'card_id', None)
         if not card_id:
-            print("❌ Kart ID yok, işlem iptal")
-            print("=" * 80)
+            logger.error("❌ Kart ID yok, işlem iptal")
             return
         
-        print(f"📊 Kart ID bulundu: {card_id}")
+        logger.debug("📊 Kart ID bulundu: %s", card_id)
         
         # Container'ı bul
         current_container_type = None
@@ -1083,25 +1099,24 @@ class BoxDetailContent(QWidget):
             for i, card in enumerate(self.card_widgets[container_type]):
                 if card == card_widget:
                     current_container_type = container_type
-                    print(f"✅ Container bulundu: {container_type} (index: {i})")
+                    logger.debug("✅ Container bulundu: %s (index: %s)", container_type, i)
                     break
             if current_container_type:
                 break
         
         if not current_container_type:
-            print("⚠️ Container bulunamadı, ID ile aranıyor...")
+            logger.warning("⚠️ Container bulunamadı, ID ile aranıyor...")
             for container_type in ["unknown", "learned"]:
                 for i, card in enumerate(self.card_widgets[container_type]):
                     if hasattr(card, 'card_id') and card.card_id == card_id:
                         current_container_type = container_type
-                        print(f"✅ Container ID ile bulundu: {container_type} (index: {i})")
+                        logger.debug("✅ Container ID ile bulundu: %s (index: %s)", container_type, i)
                         break
                 if current_container_type:
                     break
         
         if not current_container_type:
-            print("❌❌❌ Container BULUNAMADI! İşlem iptal")
-            print("=" * 80)
+            logger.error("❌❌❌ Container BULUNAMADI! İşlem iptal")
             return
         
         # Kart verilerini al - MÜMKÜN OLAN TÜM YOLLARLA
@@ -1110,53 +1125,53 @@ class BoxDetailContent(QWidget):
         detail_text = "{}"
         box_id = self.box_id
         
-        print(f"🔍 Kart verileri alınıyor...")
+        logger.debug("🔍 Kart verileri alınıyor...")
         
         try:
             # 1. YOL: get_card_data() metodu
             if hasattr(card_widget, 'get_card_data'):
-                print(f"   - get_card_data() metodu var, çağrılıyor...")
+                logger.debug("   - get_card_data() metodu var, çağrılıyor...")
                 card_data = card_widget.get_card_data()
                 english_text = card_data.get('english', '')
                 turkish_text = card_data.get('turkish', '')
                 detail_text = card_data.get('detail', '{}')
                 box_id = card_data.get('box_id', self.box_id)
-                print(f"   - get_card_data() sonucu: EN='{english_text}', TR='{turkish_text}'")
+                logger.debug("   - get_card_data() sonucu: EN='%s', TR='%s'", english_text, turkish_text)
         except Exception as e:
-            print(f"   - get_card_data() hatası: {e}")
+            logger.debug("   - get_card_data() hatası: %s", e)
         
         # 2. YOL: Doğrudan widget özelliklerinden
         if not english_text and hasattr(card_widget, 'english_edit'):
             try:
                 english_text = card_widget.english_edit.text().strip()
-                print(f"   - english_edit.text(): '{english_text}'")
+                logger.debug("   - english_edit.text(): '%s'", english_text)
             except:
                 pass
         
         if not english_text and hasattr(card_widget, 'english_label'):
             try:
                 english_text = card_widget.english_label.text().strip()
-                print(f"   - english_label.text(): '{english_text}'")
+                logger.debug("   - english_label.text(): '%s'", english_text)
             except:
                 pass
         
         if not turkish_text and hasattr(card_widget, 'turkish_edit'):
             try:
                 turkish_text = card_widget.turkish_edit.text().strip()
-                print(f"   - turkish_edit.text(): '{turkish_text}'")
+                logger.debug("   - turkish_edit.text(): '%s'", turkish_text)
             except:
                 pass
         
         if not turkish_text and hasattr(card_widget, 'turkish_label'):
             try:
                 turkish_text = card_widget.turkish_label.text().strip()
-                print(f"   - turkish_label.text(): '{turkish_text}'")
+                logger.debug("   - turkish_label.text(): '%s'", turkish_text)
             except:
                 pass
         
         # 3. YOL: Cache'den al
         if (not english_text or not turkish_text):
-            print(f"   - Widget'tan alınamadı, cache aranıyor...")
+            logger.debug("   - Widget'tan alınamadı, cache aranıyor...")
             for container in ["unknown", "learned"]:
                 for card_data in self.cards_data[container]:
                     if card_data.get('id') == card_id:
@@ -1167,19 +1182,19 @@ class BoxDetailContent(QWidget):
                         if not detail_text or detail_text == "{}":
                             detail_text = card_data.get('detail', detail_text)
                         box_id = card_data.get('box_id', box_id)
-                        print(f"   - Cache bulundu: EN='{english_text}', TR='{turkish_text}'")
+                        logger.debug("   - Cache bulundu: EN='%s', TR='%s'", english_text, turkish_text)
                         break
         
-        print(f"📊 SONUÇ KELİMELER: EN='{english_text}', TR='{turkish_text}'")
+        logger.debug("📊 SONUÇ KELİMELER: EN='%s', TR='%s'", english_text, turkish_text)
         
         # ✅ GLOBAL DUPLICATE KONTROLÜ - TÜM SİSTEMDE!
         if english_text.strip() and turkish_text.strip():
-            print(f"🔍 DUPLICATE KONTROLÜ BAŞLIYOR:")
-            print(f"   - Kontrol edilecek: '{english_text}' → '{turkish_text}'")
-            print(f"   - Kart ID (exclude): {card_id}")
-            print(f"   - Box ID: {box_id}")
-            print(f"   - Duplicate checker mevcut: {self.duplicate_checker is not None}")
-            print(f"   - 🔥 TÜM SİSTEMDE aranacak (check_only_same_box=False)")
+            logger.debug("🔍 DUPLICATE KONTROLÜ BAŞLIYOR:")
+            logger.debug("   - Kontrol edilecek: '%s' → '%s'", english_text, turkish_text)
+            logger.debug("   - Kart ID (exclude): %s", card_id)
+            logger.debug("   - Box ID: %s", box_id)
+            logger.debug("   - Duplicate checker mevcut: %s", self.duplicate_checker is not None)
+            logger.debug("   - 🔥 TÜM SİSTEMDE aranacak (check_only_same_box=False)")
             
             if self.duplicate_checker:
                 duplicate_info = self.duplicate_checker.check_global_pair_duplicate(
@@ -1190,43 +1205,42 @@ class BoxDetailContent(QWidget):
                     check_only_same_box=False  # ✅ BÜTÜN SİSTEMDE ARA!
                 )
                 
-                print(f"🔍 DUPLICATE KONTROL SONUCU:")
-                print(f"   - has_duplicate: {duplicate_info.get('has_duplicate', False)}")
-                print(f"   - total_count: {duplicate_info.get('total_count', 0)}")
-                print(f"   - locations: {len(duplicate_info.get('found_locations', []))} adet")
-                print(f"   - check_only_same_box: {duplicate_info.get('check_only_same_box', False)}")
+                logger.debug("🔍 DUPLICATE KONTROL SONUCU:")
+                logger.debug("   - has_duplicate: %s", duplicate_info.get('has_duplicate', False))
+                logger.debug("   - total_count: %s", duplicate_info.get('total_count', 0))
+                logger.debug("   - locations: %s adet", len(duplicate_info.get('found_locations', [])))
+                logger.debug("   - check_only_same_box: %s", duplicate_info.get('check_only_same_box', False))
                 
                 # DEBUG: Bulunan duplicate'ları göster
                 if duplicate_info.get('found_locations'):
-                    print(f"📋 BULUNAN DUPLICATE'LAR:")
+                    logger.debug("📋 BULUNAN DUPLICATE'LAR:")
                     for i, loc in enumerate(duplicate_info['found_locations'], 1):
                         same_box_mark = "✅ AYNI BOX" if loc.get('same_box') else "🌍 FARKLI BOX"
-                        print(f"   {i}. {same_box_mark} - Box {loc['box_id']} - {loc['container']} - ID: {loc['card_id']}")
+                        logger.debug("   %s. %s - Box %s - %s - ID: %s", i, same_box_mark, loc['box_id'], loc['container'], loc['card_id'])
                 
                 if duplicate_info.get('has_duplicate', False):
-                    print(f"⚠️⚠️⚠️ DUPLICATE BULUNDU! Dialog gösteriliyor...")
+                    logger.warning("⚠️⚠️⚠️ DUPLICATE BULUNDU! Dialog gösteriliyor...")
                     should_continue = self._show_global_duplicate_warning(duplicate_info)
-                    print(f"   - Kullanıcı seçimi: {'DEVAM' if should_continue else 'İPTAL'}")
+                    logger.debug("   - Kullanıcı seçimi: %s", 'DEVAM' if should_continue else 'İPTAL')
                     if not should_continue:
-                        print("❌ Kullanıcı iptal etti, kart GERİ ALINIYOR")
+                        logger.debug("❌ Kullanıcı iptal etti, kart GERİ ALINIYOR")
                         self._revert_card_to_previous_state(card_widget)
-                        print("=" * 80)
                         return
                     else:
-                        print("✅ Kullanıcı devam etmeyi seçti")
+                        logger.debug("✅ Kullanıcı devam etmeyi seçti")
                 else:
-                    print("✅ Duplicate BULUNAMADI, devam ediliyor")
+                    logger.debug("✅ Duplicate BULUNAMADI, devam ediliyor")
             else:
-                print("❌ Duplicate checker mevcut değil, kontrol yapılamıyor")
+                logger.error("❌ Duplicate checker mevcut değil, kontrol yapılamıyor")
         else:
-            print("⚠️ Boş kelime, duplicate kontrol YAPILMIYOR")
+            logger.warning("⚠️ Boş kelime, duplicate kontrol YAPILMIYOR")
         
         # Bucket'ı belirle
         bucket = 0 if current_container_type == "unknown" else 1
-        print(f"📦 Bucket: {bucket} ({'Bilmediklerim' if bucket == 0 else 'Öğrendiklerim'})")
+        logger.debug("📦 Bucket: %s (%s)", bucket, 'Bilmediklerim' if bucket == 0 else 'Öğrendiklerim')
         
         # Veritabanını güncelle
-        print(f"💾 Veritabanı güncelleniyor...")
+        logger.debug("💾 Veritabanı güncelleniyor...")
         try:
             success = self.db.update_word(
                 word_id=card_id,
@@ -1236,37 +1250,42 @@ class BoxDetailContent(QWidget):
                 box_id=box_id,
                 bucket=bucket
             )
-            print(f"✅ Veritabanı güncelleme: {'BAŞARILI' if success else 'BAŞARISIZ'}")
+            logger.debug("✅ Veritabanı güncelleme: %s", 'BAŞARILI' if success else 'BAŞARISIZ')
             
             if not success:
-                print("❌ Veritabanı güncelleme BAŞARISIZ, eski veriler kontrol ediliyor...")
+                logger.error("❌ Veritabanı güncelleme BAŞARISIZ, eski veriler kontrol ediliyor...")
                 # Eski verileri al
                 old_data = self.db.get_word_by_id(card_id)
                 if old_data:
-                    print(f"   - Eski veriler: EN='{old_data.get('english')}', TR='{old_data.get('turkish')}'")
+                    logger.debug("   - Eski veriler: EN='%s', TR='%s'", old_data.get('english'), old_data.get('turkish'))
         except Exception as e:
-            print(f"❌❌❌ Veritabanı güncelleme HATASI: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.error("❌❌❌ Veritabanı güncelleme HATASI: %s", e)
+            logger.debug("Ayrıntı", exc_info=True)
             success = False
         
-        # Cache'i güncelle
-        self._update_card_cache(card_id, english_text, turkish_text, detail_text, bucket, current_container_type)
-        print(f"✅ Cache güncellendi")
+        # Paylaşılan kaydı güncelle - görünüm ve duplicate checker aynı kaydı okuyor
+        store = get_card_store()
+        record = store.update(card_id, english=english_text, turkish=turkish_text, detail=detail_text, bucket=bucket)
+        if record is None:
+            record = store.intern({
+                'id': card_id,
+                'english': english_text,
+                'turkish': turkish_text,
+                'detail': detail_text,
+                'box_id': self.box_id,
+                'bucket': bucket
+            })
+        self._place_card_record(card_id, record, current_container_type)
+        logger.debug("✅ Kart kaydı güncellendi")
         
         # State'i güncelle
         if self.box_state:
             self._update_state_for_card(card_id, bucket)
-            print(f"✅ State güncellendi")
+            logger.debug("✅ State güncellendi")
         
         # Box counter'ı güncelle
         self._refresh_box_counter()
-        print(f"✅ Box counter güncellendi")
-        
-        # Duplicate checker cache'ini güncelle
-        if self.duplicate_checker:
-            QTimer.singleShot(100, lambda: self.duplicate_checker._update_cache_for_content(self))
-            print(f"✅ Duplicate checker cache güncellenecek")
+        logger.debug("✅ Box counter güncellendi")
         
         # Filtreleri yeniden uygula
         if current_container_type == "unknown" and self.unknown_filter_widgets:
@@ -1288,8 +1307,7 @@ class BoxDetailContent(QWidget):
                     True
                 )
         
-        print(f"✅✅✅ Kart güncelleme TAMAMLANDI")
-        print("=" * 80)
+        logger.debug("✅✅✅ Kart güncelleme TAMAMLANDI")
 
     def _revert_card_to_previous_state(self, card_widget):
         """Kartı önceki durumuna döndür (duplicate uyarısından sonra)"""
@@ -1299,42 +1317,19 @@ class BoxDetailContent(QWidget):
             elif hasattr(card_widget, 'refresh_display'):
                 card_widget.refresh_display()
         except Exception as e:
-            print(f"❌ Kart geri alınırken hata: {e}")
+            logger.error("❌ Kart geri alınırken hata: %s", e)
 
-    def _update_card_cache(self, card_id, english, turkish, detail, bucket, new_container_type):
-        # Kart ID'si ile arama yap
+    def _place_card_record(self, card_id, record, container_type):
+        """Kaydı doğru container listesinde tut - alanlar zaten paylaşılan kayıtta"""
         for container in ["unknown", "learned"]:
             for i, card_data in enumerate(self.cards_data[container]):
                 if card_data.get('id') == card_id:
-                    # Eğer container değiştiyse
-                    if container != new_container_type:
+                    if container != container_type:
                         self.cards_data[container].pop(i)
-                        # Yeni container'a ekle
-                        self.cards_data[new_container_type].append({
-                            'id': card_id,
-                            'english': english,
-                            'turkish': turkish,
-                            'detail': detail,
-                            'box_id': self.box_id,
-                            'bucket': bucket
-                        })
-                    else:
-                        # Aynı container'da güncelle
-                        card_data['english'] = english
-                        card_data['turkish'] = turkish
-                        card_data['detail'] = detail
-                        card_data['bucket'] = bucket
+                        self.cards_data[container_type].append(record)
                     return
         
-        # Eğer cache'te bulunamadıysa yeni ekle
-        self.cards_data[new_container_type].append({
-            'id': card_id,
-            'english': english,
-            'turkish': turkish,
-            'detail': detail,
-            'box_id': self.box_id,
-            'bucket': bucket
-        })
+        self.cards_data[container_type].append(record)
     
     def add_new_card(self):
         if not self.db:
@@ -1349,14 +1344,14 @@ class BoxDetailContent(QWidget):
             parent = self.parent()
             while parent:
                 if hasattr(parent, 'box_id') and parent.box_id:
-                    self.box_id = parent.box_id
+                    self._set_box_id(parent.box_id)
                     break
                 parent = parent.parent()
         
         if not self.box_id:
             window = self.window()
             if window and hasattr(window, 'box_id'):
-                self.box_id = window.box_id
+                self._set_box_id(window.box_id)
         
         if not self.db:
             window = self.window()
@@ -1396,7 +1391,7 @@ class BoxDetailContent(QWidget):
                 self._refresh_box_counter()
                 
         except Exception as e:
-            print(f"❌ Yeni kart eklenirken hata: {e}")
+            logger.error("❌ Yeni kart eklenirken hata: %s", e)
     
     def _refresh_box_counter(self):
         if not self.db or not self.box_id:
@@ -1411,27 +1406,12 @@ class BoxDetailContent(QWidget):
     
     def _find_and_update_box_view(self, top_window):
         try:
-            from ui.words_panel.box_widgets.box_view import BoxView
-            
-            box_views = []
-            
-            def find_box_views(widget):
-                if isinstance(widget, BoxView) and not widget._deleted:
-                    box_views.append(widget)
-                
-                for child in widget.children():
-                    if isinstance(child, QWidget):
-                        find_box_views(child)
-            
-            find_box_views(top_window)
-            
-            for box_view in box_views:
-                if box_view.db_id == self.box_id:
-                    QTimer.singleShot(0, box_view.refresh_card_counts)
-                    break
+            box_view = get_widget_registry().get(ViewKind.BOX_VIEW, self.box_id)
+            if box_view:
+                QTimer.singleShot(0, box_view.refresh_card_counts)
         
         except Exception as e:
-            print(f"❌ Box view bulunurken hata: {e}")
+            logger.error("❌ Box view bulunurken hata: %s", e)
     
     def _on_card_teleported(self, card_id: int, new_box_id: int):
         if not card_id:
@@ -1495,7 +1475,7 @@ class BoxDetailContent(QWidget):
                     
                     QTimer.singleShot(100, widget.deleteLater)
                 except Exception as e:
-                    print(f"❌ Widget kaldırılırken hata: {e}")
+                    logger.error("❌ Widget kaldırılırken hata: %s", e)
             
             # Cache'den kaldır
             self.cards_data[container_type] = [
@@ -1527,6 +1507,7 @@ class BoxDetailContent(QWidget):
             if self.db:
                 try:
                     self.db.delete_word(int(card_id))
+                    get_card_store().remove(card_id)
                 except Exception:
                     pass
             
@@ -1589,9 +1570,18 @@ class BoxDetailContent(QWidget):
                 self._on_card_deleted(card_widget, container_type)
                 return
     
+    def _set_box_id(self, box_id):
+        """box_id'yi ata ve kayıt defterindeki anahtarı güncelle"""
+        get_widget_registry().rekey(ViewKind.DETAIL_CONTENT, self.box_id, box_id, self)
+        self.box_id = box_id
+    
     def load_cards(self, db, box_id):
+        """
+        Kartları iki aşamada yükle: veriler arka plan thread'inde okunur,
+        widget'lar _materialize_next_chunk ile parça parça oluşturulur.
+        """
         self.db = db
-        self.box_id = box_id
+        self._set_box_id(box_id)
         
         # ✅ YENİ: Duplicate checker'a database'i set et
         if self.duplicate_checker and not self.duplicate_checker.db:
@@ -1600,35 +1590,55 @@ class BoxDetailContent(QWidget):
         if not self.db or not self.box_id:
             return
         
-        try:
+        # Önceki yükleme varsa sonucunu yok say
+        self._load_generation += 1
+        self._collecting = True
+        self._pending_entries = []
+        self._materialize_timer.stop()
+        
+        if hasattr(self.db, 'open_reader'):
+            # Thread parent'sız tutulur: içerik silinse de iş bitene kadar yaşar
+            loader = BoxCardsLoader(self.db, self.box_id, self._load_generation)
+            loader.loaded.connect(self._on_cards_collected)
+            loader.finished.connect(lambda l=loader: BoxDetailContent._release_loader(l))
+            BoxDetailContent._active_loaders.add(loader)
+            loader.start()
+        else:
+            # Okuma bağlantısı açılamıyorsa aynı akış GUI thread'inde
             try:
-                from .internal.states.state_loader import BoxDetailStateLoader
-                from .internal.states.box_state import BoxDetailState
-                
-                self.state_loader = BoxDetailStateLoader(db)
-                
-                box_info = db.get_box_info(box_id)
-                if not box_info:
-                    return
-                
-                box_title = box_info.get("title", f"Kutu {box_id}")
-                ui_index = 1
-                all_boxes = db.get_boxes()
-                for idx, (b_id, title) in enumerate(all_boxes, 1):
-                    if b_id == box_id:
-                        ui_index = idx
-                        break
-                
-                self.box_state = BoxDetailState(box_id, box_title, ui_index, db)
-                
-                loaded = self.state_loader._load_state(self.box_state)
-                if not loaded:
-                    self._populate_state_from_db()
-                    self.box_state.mark_dirty()
+                result = collect_box_cards(self.db, self.box_id)
+            except Exception as e:
+                logger.error("❌ Kartlar yüklenirken hata: %s", e)
+                self._collecting = False
+                # Pencere placeholder'ı kaldırabilsin
+                self.first_cards_ready.emit()
+                return
+            self._on_cards_collected(self._load_generation, result)
+    
+    @staticmethod
+    def _release_loader(loader):
+        BoxDetailContent._active_loaders.discard(loader)
+        loader.deleteLater()
+    
+    def _on_cards_collected(self, generation, result):
+        """1. aşama bitti - eski kartları temizle, widget oluşturmayı başlat"""
+        if generation != self._load_generation:
+            return
+        
+        self._collecting = False
+        if result.get('box_missing'):
+            # Gösterilecek kart yok - pencere placeholder'da beklemesin
+            self.first_cards_ready.emit()
+            return
+        
+        try:
+            self.box_state = result.get('box_state')
+            self._loaded_change_counter = result.get('change_counter')
+            if self.box_state:
+                self.state_loader = BoxDetailStateLoader(self.db)
+                # Thread'de eşitlenen state dosyaya burada (GUI thread'inde) yazılır
+                if self.box_state.is_dirty:
                     self.box_state.save()
-                
-            except Exception:
-                self.box_state = None
             
             # Eski kartları temizle
             for container_type in ["unknown", "learned"]:
@@ -1649,105 +1659,147 @@ class BoxDetailContent(QWidget):
                 self.card_widgets[container_type] = []
                 self.cards_data[container_type] = []
             
-            # State'den kartları yükle
-            if self.box_state and self.box_state.cards:
-                for card_data in self.box_state.cards:
-                    card_id = card_data.get("id")
-                    bucket = card_data.get("bucket", 0)
-                    
-                    if not card_id:
-                        continue
-                    
-                    word_data = self.db.get_word_by_id(card_id)
-                    if not word_data:
-                        if self.box_state:
-                            self.box_state.remove_card(card_id)
-                        continue
-                    
-                    container_type = "unknown" if bucket == 0 else "learned"
-                    
-                    card_full_data = {
-                        'id': card_id,
-                        'english': word_data.get('english', ''),
-                        'turkish': word_data.get('turkish', ''),
-                        'detail': word_data.get('detail', '{}'),
-                        'box_id': self.box_id,
-                        'bucket': bucket
-                    }
-                    
-                    card = self.add_card_to_container(container_type, card_full_data)
-                    
-                    if card:
-                        card.card_id = card_id
-                        card.box_id = self.box_id
-                        card.bucket_id = bucket
+            self._pending_entries = order_visible_first(result.get('entries', []))
+            self._pending_entries.reverse()  # pop() ile baştan al
+            self._load_total = len(self._pending_entries)
+            self._first_chunk_done = False
+            self._bulk_loading = True
             
-            # Veritabanından kartları yükle
-            rows = self.db.get_cards_by_box(self.box_id)
+            self.load_progress.emit(0, self._load_total)
+            self._materialize_next_chunk()
             
-            for row in rows:
-                card_id = row.get('id')
+        except Exception as e:
+            logger.error("❌ Kartlar yüklenirken hata: %s", e)
+            self._pending_entries = []
+            self._bulk_loading = False
+            self.first_cards_ready.emit()
+    
+    def _materialize_next_chunk(self):
+        """2. aşama: ~8 ms'lik dilimde kart widget'ı oluştur, kalanı sonraki turda"""
+        deadline = time.perf_counter() + self.MATERIALIZE_SLICE
+        
+        while self._pending_entries:
+            container_type, card_full_data = self._pending_entries.pop()
+            
+            card = self.add_card_to_container(container_type, card_full_data)
+            if card:
+                card.card_id = card_full_data['id']
+                card.box_id = self.box_id
+                card.bucket_id = card_full_data['bucket']
+            
+            if time.perf_counter() >= deadline:
+                break
+        
+        done = self._load_total - len(self._pending_entries)
+        self.load_progress.emit(done, self._load_total)
+        
+        if not self._first_chunk_done:
+            self._first_chunk_done = True
+            self.first_cards_ready.emit()
+        
+        if self._pending_entries:
+            self._materialize_timer.start()
+        else:
+            self._finish_loading()
+    
+    def _finish_loading(self):
+        self._bulk_loading = False
+        
+        # ✅ YENİ: Duplicate checker cache'ini güncelle
+        if self.duplicate_checker:
+            QTimer.singleShot(200, lambda: self.duplicate_checker._update_cache_for_content(self))
+        
+        # Timer'ları başlat
+        QTimer.singleShot(250, self._connect_card_teleporter_signals)
+        QTimer.singleShot(150, lambda: self._connect_to_card_teleporter())
+        
+        self.cards_loaded.emit()
+    
+    def is_loading(self):
+        return self._collecting or bool(self._pending_entries)
+    
+    def refresh_if_changed(self):
+        """
+        Havuzdan geri gelen içerik için: kutu sayacı değişmediyse hiçbir şey
+        yapma, değiştiyse sadece farkı uygula (çok fark varsa yeniden yükle).
+        """
+        if not self.db or not self.box_id or self.is_loading():
+            return
+        
+        try:
+            counter = self.db.get_box_change_counter(self.box_id)
+        except Exception:
+            counter = None
+        
+        if counter is not None and counter == self._loaded_change_counter:
+            return
+        
+        self._apply_box_diff(counter)
+    
+    def _apply_box_diff(self, counter):
+        try:
+            rows = self.db.get_cards_by_box(self.box_id)
+        except Exception as e:
+            logger.error("❌ Kutu farkı okunamadı: %s", e)
+            return
+        
+        wanted = {row['id']: row for row in rows if row.get('id')}
+        
+        current = {}
+        for container_type in ["unknown", "learned"]:
+            for data in self.cards_data[container_type]:
+                if data.get('id'):
+                    current[data['id']] = (container_type, data)
+        
+        removed = [card_id for card_id in current if card_id not in wanted]
+        added = []
+        changed = []
+        for card_id, row in wanted.items():
+            expected_type = "unknown" if row.get('bucket', 0) == 0 else "learned"
+            if card_id not in current:
+                added.append(card_id)
+                continue
+            
+            container_type, data = current[card_id]
+            if container_type != expected_type or any(
+                (data.get(key) or '') != (row.get(key) or '')
+                for key in ('english', 'turkish', 'detail')
+            ):
+                changed.append(card_id)
+        
+        if len(added) + len(changed) > self.DIFF_RELOAD_LIMIT:
+            self.load_cards(self.db, self.box_id)
+            return
+        
+        logger.debug("♻️ Kutu %s farkı: +%s -%s ~%s", self.box_id, len(added), len(removed), len(changed))
+        
+        for card_id in removed + changed:
+            self._remove_card_immediately(card_id)
+        
+        self._bulk_loading = True
+        try:
+            for card_id in changed + added:
+                row = wanted[card_id]
                 bucket = row.get('bucket', 0)
-                
-                if not card_id:
-                    continue
-                
-                # Zaten yüklü mü kontrol et
-                card_already_loaded = False
-                for container_type in ["unknown", "learned"]:
-                    for card_widget in self.card_widgets[container_type]:
-                        if hasattr(card_widget, 'card_id') and card_widget.card_id == card_id:
-                            card_already_loaded = True
-                            break
-                    if card_already_loaded:
-                        break
-                
-                if card_already_loaded:
-                    continue
-                
-                # State'e ekle
-                if self.box_state:
-                    card_in_state = False
-                    for card in self.box_state.cards:
-                        if card.get("id") == card_id:
-                            card_in_state = True
-                            break
-                    
-                    if not card_in_state:
-                        self.box_state.add_card(card_id, bucket)
-                
-                container_type = "unknown" if bucket == 0 else "learned"
-                
-                card_full_data = {
+                card = self.add_card_to_container("unknown" if bucket == 0 else "learned", {
                     'id': card_id,
                     'english': row.get('english', ''),
                     'turkish': row.get('turkish', ''),
                     'detail': row.get('detail', '{}'),
                     'box_id': self.box_id,
                     'bucket': bucket
-                }
-                
-                card = self.add_card_to_container(container_type, card_full_data)
+                })
                 if card:
                     card.card_id = card_id
                     card.box_id = self.box_id
                     card.bucket_id = bucket
-            
-            # State'i kaydet
-            if self.box_state:
-                self.box_state.mark_dirty()
-                self.box_state.save()
-            
-            # ✅ YENİ: Duplicate checker cache'ini güncelle
-            if self.duplicate_checker:
-                QTimer.singleShot(200, lambda: self.duplicate_checker._update_cache_for_content(self))
-            
-            # Timer'ları başlat
-            QTimer.singleShot(250, self._connect_card_teleporter_signals)
-            QTimer.singleShot(150, lambda: self._connect_to_card_teleporter())
-                
-        except Exception as e:
-            print(f"❌ Kartlar yüklenirken hata: {e}")
+        finally:
+            self._bulk_loading = False
+        
+        if (added or changed) and self.duplicate_checker:
+            QTimer.singleShot(200, lambda: self.duplicate_checker._update_cache_for_content(self))
+        
+        self._loaded_change_counter = counter
     
     def _connect_to_card_teleporter(self):
         if not self.card_teleporter:
@@ -1762,23 +1814,6 @@ class BoxDetailContent(QWidget):
             except Exception:
                 pass
     
-    def _populate_state_from_db(self):
-        if not self.box_state or not self.db:
-            return
-        
-        try:
-            rows = self.db.get_cards_by_box(self.box_id)
-            
-            for row in rows:
-                card_id = row.get('id')
-                bucket = row.get('bucket', 0)
-                
-                if card_id:
-                    self.box_state.add_card(card_id, bucket)
-                    
-        except Exception:
-            pass
-    
     def _try_connect_card_teleporter(self):
         if not self.card_teleporter:
             self._create_card_teleporter()
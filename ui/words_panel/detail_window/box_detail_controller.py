@@ -4,6 +4,8 @@
 from PyQt6.QtCore import QObject, pyqtSignal, QTimer
 from PyQt6.QtWidgets import QApplication
 
+from core.review_stats import ReviewEvent
+
 
 class BoxDetailController(QObject):
     """BoxDetailContent için merkezi kontrol sınıfı"""
@@ -55,6 +57,8 @@ class BoxDetailController(QObject):
             cursor.execute("UPDATE words SET bucket=1 WHERE id=?", (original_card_id,))
             self.db.conn.commit()
             
+            self.db.log_review_event(original_card_id, ReviewEvent.LEARNED, original_card_id=original_card_id)
+            
             # Tüm box_contents'lere bildir
             for box_id, content in self.box_contents.items():
                 if hasattr(content, '_transfer_single_card'):
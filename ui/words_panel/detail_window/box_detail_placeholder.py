@@ -69,6 +69,13 @@ class BoxDetailPlaceholder(QWidget):
             }}
         """)
     
+    def set_progress(self, done, total):
+        """Yüklenen kart sayısını göster"""
+        if total > 0 and done < total:
+            self.loading_label.setText(f"Kartlar Yükleniyor  {done}/{total}")
+        else:
+            self.loading_label.setText("Kartlar Yükleniyor")
+    
     def show_animated(self, duration=300):
         """Animasyonlu göster - yumuşak fade-in"""
         self.show()
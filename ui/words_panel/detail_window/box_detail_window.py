@@ -1,10 +1,13 @@
 # ui/words_panel/detail_window/box_detail_window.py
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QFrame, QHBoxLayout, QSizePolicy, QPushButton, QLineEdit
+import logging
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QFrame, QHBoxLayout, QSizePolicy, QPushButton, QLineEdit, QFileDialog
 from PyQt6.QtCore import Qt, QPropertyAnimation, QEasingCurve, QRect, QTimer, pyqtSignal, QEvent
 from PyQt6.QtGui import QCursor
 import sys
 import os
 
+logger = logging.getLogger(__name__)
+
 
 class EditableTitle(QLineEdit):
     edit_finished = pyqtSignal(str)
@@ -81,9 +84,16 @@ class BoxDetailWindow(QWidget):
         self.current_animation = None
         self.cards_loaded = False
         
+        # Placeholder, açılış animasyonu bitip ilk kartlar hazır olunca kalkar
+        self._open_animation_done = False
+        self._first_cards_ready = False
+        
         # Place holder
         self.placeholder = None
         
+        # Dosyadan toplu kart aktarımı (arka plan thread'i)
+        self.import_thread = None
+        
         # İçeriğin fade-in animasyonu için
         self.content_opacity_animation = None
         
@@ -101,6 +111,7 @@ class BoxDetailWindow(QWidget):
         
         # Content widget'ı DB'den sonra oluştur
         self.content_widget = self.load_content_widget()
+        self._connect_content_load_signals()
         
         self.setWindowFlags(Qt.WindowType.Widget)
         self.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose, False)
@@ -114,8 +125,8 @@ class BoxDetailWindow(QWidget):
         if box_id in BoxDetailWindow._all_windows:
             old_window = BoxDetailWindow._all_windows[box_id]
             if old_window != self:
-                old_window.close_window_immediate()
-                old_window.deleteLater()
+                old_window.close_window_immediate(release_to_pool=False)
+                old_window.dispose()
         
         BoxDetailWindow._all_windows[box_id] = self
         
@@ -248,6 +259,29 @@ class BoxDetailWindow(QWidget):
             }
         """)
         button_layout.addWidget(self.add_card_button, 0, Qt.AlignmentFlag.AlignLeft)
+        
+        self.import_button = QPushButton("İçe aktar")
+        self.import_button.setToolTip("CSV / TSV / Anki düz metin dosyasından kart ekle")
+        self.import_button.clicked.connect(self._on_import_clicked)
+        self.import_button.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+        self.import_button.setStyleSheet("""
+            QPushButton {
+                background-color: #f8f8f8; 
+                color: #333333; 
+                border: 1px solid #e0e0e0; 
+                border-radius: 6px;
+                padding: 8px 12px; 
+                font-size: 13px; 
+                font-weight: 600; 
+            }
+            QPushButton:hover {
+                background-color: #f0f0f0;
+            }
+            QPushButton:disabled {
+                color: #999999;
+            }
+        """)
+        button_layout.addWidget(self.import_button, 0, Qt.AlignmentFlag.AlignLeft)
         button_layout.addStretch(1)
         content_layout.addWidget(button_container)
         
@@ -266,7 +300,7 @@ class BoxDetailWindow(QWidget):
     
     def load_content_widget(self):
         """Content widget'ı yükle - FİKS VERSİYON"""
-        print(f"\n🚨 BoxDetailContent yükleniyor...")
+        logger.debug("\n🚨 BoxDetailContent yükleniyor...")
         
         try:
             import os
@@ -276,8 +310,8 @@ class BoxDetailWindow(QWidget):
             current_dir = os.path.dirname(os.path.abspath(__file__))
             parent_dir = os.path.dirname(current_dir)  # words_panel klasörü
             
-            print(f"📁 Current dir: {current_dir}")
-            print(f"📁 Parent dir: {parent_dir}")
+            logger.debug("📁 Current dir: %s", current_dir)
+            logger.debug("📁 Parent dir: %s", parent_dir)
             
             # 2. Python path'ine ekle
             if parent_dir not in sys.path:
@@ -287,16 +321,16 @@ class BoxDetailWindow(QWidget):
             try:
                 # İlk deneme: detail_window klasöründen
                 from detail_window.box_detail_content import BoxDetailContent
-                print("✅ Import başarılı (detail_window.box_detail_content)")
+                logger.debug("✅ Import başarılı (detail_window.box_detail_content)")
             except ImportError as e:
-                print(f"❌ Import hatası 1: {e}")
+                logger.error("❌ Import hatası 1: %s", e)
                 
                 # İkinci deneme: doğrudan
                 import importlib.util
                 
                 content_file = os.path.join(current_dir, "box_detail_content.py")
-                print(f"📄 Content file: {content_file}")
-                print(f"📄 File exists: {os.path.exists(content_file)}")
+                logger.debug("📄 Content file: %s", content_file)
+                logger.debug("📄 File exists: %s", os.path.exists(content_file))
                 
                 if os.path.exists(content_file):
                     spec = importlib.util.spec_from_file_location(
@@ -308,29 +342,28 @@ class BoxDetailWindow(QWidget):
                     spec.loader.exec_module(module)
                     
                     BoxDetailContent = module.BoxDetailContent
-                    print("✅ Dinamik import başarılı")
+                    logger.debug("✅ Dinamik import başarılı")
                 else:
                     raise ImportError(f"Dosya bulunamadı: {content_file}")
             
             # 4. Widget'ı oluştur
             content_widget = BoxDetailContent()
-            print(f"✅ BoxDetailContent oluşturuldu: {content_widget}")
+            logger.debug("✅ BoxDetailContent oluşturuldu: %s", content_widget)
             
             # 5. DB ve box_id'yi ata
             if hasattr(content_widget, 'db'):
                 content_widget.db = self.db
-                print(f"✅ DB atandı")
+                logger.debug("✅ DB atandı")
             
             if hasattr(content_widget, 'box_id'):
                 content_widget.box_id = self.box_id
-                print(f"✅ Box ID atandı: {self.box_id}")
+                logger.debug("✅ Box ID atandı: %s", self.box_id)
             
             return content_widget
             
         except Exception as e:
-            print(f"❌ CRITICAL ERROR: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.error("❌ CRITICAL ERROR: %s", e)
+            logger.debug("Ayrıntı", exc_info=True)
             
             # Fallback - en azından container'ları ayır
             from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QFrame, QLabel
@@ -375,7 +408,7 @@ class BoxDetailWindow(QWidget):
             layout.addWidget(left_frame, 1)
             layout.addWidget(right_frame, 1)
             
-            print("⚠️ Fallback widget oluşturuldu (yan yana container'lar)")
+            logger.warning("⚠️ Fallback widget oluşturuldu (yan yana container'lar)")
             return widget
     
     def _on_title_changed(self, new_title):
@@ -439,9 +472,80 @@ class BoxDetailWindow(QWidget):
             
             self.content_widget.add_new_card()
     
+    def _on_import_clicked(self):
+        """Dosya seç ve kartları arka planda kutuya aktar"""
+        if self.import_thread is not None or not self.db or not self.box_id:
+            return
+        
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Kart içe aktar", "",
+            "Kelime listeleri (*.csv *.tsv *.txt);;Tüm dosyalar (*)"
+        )
+        if not path:
+            return
+        
+        from ui.words_panel.detail_window.card_import_worker import CardImportThread
+        self.import_thread = CardImportThread(self.db, path, self.box_id, self)
+        self.import_thread.progress.connect(self._on_import_progress)
+        self.import_thread.import_finished.connect(self._on_import_finished)
+        self.import_thread.finished.connect(self.import_thread.deleteLater)
+        self.import_button.setEnabled(False)
+        self.import_button.setText("Aktarılıyor...")
+        self.import_thread.start()
+    
+    def _on_import_progress(self, read, imported):
+        self.import_button.setText(f"{imported} kart eklendi")
+    
+    def _on_import_finished(self, result):
+        self.import_thread = None
+        self.import_button.setEnabled(True)
+        self.import_button.setText("İçe aktar")
+        
+        if not result:
+            logger.warning("⚠️ İçe aktarma başarısız (kutu %s)", self.box_id)
+            return
+        if not result.get('imported'):
+            return
+        
+        # Açık içerik kutu sayacından farkı uygular
+        if hasattr(self.content_widget, 'refresh_if_changed'):
+            self.content_widget.refresh_if_changed()
+        
+        try:
+            from ui.refresh_scheduler import get_refresh_scheduler, RefreshKind
+            from ui.widget_registry import get_widget_registry, ViewKind
+            box_view = get_widget_registry().get(ViewKind.BOX_VIEW, self.box_id)
+            if box_view and hasattr(box_view, 'refresh_card_counts'):
+                get_refresh_scheduler().mark_dirty(RefreshKind.BOX_VIEW_COUNT, self.box_id, box_view.refresh_card_counts)
+        except Exception as e:
+            logger.debug("⚠️ Kutu sayacı yenilenemedi: %s", e)
+    
+    def _connect_content_load_signals(self):
+        """Arka planda yükleme yapan içeriğin ilerleme sinyallerini bağla"""
+        if hasattr(self.content_widget, 'first_cards_ready'):
+            self.content_widget.first_cards_ready.connect(self._on_first_cards_ready)
+        if hasattr(self.content_widget, 'load_progress'):
+            self.content_widget.load_progress.connect(self._on_load_progress)
+    
+    def _on_load_progress(self, done, total):
+        if self.placeholder and hasattr(self.placeholder, 'set_progress'):
+            self.placeholder.set_progress(done, total)
+    
+    def _on_first_cards_ready(self):
+        self._first_cards_ready = True
+        self._maybe_hide_placeholder()
+    
+    def _maybe_hide_placeholder(self):
+        """Animasyon bitti ve görünen kartlar oluştuysa placeholder'ı kaldır"""
+        if self._open_animation_done and self._first_cards_ready:
+            self._open_animation_done = False
+            self.hide_placeholder()
+    
     def load_box_cards(self):
-        """Kartları yükle"""
+        """Kartları yükle - havuzdan dönen pencerede sadece farkı uygula"""
         if self.cards_loaded:
+            if hasattr(self.content_widget, 'refresh_if_changed'):
+                self.content_widget.refresh_if_changed()
             return
         
         if not self.db:
@@ -469,6 +573,10 @@ class BoxDetailWindow(QWidget):
             
             self.content_widget.load_cards(self.db, self.box_id)
             self.cards_loaded = True
+            
+            # Eski tip içerik senkron yükler - sinyal gelmez
+            if not hasattr(self.content_widget, 'first_cards_ready'):
+                self._first_cards_ready = True
     
     def show_placeholder(self):
         """Place holder'ı göster"""
@@ -498,8 +606,8 @@ class BoxDetailWindow(QWidget):
             self.inner_container.setWindowOpacity(1.0)
     
     @classmethod
-    def get_or_create_window(cls, parent, db, box_id, box_title):
-        """Window'u al veya oluştur"""
+    def get_or_create_window(cls, parent, db, box_id, box_title, origin_widget=None):
+        """Window'u al, havuzdan geri getir ya da oluştur"""
         if not db and parent:
             if hasattr(parent, 'db'):
                 db = parent.db
@@ -511,27 +619,34 @@ class BoxDetailWindow(QWidget):
                         break
                     current_parent = current_parent.parent()
         
-        if box_id in cls._all_windows:
-            window = cls._all_windows[box_id]
-            if window and hasattr(window, 'box_id'):
-                if window.parent() != parent:
-                    window.setParent(parent)
-                    window.words_window = parent
-                
-                if window.box_title != box_title:
-                    window.box_title = box_title
-                    window.title_label.setText(box_title)
-                
-                if db and not window.db:
-                    window.db = db
-                
-                if hasattr(window, 'content_widget'):
+        window = cls._all_windows.get(box_id)
+        if not (window and hasattr(window, 'box_id')):
+            # Kapatılmış ama havuzda gizli bekleyen pencere
+            from ui.words_panel.detail_window.detail_window_pool import get_detail_window_pool
+            window = get_detail_window_pool().acquire(box_id)
+            if window:
+                cls._all_windows[box_id] = window
+        
+        if window and hasattr(window, 'box_id'):
+            if window.parent() != parent:
+                window.setParent(parent)
+                window.words_window = parent
+            
+            if window.box_title != box_title:
+                window.box_title = box_title
+                window.title_label.setText(box_title)
+            
+            if db and not window.db:
+                window.db = db
+            
+            if hasattr(window, 'content_widget'):
+                if db:
                     window.content_widget.db = db
-                    window.content_widget.box_id = box_id
-                
-                return window
+                window.content_widget.box_id = box_id
+            
+            return window
         
-        return cls(parent=parent, db=db, box_id=box_id, box_title=box_title)
+        return cls(parent=parent, db=db, box_id=box_id, box_title=box_title, origin_widget=origin_widget)
     
     def open_window(self):
         if self.is_visible:
@@ -565,6 +680,10 @@ class BoxDetailWindow(QWidget):
         if self.placeholder:
             QTimer.singleShot(10, self.show_placeholder)
         
+        # Kart verileri kayma animasyonu sırasında arka planda okunur
+        self._open_animation_done = False
+        self.load_box_cards()
+        
         if self.current_animation:
             self.current_animation.stop()
         
@@ -581,11 +700,12 @@ class BoxDetailWindow(QWidget):
                 self.words_window.installEventFilter(self)
             self.current_animation = None
             
-            # Kartları yükle
-            self.load_box_cards()
-            
-            # Place holder'ı gizle
-            QTimer.singleShot(300, self.hide_placeholder)
+            # İlk kartlar hazırsa place holder'ı gizle (değilse sinyal bekler)
+            self._open_animation_done = True
+            is_loading = getattr(self.content_widget, 'is_loading', None)
+            if not (is_loading and is_loading()):
+                self._first_cards_ready = True
+            self._maybe_hide_placeholder()
         
         self.current_animation.finished.connect(on_animation_finished)
         self.current_animation.start()
@@ -646,12 +766,14 @@ class BoxDetailWindow(QWidget):
             
             if self.box_id in BoxDetailWindow._all_windows and BoxDetailWindow._all_windows[self.box_id] == self:
                 del BoxDetailWindow._all_windows[self.box_id]
+            
+            self._release_to_pool()
         
         close_animation.finished.connect(on_close_finished)
         close_animation.start()
         self.current_animation = close_animation
     
-    def close_window_immediate(self):
+    def close_window_immediate(self, release_to_pool=True):
         self.hide()
         self.is_visible = False
         
@@ -671,6 +793,28 @@ class BoxDetailWindow(QWidget):
         
         if self.box_id in BoxDetailWindow._all_windows and BoxDetailWindow._all_windows[self.box_id] == self:
             del BoxDetailWindow._all_windows[self.box_id]
+        
+        if release_to_pool:
+            self._release_to_pool()
+    
+    def _release_to_pool(self):
+        """Gizlenen pencereyi dolu haliyle LRU havuzuna bırak"""
+        try:
+            from ui.words_panel.detail_window.detail_window_pool import get_detail_window_pool
+            get_detail_window_pool().release(self)
+        except Exception as e:
+            logger.error("❌ Detay penceresi havuza bırakılamadı: %s", e)
+            self.dispose()
+    
+    def dispose(self):
+        """Pencereyi kalıcı olarak yok et (havuzdan atılınca)"""
+        if self.import_thread is not None:
+            self.import_thread.cancel()
+            self.import_thread.wait()
+            self.import_thread = None
+        if hasattr(self.content_widget, '_unregister_from_duplicate_checker'):
+            self.content_widget._unregister_from_duplicate_checker()
+        self.deleteLater()
     
     def toggle_window(self):
         if self.is_visible:
@@ -0,0 +1,55 @@
+# ui/words_panel/detail_window/card_import_worker.py
+"""
+Kutuya dosyadan toplu kart aktarımı - arka plan thread'i.
+
+CardImporter (core.card_importer) kendi yazma bağlantısıyla çalışır; her
+parça ayrı transaction olduğu için ana bağlantı en fazla bir parça süresi
+bekler. İlerleme ve sonuç sinyalle GUI thread'ine gelir; kartlar bittiğinde
+açık pencere kutu sayacından farkı uygular.
+"""
+import logging
+
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from core.card_importer import CardImporter
+
+logger = logging.getLogger(__name__)
+
+# Arayüz açıkken daha küçük parçalar: ana bağlantının yazma kilidi beklemesi kısa kalır
+UI_CHUNK_SIZE = 2000
+
+
+class CardImportThread(QThread):
+    """Dosyayı kutuya aktar; ilerleme progress, sonuç import_finished ile"""
+
+    progress = pyqtSignal(int, int)        # okunan satır, eklenen kart
+    import_finished = pyqtSignal(object)   # {'read', 'imported', 'duplicates', 'skipped'} ya da None (hata)
+
+    def __init__(self, db, path, box_id, parent=None):
+        super().__init__(parent)
+        self.db = db
+        self.path = path
+        self.box_id = box_id
+        self.importer = CardImporter(None, chunk_size=UI_CHUNK_SIZE)
+
+    def cancel(self):
+        self.importer.cancel()
+
+    def run(self):
+        writer = None
+        result = None
+        try:
+            writer = self.db.open_writer()
+            self.importer.db = writer
+            result = self.importer.import_file(self.path, self.box_id, progress=self.progress.emit)
+            logger.info("📥 [CardImportThread] %s: %s", self.path, result)
+        except Exception as e:
+            logger.error("❌ [CardImportThread] İçe aktarma başarısız (%s): %s", self.path, e)
+        finally:
+            if writer is not None:
+                try:
+                    writer.conn.close()
+                except Exception:
+                    pass
+
+        self.import_finished.emit(result)
@@ -0,0 +1,145 @@
+# ui/words_panel/detail_window/card_loader.py
+"""
+BoxDetailContent için iki aşamalı kart yükleme.
+
+1. aşama (BoxCardsLoader, QThread): kutu bilgisi, JSON state ve kart satırları
+   kendi okuma bağlantısıyla arka planda toplanır; sonuç sadece veridir.
+   State dosyası burada yazılmaz - değişen state GUI thread'inde kaydedilir.
+2. aşama (BoxDetailContent): widget'lar GUI thread'inde zaman dilimli
+   parçalar halinde oluşturulur.
+"""
+import logging
+
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from .states.box_state import BoxDetailState
+from .states.state_loader import BoxDetailStateLoader
+
+logger = logging.getLogger(__name__)
+
+
+def collect_box_cards(db, box_id):
+    """
+    Kutunun gösterilecek kartlarını sırasıyla topla - widget oluşturmaz.
+    Dönen sözlük: box_state, entries [(container_type, kart verisi)], box_missing.
+    box_state veritabanıyla eşitlenir ama kaydedilmez; değiştiyse is_dirty.
+    """
+    result = {'box_state': None, 'entries': [], 'box_missing': False, 'change_counter': None}
+
+    # Satırlardan önce okunur: arada gelen değişiklik sonraki açılışta fark olarak görünür
+    if hasattr(db, 'get_box_change_counter'):
+        try:
+            result['change_counter'] = db.get_box_change_counter(box_id)
+        except Exception:
+            pass
+
+    box_info = db.get_box_info(box_id)
+    if not box_info:
+        result['box_missing'] = True
+        return result
+
+    rows = db.get_cards_by_box(box_id)
+    rows_by_id = {row['id']: row for row in rows if row.get('id')}
+
+    box_state = BoxDetailState(box_id, box_info.get("title", f"Kutu {box_id}"), box_info.get("order", 1), db)
+    try:
+        loaded = BoxDetailStateLoader(db)._load_state(box_state)
+    except (OSError, ValueError, TypeError, AttributeError) as e:
+        logger.warning("⚠️ [collect_box_cards] Kutu %s state dosyası okunamadı: %s", box_id, e)
+        box_state.cards = []
+        loaded = False
+    if not loaded:
+        box_state.mark_dirty()
+
+    def entry(row):
+        bucket = row.get('bucket', 0)
+        return ("unknown" if bucket == 0 else "learned", {
+            'id': row['id'],
+            'english': row.get('english', ''),
+            'turkish': row.get('turkish', ''),
+            'detail': row.get('detail', '{}'),
+            'box_id': box_id,
+            'bucket': bucket
+        })
+
+    entries = []
+    seen_ids = set()
+
+    # State'deki sırayla kartlar - kovası veritabanından (taşımalar önce orada yazılır)
+    for card_data in list(box_state.cards):
+        card_id = card_data.get("id")
+        if not card_id or card_id in seen_ids:
+            continue
+
+        row = rows_by_id.get(card_id)
+        if row is None:
+            box_state.remove_card(card_id)
+            continue
+
+        if card_data.get("bucket", 0) != row.get('bucket', 0):
+            box_state.add_card(card_id, row.get('bucket', 0))
+
+        seen_ids.add(card_id)
+        entries.append(entry(row))
+
+    # State'de olmayan veritabanı kartları
+    for card_id, row in rows_by_id.items():
+        if card_id in seen_ids:
+            continue
+        box_state.add_card(card_id, row.get('bucket', 0))
+        seen_ids.add(card_id)
+        entries.append(entry(row))
+
+    result['box_state'] = box_state
+    result['entries'] = entries
+    return result
+
+
+def order_visible_first(entries):
+    """
+    İki sütunu sırayla doldur: her iki container'ın üstteki (görünen)
+    kartları önce oluşturulsun. Container içi sıra korunur.
+    """
+    unknown = [entry for entry in entries if entry[0] == "unknown"]
+    learned = [entry for entry in entries if entry[0] == "learned"]
+
+    ordered = []
+    for index in range(max(len(unknown), len(learned))):
+        if index < len(unknown):
+            ordered.append(unknown[index])
+        if index < len(learned):
+            ordered.append(learned[index])
+    return ordered
+
+
+class BoxCardsLoader(QThread):
+    """1. aşama: kart verilerini kendi okuma bağlantısıyla arka planda topla"""
+
+    loaded = pyqtSignal(int, object)  # generation, collect_box_cards sonucu
+
+    def __init__(self, db, box_id, generation, parent=None):
+        super().__init__(parent)
+        self.db = db
+        self.box_id = box_id
+        self.generation = generation
+
+    def run(self):
+        reader = None
+        result = {'box_state': None, 'entries': [], 'box_missing': False}
+        try:
+            reader = self.db.open_reader()
+            result = collect_box_cards(reader, self.box_id)
+        except Exception as e:
+            logger.error("❌ [BoxCardsLoader] Kartlar okunamadı: %s", e)
+        finally:
+            if reader is not None:
+                try:
+                    reader.conn.close()
+                except Exception:
+                    pass
+
+        # State nesnesi GUI thread'inde ana bağlantıyla kullanılacak
+        if result.get('box_state') is not None:
+            result['box_state'].db = self.db
+
+        self.loaded.emit(self.generation, result)
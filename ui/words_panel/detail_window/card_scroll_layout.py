@@ -2,11 +2,14 @@
 """
 Kart grid'i ve smooth scroll yönetimi için tek sınıf
 """
+import logging
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QFrame, QGridLayout
 from PyQt6.QtCore import Qt, QPropertyAnimation, QEasingCurve, QTimer
 from PyQt6.QtGui import QWheelEvent
 from PyQt6.QtWidgets import QScrollArea, QSizePolicy
 
+logger = logging.getLogger(__name__)
+
 
 class SmoothScrollArea(QScrollArea):
     """Yumuşak scroll özellikli QScrollArea"""
@@ -286,7 +289,7 @@ class CardScrollLayout(QFrame):
             immediate: Hemen uygula (False ise QTimer ile)
         """
         def apply_filter():
-            print(f"🔍 [CardScrollLayout] Filtre uygulanıyor - {self.container_type}")
+            logger.debug("🔍 [CardScrollLayout] Filtre uygulanıyor - %s", self.container_type)
             
             # 1. TÜM kartları grid'den çıkar
             all_widgets = []
@@ -306,9 +309,9 @@ class CardScrollLayout(QFrame):
                 else:
                     card.hide()
             
-            print(f"   - Toplam kart: {len(self.card_widgets)}")
-            print(f"   - Görünen kart: {len(self.visible_cards)}")
-            print(f"   - Kolon sayısı: {self.config['columns']} (SABİT)")
+            logger.debug("   - Toplam kart: %s", len(self.card_widgets))
+            logger.debug("   - Görünen kart: %s", len(self.visible_cards))
+            logger.debug("   - Kolon sayısı: %s (SABİT)", self.config['columns'])
             
             # 3. SADECE görünen kartları SIRAYLA grid'e ekle (0'dan başlayarak)
             for i, card in enumerate(self.visible_cards):
@@ -334,7 +337,7 @@ class CardScrollLayout(QFrame):
             self.scroll_area.updateGeometry()
             self.updateGeometry()
             
-            print(f"✅ [CardScrollLayout] Filtre uygulandı - {len(self.visible_cards)} kart gösteriliyor")
+            logger.debug("✅ [CardScrollLayout] Filtre uygulandı - %s kart gösteriliyor", len(self.visible_cards))
         
         if immediate:
             apply_filter()
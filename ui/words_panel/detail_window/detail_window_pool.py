@@ -0,0 +1,134 @@
+# ui/words_panel/detail_window/detail_window_pool.py
+"""
+Kapatılan BoxDetailWindow'ların gizli ve dolu halde saklandığı LRU havuzu.
+
+Aynı iki üç kutu arasında gidip gelirken pencere ve kart widget'ları
+yeniden kurulmaz; tekrar açılışta içerik kutunun değişiklik sayacıyla
+doğrulanır (BoxDetailContent.refresh_if_changed).
+
+Boyut ve kart tavanı ortam değişkenleriyle ayarlanabilir:
+    KELIME_DETAIL_POOL_SIZE       havuzdaki en fazla pencere (varsayılan 3, 0 = kapalı)
+    KELIME_DETAIL_POOL_MAX_CARDS  havuzdaki toplam kart widget'ı tavanı (varsayılan 2000)
+"""
+import logging
+import os
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_SIZE = 3
+DEFAULT_MAX_CARDS = 2000
+
+
+def _env_int(name, default):
+    try:
+        return max(0, int(os.environ.get(name, default)))
+    except (TypeError, ValueError):
+        return default
+
+
+class DetailWindowPool:
+    """box_id -> gizli pencere; en eski kullanılan önce atılır"""
+
+    def __init__(self, max_windows=None, max_cards=None):
+        self.max_windows = _env_int("KELIME_DETAIL_POOL_SIZE", DEFAULT_POOL_SIZE) \
+            if max_windows is None else max_windows
+        self.max_cards = _env_int("KELIME_DETAIL_POOL_MAX_CARDS", DEFAULT_MAX_CARDS) \
+            if max_cards is None else max_cards
+        self._windows = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _card_count(window):
+        content = getattr(window, 'content_widget', None)
+        card_widgets = getattr(content, 'card_widgets', None)
+        if not card_widgets:
+            return 0
+        return sum(len(widgets) for widgets in card_widgets.values())
+
+    def total_cards(self):
+        return sum(self._card_count(window) for window in self._windows.values())
+
+    def release(self, window):
+        """Kapanan pencereyi havuza koy (en yeni); sınırlar aşılırsa eskileri at"""
+        box_id = getattr(window, 'box_id', None)
+        if box_id is None:
+            return
+
+        if self.max_windows <= 0 or self._card_count(window) > self.max_cards:
+            self._dispose(window)
+            return
+
+        old_window = self._windows.pop(box_id, None)
+        if old_window is not None and old_window is not window:
+            self._dispose(old_window)
+
+        self._windows[box_id] = window
+        self._evict()
+
+    def acquire(self, box_id):
+        """Havuzdaki pencereyi çıkarıp döndür (yoksa None)"""
+        window = self._windows.pop(box_id, None)
+        if window is None:
+            self.misses += 1
+            return None
+
+        try:
+            # C++ nesnesi silinmiş olabilir
+            window.isVisible()
+        except RuntimeError:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        logger.debug("♻️ [DetailWindowPool] Kutu %s havuzdan açıldı", box_id)
+        return window
+
+    def discard(self, box_id):
+        """Kutu silindi / yeniden adlandırıldı - havuzdaki penceresini at"""
+        window = self._windows.pop(box_id, None)
+        if window is not None:
+            self._dispose(window)
+
+    def clear(self):
+        while self._windows:
+            _, window = self._windows.popitem(last=False)
+            self._dispose(window)
+
+    def _evict(self):
+        while self._windows and (
+            len(self._windows) > self.max_windows or self.total_cards() > self.max_cards
+        ):
+            box_id, window = self._windows.popitem(last=False)
+            logger.debug("🗑️ [DetailWindowPool] Kutu %s havuzdan çıkarıldı", box_id)
+            self._dispose(window)
+
+    @staticmethod
+    def _dispose(window):
+        try:
+            if hasattr(window, 'dispose'):
+                window.dispose()
+            else:
+                window.deleteLater()
+        except RuntimeError:
+            pass
+
+    def get_stats(self):
+        return {
+            'windows': len(self._windows),
+            'cards': self.total_cards(),
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+
+
+# Global pool instance
+_global_pool = None
+
+def get_detail_window_pool():
+    """Global detay penceresi havuzunu getir"""
+    global _global_pool
+    if _global_pool is None:
+        _global_pool = DetailWindowPool()
+    return _global_pool
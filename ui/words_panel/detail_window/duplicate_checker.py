@@ -3,12 +3,18 @@ Global Duplicate Checker - Hard Odaklı, Dil Bağımsız Çift Kontrol Sistemi
 Herhangi iki dil çifti için çalışır: EN-TR, RU-TR, ES-NL, vb.
 """
 
+import logging
 from PyQt6.QtCore import QObject, pyqtSignal, QTimer
 from PyQt6.QtWidgets import QApplication
 import sqlite3
 from typing import Dict, List, Optional, Tuple
 import re
 
+from core.box_directory import BoxKind, get_box_directory
+from core.flashcard_model import normalize_field_text
+
+logger = logging.getLogger(__name__)
+
 
 class GlobalDuplicateChecker(QObject):
     """
@@ -22,7 +28,12 @@ class GlobalDuplicateChecker(QObject):
         super().__init__()
         self.db = db
         self.open_contents = {}  # content_id -> BoxDetailContent
-        self.word_cache = {}  # Önbellek için {box_id: {container_type: [cards]}}
+        self.word_cache = {}  # {box_id: {container_type: [CardRecord]}} - kopya değil, paylaşılan kayıtlar
+        
+        # Kayıtlar ortak olduğu için düzenlemeler cache'e kendiliğinden yansır;
+        # sadece silinen kartları ayıklamak gerekiyor
+        from ui.card_store import get_card_store
+        get_card_store().card_removed.connect(self._on_card_removed)
     
     def set_database(self, db):
         """Veritabanını ayarla"""
@@ -44,35 +55,21 @@ class GlobalDuplicateChecker(QObject):
             return
         
         box_id = content_obj.box_id
-        if box_id not in self.word_cache:
-            self.word_cache[box_id] = {"unknown": [], "learned": []}
+        cards_data = getattr(content_obj, 'cards_data', {})
         
-        # Cache'i temizle
-        self.word_cache[box_id]["unknown"] = []
-        self.word_cache[box_id]["learned"] = []
-        
-        # Box başlığını al
-        box_title = getattr(content_obj, 'box_title', f'Box {box_id}')
-        if not box_title:
-            box_title = f'Box {box_id}'
-        
-        # Kartları cache'e al
-        for container_type in ["unknown", "learned"]:
-            if hasattr(content_obj, 'cards_data') and container_type in content_obj.cards_data:
-                for card_data in content_obj.cards_data[container_type]:
-                    front = str(card_data.get('english', '')).strip()
-                    back = str(card_data.get('turkish', '')).strip()
-                    card_id = card_data.get('id')
-                    
-                    if front and back and card_id:
-                        self.word_cache[box_id][container_type].append({
-                            'id': card_id,
-                            'front': front,
-                            'back': back,
-                            'container': container_type,
-                            'content_id': id(content_obj),
-                            'box_title': box_title  # ✅ Box başlığını ekle
-                        })
+        # Sadece kayıt referansları - kart başına yeni sözlük üretilmez
+        self.word_cache[box_id] = {
+            container_type: [
+                card_data for card_data in cards_data.get(container_type, [])
+                if card_data.get('id')
+            ]
+            for container_type in ["unknown", "learned"]
+        }
+    
+    def _on_card_removed(self, card_id):
+        for containers in self.word_cache.values():
+            for container_type, cards in containers.items():
+                containers[container_type] = [card for card in cards if card.get('id') != card_id]
     
     def check_global_pair_duplicate(self, 
                                     front_text: str, 
@@ -82,19 +79,18 @@ class GlobalDuplicateChecker(QObject):
                                     check_only_same_box: bool = False) -> Dict:
         """Global çift duplicate kontrolü - EZBER KUTULARINI FİLTRELE"""
         
-        print("=" * 60)
-        print(f"🔍🔍🔍 DUPLICATE_CHECKER ÇAĞRILDI:")
-        print(f"   - front_text: '{front_text}'")
-        print(f"   - back_text: '{back_text}'")
-        print(f"   - exclude_card_id: {exclude_card_id}")
-        print(f"   - current_box_id: {current_box_id}")
-        print(f"   - check_only_same_box: {check_only_same_box}")
+        logger.debug("🔍🔍🔍 DUPLICATE_CHECKER ÇAĞRILDI:")
+        logger.debug("   - front_text: '%s'", front_text)
+        logger.debug("   - back_text: '%s'", back_text)
+        logger.debug("   - exclude_card_id: %s", exclude_card_id)
+        logger.debug("   - current_box_id: %s", current_box_id)
+        logger.debug("   - check_only_same_box: %s", check_only_same_box)
         
         front_clean = front_text.strip()
         back_clean = back_text.strip()
         
         if not front_clean or not back_clean:
-            print("❌ Boş kelime, kontrol yapılmıyor")
+            logger.debug("❌ Boş kelime, kontrol yapılmıyor")
             return {'has_duplicate': False, 'total_count': 0, 'found_locations': []}
         
         result = {
@@ -105,13 +101,13 @@ class GlobalDuplicateChecker(QObject):
             'check_only_same_box': check_only_same_box
         }
         
-        print(f"📊 Clean kelimeler: '{front_clean}' → '{back_clean}'")
+        logger.debug("📊 Clean kelimeler: '%s' → '%s'", front_clean, back_clean)
         
         # Box başlıkları için cache
         box_titles_cache = {}
         
         # 1. AÇIK PENCERELERDE ARA - EZBER KUTULARINI FİLTRELE
-        print(f"🔍 Açık pencerelerde aranıyor ({len(self.open_contents)} pencere)...")
+        logger.debug("🔍 Açık pencerelerde aranıyor (%s pencere)...", len(self.open_contents))
         
         for content_id, content in self.open_contents.items():
             # Box ID'yi integer olarak al
@@ -120,17 +116,17 @@ class GlobalDuplicateChecker(QObject):
             # Box başlığını al
             box_title = self._get_box_title_for_content(content, content_box_id)
             
-            # ✅ EZBER KUTULARINI BAŞLIĞA GÖRE FİLTRELE
-            if self._is_memory_box(box_title):
-                print(f"   - Pencere {content_id} filtrelendi (Ezber Kutusu: '{box_title}')")
+            # ✅ EZBER KUTULARINI TÜRE GÖRE FİLTRELE
+            if self._is_memory_box(content_box_id):
+                logger.debug("   - Pencere %s filtrelendi (Ezber Kutusu: '%s')", content_id, box_title)
                 continue
                 
             # ✅ DÜZELTME: check_only_same_box True ise filtrele
             if check_only_same_box and current_box_id and content_box_id != current_box_id:
-                print(f"   - Pencere {content_id} filtrelendi (sadece Box {current_box_id} aranıyor)")
+                logger.debug("   - Pencere %s filtrelendi (sadece Box %s aranıyor)", content_id, current_box_id)
                 continue
             
-            print(f"   - Pencere: {content_id}, Box ID: {content_box_id}, Başlık: '{box_title}'")
+            logger.debug("   - Pencere: %s, Box ID: %s, Başlık: '%s'", content_id, content_box_id, box_title)
             
             # Cache'e kaydet
             box_titles_cache[content_box_id] = box_title
@@ -141,7 +137,7 @@ class GlobalDuplicateChecker(QObject):
                         card_id = card_data.get('id')
                         
                         if exclude_card_id and card_id == exclude_card_id:
-                            print(f"      - Kart {card_id} exclude edildi (kendisi)")
+                            logger.debug("      - Kart %s exclude edildi (kendisi)", card_id)
                             continue
                         
                         card_front = str(card_data.get('english', '')).strip()
@@ -151,7 +147,7 @@ class GlobalDuplicateChecker(QObject):
                         if (card_front.lower() == front_clean.lower() and 
                             card_back.lower() == back_clean.lower()):
                             
-                            print(f"      ⚠️ DUPLICATE BULUNDU! Kart {card_id}: '{card_front}' → '{card_back}'")
+                            logger.debug("⚠️ DUPLICATE BULUNDU! Kart %s: '%s' → '%s'", card_id, card_front, card_back)
                             
                             result['has_duplicate'] = True
                             result['total_count'] += 1
@@ -170,25 +166,21 @@ class GlobalDuplicateChecker(QObject):
         
         # 2. VERİTABANINDA ARA (kapalı pencereler için) - EZBER KUTULARINI FİLTRELE
         if self.db:
-            print(f"🔍 Veritabanında aranıyor...")
+            logger.debug("🔍 Veritabanında aranıyor...")
             try:
                 cursor = self.db.conn.cursor()
                 
-                # SQL sorgusu - EZBER KUTULARINI FİLTRELE
+                # SQL sorgusu - card_fields index'iyle: ek anlamlar da dahil
+                # herhangi bir ön + arka anlam çifti eşleşirse çift sayılır
                 sql_query = """
-                    SELECT w.id, w.box, w.bucket 
-                    FROM words w
-                    WHERE LOWER(TRIM(w.english)) = ? 
-                    AND LOWER(TRIM(w.turkish)) = ?
-                    AND w.box NOT IN (
-                        SELECT id FROM boxes 
-                        WHERE title LIKE '%Her Gün%' 
-                        OR title LIKE '%Ezber%' 
-                        OR title LIKE '%Daily%'
-                        OR title LIKE '%Memory%'
-                    )
+                    SELECT DISTINCT w.id, w.box, w.bucket 
+                    FROM card_fields f
+                    JOIN card_fields b ON b.card_id = f.card_id AND b.side = 'back' AND b.norm_text = ?
+                    JOIN words w ON w.id = f.card_id
+                    WHERE f.side = 'front' AND f.norm_text = ?
+                    AND w.box NOT IN (SELECT id FROM boxes WHERE kind = ?)
                 """
-                params = [front_clean.lower(), back_clean.lower()]
+                params = [normalize_field_text(back_clean), normalize_field_text(front_clean), BoxKind.MEMORY]
                 
                 if exclude_card_id:
                     sql_query += " AND w.id != ?"
@@ -199,12 +191,12 @@ class GlobalDuplicateChecker(QObject):
                     sql_query += " AND w.box = ?"
                     params.append(current_box_id)
                 
-                print(f"   - SQL sorgusu: {sql_query}")
-                print(f"   - Parametreler: {params}")
+                logger.debug("   - SQL sorgusu: %s", sql_query)
+                logger.debug("   - Parametreler: %s", params)
                 
                 cursor.execute(sql_query, params)
                 rows = cursor.fetchall()
-                print(f"   - SQL sorgu sonucu: {len(rows)} satır")
+                logger.debug("   - SQL sorgu sonucu: %s satır", len(rows))
                 
                 # Her satırı işle
                 for row_idx, row in enumerate(rows):
@@ -212,24 +204,24 @@ class GlobalDuplicateChecker(QObject):
                     box_id = row[1]
                     bucket = row[2]
                     
-                    print(f"      - Satır {row_idx+1}: ID={card_id}, Box={box_id}, Bucket={bucket}")
+                    logger.debug("      - Satır %s: ID=%s, Box=%s, Bucket=%s", row_idx+1, card_id, box_id, bucket)
                     
                     # Box başlığını belirle
                     box_title = self._get_box_title_from_db(box_id)
                     
                     # ✅ EZBER KUTUSU KONTROLÜ (yedek kontrol)
-                    if self._is_memory_box(box_title):
-                        print(f"         - Box {box_id} filtrelendi (Ezber Kutusu: '{box_title}')")
+                    if self._is_memory_box(box_id):
+                        logger.debug("         - Box %s filtrelendi (Ezber Kutusu: '%s')", box_id, box_title)
                         continue
                     
-                    print(f"      ⚠️ VERİTABANINDA DUPLICATE BULUNDU! Kart {card_id}, Box {box_id}")
+                    logger.debug("⚠️ VERİTABANINDA DUPLICATE BULUNDU! Kart %s, Box %s", card_id, box_id)
                     
                     # Cache'de varsa onu kullan (açık penceredeki isim daha güncel olabilir)
                     if box_id in box_titles_cache:
                         box_title = box_titles_cache[box_id]
-                        print(f"         - Cache box_title: {box_title}")
+                        logger.debug("         - Cache box_title: %s", box_title)
                     else:
-                        print(f"         - DB box_title: {box_title}")
+                        logger.debug("         - DB box_title: %s", box_title)
                     
                     result['has_duplicate'] = True
                     result['total_count'] += 1
@@ -249,39 +241,25 @@ class GlobalDuplicateChecker(QObject):
                     })
                     
             except Exception as e:
-                print(f"❌ Veritabanı duplicate kontrol hatası: {e}")
-                import traceback
-                traceback.print_exc()
+                logger.error("❌ Veritabanı duplicate kontrol hatası: %s", e)
+                logger.debug("Ayrıntı", exc_info=True)
         
-        # DEBUG: Tüm bulunan lokasyonları göster
-        if result['found_locations']:
-            print(f"📋 BULUNAN DUPLICATE'LAR ({len(result['found_locations'])} adet):")
+        # DEBUG: Tüm bulunan lokasyonları göster (sadece debug açıkken)
+        if result['found_locations'] and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("📋 BULUNAN DUPLICATE'LAR (%s adet):", len(result['found_locations']))
             for i, loc in enumerate(result['found_locations'], 1):
                 same_box_mark = "✅" if loc.get('same_box') else "🌍"
                 window_status = "🪟" if loc.get('is_open_window') else "📂"
-                print(f"   {i}. {same_box_mark} {window_status} {loc.get('box_title', f'Box {loc.get("box_id")}')} - {loc['container']} - ID: {loc['card_id']}")
+                logger.debug("   %s. %s %s %s - %s - ID: %s", i, same_box_mark, window_status, loc.get('box_title', f'Box {loc.get("box_id")}'), loc['container'], loc['card_id'])
         
-        print(f"📊 SONUÇ: has_duplicate={result['has_duplicate']}, total_count={result['total_count']}")
-        print("=" * 60)
+        logger.debug("📊 SONUÇ: has_duplicate=%s, total_count=%s", result['has_duplicate'], result['total_count'])
         
         return result
 
-    def _is_memory_box(self, box_title: str) -> bool:
-        """Box başlığının ezber kutusu olup olmadığını kontrol et"""
-        if not box_title:
-            return False
-        
-        memory_keywords = [
-            'Her Gün', 'Ezber', 'Daily', 'Memory', 
-            'Günlük', 'Gün', 'Hergün', 'HerGün'
-        ]
-        
-        box_title_lower = box_title.lower()
-        for keyword in memory_keywords:
-            if keyword.lower() in box_title_lower:
-                return True
-        
-        return False
+    def _is_memory_box(self, box_id) -> bool:
+        """Kutu ezber kutusu mu? (boxes.kind - başlığa bakılmaz)"""
+        boxes = getattr(self.db, 'boxes', None) or get_box_directory()
+        return boxes.is_memory(box_id)
     
     def _get_box_title_for_content(self, content, box_id):
         """Content'ten box başlığını al"""
@@ -291,7 +269,7 @@ class GlobalDuplicateChecker(QObject):
             # 1. Yol: content'in kendi box_title özelliği
             if hasattr(content, 'box_title') and content.box_title:
                 box_title = content.box_title
-                print(f"   - Content box_title: {box_title}")
+                logger.debug("   - Content box_title: %s", box_title)
                 return box_title
             
             # 2. Yol: DB'den box başlığını al
@@ -299,7 +277,7 @@ class GlobalDuplicateChecker(QObject):
                 db_title = self._get_box_title_from_db(box_id)
                 if db_title != f"Box {box_id}":
                     box_title = db_title
-                    print(f"   - DB box_title: {box_title}")
+                    logger.debug("   - DB box_title: %s", box_title)
                     return box_title
             
             # 3. Yol: parent window'dan al
@@ -309,7 +287,7 @@ class GlobalDuplicateChecker(QObject):
                 # BoxDetailWindow kontrolü
                 if hasattr(window, 'box_title') and window.box_title:
                     box_title = window.box_title
-                    print(f"   - Window box_title: {box_title}")
+                    logger.debug("   - Window box_title: %s", box_title)
                     return box_title
                 
                 # title_label kontrolü
@@ -317,7 +295,7 @@ class GlobalDuplicateChecker(QObject):
                     title_text = window.title_label.text()
                     if title_text and title_text.strip():
                         box_title = title_text.strip()
-                        print(f"   - Window title_label: {box_title}")
+                        logger.debug("   - Window title_label: %s", box_title)
                         return box_title
             
             # 4. Yol: content'in parent'larında ara
@@ -325,12 +303,12 @@ class GlobalDuplicateChecker(QObject):
             while parent:
                 if hasattr(parent, 'box_title') and parent.box_title:
                     box_title = parent.box_title
-                    print(f"   - Parent box_title: {box_title}")
+                    logger.debug("   - Parent box_title: %s", box_title)
                     return box_title
                 parent = parent.parent()
                 
         except Exception as e:
-            print(f"   - Box başlığı alınırken hata: {e}")
+            logger.debug("   - Box başlığı alınırken hata: %s", e)
         
         return box_title
     
@@ -371,7 +349,7 @@ class GlobalDuplicateChecker(QObject):
                     continue
                     
         except Exception as e:
-            print(f"   - DB'den box başlığı alınırken hata: {e}")
+            logger.debug("   - DB'den box başlığı alınırken hata: %s", e)
         
         return f"Box {box_id}"
     
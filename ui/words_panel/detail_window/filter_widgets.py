@@ -344,12 +344,13 @@ class ContainerFilterWidgets(QWidget):
     
     # ========== BAŞ HARFE GÖRE FİLTRELEME (GÜNCELLENDİ!) ==========
     @staticmethod
-    def card_matches_filter(card_data, search_text="", color_id=0, db=None):
+    def card_matches_filter(card_data, search_text="", color_id=0, db=None, field_match_ids=None):
         """
         Kartın filtreye uyup uymadığını kontrol et
         ✅ BAŞ HARFE GÖRE FİLTRELEME!
         ✅ TÜRKÇE KARAKTER DESTEĞİ!
         ✅ BÜYÜK/KÜÇÜK HARF DUYARSIZ!
+        field_match_ids: ek anlamlarından biri aramayla başlayan kart ID'leri (card_fields)
         """
         matches_search = True
         matches_color = True
@@ -372,6 +373,9 @@ class ContainerFilterWidgets(QWidget):
                     english_norm.startswith(search_norm) or 
                     turkish_norm.startswith(search_norm)
                 )
+            
+            if not matches_search and field_match_ids:
+                matches_search = card_data.get('id') in field_match_ids
         
         # ===== Renk filtresi =====
         if color_id > 0 and db and card_data.get('bucket', 0) == 0:
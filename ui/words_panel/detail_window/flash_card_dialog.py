@@ -9,6 +9,8 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt, pyqtSignal
 
+from core.box_directory import get_box_directory
+
 
 class GlobalPairDuplicateDialog(QDialog):
     """
@@ -171,8 +173,8 @@ class GlobalPairDuplicateDialog(QDialog):
             box_id = location.get('box_id', 0)
             box_title = location.get('box_title', f'Kutu {box_id}')
             
-            # EZBER KUTULARINI FİLTRELE (Box ID 100'den büyük olanlar ezber kutusudur)
-            if box_id >= 100:
+            # EZBER KUTULARINI FİLTRELE (boxes.kind)
+            if get_box_directory().is_memory(box_id):
                 continue
                 
             if box_title not in box_groups:
@@ -266,7 +268,7 @@ class GlobalPairDuplicateDialog(QDialog):
         box_ids = set()
         for loc in found_locations:
             box_id = loc.get('box_id', 0)
-            if box_id >= 100:  # Ezber kutularını atla
+            if get_box_directory().is_memory(box_id):  # Ezber kutularını atla
                 continue
             box_ids.add(box_id)
         
@@ -279,7 +281,7 @@ class GlobalPairDuplicateDialog(QDialog):
         
         for loc in found_locations:
             box_id = loc.get('box_id', 0)
-            if box_id >= 100:  # Ezber kutularını atla
+            if get_box_directory().is_memory(box_id):  # Ezber kutularını atla
                 continue
                 
             card_id = loc.get('card_id')
@@ -41,6 +41,10 @@ class BoxDetailState:
         return self._file_manager
     
     # State işlemleri (kart ekleme/çıkarma/güncelleme)
+    @property
+    def is_dirty(self):
+        return self._dirty
+    
     def mark_dirty(self):
         self._dirty = True
     
@@ -63,11 +67,9 @@ class BoxDetailState:
         return self.file_manager.rename_state_file(self, new_title)
     
     def update_ui_index(self, new_index: int):
-        """UI index'ini güncelle"""
-        old_index = self.ui_index
+        """UI index'ini güncelle (sadece bellekte - dosya adı kutu ID'sine bağlı)"""
         self.ui_index = new_index
-        self.mark_dirty()
-        return self.file_manager.rename_state_file(self, self.box_title, new_index)
+        return True
     
     def remove_card(self, card_id: int):
         """Kartı state'ten kaldır"""
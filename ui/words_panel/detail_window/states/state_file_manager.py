@@ -4,6 +4,8 @@ from __future__ import annotations
 import os
 import json
 import glob
+import logging
+import re
 from pathlib import Path
 from typing import List, Tuple, Dict, Optional, TYPE_CHECKING
 
@@ -11,42 +13,60 @@ from typing import List, Tuple, Dict, Optional, TYPE_CHECKING
 if TYPE_CHECKING:
     from .box_state import BoxDetailState
 
+logger = logging.getLogger(__name__)
+
+STATE_SUFFIX = ".state.json"
+
+# Dosya adı sadece kutu ID'sine bağlı: başlık / sıra değişince dosyaya dokunulmaz
+_STATE_NAME_RE = re.compile(r"^box_(\d+)" + re.escape(STATE_SUFFIX) + "$")
+
+# Eski "{ui_index}_{başlık}.state.json" dosyaları dizin başına bir kez taşınır
+_migrated_dirs = set()
+
+
+def state_filename(box_id: int) -> str:
+    return f"box_{int(box_id)}{STATE_SUFFIX}"
+
+
+def box_id_from_filename(filename: str) -> Optional[int]:
+    """box_<id>.state.json -> id (eski biçimli adlar için None)"""
+    match = _STATE_NAME_RE.match(os.path.basename(filename))
+    return int(match.group(1)) if match else None
+
 
 class StateFileManager:
     """
     State dosya işlemleri:
-    - Dosya yolları
+    - Dosya yolları (box_<id>.state.json)
     - Temizlik (orphaned states)
-    - Onarım (repair)
-    - Yeniden sıralama (reorder)
+    - Eski adlandırmadan taşıma
+
+    Kutu sırası veritabanında (boxes.ordinal) tutulur; kutu silmek, yeniden
+    sıralamak ya da yeniden adlandırmak state dosyalarının adını değiştirmez.
     """
     
     def __init__(self, states_dir: Optional[str] = None):
         self.states_dir = states_dir or self._default_states_dir()
         Path(self.states_dir).mkdir(exist_ok=True)
+        if self.states_dir not in _migrated_dirs:
+            _migrated_dirs.add(self.states_dir)
+            self.migrate_legacy_files()
     
     def _default_states_dir(self) -> str:
         """State dosyalarının varsayılan dizini - state_json"""
         base = os.path.dirname(os.path.abspath(__file__))
         return os.path.join(base, "state_json")  # DÜZELTİLDİ: states_json -> state_json
     
+    def path_for_box(self, box_id: int) -> str:
+        return os.path.join(self.states_dir, state_filename(box_id))
+    
     def get_state_path(self, state: BoxDetailState) -> str:
         """State için dosya yolunu oluştur"""
-        safe_title = self._safe_filename(state.box_title)
-        if not safe_title:
-            safe_title = f"box_{state.box_id}"
-        
-        filename = f"{state.ui_index}_{safe_title}.state.json"
-        return os.path.join(self.states_dir, filename)
+        return self.path_for_box(state.box_id)
     
-    def get_state_path_for_params(self, box_id: int, title: str, ui_index: int) -> str:
-        """Parametrelerden dosya yolunu oluştur"""
-        safe_title = self._safe_filename(title)
-        if not safe_title:
-            safe_title = f"box_{box_id}"
-        
-        filename = f"{ui_index}_{safe_title}.state.json"
-        return os.path.join(self.states_dir, filename)
+    def get_state_path_for_params(self, box_id: int, title: str = None, ui_index: int = None) -> str:
+        """Parametrelerden dosya yolunu oluştur (başlık / sıra artık yolu etkilemez)"""
+        return self.path_for_box(box_id)
     
     @staticmethod
     def _safe_filename(text: str) -> str:
@@ -67,10 +87,9 @@ class StateFileManager:
         """State'i dosyaya kaydet"""
         try:
             data = {
-                "version": BoxDetailState.VERSION,
+                "version": state.VERSION,
                 "box_id": state.box_id,
                 "box_title": state.box_title,
-                "ui_index": state.ui_index,
                 "cards": state.cards,
                 "scroll_y": state.scroll_y,
                 "panel_width": state.panel_width,
@@ -88,28 +107,8 @@ class StateFileManager:
             return False
     
     def rename_state_file(self, state: BoxDetailState, new_title: str, new_ui_index: Optional[int] = None) -> bool:
-        """State dosyasını yeniden adlandır"""
-        old_path = self.get_state_path(state)
-        
-        # Yeni parametreler
-        new_ui_index = new_ui_index or state.ui_index
-        new_path = self.get_state_path_for_params(state.box_id, new_title, new_ui_index)
-        
-        if old_path == new_path:
-            return True
-        
-        try:
-            # Yeni dosya varsa sil
-            if os.path.exists(new_path):
-                os.remove(new_path)
-            
-            # Dosyayı taşı
-            if os.path.exists(old_path):
-                os.rename(old_path, new_path)
-            
-            return True
-        except Exception:
-            return False
+        """Yol sadece kutu ID'sine bağlı - taşınacak dosya yok, başlık sonraki kayıtta yazılır"""
+        return True
     
     def delete_state_file(self, state: BoxDetailState) -> bool:
         """State dosyasını sil"""
@@ -125,65 +124,52 @@ class StateFileManager:
     def cleanup_orphaned_states(self, valid_box_ids: set) -> int:
         """Database'de olmayan kutuların state dosyalarını temizle"""
         deleted_count = 0
-        pattern = os.path.join(self.states_dir, "*.state.json")
+        pattern = os.path.join(self.states_dir, "*" + STATE_SUFFIX)
         
+        # Kutu ID'si dosya adında - dosyaları açıp okumaya gerek yok.
+        # Taşınamamış eski biçimli dosyalar (ID'siz ad) silinmez.
         for filepath in glob.glob(pattern):
-            try:
-                data = self.load_state_from_file(filepath)
-                if data:
-                    stored_box_id = data.get("box_id")
-                    if stored_box_id not in valid_box_ids:
-                        os.remove(filepath)
-                        deleted_count += 1
-            except Exception:
+            box_id = box_id_from_filename(filepath)
+            if box_id is not None and box_id not in valid_box_ids:
                 try:
                     os.remove(filepath)
+                    deleted_count += 1
                 except Exception:
                     pass
         
         return deleted_count
     
-    def repair_all_states(self, box_order: List[Tuple[int, str, int]]) -> int:
-        """Tüm state dosyalarını onar ve numaralandır"""
-        repaired_count = 0
+    def migrate_legacy_files(self) -> int:
+        """
+        Eski "{ui_index}_{başlık}.state.json" dosyalarını box_<id>.state.json yap.
+        Okunamayan ya da box_id'si olmayan dosyalar yerinde bırakılır.
+        """
+        migrated_count = 0
+        pattern = os.path.join(self.states_dir, "*" + STATE_SUFFIX)
         
-        for box_id, title, ui_index in box_order:
-            # State dosyasını bul
-            pattern = os.path.join(self.states_dir, "*.state.json")
-            found_file = None
-            state_data = None
+        for filepath in glob.glob(pattern):
+            if box_id_from_filename(filepath) is not None:
+                continue
             
-            for filepath in glob.glob(pattern):
-                data = self.load_state_from_file(filepath)
-                if data and data.get("box_id") == box_id:
-                    found_file = filepath
-                    state_data = data
-                    break
+            data = self.load_state_from_file(filepath)
+            box_id = data.get("box_id") if isinstance(data, dict) else None
+            if box_id is None:
+                logger.warning("⚠️ [StateFileManager] Eski state dosyası okunamadı, taşınmadı: %s", filepath)
+                continue
             
-            if found_file and state_data:
-                # Yeni dosya adı
-                new_path = self.get_state_path_for_params(box_id, title, ui_index)
-                
-                # State verisini güncelle
-                state_data["version"] = BoxDetailState.VERSION
-                state_data["ui_index"] = ui_index
-                state_data["box_title"] = title
-                
-                # Dosyayı yeniden adlandır/güncelle
-                try:
-                    if found_file != new_path:
-                        if os.path.exists(new_path):
-                            os.remove(new_path)
-                        
-                        os.rename(found_file, new_path)
-                    
-                    # İçeriği güncelle
-                    with open(new_path if found_file != new_path else found_file, 
-                              'w', encoding='utf-8') as f:
-                        json.dump(state_data, f, indent=2, ensure_ascii=False)
-                    
-                    repaired_count += 1
-                except Exception:
-                    continue
+            try:
+                new_path = self.path_for_box(box_id)
+                if os.path.exists(new_path):
+                    # Yeni biçimli dosya zaten var; eski kopya fazlalık
+                    os.remove(filepath)
+                else:
+                    os.replace(filepath, new_path)
+                    migrated_count += 1
+            except Exception as e:
+                logger.warning("⚠️ [StateFileManager] Eski state dosyası taşınamadı (%s): %s", filepath, e)
         
-        return repaired_count
\ No newline at end of file
+        return migrated_count
+    
+    def repair_all_states(self, box_order: List[Tuple[int, str, int]]) -> int:
+        """Tüm state dosyalarını onar (eski adlandırmayı taşı) - sıra artık dosya adında değil"""
+        return self.migrate_legacy_files()
\ No newline at end of file
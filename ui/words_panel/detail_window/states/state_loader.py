@@ -40,18 +40,14 @@ class BoxDetailStateLoader:
     def _determine_ui_index(self, box_id: int) -> int:
         """Box ID'den UI index'ini belirle"""
         try:
-            all_boxes = self.db.get_boxes()
-            for index, (b_id, title) in enumerate(all_boxes, 1):
-                if b_id == box_id:
-                    return index
-            return 1
+            return self.db.boxes.ui_index(box_id)
         except Exception:
             return 1
     
     def _load_state(self, state: BoxDetailState) -> bool:
         """State'i dosyadan yükle"""
         
-        # 1. Numaralı dosyayı ara
+        # 1. Kutu ID'li dosyayı ara (eski numaralı dosyalar StateFileManager'da taşınır)
         current_path = self.file_manager.get_state_path(state)
         
         if self._try_load_from_file(state, current_path):
@@ -131,14 +127,15 @@ class BoxDetailStateLoader:
             state.scroll_y = data.get("scroll_y", 0)
             state.panel_width = data.get("panel_width")
             
-            # Kaydet ve eski dosyayı sil
+            # Kaydet; eski dosya başka bir yoldaysa sil (aynı yolsa yeni kayıt odur)
             state.mark_dirty()
-            self.file_manager.save_state_to_file(state)
+            saved = self.file_manager.save_state_to_file(state)
             
-            try:
-                os.remove(filepath)
-            except Exception:
-                pass
+            if saved and os.path.abspath(filepath) != os.path.abspath(self.file_manager.get_state_path(state)):
+                try:
+                    os.remove(filepath)
+                except Exception:
+                    pass
             
             return True
         except Exception:
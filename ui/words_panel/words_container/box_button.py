@@ -1,7 +1,9 @@
 from PyQt6.QtWidgets import QFrame, QLabel, QSizePolicy
-from PyQt6.QtCore import Qt, pyqtSignal, QSize, QTimer
+from PyQt6.QtCore import Qt, pyqtSignal, QSize
 from PyQt6.QtGui import QFont, QPainter, QPen, QColor
 
+from ui.animation_clock import get_animation_clock
+
 
 class AddBoxButton(QFrame):
     clicked = pyqtSignal()
@@ -23,10 +25,8 @@ class AddBoxButton(QFrame):
         self.target_intensity = 0.0
         self.target_scale = 1.0
 
-        # Animation update timer
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.animate_step)
-        self.timer.start(16)  # ~60 FPS
+        # Ortak animasyon saati - sadece hover geçişi sürerken çalışır
+        self.animation_clock = get_animation_clock()
 
         self.setStyleSheet("background: transparent;")
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
@@ -43,6 +43,7 @@ class AddBoxButton(QFrame):
 
         self.target_intensity = 1.0   # görünür olsun
         self.target_scale = 1.08      # yumuşak büyüme
+        self.animation_clock.request(self.animate_step)
 
         super().enterEvent(event)
 
@@ -52,12 +53,14 @@ class AddBoxButton(QFrame):
 
         self.target_intensity = 0.0   # transparan olsun
         self.target_scale = 1.0       # anında küçülsün
+        self.animation_clock.request(self.animate_step)
 
         super().leaveEvent(event)
 
     # ------------------ ANIMATION ENGINE ------------------
     def animate_step(self):
-        """Her frame'de intensity ve scale değerlerini hedefe doğru yaklaştırır."""
+        """Her frame'de intensity ve scale değerlerini hedefe doğru yaklaştırır.
+        Hedefe ulaşılınca False döner ve saatten çıkar."""
         changed = False
 
         # Fade
@@ -74,8 +77,9 @@ class AddBoxButton(QFrame):
         else:
             self.scale = self.target_scale
 
-        if changed:
-            self.update()
+        # Son adımda da (hedefe oturunca) bir kez çiz
+        self.update()
+        return changed
 
     # ------------------ PAINT ------------------
     def paintEvent(self, event):
@@ -1,6 +1,7 @@
 # ui/words_panel/words_container/container_boxes.py
 from __future__ import annotations
 
+import logging
 import os
 import json
 from pathlib import Path
@@ -13,6 +14,8 @@ from ui.words_panel.words_container.container_core import WordsContainerCore
 from ui.words_panel.box_widgets.box_view import BoxView
 from ui.words_panel.words_container.box_button import AddBoxButton
 
+logger = logging.getLogger(__name__)
+
 
 class WordsContainer(WordsContainerCore):
     selection_changed = pyqtSignal(list)
@@ -93,48 +96,14 @@ class WordsContainer(WordsContainerCore):
             self.add_button.show()
             self.add_button.raise_()
 
-    def _get_states_dir(self) -> Path:
-        """State dosyalarının bulunduğu dizini al - detail_window/states/state_json"""
-        try:
-            current_file = Path(__file__).resolve()
-            
-            # detail_window/states/state_json yolunu oluştur
-            ui_words_panel_dir = current_file.parent.parent
-            states_dir = ui_words_panel_dir / "detail_window" / "states" / "state_json"
-            
-            if states_dir.exists():
-                return states_dir
-            
-            # Alternatif yolları dene
-            cwd = Path.cwd()
-            possible_paths = [
-                cwd / "ui" / "words_panel" / "detail_window" / "states" / "state_json",
-                cwd / "detail_window" / "states" / "state_json",
-            ]
-            
-            for path in possible_paths:
-                if path.exists():
-                    return path
-            
-            # Hiçbiri yoksa, oluştur
-            states_dir.mkdir(parents=True, exist_ok=True)
-            return states_dir
-            
-        except Exception:
-            # Fallback
-            return Path.cwd() / "state_json"
+    def _state_files(self):
+        """State dosyaları box_<id>.state.json - yol başlığa / sıraya bağlı değil"""
+        from ui.words_panel.detail_window.states.state_file_manager import StateFileManager
+        return StateFileManager()
 
     def _create_state_file_for_box(self, box_id: int, title: str, ui_index: int):
         try:
-            states_dir = self._get_states_dir()
-            states_dir.mkdir(parents=True, exist_ok=True)
-            
-            safe_title = self._make_safe_filename(title)
-            if not safe_title:
-                safe_title = f"box_{box_id}"
-            
-            filename = f"{ui_index}_{safe_title}.state.json"
-            filepath = states_dir / filename
+            filepath = Path(self._state_files().path_for_box(box_id))
             
             if filepath.exists():
                 with open(filepath, 'r', encoding='utf-8') as f:
@@ -151,7 +120,6 @@ class WordsContainer(WordsContainerCore):
                 "version": 5,
                 "box_id": box_id,
                 "box_title": title,
-                "ui_index": ui_index,
                 "cards": [],
                 "scroll_y": 0,
                 "panel_width": None,
@@ -167,101 +135,20 @@ class WordsContainer(WordsContainerCore):
 
     def _ensure_state_file_exists(self, box_id: int, title: str, ui_index: int):
         try:
-            states_dir = self._get_states_dir()
-            
-            safe_title = self._make_safe_filename(title)
-            if not safe_title:
-                safe_title = f"box_{box_id}"
-            
-            pattern1 = f"{ui_index}_{safe_title}.state.json"
-            filepath1 = states_dir / pattern1
-            
-            if filepath1.exists():
+            if os.path.exists(self._state_files().path_for_box(box_id)):
                 return True
             
-            # Eski dosyaları ara (farklı formatlarda olabilir)
-            for filepath in states_dir.glob("*.state.json"):
-                try:
-                    with open(filepath, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    
-                    if data.get("box_id") == box_id:
-                        # Eski dosyayı yeni formatla güncelle
-                        data["box_title"] = title
-                        data["ui_index"] = ui_index
-                        data["updated_at"] = datetime.now().isoformat()
-                        
-                        new_filename = f"{ui_index}_{safe_title}.state.json"
-                        new_path = states_dir / new_filename
-                        
-                        with open(new_path, 'w', encoding='utf-8') as f:
-                            json.dump(data, f, ensure_ascii=False, indent=2)
-                        
-                        # Eski dosyayı sil (yenisi farklı isimdeyse)
-                        if filepath != new_path and filepath.exists():
-                            filepath.unlink()
-                        
-                        return True
-                        
-                except Exception:
-                    continue
-            
-            # Hiç dosya bulunamazsa yeni oluştur
             self._create_state_file_for_box(box_id, title, ui_index)
             return True
             
         except Exception:
             return False
 
-    def _make_safe_filename(self, text: str) -> str:
-        if not text:
-            return ""
-        
-        turkish_chars = {'ç': 'c', 'ğ': 'g', 'ı': 'i', 'ö': 'o', 
-                         'ş': 's', 'ü': 'u', 'Ç': 'C', 'Ğ': 'G', 
-                         'İ': 'I', 'Ö': 'O', 'Ş': 'S', 'Ü': 'U'}
-        
-        for old, new in turkish_chars.items():
-            text = text.replace(old, new)
-        
-        safe = "".join(c for c in text if c.isalnum() or c in (' ', '-', '_')).strip()
-        safe = safe.replace(' ', '_').replace('-', '_')
-        
-        while '__' in safe:
-            safe = safe.replace('__', '_')
-        
-        safe = safe.lower()[:50]
-        
-        if not safe or all(c == '_' for c in safe):
-            return ""
-        
-        return safe
-
     def _cleanup_orphaned_states(self):
         """Database'de olmayan kutuların state dosyalarını temizle"""
         try:
-            states_dir = self._get_states_dir()
-            if not states_dir.exists():
-                return
-            
-            db_boxes = self.db.get_boxes()
-            valid_box_ids = {box[0] for box in db_boxes}
-            
-            for filepath in states_dir.glob("*.state.json"):
-                try:
-                    with open(filepath, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    
-                    box_id = data.get("box_id")
-                    if box_id not in valid_box_ids:
-                        filepath.unlink()
-                        
-                except Exception:
-                    try:
-                        filepath.unlink()
-                    except:
-                        pass
-                
+            valid_box_ids = {box_id for box_id, _ in self.db.get_boxes()}
+            self._state_files().cleanup_orphaned_states(valid_box_ids)
         except Exception:
             pass
 
@@ -324,74 +211,22 @@ class WordsContainer(WordsContainerCore):
             self._create_state_file_for_box(box.db_id, new_title, box.ui_index)
 
     def _rename_state_file(self, box_id: int, old_title: str, new_title: str, ui_index: int) -> bool:
+        """Dosya adı kutu ID'sine bağlı - sadece içerikteki başlık güncellenir"""
         try:
-            states_dir = self._get_states_dir()
-            if not states_dir.exists():
-                states_dir.mkdir(parents=True, exist_ok=True)
-                return False
-            
-            old_safe_title = self._make_safe_filename(old_title)
-            new_safe_title = self._make_safe_filename(new_title)
-            
-            if not old_safe_title:
-                old_safe_title = f"box_{box_id}"
-            if not new_safe_title:
-                new_safe_title = f"box_{box_id}"
-            
-            old_filename = f"{ui_index}_{old_safe_title}.state.json"
-            new_filename = f"{ui_index}_{new_safe_title}.state.json"
-            
-            old_path = states_dir / old_filename
-            new_path = states_dir / new_filename
-            
-            # Eski dosyayı bul
-            if not old_path.exists():
-                for filepath in states_dir.glob("*.state.json"):
-                    try:
-                        with open(filepath, 'r', encoding='utf-8') as f:
-                            data = json.load(f)
-                        
-                        if data.get("box_id") == box_id:
-                            old_path = filepath
-                            break
-                    except Exception:
-                        continue
-            
-            # Eski dosya yoksa yeni oluştur
-            if not old_path.exists():
+            filepath = Path(self._state_files().path_for_box(box_id))
+            if not filepath.exists():
                 self._create_state_file_for_box(box_id, new_title, ui_index)
                 return True
             
-            # Aynı dosyaysa sadece içeriği güncelle
-            if old_path == new_path:
-                with open(old_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
-                data["box_title"] = new_title
-                data["updated_at"] = datetime.now().isoformat()
-                
-                with open(old_path, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, ensure_ascii=False, indent=2)
-                return True
-            
-            # Yeni dosya varsa sil
-            if new_path.exists():
-                new_path.unlink()
-            
-            # Eski dosyayı oku ve güncelle
-            with open(old_path, 'r', encoding='utf-8') as f:
+            with open(filepath, 'r', encoding='utf-8') as f:
                 data = json.load(f)
             
             data["box_title"] = new_title
             data["updated_at"] = datetime.now().isoformat()
             
-            # Yeni dosyaya yaz
-            with open(new_path, 'w', encoding='utf-8') as f:
+            with open(filepath, 'w', encoding='utf-8') as f:
                 json.dump(data, f, ensure_ascii=False, indent=2)
             
-            # Eski dosyayı sil
-            old_path.unlink()
-            
             return True
             
         except Exception:
@@ -399,30 +234,9 @@ class WordsContainer(WordsContainerCore):
 
     def remove_box(self, box):
         try:
-            states_dir = self._get_states_dir()
-            
-            safe_title = self._make_safe_filename(box.title)
-            if not safe_title:
-                safe_title = f"box_{box.db_id}"
-            
-            filename = f"{box.ui_index}_{safe_title}.state.json"
-            filepath = states_dir / filename
-            
+            filepath = Path(self._state_files().path_for_box(box.db_id))
             if filepath.exists():
                 filepath.unlink()
-            else:
-                # Farklı isimdeki dosyayı bul ve sil
-                for fpath in states_dir.glob("*.state.json"):
-                    try:
-                        with open(fpath, 'r', encoding='utf-8') as f:
-                            data = json.load(f)
-                        
-                        if data.get("box_id") == box.db_id:
-                            fpath.unlink()
-                            break
-                    except Exception:
-                        continue
-                
         except Exception:
             pass
         
@@ -442,6 +256,13 @@ class WordsContainer(WordsContainerCore):
                 self.db.delete_box(box.db_id)
             except Exception:
                 pass
+            
+            # Havuzda gizli bekleyen detay penceresi artık geçersiz
+            try:
+                from ui.words_panel.detail_window.detail_window_pool import get_detail_window_pool
+                get_detail_window_pool().discard(box.db_id)
+            except Exception:
+                pass
         
         self._reindex_boxes_after_deletion()
         
@@ -449,78 +270,42 @@ class WordsContainer(WordsContainerCore):
         self.selection_changed.emit(self.selected_boxes)
 
     def _reindex_boxes_after_deletion(self):
-        """Box silindikten sonra kalan box'ları yeniden indeksle"""
-        try:
-            states_dir = self._get_states_dir()
-            
-            box_order = []
-            for idx, box in enumerate(self.boxes, 1):
-                if hasattr(box, 'db_id') and box.db_id:
+        """Box silindikten sonra kalan box'ların ekran sırasını güncelle.
+        Sıra veritabanında (boxes.ordinal), state dosyaları kutu ID'siyle
+        adlandırılır - burada dosyaya dokunulmaz."""
+        for idx, box in enumerate(self.boxes, 1):
+            if hasattr(box, 'db_id') and box.db_id:
+                if hasattr(box, 'set_ui_index'):
+                    box.set_ui_index(idx)
+                else:
                     box.ui_index = idx
-                    box_order.append((box.db_id, box.title, idx))
-            
-            # Tüm state dosyalarını güncelle
-            for db_id, title, new_index in box_order:
-                for filepath in states_dir.glob("*.state.json"):
-                    try:
-                        with open(filepath, 'r', encoding='utf-8') as f:
-                            data = json.load(f)
-                        
-                        if data.get("box_id") == db_id:
-                            data["ui_index"] = new_index
-                            data["box_title"] = title
-                            data["updated_at"] = datetime.now().isoformat()
-                            
-                            safe_title = self._make_safe_filename(title)
-                            if not safe_title:
-                                safe_title = f"box_{db_id}"
-                            
-                            new_filename = f"{new_index}_{safe_title}.state.json"
-                            new_path = states_dir / new_filename
-                            
-                            # Yeni dosyaya yaz
-                            with open(new_path, 'w', encoding='utf-8') as f:
-                                json.dump(data, f, ensure_ascii=False, indent=2)
-                            
-                            # Eski dosyayı sil (farklı isimdeyse)
-                            if filepath != new_path and filepath.exists():
-                                filepath.unlink()
-                            
-                            break
-                            
-                    except Exception:
-                        continue
-                        
-        except Exception:
-            pass
 
     def _forward_enter_request(self, box):
         """Enter tuşuna basıldığında detail window aç - DÜZELTİLMİŞ"""
-        print(f"➡️ WordsContainer: Enter tuşuna basıldı: {box.db_id} - {box.title}")
+        logger.debug("➡️ WordsContainer: Enter tuşuna basıldı: %s - %s", box.db_id, box.title)
         
         # Önce parent window'ı bul
         parent_window = self.window()
         
-        print(f"🔍 WordsContainer: Parent window: {parent_window}")
-        print(f"🔍 WordsContainer: Parent has open_box_detail: {hasattr(parent_window, 'open_box_detail')}")
-        print(f"🔍 WordsContainer: Parent DB var mı: {hasattr(parent_window, 'db') and parent_window.db is not None}")
+        logger.debug("🔍 WordsContainer: Parent window: %s", parent_window)
+        logger.debug("🔍 WordsContainer: Parent has open_box_detail: %s", hasattr(parent_window, 'open_box_detail'))
+        logger.debug("🔍 WordsContainer: Parent DB var mı: %s", hasattr(parent_window, 'db') and parent_window.db is not None)
         
         if parent_window and hasattr(parent_window, 'open_box_detail'):
             try:
                 # DB'yi kontrol et
                 if not hasattr(parent_window, 'db') or not parent_window.db:
-                    print(f"❌ WordsContainer: Parent window'da DB yok!")
+                    logger.error("❌ WordsContainer: Parent window'da DB yok!")
                     return
                 
                 detail_window = parent_window.open_box_detail(box)
                 if detail_window:
-                    print(f"✅ WordsContainer: Detail window açıldı: {box.db_id}")
+                    logger.debug("✅ WordsContainer: Detail window açıldı: %s", box.db_id)
             except Exception as e:
-                print(f"❌ WordsContainer: Detail window açma hatası: {e}")
-                import traceback
-                traceback.print_exc()
+                logger.error("❌ WordsContainer: Detail window açma hatası: %s", e)
+                logger.debug("Ayrıntı", exc_info=True)
         else:
-            print(f"⚠️ WordsContainer: open_box_detail metodu bulunamadı, alternatif yöntem deneniyor...")
+            logger.warning("⚠️ WordsContainer: open_box_detail metodu bulunamadı, alternatif yöntem deneniyor...")
             
             # Alternatif: direkt BoxDetailWindow oluştur
             try:
@@ -532,10 +317,10 @@ class WordsContainer(WordsContainerCore):
                     db = parent_window.db
                 
                 if not db:
-                    print(f"❌ WordsContainer: DB bulunamadı!")
+                    logger.error("❌ WordsContainer: DB bulunamadı!")
                     return
                 
-                print(f"🔧 WordsContainer: Alternatif yöntemle DB kullanılıyor: {db is not None}")
+                logger.debug("🔧 WordsContainer: Alternatif yöntemle DB kullanılıyor: %s", db is not None)
                 
                 window = BoxDetailWindow.get_or_create_window(
                     parent=parent_window,
@@ -546,12 +331,11 @@ class WordsContainer(WordsContainerCore):
                 )
                 
                 window.open_window()
-                print(f"✅ WordsContainer: Alternatif yöntemle detail window açıldı")
+                logger.debug("✅ WordsContainer: Alternatif yöntemle detail window açıldı")
                 
             except Exception as e:
-                print(f"❌ WordsContainer: Alternatif yöntem hatası: {e}")
-                import traceback
-                traceback.print_exc()
+                logger.error("❌ WordsContainer: Alternatif yöntem hatası: %s", e)
+                logger.debug("Ayrıntı", exc_info=True)
 
     def on_box_selection_changed(self, box: BoxView, is_selected: bool):
         if not self._is_widget_valid(box):
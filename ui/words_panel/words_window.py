@@ -8,6 +8,7 @@ from ui.words_panel.buttons_panel import ButtonsPanel
 from core.database import Database
 from ui.words_panel.button_and_cards.card_teleporter import CardTeleporter
 from ui.words_panel.detail_window.box_detail_controller import init_controller
+from ui.widget_registry import get_widget_registry, ViewKind
 
 
 class WordsWindow(QWidget):
@@ -162,18 +163,13 @@ class WordsWindow(QWidget):
             pass
 
     def _find_all_memory_boxes(self, widget):
-        """Widget içindeki tüm MemoryBox'ları bul"""
+        """Widget içindeki tüm MemoryBox'ları bul (ağaç taraması yerine kayıt defteri)"""
         memory_boxes = []
         
         try:
-            # Eğer widget kendisi MemoryBox ise
-            if hasattr(widget, '__class__') and 'MemoryBox' in widget.__class__.__name__:
-                memory_boxes.append(widget)
-            
-            # Çocuk widget'ları kontrol et
-            for child in widget.children():
-                memory_boxes.extend(self._find_all_memory_boxes(child))
-                
+            for memory_box in get_widget_registry().iter_kind(ViewKind.MEMORY_BOX):
+                if memory_box is widget or widget.isAncestorOf(memory_box):
+                    memory_boxes.append(memory_box)
         except Exception:
             pass
         